@@ -0,0 +1,231 @@
+from typing import Callable, Generic, Hashable, Iterable, Optional, Sequence, TypeVar
+
+import flask
+from sqlalchemy import func, select
+
+from ark_nova_stats.config import db
+from ark_nova_stats.models import (
+    Card,
+    CardPlay,
+    GameLog,
+    GameParticipation,
+    GameRating,
+    GameStatistics,
+    User,
+    UserStats,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Loads the values for many keys with a single call to `batch_fn`.
+
+    Keys are queued up (with `prime`) as their parent objects are resolved, e.g. the IDs
+    of every game log in a listing. The first `load` of a key that hasn't been fetched yet
+    then fetches every queued key at once, so sibling resolvers share a single query.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], dict[K, V]],
+        default: Callable[[], V],
+    ):
+        self.batch_fn = batch_fn
+        self.default = default
+        # Used as an ordered set.
+        self.pending: dict[K, None] = {}
+        self.cache: dict[K, V] = {}
+
+    def prime(self, keys: Iterable[K]) -> None:
+        for key in keys:
+            if key not in self.cache:
+                self.pending[key] = None
+
+    def load(self, key: K) -> V:
+        if key not in self.cache:
+            self.pending[key] = None
+            keys = list(self.pending)
+            self.pending.clear()
+
+            values = self.batch_fn(keys)
+            for k in keys:
+                self.cache[k] = values[k] if k in values else self.default()
+
+        return self.cache[key]
+
+
+def group_by_key(rows: Iterable[tuple[K, V]]) -> dict[K, list[V]]:
+    grouped: dict[K, list[V]] = {}
+    for key, value in rows:
+        grouped.setdefault(key, []).append(value)
+
+    return grouped
+
+
+class Loaders:
+    """
+    The batch loaders for a single GraphQL request.
+    Each relationship is loaded with one IN query per level of the response,
+    rather than one query per parent object.
+    """
+
+    def __init__(self) -> None:
+        # Keyed by game log ID.
+        self.game_log_users: BatchLoader[int, list[User]] = BatchLoader(
+            self.load_game_log_users, list
+        )
+        self.game_log_cards: BatchLoader[int, list[Card]] = BatchLoader(
+            self.load_game_log_cards, list
+        )
+        # Keyed by BGA table ID.
+        self.game_logs: BatchLoader[int, Optional[GameLog]] = BatchLoader(
+            self.load_game_logs, lambda: None
+        )
+        self.game_log_ratings: BatchLoader[int, list[GameRating]] = BatchLoader(
+            self.load_game_log_ratings, list
+        )
+        self.game_log_statistics: BatchLoader[int, list[GameStatistics]] = BatchLoader(
+            self.load_game_log_statistics, list
+        )
+        # Keyed by BGA user ID.
+        self.users: BatchLoader[int, Optional[User]] = BatchLoader(
+            self.load_users, lambda: None
+        )
+        self.user_num_game_logs: BatchLoader[int, int] = BatchLoader(
+            self.load_user_num_game_logs, int
+        )
+        self.user_current_elo: BatchLoader[int, Optional[int]] = BatchLoader(
+            lambda user_ids: self.load_user_current_elos(
+                user_ids, UserStats.current_elo
+            ),
+            lambda: None,
+        )
+        self.user_current_arena_elo: BatchLoader[int, Optional[int]] = BatchLoader(
+            lambda user_ids: self.load_user_current_elos(
+                user_ids, UserStats.current_arena_elo
+            ),
+            lambda: None,
+        )
+
+    def prime_game_logs(self, game_logs: Sequence[GameLog]) -> None:
+        for game_log in game_logs:
+            self.game_logs.cache[game_log.bga_table_id] = game_log
+
+        self.game_log_users.prime(game_log.id for game_log in game_logs)
+        self.game_log_cards.prime(game_log.id for game_log in game_logs)
+        self.game_log_ratings.prime(game_log.bga_table_id for game_log in game_logs)
+        self.game_log_statistics.prime(game_log.bga_table_id for game_log in game_logs)
+
+    def prime_users(self, users: Iterable[User]) -> None:
+        user_ids = []
+        for user in users:
+            self.users.cache[user.bga_id] = user
+            user_ids.append(user.bga_id)
+
+        self.user_num_game_logs.prime(user_ids)
+        self.user_current_elo.prime(user_ids)
+        self.user_current_arena_elo.prime(user_ids)
+
+    def prime_game_ratings(self, game_ratings: Sequence[GameRating]) -> None:
+        self.users.prime(rating.user_id for rating in game_ratings)
+        self.game_logs.prime(rating.bga_table_id for rating in game_ratings)
+
+    def prime_game_statistics(self, game_statistics: Sequence[GameStatistics]) -> None:
+        self.users.prime(stat.bga_user_id for stat in game_statistics)
+        self.game_logs.prime(stat.bga_table_id for stat in game_statistics)
+
+    def load_game_log_users(self, game_log_ids: list[int]) -> dict[int, list[User]]:
+        users = group_by_key(
+            db.session.execute(
+                select(GameParticipation.game_log_id, User)
+                .join(User, User.bga_id == GameParticipation.user_id)
+                .where(GameParticipation.game_log_id.in_(game_log_ids))
+                .order_by(GameParticipation.game_log_id, User.id)
+            ).tuples()
+        )
+        self.prime_users(user for game_users in users.values() for user in game_users)
+        return users
+
+    def load_game_log_cards(self, game_log_ids: list[int]) -> dict[int, list[Card]]:
+        return group_by_key(
+            db.session.execute(
+                select(CardPlay.game_log_id, Card)
+                .join(Card, Card.id == CardPlay.card_id)
+                .where(CardPlay.game_log_id.in_(game_log_ids))
+                .group_by(CardPlay.game_log_id, Card.id)
+                .order_by(CardPlay.game_log_id, func.min(CardPlay.move))
+            ).tuples()
+        )
+
+    def load_game_logs(self, bga_table_ids: list[int]) -> dict[int, Optional[GameLog]]:
+        game_logs = db.session.scalars(
+            select(GameLog).where(GameLog.bga_table_id.in_(bga_table_ids))
+        ).all()
+        self.prime_game_logs(game_logs)
+        return {game_log.bga_table_id: game_log for game_log in game_logs}
+
+    def load_game_log_ratings(
+        self, bga_table_ids: list[int]
+    ) -> dict[int, list[GameRating]]:
+        ratings = db.session.scalars(
+            select(GameRating)
+            .where(GameRating.bga_table_id.in_(bga_table_ids))
+            .order_by(GameRating.id)
+        ).all()
+        self.prime_game_ratings(ratings)
+        return group_by_key((rating.bga_table_id, rating) for rating in ratings)
+
+    def load_game_log_statistics(
+        self, bga_table_ids: list[int]
+    ) -> dict[int, list[GameStatistics]]:
+        statistics = db.session.scalars(
+            select(GameStatistics)
+            .where(GameStatistics.bga_table_id.in_(bga_table_ids))
+            .order_by(GameStatistics.id)
+        ).all()
+        self.prime_game_statistics(statistics)
+        return group_by_key((stat.bga_table_id, stat) for stat in statistics)
+
+    def load_users(self, user_ids: list[int]) -> dict[int, Optional[User]]:
+        users = db.session.scalars(select(User).where(User.bga_id.in_(user_ids))).all()
+        self.prime_users(users)
+        return {user.bga_id: user for user in users}
+
+    def load_user_num_game_logs(self, user_ids: list[int]) -> dict[int, int]:
+        return {
+            user_id: num_game_logs
+            for user_id, num_game_logs in db.session.execute(
+                select(UserStats.user_id, UserStats.num_game_logs).where(
+                    UserStats.user_id.in_(user_ids)
+                )
+            ).tuples()
+        }
+
+    def load_user_current_elos(
+        self, user_ids: list[int], elo_column
+    ) -> dict[int, Optional[int]]:
+        return {
+            user_id: elo
+            for user_id, elo in db.session.execute(
+                select(UserStats.user_id, elo_column).where(
+                    UserStats.user_id.in_(user_ids)
+                )
+            ).tuples()
+        }
+
+
+def request_loaders() -> Loaders:
+    """
+    Returns the batch loaders for the current request, creating them if needed.
+    Loaded values are only cached for the lifetime of the request.
+    """
+    if not flask.has_app_context():
+        return Loaders()
+
+    if "loaders" not in flask.g:
+        flask.g.loaders = Loaders()
+
+    return flask.g.loaders
@@ -0,0 +1,50 @@
+import sys
+
+import pytest
+
+from ark_nova_stats.api.gql.loaders import BatchLoader, group_by_key
+
+
+class TestBatchLoader:
+    def test_loads_primed_keys_in_one_batch(self):
+        batches = []
+
+        def batch_fn(keys: list[int]) -> dict[int, int]:
+            batches.append(keys)
+            return {key: key * 10 for key in keys}
+
+        loader: BatchLoader[int, int] = BatchLoader(batch_fn, int)
+        loader.prime([1, 2, 3])
+
+        assert [10, 20, 30, 40] == [loader.load(key) for key in [1, 2, 3, 4]]
+        assert [[1, 2, 3], [4]] == batches
+
+    def test_does_not_refetch_cached_keys(self):
+        batches = []
+
+        def batch_fn(keys: list[int]) -> dict[int, int]:
+            batches.append(keys)
+            return {key: key for key in keys}
+
+        loader: BatchLoader[int, int] = BatchLoader(batch_fn, int)
+        loader.load(1)
+        loader.prime([1, 2])
+        loader.load(2)
+        loader.load(1)
+
+        assert [[1], [2]] == batches
+
+    def test_missing_keys_get_separate_defaults(self):
+        loader: BatchLoader[int, list[str]] = BatchLoader(lambda keys: {}, list)
+        loader.prime([1, 2])
+
+        loader.load(1).append("a")
+        assert [] == loader.load(2)
+
+
+def test_group_by_key_preserves_order():
+    assert {1: ["a", "c"], 2: ["b"]} == group_by_key([(1, "a"), (2, "b"), (1, "c")])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
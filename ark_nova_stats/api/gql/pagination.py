@@ -0,0 +1,93 @@
+import base64
+import datetime
+from typing import Iterable, Iterator, Optional, Sequence
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLBoolean,
+    GraphQLField,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLString,
+    InlineFragmentNode,
+    SelectionSetNode,
+)
+
+
+def encode_cursor(game_end: datetime.datetime, id: int) -> str:
+    """
+    Encodes a position in a listing ordered by (game_end, id) as an opaque cursor.
+    """
+    return base64.urlsafe_b64encode(f"{game_end.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime.datetime, int]:
+    try:
+        game_end, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.datetime.fromisoformat(game_end), int(id)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def child_field_nodes(
+    selection_set: Optional[SelectionSetNode],
+    fragments: dict[str, FragmentDefinitionNode],
+) -> Iterator[FieldNode]:
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            yield selection
+        elif isinstance(selection, InlineFragmentNode):
+            yield from child_field_nodes(selection.selection_set, fragments)
+        elif isinstance(selection, FragmentSpreadNode):
+            yield from child_field_nodes(
+                fragments[selection.name.value].selection_set, fragments
+            )
+
+
+def selected_field_names(
+    info: GraphQLResolveInfo, path: Sequence[str] = ()
+) -> set[str]:
+    """
+    Returns the names of the fields that the query selects on the object at `path`,
+    relative to the field being resolved (e.g. ["edges", "node"] for a connection's nodes).
+    """
+    field_nodes: Iterable[FieldNode] = info.field_nodes
+    for name in path:
+        field_nodes = [
+            child
+            for field_node in field_nodes
+            for child in child_field_nodes(field_node.selection_set, info.fragments)
+            if child.name.value == name
+        ]
+
+    return set(
+        child.name.value
+        for field_node in field_nodes
+        for child in child_field_nodes(field_node.selection_set, info.fragments)
+    )
+
+
+def page_info_fields() -> dict[str, GraphQLField]:
+    return {
+        "hasNextPage": GraphQLField(
+            GraphQLNonNull(GraphQLBoolean),
+            description="Whether there are more results after this page.",
+        ),
+        "endCursor": GraphQLField(
+            GraphQLString,
+            description="Cursor of the last result in this page. Pass it as `after` to fetch the next page.",
+        ),
+    }
+
+
+page_info_type = GraphQLObjectType(
+    "PageInfo",
+    description="Information about a page of results.",
+    fields=page_info_fields,
+)
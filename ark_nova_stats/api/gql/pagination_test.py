@@ -0,0 +1,66 @@
+import datetime
+import sys
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from graphql import FragmentDefinitionNode, OperationDefinitionNode, parse
+
+from ark_nova_stats.api.gql.pagination import (
+    decode_cursor,
+    encode_cursor,
+    selected_field_names,
+)
+
+
+def test_cursor_round_trips():
+    game_end = datetime.datetime(2024, 5, 6, 7, 8, 9, tzinfo=datetime.timezone.utc)
+    assert (game_end, 123) == decode_cursor(encode_cursor(game_end, 123))
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor")
+
+
+def fake_info(query: str) -> Any:
+    document = parse(query)
+    [operation] = [
+        d for d in document.definitions if isinstance(d, OperationDefinitionNode)
+    ]
+    return SimpleNamespace(
+        field_nodes=list(operation.selection_set.selections),
+        fragments={
+            d.name.value: d
+            for d in document.definitions
+            if isinstance(d, FragmentDefinitionNode)
+        },
+    )
+
+
+def test_selected_field_names_follows_path_and_fragments():
+    info = fake_info("""
+        query {
+            gameLogsConnection {
+                edges {
+                    cursor
+                    node {
+                        id
+                        ...Timestamps
+                        ... on GameLog { bgaTableId }
+                    }
+                }
+                pageInfo { hasNextPage }
+            }
+        }
+        fragment Timestamps on GameLog { start end }
+        """)
+
+    assert {"edges", "pageInfo"} == selected_field_names(info)
+    assert {"id", "start", "end", "bgaTableId"} == selected_field_names(
+        info, ["edges", "node"]
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
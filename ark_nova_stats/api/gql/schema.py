@@ -7,11 +7,13 @@ from ark_nova_stats.api.gql.types.game_log import (
     fetch_game_statistics_field,
     fetch_user_field,
     game_log_field,
+    game_logs_connection_field,
     game_logs_field,
     recent_game_log_archives_field,
     recent_game_logs_field,
     stats_field,
     submit_game_logs_field,
+    submit_many_game_logs_field,
 )
 from ark_nova_stats.api.gql.types.game_rating import (
     fetch_game_ratings_field,
@@ -34,11 +36,12 @@ def Schema(app: flask.Flask):
             fields={
                 "gameLog": game_log_field(GameLog),
                 "gameLogs": game_logs_field(GameLog),
+                "gameLogsConnection": game_logs_connection_field(GameLog),
                 "gameStatistics": fetch_game_statistics_field(GameStatistics),
                 "gameRatings": fetch_game_ratings_field(GameRating),
                 "recentGameLogs": recent_game_logs_field(GameLog),
                 "recentGameLogArchives": recent_game_log_archives_field(GameLogArchive),
-                "stats": stats_field(GameLog, User),
+                "stats": stats_field(),
                 "user": fetch_user_field(User),
                 "card": fetch_card_field(Card),
                 "cards": fetch_cards_field(Card),
@@ -48,6 +51,7 @@ def Schema(app: flask.Flask):
             name="Mutation",
             fields={
                 "submitGameLogs": submit_game_logs_field(GameLog),
+                "submitManyGameLogs": submit_many_game_logs_field(GameLog),
                 "submitGameRatings": submit_game_ratings_field(GameRating),
             },
         ),
@@ -1,5 +1,5 @@
-import json
-from typing import Any, Iterable, Optional, Sequence, Type
+import datetime
+from typing import Any, Callable, Iterable, Optional, Sequence, Type
 
 from graphql import (
     GraphQLArgument,
@@ -9,18 +9,31 @@ from graphql import (
     GraphQLList,
     GraphQLNonNull,
     GraphQLObjectType,
+    GraphQLResolveInfo,
     GraphQLString,
 )
-from sqlalchemy import asc, desc
-
-from ark_nova_stats.bga_log_parser.game_log import GameLog as ParsedGameLog
-from ark_nova_stats.config import app, db
+from sqlalchemy import Select, asc, desc, exists, literal, tuple_
+from sqlalchemy.orm import defer
+
+from ark_nova_stats.api.gql.loaders import request_loaders
+from ark_nova_stats.api.gql.pagination import (
+    decode_cursor,
+    encode_cursor,
+    page_info_type,
+    selected_field_names,
+)
+from ark_nova_stats.bga_log_parser.stat_schema import STAT_FIELDS
+from ark_nova_stats.config import db
+from ark_nova_stats.ingestion import ingest_game_logs
 from ark_nova_stats.models import Card as CardModel
+from ark_nova_stats.models import CardPlay as CardPlayModel
 from ark_nova_stats.models import GameLog as GameLogModel
 from ark_nova_stats.models import GameLogArchive as GameLogArchiveModel
 from ark_nova_stats.models import GameLogArchiveType
+from ark_nova_stats.models import GameParticipation as GameParticipationModel
 from ark_nova_stats.models import GameStatistics as GameStatisticsModel
 from ark_nova_stats.models import User as UserModel
+from ark_nova_stats.stats import DAILY_SUBMISSION_DAYS, stats_cache
 
 
 def player_rating_change_fields() -> dict[str, GraphQLField]:
@@ -71,26 +84,35 @@ def game_log_end_resolver(game_log: GameLogModel, info, **args) -> int:
     return round(game_log.game_end.timestamp())
 
 
+def game_log_users_resolver(game_log: GameLogModel, info, **args) -> list[UserModel]:
+    return request_loaders().game_log_users.load(game_log.id)
+
+
+def game_log_cards_resolver(game_log: GameLogModel, info, **args) -> list[CardModel]:
+    return request_loaders().game_log_cards.load(game_log.id)
+
+
 def game_log_player_rating_changes_resolver(
     game_log: GameLogModel, info, **args
 ) -> list:
+    loaders = request_loaders()
     return [
         {
-            "user": rating.user,
+            "user": loaders.users.load(rating.user_id),
             "gameLog": game_log,
             "priorElo": rating.prior_elo,
             "newElo": rating.new_elo,
             "priorArenaElo": rating.prior_arena_elo,
             "newArenaElo": rating.new_arena_elo,
         }
-        for rating in game_log.game_ratings
+        for rating in loaders.game_log_ratings.load(game_log.bga_table_id)
     ]
 
 
 def game_log_statistics_resolver(
     game_log: GameLogModel, info, **args
 ) -> list[GameStatisticsModel]:
-    return game_log.game_statistics
+    return request_loaders().game_log_statistics.load(game_log.bga_table_id)
 
 
 def game_log_fields() -> dict[str, GraphQLField]:
@@ -111,10 +133,12 @@ def game_log_fields() -> dict[str, GraphQLField]:
         "users": GraphQLField(
             GraphQLNonNull(GraphQLList(user_type)),
             description="Users who played in this game.",
+            resolve=game_log_users_resolver,
         ),
         "cards": GraphQLField(
             GraphQLNonNull(GraphQLList(card_type)),
             description="Cards played in this game.",
+            resolve=game_log_cards_resolver,
         ),
         "start": GraphQLField(
             GraphQLNonNull(GraphQLInt),
@@ -182,41 +206,7 @@ def submit_game_logs(
     game_log_model: Type[GameLogModel],
     args: dict[str, Any],
 ) -> GameLogModel:
-    json_logs = json.loads(args["logs"])
-    parsed_logs = ParsedGameLog(**json_logs)
-
-    table_ids = set(l.table_id for l in parsed_logs.data.logs)
-    if len(table_ids) != 1:
-        raise RuntimeError(
-            f"Log is invalid: there must be exactly one table_id per game log, found: {table_ids}"
-        )
-
-    log: GameLogModel = game_log_model(
-        bga_table_id=list(table_ids)[0],
-        log=args["logs"],
-        game_start=parsed_logs.game_start,
-        game_end=parsed_logs.game_end,
-    )
-    if app.config["TESTING"] == True:
-        log.id = 1
-    else:
-        # Only create the log if it doesn't already exist.
-        existing_log: GameLogModel | None = db.session.execute(
-            db.select(game_log_model)
-            .filter(game_log_model.bga_table_id == log.bga_table_id)
-            .first()
-        ).scalar_one()
-        if existing_log is None:
-            db.session.add(log)
-        else:
-            log = existing_log
-
-        for obj in log.create_related_objects(parsed_logs):
-            db.session.add(obj)
-
-        db.session.commit()
-
-    return log
+    return ingest_game_logs([args["logs"]])[0]
 
 
 def submit_game_logs_field(
@@ -235,14 +225,55 @@ def submit_game_logs_field(
     )
 
 
+def submit_many_game_logs(
+    game_log_model: Type[GameLogModel],
+    args: dict[str, Any],
+) -> list[GameLogModel]:
+    return ingest_game_logs(args["logs"])
+
+
+def submit_many_game_logs_field(
+    game_log_model: Type[GameLogModel],
+) -> GraphQLField:
+    return GraphQLField(
+        GraphQLNonNull(GraphQLList(GraphQLNonNull(game_log_type))),
+        description="Submit logs for many games at once. Games that were already submitted are returned as-is.",
+        args={
+            "logs": GraphQLArgument(
+                GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLString))),
+                description="JSON-encoded representations of each game's logs.",
+            ),
+        },
+        resolve=lambda root, info, **args: submit_many_game_logs(game_log_model, args),
+    )
+
+
+def defer_unselected_log(
+    query: Select[tuple[GameLogModel]],
+    game_log_model: Type[GameLogModel],
+    game_log_fields: set[str],
+) -> Select[tuple[GameLogModel]]:
+    # Logs are large, so only load them if they were asked for.
+    if "log" in game_log_fields:
+        return query
+
+    return query.options(
+        defer(game_log_model.uncompressed_log), defer(game_log_model.compressed_log)
+    )
+
+
 def fetch_game_logs(
-    game_log_model: Type[GameLogModel], args: dict
+    game_log_model: Type[GameLogModel], info: GraphQLResolveInfo, args: dict
 ) -> Iterable[GameLogModel]:
-    query = db.select(game_log_model)
+    query = defer_unselected_log(
+        db.select(game_log_model), game_log_model, selected_field_names(info)
+    )
     if "bgaTableIds" in args:
         query = query.where(game_log_model.bga_table_id.in_(args["bgaTableIds"]))
 
-    return db.session.scalars(query.limit(500))
+    game_logs = db.session.scalars(query.limit(500)).all()
+    request_loaders().prime_game_logs(game_logs)
+    return game_logs
 
 
 fetch_game_logs_filters: dict[str, GraphQLArgument] = {
@@ -260,19 +291,198 @@ def game_logs_field(
         GraphQLNonNull(GraphQLList(game_log_type)),
         description="List all game logs.",
         args=fetch_game_logs_filters,
-        resolve=lambda root, info, **args: fetch_game_logs(game_log_model, args),
+        resolve=lambda root, info, **args: fetch_game_logs(game_log_model, info, args),
     )
 
 
-def fetch_recent_game_logs(
+def game_log_edge_fields() -> dict[str, GraphQLField]:
+    return {
+        "cursor": GraphQLField(
+            GraphQLNonNull(GraphQLString),
+            description="Cursor of this game log. Pass it as `after` to fetch the game logs after it.",
+        ),
+        "node": GraphQLField(
+            GraphQLNonNull(game_log_type),
+            description="The game log.",
+        ),
+    }
+
+
+game_log_edge_type = GraphQLObjectType(
+    "GameLogEdge",
+    description="A game log in a page of game logs.",
+    fields=game_log_edge_fields,
+)
+
+
+def game_log_connection_fields() -> dict[str, GraphQLField]:
+    return {
+        "edges": GraphQLField(
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(game_log_edge_type))),
+            description="The game logs in this page.",
+        ),
+        "pageInfo": GraphQLField(
+            GraphQLNonNull(page_info_type),
+            description="Information about this page.",
+        ),
+    }
+
+
+game_log_connection_type = GraphQLObjectType(
+    "GameLogConnection",
+    description="A page of game logs, ordered by when they ended. Games without an end time aren't included.",
+    fields=game_log_connection_fields,
+)
+
+MAX_GAME_LOGS_PAGE_SIZE = 500
+
+
+def game_logs_connection_query(
+    game_log_model: Type[GameLogModel], args: dict, game_log_fields: set[str]
+) -> Select[tuple[GameLogModel]]:
+    """
+    Builds the query for a page of the game logs connection, without its limit.
+    Games that haven't ended have no position in the (game_end, id) order, so they're left out.
+    """
+    query = defer_unselected_log(
+        db.select(game_log_model).where(game_log_model.game_end != None),
+        game_log_model,
+        game_log_fields,
+    )
+
+    if args.get("after") is not None:
+        game_end, id = decode_cursor(args["after"])
+        query = query.where(
+            tuple_(game_log_model.game_end, game_log_model.id)
+            > tuple_(literal(game_end), literal(id))
+        )
+
+    # Each player & card must be in the game.
+    for player_id in args.get("playerIds") or []:
+        query = query.where(
+            exists()
+            .where(GameParticipationModel.game_log_id == game_log_model.id)
+            .where(GameParticipationModel.user_id == player_id)
+        )
+    for card_id in args.get("cardIds") or []:
+        query = query.where(
+            exists()
+            .where(CardPlayModel.game_log_id == game_log_model.id)
+            .where(CardPlayModel.card_id == CardModel.id)
+            .where(CardModel.bga_id == card_id)
+        )
+    if args.get("mapIds"):
+        query = query.where(
+            exists()
+            .where(GameStatisticsModel.bga_table_id == game_log_model.bga_table_id)
+            .where(GameStatisticsModel.map_id.in_(args["mapIds"]))
+        )
+    if args.get("endedAfter") is not None:
+        query = query.where(
+            game_log_model.game_end
+            >= datetime.datetime.fromtimestamp(
+                args["endedAfter"], tz=datetime.timezone.utc
+            )
+        )
+    if args.get("endedBefore") is not None:
+        query = query.where(
+            game_log_model.game_end
+            < datetime.datetime.fromtimestamp(
+                args["endedBefore"], tz=datetime.timezone.utc
+            )
+        )
+
+    return query.order_by(game_log_model.game_end, game_log_model.id)
+
+
+def game_logs_connection_page(game_logs: Sequence[GameLogModel], first: int) -> dict:
+    """
+    Turns up to `first + 1` game logs into a page of `first` edges; the extra one signals a next page.
+    """
+    edges = [
+        {"cursor": encode_cursor(game_log.game_end, game_log.id), "node": game_log}
+        for game_log in game_logs[:first]
+    ]
+    return {
+        "edges": edges,
+        "pageInfo": {
+            "hasNextPage": len(game_logs) > first,
+            "endCursor": edges[-1]["cursor"] if edges else None,
+        },
+    }
+
+
+def fetch_game_logs_connection(
+    game_log_model: Type[GameLogModel], info: GraphQLResolveInfo, args: dict
+) -> dict:
+    first = min(max(int(args["first"]), 0), MAX_GAME_LOGS_PAGE_SIZE)
+    query = game_logs_connection_query(
+        game_log_model, args, selected_field_names(info, ["edges", "node"])
+    )
+
+    # Fetch one more game log than requested, to tell whether there's another page.
+    game_logs = db.session.scalars(query.limit(first + 1)).all()
+    request_loaders().prime_game_logs(game_logs[:first])
+    return game_logs_connection_page(game_logs, first)
+
+
+fetch_game_logs_connection_filters: dict[str, GraphQLArgument] = {
+    "first": GraphQLArgument(
+        GraphQLInt,
+        default_value=100,
+        description=f"How many game logs to return. Maximum of {MAX_GAME_LOGS_PAGE_SIZE}.",
+    ),
+    "after": GraphQLArgument(
+        GraphQLString,
+        description="Only return game logs after this cursor.",
+    ),
+    "playerIds": GraphQLArgument(
+        GraphQLList(GraphQLNonNull(GraphQLInt)),
+        description="Only return games that all of these BGA users played in.",
+    ),
+    "cardIds": GraphQLArgument(
+        GraphQLList(GraphQLNonNull(GraphQLString)),
+        description="Only return games where all of these cards (by BGA ID) were played.",
+    ),
+    "mapIds": GraphQLArgument(
+        GraphQLList(GraphQLNonNull(GraphQLInt)),
+        description="Only return games where any player used one of these maps.",
+    ),
+    "endedAfter": GraphQLArgument(
+        GraphQLInt,
+        description="Only return games that ended at or after this UNIX timestamp.",
+    ),
+    "endedBefore": GraphQLArgument(
+        GraphQLInt,
+        description="Only return games that ended before this UNIX timestamp.",
+    ),
+}
+
+
+def game_logs_connection_field(
     game_log_model: Type[GameLogModel],
+) -> GraphQLField:
+    return GraphQLField(
+        GraphQLNonNull(game_log_connection_type),
+        description="Page through game logs, in order of when they ended. Games without an end time aren't included.",
+        args=fetch_game_logs_connection_filters,
+        resolve=lambda root, info, **args: fetch_game_logs_connection(
+            game_log_model, info, args
+        ),
+    )
+
+
+def fetch_recent_game_logs(
+    game_log_model: Type[GameLogModel], info: GraphQLResolveInfo
 ) -> Iterable[GameLogModel]:
-    return (
-        db.select(game_log_model)
-        .order_by(desc(game_log_model.game_end))
-        .limit(10)
-        .all()
+    query = defer_unselected_log(
+        db.select(game_log_model), game_log_model, selected_field_names(info)
     )
+    game_logs = db.session.scalars(
+        query.order_by(desc(game_log_model.game_end)).limit(10)
+    ).all()
+    request_loaders().prime_game_logs(game_logs)
+    return game_logs
 
 
 def recent_game_logs_field(
@@ -282,7 +492,7 @@ def recent_game_logs_field(
         GraphQLNonNull(GraphQLList(game_log_type)),
         description="List recent game logs.",
         args={},
-        resolve=lambda root, info, **args: fetch_recent_game_logs(game_log_model),
+        resolve=lambda root, info, **args: fetch_recent_game_logs(game_log_model, info),
     )
 
 
@@ -295,7 +505,7 @@ def user_recent_game_logs_resolver(user: UserModel, info, **args) -> list[GameLo
 
 
 def user_num_game_logs_resolver(user: UserModel, info, **args) -> int:
-    return user.num_game_logs
+    return request_loaders().user_num_game_logs.load(user.bga_id)
 
 
 def user_play_count_fields() -> dict[str, GraphQLField]:
@@ -330,11 +540,11 @@ def user_commonly_played_cards_resolver(user: UserModel, info, **args) -> list[d
 
 
 def user_current_elo_resolver(user: UserModel, info, **args) -> Optional[int]:
-    return user.current_elo()
+    return request_loaders().user_current_elo.load(user.bga_id)
 
 
 def user_current_arena_elo_resolver(user: UserModel, info, **args) -> Optional[int]:
-    return user.current_arena_elo()
+    return request_loaders().user_current_arena_elo.load(user.bga_id)
 
 
 def user_fields() -> dict[str, GraphQLField]:
@@ -418,20 +628,44 @@ def fetch_user_field(
     )
 
 
+def daily_submissions_fields() -> dict[str, GraphQLField]:
+    return {
+        "date": GraphQLField(
+            GraphQLNonNull(GraphQLString),
+            description="Day that the games were submitted on (UTC), formatted as YYYY-MM-DD.",
+        ),
+        "count": GraphQLField(
+            GraphQLNonNull(GraphQLInt),
+            description="Number of games submitted that day.",
+        ),
+    }
+
+
+daily_submissions_type = GraphQLObjectType(
+    "DailySubmissions",
+    description="The number of games submitted on a day.",
+    fields=daily_submissions_fields,
+)
+
+
 def stats_fields() -> dict[str, GraphQLField]:
     return {
         "numGameLogs": GraphQLField(
             GraphQLNonNull(GraphQLInt),
-            description="Number of game logs in the database.",
+            description="Number of game logs in the database. Approximate for large tables.",
         ),
         "numPlayers": GraphQLField(
             GraphQLNonNull(GraphQLInt),
-            description="Number of players in the database.",
+            description="Number of players in the database. Approximate for large tables.",
         ),
         "mostRecentSubmission": GraphQLField(
             GraphQLInt,
             description="UNIX timestamp for the most recently-submitted game in the database.",
         ),
+        "dailySubmissions": GraphQLField(
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(daily_submissions_type))),
+            description=f"Number of games submitted on each of the last {DAILY_SUBMISSION_DAYS} days, oldest first. Days without submissions are omitted.",
+        ),
     }
 
 
@@ -442,37 +676,31 @@ stats_type = GraphQLObjectType(
 )
 
 
-def fetch_stats(
-    game_log_model: Type[GameLogModel], user_model: Type[UserModel]
-) -> dict:
-    most_recent_submission = db.session.execute(
-        db.select(game_log_model).order_by(desc(game_log_model.created_at))
-    ).scalar_one_or_none()
-    if most_recent_submission is None:
+def fetch_stats() -> dict:
+    # Stats are cached for a short time, since they're requested on every home page view.
+    stats = stats_cache.get()
+    if stats.most_recent_submission is None:
         most_recent_time = None
     else:
-        most_recent_time = int(most_recent_submission.created_at.timestamp())
+        most_recent_time = int(stats.most_recent_submission.timestamp())
 
     return {
-        "numGameLogs": db.session.execute(
-            db.select(game_log_model).count()
-        ).scalar_one(),
-        "numPlayers": db.session.execute(
-            db.select(user_model).query.count()
-        ).scalar_one(),
+        "numGameLogs": stats.num_game_logs,
+        "numPlayers": stats.num_players,
         "mostRecentSubmission": most_recent_time,
+        "dailySubmissions": [
+            {"date": day.date.isoformat(), "count": day.count}
+            for day in stats.daily_submissions
+        ],
     }
 
 
-def stats_field(
-    game_log_model: Type[GameLogModel],
-    user_model: Type[UserModel],
-) -> GraphQLField:
+def stats_field() -> GraphQLField:
     return GraphQLField(
         GraphQLNonNull(stats_type),
         description="Fetch database statistics.",
         args={},
-        resolve=lambda root, info, **args: fetch_stats(game_log_model, user_model),
+        resolve=lambda root, info, **args: fetch_stats(),
     )
 
 
@@ -512,6 +740,30 @@ def game_log_archive_created_at_resolver(
     return int(round(game_log_archive.created_at.timestamp()))
 
 
+def game_log_archive_is_delta_resolver(
+    game_log_archive: GameLogArchiveModel, info, **args
+) -> bool:
+    return game_log_archive.is_delta
+
+
+def game_log_archive_base_archive_id_resolver(
+    game_log_archive: GameLogArchiveModel, info, **args
+) -> Optional[int]:
+    return game_log_archive.base_archive_id
+
+
+def game_log_archive_base_archive_resolver(
+    game_log_archive: GameLogArchiveModel, info, **args
+) -> Optional[GameLogArchiveModel]:
+    return game_log_archive.base_archive
+
+
+def game_log_archive_delta_archives_resolver(
+    game_log_archive: GameLogArchiveModel, info, **args
+) -> list[GameLogArchiveModel]:
+    return game_log_archive.delta_archives
+
+
 def game_log_archive_fields() -> dict[str, GraphQLField]:
     archive_types = set(t.name for t in GameLogArchiveType)
     return {
@@ -535,12 +787,12 @@ def game_log_archive_fields() -> dict[str, GraphQLField]:
         ),
         "numGameLogs": GraphQLField(
             GraphQLNonNull(GraphQLInt),
-            description=f"Number of game logs in this archive.",
+            description=f"Number of game logs in this archive. For a delta archive, this only counts the game logs added since the previous archive in its chain.",
             resolve=game_log_archive_num_game_logs_resolver,
         ),
         "numUsers": GraphQLField(
             GraphQLNonNull(GraphQLInt),
-            description=f"Number of users in this archive.",
+            description=f"Number of users in this archive. For a delta archive, this only counts the users in the delta's own game logs.",
             resolve=game_log_archive_num_users_resolver,
         ),
         "maxGameLog": GraphQLField(
@@ -553,6 +805,26 @@ def game_log_archive_fields() -> dict[str, GraphQLField]:
             description="UNIX timestamp for when this archive was created.",
             resolve=game_log_archive_created_at_resolver,
         ),
+        "isDelta": GraphQLField(
+            GraphQLNonNull(GraphQLBoolean),
+            description="Whether this archive only contains the game logs since the previous archive in its chain.",
+            resolve=game_log_archive_is_delta_resolver,
+        ),
+        "baseArchiveId": GraphQLField(
+            GraphQLInt,
+            description="ID of the full archive that this delta archive's chain starts at. Null for full archives.",
+            resolve=game_log_archive_base_archive_id_resolver,
+        ),
+        "baseArchive": GraphQLField(
+            game_log_archive_type,
+            description="The full archive that this delta archive's chain starts at. Null for full archives.",
+            resolve=game_log_archive_base_archive_resolver,
+        ),
+        "deltaArchives": GraphQLField(
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(game_log_archive_type))),
+            description="The delta archives in this full archive's chain, oldest first. Restoring every game log means downloading this archive & each delta in order.",
+            resolve=game_log_archive_delta_archives_resolver,
+        ),
     }
 
 
@@ -566,8 +838,10 @@ game_log_archive_type = GraphQLObjectType(
 def fetch_recent_game_log_archives(
     game_log_archive_model: Type[GameLogArchiveModel],
 ) -> Iterable[GameLogArchiveModel]:
+    # Deltas are partial, so only list full archives; their deltas hang off of them.
     return db.session.execute(
         db.select(game_log_archive_model)
+        .where(game_log_archive_model.base_archive_id == None)
         .order_by(desc(game_log_archive_model.created_at))
         .limit(10)
     ).scalars()
@@ -578,7 +852,7 @@ def recent_game_log_archives_field(
 ) -> GraphQLField:
     return GraphQLField(
         GraphQLNonNull(GraphQLList(game_log_archive_type)),
-        description="List recent game log archives.",
+        description="List recent full game log archives. Each one's deltas are in its deltaArchives.",
         args={},
         resolve=lambda root, info, **args: fetch_recent_game_log_archives(
             game_log_archive_model
@@ -645,7 +919,7 @@ def card_fields() -> dict[str, GraphQLField]:
         "recentUsers": GraphQLField(
             GraphQLNonNull(GraphQLList(user_type)),
             description="Players who played this in a recent game.",
-            resolve=card_recent_game_logs_resolver,
+            resolve=card_recent_users_resolver,
         ),
         "mostPlayedBy": GraphQLField(
             GraphQLNonNull(GraphQLList(user_play_count_type)),
@@ -715,8 +989,14 @@ def fetch_cards_field(
 
 def game_statistics_game_log_resolver(
     game_statistics: GameStatisticsModel, info, **args
-) -> GameLogModel:
-    return game_statistics.game_log
+) -> Optional[GameLogModel]:
+    return request_loaders().game_logs.load(game_statistics.bga_table_id)
+
+
+def game_statistics_user_resolver(
+    game_statistics: GameStatisticsModel, info, **args
+) -> Optional[UserModel]:
+    return request_loaders().users.load(game_statistics.bga_user_id)
 
 
 def game_statistics_bga_table_id_resolver(
@@ -737,364 +1017,23 @@ def game_statistics_created_at_resolver(
     return int(round(game_statistics.created_at.timestamp()))
 
 
-def game_statistics_thinking_time_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.thinking_time
-
-
-def game_statistics_starting_position_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.starting_position
-
-
-def game_statistics_breaks_triggered_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.breaks_triggered
-
-
-def game_statistics_triggered_end_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> bool:
-    return game_statistics.triggered_end
-
-
-def game_statistics_map_id_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.map_id
-
-
-def game_statistics_actions_build_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.actions_build
-
-
-def game_statistics_actions_animals_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.actions_animals
-
-
-def game_statistics_actions_cards_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.actions_cards
-
-
-def game_statistics_actions_association_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.actions_association
-
-
-def game_statistics_actions_sponsors_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.actions_sponsors
-
-
-def game_statistics_x_tokens_gained_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.x_tokens_gained
-
-
-def game_statistics_x_actions_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.x_actions
-
-
-def game_statistics_x_tokens_used_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.x_tokens_used
-
-
-def game_statistics_money_gained_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.money_gained
-
-
-def game_statistics_money_gained_through_income_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.money_gained_through_income
-
-
-def game_statistics_money_spent_on_animals_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.money_spent_on_animals
-
-
-def game_statistics_money_spent_on_enclosures_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.money_spent_on_enclosures
-
-
-def game_statistics_money_spent_on_donations_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.money_spent_on_donations
-
-
-def game_statistics_money_spent_on_playing_cards_from_reputation_range_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.money_spent_on_playing_cards_from_reputation_range
-
-
-def game_statistics_cards_drawn_from_deck_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.cards_drawn_from_deck
-
-
-def game_statistics_cards_drawn_from_reputation_range_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.cards_drawn_from_reputation_range
-
-
-def game_statistics_cards_snapped_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.cards_snapped
-
-
-def game_statistics_cards_discarded_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.cards_discarded
-
-
-def game_statistics_played_sponsors_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.played_sponsors
-
-
-def game_statistics_played_animals_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.played_animals
-
-
-def game_statistics_released_animals_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.released_animals
-
-
-def game_statistics_association_workers_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.association_workers
-
-
-def game_statistics_association_donations_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.association_donations
-
-
-def game_statistics_association_reputation_actions_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.association_reputation_actions
-
-
-def game_statistics_association_partner_zoo_actions_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.association_partner_zoo_actions
-
-
-def game_statistics_association_university_actions_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.association_university_actions
-
-
-def game_statistics_association_conservation_project_actions_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.association_conservation_project_actions
-
-
-def game_statistics_built_enclosures_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.built_enclosures
-
-
-def game_statistics_built_kiosks_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.built_kiosks
-
-
-def game_statistics_built_pavilions_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.built_pavilions
-
-
-def game_statistics_built_unique_buildings_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.built_unique_buildings
-
-
-def game_statistics_hexes_covered_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.hexes_covered
-
-
-def game_statistics_hexes_empty_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.hexes_empty
-
-
-def game_statistics_upgraded_action_cards_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.upgraded_action_cards
-
-
-def game_statistics_upgraded_animals_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> bool:
-    return game_statistics.upgraded_animals
-
-
-def game_statistics_upgraded_build_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> bool:
-    return game_statistics.upgraded_build
-
-
-def game_statistics_upgraded_cards_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> bool:
-    return game_statistics.upgraded_cards
-
-
-def game_statistics_upgraded_sponsors_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> bool:
-    return game_statistics.upgraded_sponsors
-
+def game_statistics_stat_resolver(name: str) -> Callable[..., Any]:
+    def resolve(game_statistics: GameStatisticsModel, info, **args) -> Any:
+        return getattr(game_statistics, name)
 
-def game_statistics_upgraded_association_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> bool:
-    return game_statistics.upgraded_association
+    return resolve
 
 
-def game_statistics_icons_africa_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_africa
-
-
-def game_statistics_icons_europe_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_europe
-
-
-def game_statistics_icons_asia_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_asia
-
-
-def game_statistics_icons_australia_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_australia
-
-
-def game_statistics_icons_americas_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_americas
-
-
-def game_statistics_icons_bird_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_bird
-
-
-def game_statistics_icons_predator_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_predator
-
-
-def game_statistics_icons_herbivore_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_herbivore
-
-
-def game_statistics_icons_bear_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_bear
-
-
-def game_statistics_icons_reptile_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_reptile
-
-
-def game_statistics_icons_primate_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_primate
-
-
-def game_statistics_icons_petting_zoo_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_petting_zoo
-
-
-def game_statistics_icons_sea_animal_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_sea_animal
-
-
-def game_statistics_icons_water_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_water
-
-
-def game_statistics_icons_rock_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_rock
-
-
-def game_statistics_icons_science_resolver(
-    game_statistics: GameStatisticsModel, info, **args
-) -> int:
-    return game_statistics.icons_science
+def game_statistics_stat_fields() -> dict[str, GraphQLField]:
+    return {
+        field.graphql_name: GraphQLField(
+            GraphQLNonNull(GraphQLBoolean if field.type is bool else GraphQLInt),
+            description=field.description,
+            resolve=game_statistics_stat_resolver(field.name),
+        )
+        for field in STAT_FIELDS
+        if field.description is not None
+    }
 
 
 def game_statistics_fields() -> dict[str, GraphQLField]:
@@ -1111,6 +1050,7 @@ def game_statistics_fields() -> dict[str, GraphQLField]:
         "user": GraphQLField(
             GraphQLNonNull(user_type),
             description="User that this rating change corresponds to.",
+            resolve=game_statistics_user_resolver,
         ),
         "bgaTableId": GraphQLField(
             GraphQLNonNull(GraphQLInt),
@@ -1127,314 +1067,7 @@ def game_statistics_fields() -> dict[str, GraphQLField]:
             description="When the statistics for this game log and user were recorded.",
             resolve=game_statistics_created_at_resolver,
         ),
-        "score": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="Player's score.",
-        ),
-        "rank": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="Player's final rank. The winner has rank 1.",
-        ),
-        "thinkingTime": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The thinking time, in seconds, for this game log and user.",
-            resolve=game_statistics_thinking_time_resolver,
-        ),
-        "startingPosition": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The starting position for this game log and user.",
-            resolve=game_statistics_starting_position_resolver,
-        ),
-        "breaksTriggered": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of breaks triggered by this user in this game.",
-            resolve=game_statistics_breaks_triggered_resolver,
-        ),
-        "triggeredEnd": GraphQLField(
-            GraphQLNonNull(GraphQLBoolean),
-            description="Whether the user in this game triggered the end of the game.",
-            resolve=game_statistics_triggered_end_resolver,
-        ),
-        "mapId": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The map ID for this game log and user.",
-            resolve=game_statistics_map_id_resolver,
-        ),
-        "actionsBuild": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of build actions for this game log and user.",
-            resolve=game_statistics_actions_build_resolver,
-        ),
-        "actionsAnimals": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of animals actions for this game log and user.",
-            resolve=game_statistics_actions_animals_resolver,
-        ),
-        "actionsCards": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of cards actions for this game log and user.",
-            resolve=game_statistics_actions_cards_resolver,
-        ),
-        "actionsAssociation": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association actions for this game log and user.",
-            resolve=game_statistics_actions_association_resolver,
-        ),
-        "actionsSponsors": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of sponsors actions for this game log and user.",
-            resolve=game_statistics_actions_sponsors_resolver,
-        ),
-        "xTokensGained": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of X tokens gained for this game log and user.",
-            resolve=game_statistics_x_tokens_gained_resolver,
-        ),
-        "xActions": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of X actions taken for this game log and user.",
-            resolve=game_statistics_x_actions_resolver,
-        ),
-        "xTokensUsed": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of X tokens used for this game log and user.",
-            resolve=game_statistics_x_tokens_used_resolver,
-        ),
-        "moneyGained": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The money gained for this game log and user.",
-            resolve=game_statistics_money_gained_resolver,
-        ),
-        "moneyGainedThroughIncome": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The money gained through income for this game log and user.",
-            resolve=game_statistics_money_gained_through_income_resolver,
-        ),
-        "moneySpentOnAnimals": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The money spent on animals for this game log and user.",
-            resolve=game_statistics_money_spent_on_animals_resolver,
-        ),
-        "moneySpentOnEnclosures": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The money spent on enclosures for this game log and user.",
-            resolve=game_statistics_money_spent_on_enclosures_resolver,
-        ),
-        "moneySpentOnDonations": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The money spent on donations for this game log and user.",
-            resolve=game_statistics_money_spent_on_donations_resolver,
-        ),
-        "moneySpentOnPlayingCardsFromReputationRange": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The money spent on playing cards from reputation range for this game log and user.",
-            resolve=game_statistics_money_spent_on_playing_cards_from_reputation_range_resolver,
-        ),
-        "cardsDrawnFromDeck": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of cards drawn from deck for this game log and user.",
-            resolve=game_statistics_cards_drawn_from_deck_resolver,
-        ),
-        "cardsDrawnFromReputationRange": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of cards drawn from reputation range for this game log and user.",
-            resolve=game_statistics_cards_drawn_from_reputation_range_resolver,
-        ),
-        "cardsSnapped": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of cards snapped for this game log and user.",
-            resolve=game_statistics_cards_snapped_resolver,
-        ),
-        "cardsDiscarded": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of cards discarded for this game log and user.",
-            resolve=game_statistics_cards_discarded_resolver,
-        ),
-        "playedSponsors": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of played sponsors for this game log and user.",
-            resolve=game_statistics_played_sponsors_resolver,
-        ),
-        "playedAnimals": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of played animals for this game log and user.",
-            resolve=game_statistics_played_animals_resolver,
-        ),
-        "releasedAnimals": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of released animals for this game log and user.",
-            resolve=game_statistics_released_animals_resolver,
-        ),
-        "associationWorkers": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association workers for this game log and user.",
-            resolve=game_statistics_association_workers_resolver,
-        ),
-        "associationDonations": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association donations for this game log and user.",
-            resolve=game_statistics_association_donations_resolver,
-        ),
-        "associationReputationActions": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association reputation actions for this game log and user.",
-            resolve=game_statistics_association_reputation_actions_resolver,
-        ),
-        "associationPartnerZooActions": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association partner zoo actions for this game log and user.",
-            resolve=game_statistics_association_partner_zoo_actions_resolver,
-        ),
-        "associationUniversityActions": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association university actions for this game log and user.",
-            resolve=game_statistics_association_university_actions_resolver,
-        ),
-        "associationConservationProjectActions": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of association conservation project actions for this game log and user.",
-            resolve=game_statistics_association_conservation_project_actions_resolver,
-        ),
-        "builtEnclosures": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of built enclosures for this game log and user.",
-            resolve=game_statistics_built_enclosures_resolver,
-        ),
-        "builtKiosks": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of built kiosks for this game log and user.",
-            resolve=game_statistics_built_kiosks_resolver,
-        ),
-        "builtPavilions": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of built pavilions for this game log and user.",
-            resolve=game_statistics_built_pavilions_resolver,
-        ),
-        "builtUniqueBuildings": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of built unique buildings for this game log and user.",
-            resolve=game_statistics_built_unique_buildings_resolver,
-        ),
-        "hexesCovered": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of covered map hexes for this game log and user.",
-            resolve=game_statistics_hexes_covered_resolver,
-        ),
-        "hexesEmpty": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of empty max hexes for this game log and user.",
-            resolve=game_statistics_hexes_empty_resolver,
-        ),
-        "upgradedActionCards": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of upgraded action cards for this game log and user.",
-            resolve=game_statistics_upgraded_action_cards_resolver,
-        ),
-        "upgradedAnimals": GraphQLField(
-            GraphQLNonNull(GraphQLBoolean),
-            description="Whether the user upgraded animals in this game.",
-            resolve=game_statistics_upgraded_animals_resolver,
-        ),
-        "upgradedBuild": GraphQLField(
-            GraphQLNonNull(GraphQLBoolean),
-            description="Whether the user upgraded build in this game.",
-            resolve=game_statistics_upgraded_build_resolver,
-        ),
-        "upgradedCards": GraphQLField(
-            GraphQLNonNull(GraphQLBoolean),
-            description="Whether the user upgraded cards in this game.",
-            resolve=game_statistics_upgraded_cards_resolver,
-        ),
-        "upgradedSponsors": GraphQLField(
-            GraphQLNonNull(GraphQLBoolean),
-            description="Whether the user upgraded sponsors in this game.",
-            resolve=game_statistics_upgraded_sponsors_resolver,
-        ),
-        "upgradedAssociation": GraphQLField(
-            GraphQLNonNull(GraphQLBoolean),
-            description="Whether the user upgraded association in this game.",
-            resolve=game_statistics_upgraded_association_resolver,
-        ),
-        "iconsAfrica": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of africa icons for this game log and user.",
-            resolve=game_statistics_icons_africa_resolver,
-        ),
-        "iconsEurope": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of europe icons for this game log and user.",
-            resolve=game_statistics_icons_europe_resolver,
-        ),
-        "iconsAsia": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of asia icons for this game log and user.",
-            resolve=game_statistics_icons_asia_resolver,
-        ),
-        "iconsAustralia": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of australia icons for this game log and user.",
-            resolve=game_statistics_icons_australia_resolver,
-        ),
-        "iconsAmericas": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of americas icons for this game log and user.",
-            resolve=game_statistics_icons_americas_resolver,
-        ),
-        "iconsBird": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of bird icons for this game log and user.",
-            resolve=game_statistics_icons_bird_resolver,
-        ),
-        "iconsPredator": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of predator icons for this game log and user.",
-            resolve=game_statistics_icons_predator_resolver,
-        ),
-        "iconsHerbivore": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of herbivore icons for this game log and user.",
-            resolve=game_statistics_icons_herbivore_resolver,
-        ),
-        "iconsBear": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of bear icons for this game log and user.",
-            resolve=game_statistics_icons_bear_resolver,
-        ),
-        "iconsReptile": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of reptile icons for this game log and user.",
-            resolve=game_statistics_icons_reptile_resolver,
-        ),
-        "iconsPrimate": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of primate icons for this game log and user.",
-            resolve=game_statistics_icons_primate_resolver,
-        ),
-        "iconsPettingZoo": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of petting_zoo icons for this game log and user.",
-            resolve=game_statistics_icons_petting_zoo_resolver,
-        ),
-        "iconsSeaAnimal": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of sea_animal icons for this game log and user.",
-            resolve=game_statistics_icons_sea_animal_resolver,
-        ),
-        "iconsWater": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of water icons for this game log and user.",
-            resolve=game_statistics_icons_water_resolver,
-        ),
-        "iconsRock": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of rock icons for this game log and user.",
-            resolve=game_statistics_icons_rock_resolver,
-        ),
-        "iconsScience": GraphQLField(
-            GraphQLNonNull(GraphQLInt),
-            description="The number of science icons for this game log and user.",
-            resolve=game_statistics_icons_science_resolver,
-        ),
+        **game_statistics_stat_fields(),
     }
 
 
@@ -1452,9 +1085,11 @@ def fetch_game_statistics(
     table_ids = [int(i) for i in args["bgaTableIds"]]
     query = query.where(game_statistics_model.bga_table_id.in_(table_ids))
 
-    return db.session.execute(
-        query.order_by(asc(game_statistics_model.bga_table_id)).all()
-    ).scalars()
+    game_statistics = db.session.scalars(
+        query.order_by(asc(game_statistics_model.bga_table_id))
+    ).all()
+    request_loaders().prime_game_statistics(game_statistics)
+    return game_statistics
 
 
 fetch_game_statistics_filters: dict[str, GraphQLArgument] = {
@@ -0,0 +1,71 @@
+import datetime
+import sys
+from typing import Iterator, Optional
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from ark_nova_stats.api.gql.types.game_log import (
+    game_logs_connection_page,
+    game_logs_connection_query,
+)
+from ark_nova_stats.models import Base, GameLog
+
+START = datetime.datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        # Several games end at the same time, so pages have to break ties by ID.
+        session.add_all(
+            GameLog(
+                id=id,
+                bga_table_id=1000 + id,
+                game_start=START,
+                game_end=START + datetime.timedelta(hours=id // 3),
+            )
+            for id in range(1, 11)
+        )
+        session.commit()
+        yield session
+
+
+def fetch_page(session: Session, first: int, after: Optional[str] = None) -> dict:
+    query = game_logs_connection_query(GameLog, {"after": after}, {"id"})
+    return game_logs_connection_page(
+        session.scalars(query.limit(first + 1)).all(), first
+    )
+
+
+def test_game_logs_connection_pages_through_every_game_once(session: Session):
+    seen: list[int] = []
+    after = None
+    while True:
+        page = fetch_page(session, 3, after)
+        seen.extend(edge["node"].id for edge in page["edges"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        after = page["pageInfo"]["endCursor"]
+
+    assert list(range(1, 11)) == seen
+
+
+def test_game_logs_connection_handles_empty_page(session: Session):
+    page = fetch_page(session, 0)
+
+    assert [] == page["edges"]
+    assert {"hasNextPage": True, "endCursor": None} == page["pageInfo"]
+
+
+def test_game_logs_connection_skips_games_without_end():
+    query = game_logs_connection_query(GameLog, {}, {"id"})
+
+    assert "game_logs.game_end IS NOT NULL" in str(query)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -9,19 +9,28 @@ from graphql import (
     GraphQLObjectType,
     GraphQLString,
 )
-from sqlalchemy import asc
+from sqlalchemy import asc, exists, select
 
+from ark_nova_stats.api.gql.loaders import request_loaders
 from ark_nova_stats.api.gql.types.game_log import game_log_type, user_type
 from ark_nova_stats.bga_log_parser.game_ratings import parse_ratings
 from ark_nova_stats.config import app, db
 from ark_nova_stats.models import GameLog as GameLogModel
 from ark_nova_stats.models import GameRating as GameRatingModel
+from ark_nova_stats.models import User as UserModel
+from ark_nova_stats.rollups import update_current_elos
 
 
 def game_rating_game_log_resolver(
     game_rating: GameRatingModel, info, **args
-) -> GameLogModel:
-    return game_rating.game_log
+) -> Optional[GameLogModel]:
+    return request_loaders().game_logs.load(game_rating.bga_table_id)
+
+
+def game_rating_user_resolver(
+    game_rating: GameRatingModel, info, **args
+) -> Optional[UserModel]:
+    return request_loaders().users.load(game_rating.user_id)
 
 
 def game_rating_prior_elo_resolver(
@@ -62,6 +71,7 @@ def game_rating_fields() -> dict[str, GraphQLField]:
         "user": GraphQLField(
             GraphQLNonNull(user_type),
             description="User that this rating change corresponds to.",
+            resolve=game_rating_user_resolver,
         ),
         "priorElo": GraphQLField(
             GraphQLInt,
@@ -138,19 +148,31 @@ def submit_game_ratings(
             ratings.append(rating)
         else:
             # Only try to create this if it doesn't already exist.
-            if (
-                db.session.execute(
-                    db.select(game_rating_model)
-                    .filter(game_rating_model.bga_table_id == table_id)
-                    .filter(game_rating_model.user_id == player_id)
-                    .count()
-                ).scalar_one()
-                == 0
+            if not db.session.scalar(
+                select(
+                    exists()
+                    .where(game_rating_model.bga_table_id == table_id)
+                    .where(game_rating_model.user_id == player_id)
+                )
             ):
                 db.session.add(rating)
                 ratings.append(rating)
 
     if app.config["TESTING"] != True:
+        game_end = db.session.scalar(
+            select(GameLogModel.game_end).where(GameLogModel.bga_table_id == table_id)
+        )
+        # If the game's log hasn't been submitted yet, these are rolled up once it is.
+        if game_end is not None:
+            update_current_elos(
+                {
+                    "user_id": rating.user_id,
+                    "new_elo": rating.new_elo,
+                    "new_arena_elo": rating.new_arena_elo,
+                    "game_end": game_end,
+                }
+                for rating in ratings
+            )
         db.session.commit()
 
     return ratings
@@ -183,9 +205,11 @@ def fetch_game_ratings(
     table_ids = [int(i) for i in args["bgaTableIds"]]
     query = query.where(game_rating_model.bga_table_id.in_(table_ids))
 
-    return db.session.execute(
-        query.order_by(asc(game_rating_model.bga_table_id)).all()
-    ).scalars()
+    game_ratings = db.session.scalars(
+        query.order_by(asc(game_rating_model.bga_table_id))
+    ).all()
+    request_loaders().prime_game_ratings(game_ratings)
+    return game_ratings
 
 
 fetch_game_ratings_filters: dict[str, GraphQLArgument] = {
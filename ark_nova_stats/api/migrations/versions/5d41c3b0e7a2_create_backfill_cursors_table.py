@@ -0,0 +1,43 @@
+"""create-backfill-cursors-table
+
+Revision ID: 5d41c3b0e7a2
+Revises: deca8621de11
+Create Date: 2026-10-18 14:02:11.318205
+
+"""
+
+from typing import Optional
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql.functions import now
+
+# revision identifiers, used by Alembic.
+revision = "5d41c3b0e7a2"
+down_revision = "deca8621de11"
+branch_labels: Optional[tuple[str]] = None
+depends_on: Optional[str] = None
+
+
+def upgrade():
+    op.create_table(
+        "backfill_cursors",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("name", sa.UnicodeText, nullable=False),
+        sa.Column("shard", sa.Integer, nullable=False),
+        sa.Column("num_shards", sa.Integer, nullable=False),
+        sa.Column("last_game_log_id", sa.Integer, nullable=False),
+        sa.Column("updated_at", sa.DateTime, default=now, nullable=False),
+    )
+
+    op.create_index(
+        "backfill_cursors_name_shard_num_shards",
+        "backfill_cursors",
+        ["name", "shard", "num_shards"],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index("backfill_cursors_name_shard_num_shards", "backfill_cursors")
+    op.drop_table("backfill_cursors")
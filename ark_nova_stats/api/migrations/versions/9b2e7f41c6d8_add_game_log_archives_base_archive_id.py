@@ -0,0 +1,41 @@
+"""add-game-log-archives-base-archive-id
+
+Revision ID: 9b2e7f41c6d8
+Revises: 5d41c3b0e7a2
+Create Date: 2026-10-18 16:40:27.504913
+
+"""
+
+from typing import Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b2e7f41c6d8"
+down_revision = "5d41c3b0e7a2"
+branch_labels: Optional[tuple[str]] = None
+depends_on: Optional[str] = None
+
+
+def upgrade():
+    op.add_column(
+        "game_log_archives",
+        sa.Column(
+            "base_archive_id",
+            sa.Integer,
+            sa.ForeignKey("game_log_archives.id"),
+            nullable=True,
+        ),
+    )
+
+    op.create_index(
+        "game_log_archives_base_archive_id",
+        "game_log_archives",
+        ["base_archive_id"],
+    )
+
+
+def downgrade():
+    op.drop_index("game_log_archives_base_archive_id", "game_log_archives")
+    op.drop_column("game_log_archives", "base_archive_id")
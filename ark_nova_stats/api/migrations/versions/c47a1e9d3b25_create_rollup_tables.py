@@ -0,0 +1,83 @@
+"""create-rollup-tables
+
+Revision ID: c47a1e9d3b25
+Revises: 9b2e7f41c6d8
+Create Date: 2026-10-18 18:12:54.207731
+
+"""
+
+from typing import Optional
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql.functions import now
+
+# revision identifiers, used by Alembic.
+revision = "c47a1e9d3b25"
+down_revision = "9b2e7f41c6d8"
+branch_labels: Optional[tuple[str]] = None
+depends_on: Optional[str] = None
+
+
+def upgrade():
+    op.create_table(
+        "user_stats",
+        sa.Column(
+            "user_id",
+            sa.Integer,
+            sa.ForeignKey("users.bga_id"),
+            primary_key=True,
+        ),
+        sa.Column("num_game_logs", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("current_elo", sa.Integer, nullable=True),
+        sa.Column("current_elo_game_end", sa.DateTime, nullable=True),
+        sa.Column("current_arena_elo", sa.Integer, nullable=True),
+        sa.Column("current_arena_elo_game_end", sa.DateTime, nullable=True),
+        sa.Column("updated_at", sa.DateTime, default=now, nullable=False),
+    )
+
+    op.create_table(
+        "user_card_play_counts",
+        sa.Column(
+            "user_id",
+            sa.Integer,
+            sa.ForeignKey("users.bga_id"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "card_id",
+            sa.Integer,
+            sa.ForeignKey("cards.id"),
+            primary_key=True,
+        ),
+        sa.Column("count", sa.Integer, nullable=False),
+        sa.Column("last_played_at", sa.DateTime, nullable=False),
+    )
+
+    # For cards' most frequent & most recent players.
+    op.create_index(
+        "user_card_play_counts_card_id_count",
+        "user_card_play_counts",
+        ["card_id", "count"],
+    )
+    op.create_index(
+        "user_card_play_counts_card_id_last_played_at",
+        "user_card_play_counts",
+        ["card_id", "last_played_at"],
+    )
+    # For users' most frequently-played cards.
+    op.create_index(
+        "user_card_play_counts_user_id_count",
+        "user_card_play_counts",
+        ["user_id", "count"],
+    )
+
+
+def downgrade():
+    op.drop_index("user_card_play_counts_user_id_count", "user_card_play_counts")
+    op.drop_index(
+        "user_card_play_counts_card_id_last_played_at", "user_card_play_counts"
+    )
+    op.drop_index("user_card_play_counts_card_id_count", "user_card_play_counts")
+    op.drop_table("user_card_play_counts")
+    op.drop_table("user_stats")
@@ -0,0 +1,30 @@
+"""add-game-logs-game-end-id-index
+
+Revision ID: e8d05a6b7c19
+Revises: c47a1e9d3b25
+Create Date: 2026-10-18 19:31:08.662140
+
+"""
+
+from typing import Optional
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e8d05a6b7c19"
+down_revision = "c47a1e9d3b25"
+branch_labels: Optional[tuple[str]] = None
+depends_on: Optional[str] = None
+
+
+def upgrade():
+    # Serves keyset pagination of game logs, which orders by (game_end, id).
+    op.create_index(
+        "game_logs_game_end_id",
+        "game_logs",
+        ["game_end", "id"],
+    )
+
+
+def downgrade():
+    op.drop_index("game_logs_game_end_id", "game_logs")
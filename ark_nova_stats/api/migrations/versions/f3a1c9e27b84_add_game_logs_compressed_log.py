@@ -0,0 +1,39 @@
+"""add-game-logs-compressed-log
+
+Revision ID: f3a1c9e27b84
+Revises: e8d05a6b7c19
+Create Date: 2026-10-18 20:12:44.381027
+
+"""
+
+from typing import Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3a1c9e27b84"
+down_revision = "e8d05a6b7c19"
+branch_labels: Optional[tuple[str]] = None
+depends_on: Optional[str] = None
+
+
+def upgrade():
+    op.add_column(
+        "game_logs",
+        sa.Column(
+            "compressed_log",
+            sa.LargeBinary,
+            nullable=True,
+        ),
+    )
+    # Compressed logs are already dense, so don't have Postgres try to compress them again.
+    op.execute("ALTER TABLE game_logs ALTER COLUMN compressed_log SET STORAGE EXTERNAL")
+    # Newly-submitted logs are only stored compressed.
+    op.alter_column("game_logs", "log", nullable=True)
+
+
+def downgrade():
+    # Fails if any logs are only stored compressed.
+    op.alter_column("game_logs", "log", nullable=False)
+    op.drop_column("game_logs", "compressed_log")
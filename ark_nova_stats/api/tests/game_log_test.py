@@ -45,5 +45,46 @@ def test_submit_game_logs(client: FlaskClient) -> None:
     ), f"game log was not expected value: {response.json}"
 
 
+def test_submit_many_game_logs(client: FlaskClient) -> None:
+    r = Runfiles.Create()
+    game_logs = []
+    for fixture in ["sample_game.log.json", "4p.log.json", "sample_game.log.json"]:
+        with open(
+            r.Rlocation(f"_main/ark_nova_stats/bga_log_parser/fixtures/{fixture}"),
+            "r",
+        ) as logfile:
+            game_logs.append(logfile.read().strip())
+
+    response = client.post(
+        "/graphql",
+        json={
+            "query": """
+                mutation($logs: [String!]!) {
+                    submitManyGameLogs(
+                        logs: $logs,
+                    ) {
+                        id
+                        bgaTableId
+                        log
+                    }
+                }
+            """,
+            "variables": {
+                "logs": game_logs,
+            },
+        },
+    )
+    assert response.json is not None
+    assert response.json.get(
+        "data", {}
+    ), f"data field not set on response json: {response.json}"
+    submitted = response.json["data"].get("submitManyGameLogs", [])
+
+    # Duplicate submissions of the same game are only stored once.
+    assert 2 == len(submitted), f"unexpected game logs returned: {submitted}"
+    assert [game_logs[0], game_logs[1]] == [s["log"] for s in submitted]
+    assert len(set(s["bgaTableId"] for s in submitted)) == 2
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
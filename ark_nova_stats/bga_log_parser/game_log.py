@@ -1,6 +1,11 @@
 import datetime
-from dataclasses import dataclass
-from typing import Any, Iterator, Optional
+import functools
+import json
+import marshal
+import sys
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
 from ark_nova_stats.bga_log_parser.exceptions import (
     MoveNotSetError,
@@ -8,29 +13,99 @@ from ark_nova_stats.bga_log_parser.exceptions import (
     PlayerNotFoundError,
     StatsNotSetError,
 )
-from ark_nova_stats.bga_log_parser.proto.game_pb2 import Game  # type: ignore
+from ark_nova_stats.bga_log_parser.proto.game_pb2 import (  # type: ignore
+    Game,
+    GameCard,
+    GameCardPlay,
+    GameEnd,
+    GameEndResult,
+    GameEvent,
+    GameEventData,
+    GameOpeningHand,
+    GamePlayer,
+    GameTie,
+)
 from ark_nova_stats.bga_log_parser.proto.stats_pb2 import (  # type: ignore
     PlayerStats,
     Stats,
 )
+from ark_nova_stats.bga_log_parser.stat_schema import parse_player_stats
 
 
-@dataclass
+@dataclass(slots=True)
 class GameLogEventDataCard:
     name: str
     id: str
 
 
-@dataclass
+class CompactArgs(Mapping[str, Any]):
+    """
+    An event's args, kept marshalled & only unmarshalled when a value is read.
+    Args make up most of a replay (especially the game state snapshots sent with every state change),
+    but consumers only read a few keys of a few events.
+    The top-level keys are kept unmarshalled, so checking for a key is free.
+    """
+
+    __slots__ = ("data", "_keys")
+
+    def __init__(self, args: dict[str, Any]):
+        self.data = marshal.dumps(args)
+        # json.loads already shares one copy of each key across a replay.
+        self._keys = tuple(args)
+
+    def decode(self) -> dict[str, Any]:
+        return marshal.loads(self.data)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return self.decode()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactArgs):
+            return self.decode() == other.decode()
+        if isinstance(other, Mapping):
+            return self.decode() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactArgs({self.decode()!r})"
+
+
+@dataclass(slots=True)
 class GameLogEventData:
     uid: str
     type: str
     log: str
-    args: dict
+    args: Mapping[str, Any]
     lock_uuid: Optional[str] = None
     synchro: Optional[int] = None
     h: Optional[str] = None
 
+    # Derived values are computed on first access, since consumers tend to ask for them repeatedly.
+    # Each is wrapped in a 1-tuple so that a computed value of None can be told apart from "not yet computed".
+    _is_play_action: Optional[tuple[bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _played_card_names: Optional[tuple[Optional[set[str]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _played_cards: Optional[tuple[Optional[list[GameLogEventDataCard]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _player: Optional[tuple[Optional[dict[str, int | str | None]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     PLAY_LOGS = [
         "plays",
         "plays a new conservation project",
@@ -38,8 +113,20 @@ class GameLogEventData:
         "buys",
     ]
 
+    def __post_init__(self):
+        # Event types & log templates repeat across every replay, so share one copy of each.
+        self.type = sys.intern(self.type)
+        self.log = sys.intern(self.log)
+        if isinstance(self.args, dict):
+            self.args = CompactArgs(self.args)
+
     @property
     def is_play_action(self) -> bool:
+        if self._is_play_action is None:
+            self._is_play_action = (self._compute_is_play_action(),)
+        return self._is_play_action[0]
+
+    def _compute_is_play_action(self) -> bool:
         if "card_name" not in self.args and "cards" not in self.args:
             return False
 
@@ -47,6 +134,11 @@ class GameLogEventData:
 
     @property
     def played_card_names(self) -> Optional[set[str]]:
+        if self._played_card_names is None:
+            self._played_card_names = (self._compute_played_card_names(),)
+        return self._played_card_names[0]
+
+    def _compute_played_card_names(self) -> Optional[set[str]]:
         card_names = set()
         if "card_name" in self.args:
             card_names.add(self.args["card_name"])
@@ -62,6 +154,11 @@ class GameLogEventData:
 
     @property
     def played_cards(self) -> Optional[list[GameLogEventDataCard]]:
+        if self._played_cards is None:
+            self._played_cards = (self._compute_played_cards(),)
+        return self._played_cards[0]
+
+    def _compute_played_cards(self) -> Optional[list[GameLogEventDataCard]]:
         cards = []
         if "card_name" in self.args:
             cards = [
@@ -86,6 +183,11 @@ class GameLogEventData:
 
     @property
     def player(self) -> Optional[dict[str, int | str | None]]:
+        if self._player is None:
+            self._player = (self._compute_player(),)
+        return self._player[0]
+
+    def _compute_player(self) -> Optional[dict[str, int | str | None]]:
         player_data = {
             "id": self.args.get("player_id", None),
             "name": self.args.get("player_name", None),
@@ -97,7 +199,7 @@ class GameLogEventData:
         return player_data
 
 
-@dataclass
+@dataclass(slots=True)
 class GameLogEvent:
     channel: str
     table_id: int
@@ -108,6 +210,8 @@ class GameLogEvent:
     move_id: Optional[int] = None
 
     def __post_init__(self):
+        self.channel = sys.intern(self.channel)
+        self.packet_type = sys.intern(self.packet_type)
         self.table_id = int(self.table_id)
         if self.move_id is not None:
             self.move_id = int(self.move_id)
@@ -115,7 +219,7 @@ class GameLogEvent:
         self.data = [GameLogEventData(**x) for x in self.data]  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class GameLogPlayer:
     id: int
     color: str
@@ -123,13 +227,207 @@ class GameLogPlayer:
     avatar: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GameLogCardPlay:
     card: GameLogEventDataCard
     player: GameLogPlayer
     move: int
 
 
+# How many events from the start of a replay to search for Ark Nova-specific actions.
+ARK_NOVA_DETECTION_EVENTS = 20
+
+# How many events from the end of a replay to search for the game's result & stats.
+END_OF_GAME_EVENTS = 10
+
+
+def is_ark_nova_opening(head: Iterable[GameLogEvent]) -> bool:
+    # Check to see if there's a scoring card draw in the first few actions.
+    return any(
+        "from the deck (scoring cards)" in data.log for log in head for data in log.data
+    )
+
+
+def parse_opening_hands(
+    logs: Iterable[GameLogEvent],
+) -> dict[int, list[GameLogEventDataCard]]:
+    # Look in the first few events, up to the first discard event.
+    hands = {}
+    for log in logs:
+        if any(d.type == "pDiscardCards" for d in log.data):
+            break
+
+        for d in log.data:
+            if is_opening_draw(d):
+                hands[int(d.args["player_id"])] = opening_draw_cards(d)
+
+    return hands
+
+
+def is_opening_draw(d: GameLogEventData) -> bool:
+    return d.type == "pDrawCards" and "cards" in d.args and len(d.args["cards"]) == 8
+
+
+def opening_draw_cards(d: GameLogEventData) -> list[GameLogEventDataCard]:
+    return [
+        GameLogEventDataCard(
+            id=d.args["card_names"]["args"][f"card_name_{i}"]["args"]["card_id"],
+            name=d.args["card_names"]["args"][f"card_name_{i}"]["args"]["card_name"],
+        )
+        for i in range(8)
+    ]
+
+
+def find_victory_event(tail: Iterable[GameLogEvent]) -> Optional[GameLogEventData]:
+    # Look at the last few moves.
+    for move in tail:
+        for e in move.data:
+            if e.type == "simpleNode" and "wins" in e.log:
+                return e
+
+    return None
+
+
+def is_tie_ending(tail: Iterable[GameLogEvent]) -> bool:
+    # Look at the last few moves.
+    return any(
+        e.type == "simpleNode" and "End of game (tie)" in e.log
+        for move in tail
+        for e in move.data
+    )
+
+
+def find_stats_result(tail: Iterable[GameLogEvent]) -> Optional[list[dict[str, Any]]]:
+    # The stats are in a log that's close to the end.
+    # It doesn't get deterministically emitted in any given position,
+    # so we search for it.
+    for l in tail:
+        for e in l.data:
+            if (
+                e.args
+                and "args" in e.args
+                and isinstance(e.args["args"], dict)
+                and "result" in e.args["args"]
+            ):
+                return e.args["args"]["result"]
+
+    return None
+
+
+def card_plays_from_events(
+    logs: Iterable[GameLogEvent], players_by_id: dict[int, GameLogPlayer]
+) -> Iterator[GameLogCardPlay]:
+    for log in logs:
+        for d in log.data:
+            if not d.is_play_action or d.played_cards is None:
+                continue
+
+            for c in d.played_cards:
+                if log.move_id is None:
+                    raise MoveNotSetError()
+
+                if d.player is None:
+                    raise PlayerNotFoundError()
+
+                player = players_by_id.get(d.player["id"])  # type: ignore
+                if player is None:
+                    raise PlayerNotFoundError()
+
+                yield GameLogCardPlay(
+                    card=c,
+                    move=log.move_id,
+                    player=player,
+                )
+
+
+@dataclass
+class GameLogSummary:
+    """
+    Everything that consumers commonly need to know about a game,
+    computed in a single pass over its events.
+    """
+
+    players: list[GameLogPlayer]
+    players_by_id: dict[int, GameLogPlayer]
+    players_by_name: dict[str, GameLogPlayer]
+    # Names of the cards played by each player, keyed by player ID.
+    card_names_by_player: dict[int, set[str]]
+    opening_hands: dict[int, list[GameLogEventDataCard]]
+    winner: Optional[GameLogPlayer]
+    is_tie: bool
+    play_events: list[GameLogEvent] = field(repr=False)
+    # The first card play that we couldn't attribute to a player, if any.
+    unattributed_play: Optional[GameLogEventData] = field(default=None, repr=False)
+
+    @functools.cached_property
+    def card_plays(self) -> list[GameLogCardPlay]:
+        return list(card_plays_from_events(self.play_events, self.players_by_id))
+
+
+class GameLogSummaryBuilder:
+    """
+    Accumulates a GameLogSummary from a replay's events, fed in order.
+    Only the events the summary needs are retained.
+    """
+
+    def __init__(self) -> None:
+        self.opening_events: list[GameLogEvent] = []
+        self.opening_done = False
+        self.card_names_by_player: defaultdict[int, set[str]] = defaultdict(set)
+        self.play_events: list[GameLogEvent] = []
+        self.unattributed_play: Optional[GameLogEventData] = None
+        self.tail: deque[GameLogEvent] = deque(maxlen=END_OF_GAME_EVENTS)
+
+    def add_event(self, event: GameLogEvent) -> None:
+        if not self.opening_done:
+            if any(d.type == "pDiscardCards" for d in event.data):
+                self.opening_done = True
+            elif any(is_opening_draw(d) for d in event.data):
+                self.opening_events.append(event)
+
+        is_play_event = False
+        for d in event.data:
+            if not d.is_play_action:
+                continue
+
+            is_play_event = True
+            card_names = d.played_card_names
+            if card_names is None or d.player is None:
+                continue
+
+            if d.player["id"] is None:
+                if self.unattributed_play is None:
+                    self.unattributed_play = d
+                continue
+
+            self.card_names_by_player[int(d.player["id"])].update(card_names)
+
+        if is_play_event:
+            self.play_events.append(event)
+
+        self.tail.append(event)
+
+    def build(self, players: list[GameLogPlayer]) -> GameLogSummary:
+        players_by_name = {p.name: p for p in players}
+
+        winner = None
+        victory_event = find_victory_event(self.tail)
+        if victory_event is not None:
+            winner = players_by_name.get(victory_event.args["player_name"])
+
+        return GameLogSummary(
+            players=players,
+            players_by_id={p.id: p for p in players},
+            players_by_name=players_by_name,
+            card_names_by_player=dict(self.card_names_by_player),
+            opening_hands=parse_opening_hands(self.opening_events),
+            winner=winner,
+            is_tie=is_tie_ending(self.tail),
+            play_events=self.play_events,
+            unattributed_play=self.unattributed_play,
+        )
+
+
 @dataclass
 class GameLogData:
     logs: list[GameLogEvent]
@@ -147,68 +445,55 @@ class GameLogData:
         So we have to lossily infer this from what's in the data.
         """
 
-        # Check to see if there's a scoring card draw in the first few actions.
-        if not any(
-            "from the deck (scoring cards)" in data.log
-            for log in self.logs[:20]
-            for data in log.data
-        ):
+        if not is_ark_nova_opening(self.logs[:ARK_NOVA_DETECTION_EVENTS]):
             raise NonArkNovaReplayError()
 
+    @functools.cached_property
+    def summary(self) -> GameLogSummary:
+        builder = GameLogSummaryBuilder()
+        for log in self.logs:
+            builder.add_event(log)
+
+        return builder.build(self.players)
+
     @property
     def card_plays(self) -> Iterator[GameLogCardPlay]:
-        for log in self.logs:
-            for d in log.data:
-                if not d.is_play_action or d.played_cards is None:
-                    continue
+        return iter(self.summary.card_plays)
+
+    @property
+    def opening_hands(self) -> dict[int, list[GameLogEventDataCard]]:
+        return self.summary.opening_hands
 
-                for c in d.played_cards:
-                    if log.move_id is None:
-                        raise MoveNotSetError()
 
-                    if d.player is None:
-                        raise PlayerNotFoundError()
+def game_event_data_proto(d: GameLogEventData) -> GameEventData:
+    return GameEventData(
+        uid=d.uid,
+        type=d.type,
+        log=d.log,
+        args_json=json.dumps(
+            d.args.decode() if isinstance(d.args, CompactArgs) else d.args,
+            separators=(",", ":"),
+        ),
+        lock_uuid=d.lock_uuid,
+        synchro=d.synchro,
+        h=d.h,
+    )
 
-                    find_player = [p for p in self.players if p.id == d.player["id"]]
-                    if not find_player:
-                        raise PlayerNotFoundError()
 
-                    yield GameLogCardPlay(
-                        card=c,
-                        move=log.move_id,
-                        player=find_player[0],
-                    )
+def game_event_proto(event: GameLogEvent) -> GameEvent:
+    return GameEvent(
+        channel=event.channel,
+        table_id=event.table_id,
+        packet_id=event.packet_id,
+        packet_type=event.packet_type,
+        time=event.time,
+        move_id=event.move_id,
+        data=[game_event_data_proto(d) for d in event.data],
+    )
 
-    @property
-    def opening_hands(self) -> dict[int, list[GameLogEventDataCard]]:
-        # Look in the first few events, up to the first discard event.
-        hands = {}
-        for log in self.logs:
-            if any(d.type == "pDiscardCards" for d in log.data):
-                break
-
-            for d in log.data:
-                if (
-                    d.type == "pDrawCards"
-                    and "cards" in d.args
-                    and len(d.args["cards"]) == 8
-                ):
-                    # This is an opening draw action.
-                    player_id = int(d.args["player_id"])
-                    cards = [
-                        GameLogEventDataCard(
-                            id=d.args["card_names"]["args"][f"card_name_{i}"]["args"][
-                                "card_id"
-                            ],
-                            name=d.args["card_names"]["args"][f"card_name_{i}"]["args"][
-                                "card_name"
-                            ],
-                        )
-                        for i in range(8)
-                    ]
-                    hands[player_id] = cards
 
-        return hands
+def game_card_proto(card: GameLogEventDataCard) -> GameCard:
+    return GameCard(id=card.id, name=card.name)
 
 
 @dataclass
@@ -218,10 +503,54 @@ class GameLog:
 
     def __post_init__(self):
         self.data = GameLogData(**self.data)  # type: ignore
-        # TODO: populate this from self.data.
-        self.game = Game()
         self.stats = self.parse_game_stats()
 
+    @functools.cached_property
+    def game(self) -> Game:
+        """
+        This game as a Game proto: its players, events, card plays, opening hands, stats & result.
+        """
+        summary = self.summary
+        game = Game(
+            table_id=self.table_id,
+            status=self.status,
+            player_ids=[player.id for player in self.data.players],
+            players=[
+                GamePlayer(
+                    id=player.id,
+                    color=player.color,
+                    name=player.name,
+                    avatar=player.avatar,
+                )
+                for player in self.data.players
+            ],
+            events=[game_event_proto(event) for event in self.data.logs],
+            card_plays=[
+                GameCardPlay(
+                    card=game_card_proto(play.card),
+                    player_id=play.player.id,
+                    move=play.move,
+                )
+                for play in summary.card_plays
+            ],
+            opening_hands=[
+                GameOpeningHand(
+                    player_id=player_id,
+                    cards=[game_card_proto(card) for card in cards],
+                )
+                for player_id, cards in summary.opening_hands.items()
+            ],
+            stats=self.stats,
+        )
+        if summary.is_tie:
+            game.tie.CopyFrom(GameTie())
+        elif summary.winner is not None:
+            game.end.CopyFrom(
+                GameEnd(result=GameEndResult(rank=1, player_id=summary.winner.id))
+            )
+
+        return game
+
     @property
     def table_id(self) -> Optional[int]:
         if not self.data.logs:
@@ -230,145 +559,31 @@ class GameLog:
         return self.data.logs[0].table_id
 
     @property
-    def winner(self) -> Optional[GameLogPlayer]:
-        if not self.data.logs:
-            return None
-
-        # Look at the last few moves.
-        victory_event = None
-        for move in self.data.logs[-10:]:
-            for e in move.data:
-                if e.type == "simpleNode" and "wins" in e.log:
-                    victory_event = e
-                    break
-
-            if victory_event is not None:
-                break
-
-        if victory_event is None:
-            return None
+    def summary(self) -> GameLogSummary:
+        return self.data.summary
 
-        return next(
-            p for p in self.data.players if p.name == victory_event.args["player_name"]
-        )
+    @property
+    def winner(self) -> Optional[GameLogPlayer]:
+        return self.summary.winner
 
     @property
     def is_tie(self) -> bool:
-        if not self.data.logs:
-            return False
-
-        # Look at the last few moves.
-        return any(
-            e.type == "simpleNode" and "End of game (tie)" in e.log
-            for move in self.data.logs[-10:]
-            for e in move.data
-        )
+        return self.summary.is_tie
 
     def parse_player_stats(self, stats: dict[str, Any]) -> PlayerStats:
-        # The int keys here come from BGA's own format in replays;
-        # I expect these to change / break over time as BGA changes its own format.
-        # TODO: look into .get() instead; maybe we can set these to optional to make it more resilient?
-        return PlayerStats(
-            player_id=int(stats["player"]),
-            score=int(stats["score"]),
-            rank=int(stats["rank"]),
-            thinking_time=int(stats["stats"]["1"]),
-            starting_position=int(stats["stats"]["11"]),
-            turns=int(stats["stats"]["12"]),
-            breaks_triggered=int(stats["stats"]["13"]),
-            triggered_end=bool(int(stats["stats"]["14"])),
-            map_id=int(stats["stats"]["15"]),
-            appeal=int(stats["stats"]["16"]),
-            conservation=int(stats["stats"]["17"]),
-            reputation=int(stats["stats"]["19"]),
-            actions_build=int(stats["stats"]["20"]),
-            actions_animals=int(stats["stats"]["21"]),
-            actions_cards=int(stats["stats"]["22"]),
-            actions_association=int(stats["stats"]["23"]),
-            actions_sponsors=int(stats["stats"]["24"]),
-            x_tokens_gained=int(stats["stats"]["25"]),
-            x_actions=int(stats["stats"]["26"]),
-            x_tokens_used=int(stats["stats"]["27"]),
-            money_gained=int(stats["stats"]["30"]),
-            money_gained_through_income=int(stats["stats"]["31"]),
-            money_spent_on_animals=int(stats["stats"]["32"]),
-            money_spent_on_enclosures=int(stats["stats"]["33"]),
-            money_spent_on_donations=int(stats["stats"]["34"]),
-            money_spent_on_playing_cards_from_reputation_range=int(
-                stats["stats"]["35"]
-            ),
-            cards_drawn_from_deck=int(stats["stats"]["40"]),
-            cards_drawn_from_reputation_range=int(stats["stats"]["41"]),
-            cards_snapped=int(stats["stats"]["42"]),
-            cards_discarded=int(stats["stats"]["43"]),
-            played_sponsors=int(stats["stats"]["44"]),
-            played_animals=int(stats["stats"]["45"]),
-            released_animals=int(stats["stats"]["46"]),
-            association_workers=int(stats["stats"]["50"]),
-            association_donations=int(stats["stats"]["51"]),
-            association_reputation_actions=int(stats["stats"]["52"]),
-            association_partner_zoo_actions=int(stats["stats"]["53"]),
-            association_university_actions=int(stats["stats"]["54"]),
-            association_conservation_project_actions=int(stats["stats"]["55"]),
-            built_enclosures=int(stats["stats"]["60"]),
-            built_kiosks=int(stats["stats"]["61"]),
-            built_pavilions=int(stats["stats"]["62"]),
-            built_unique_buildings=int(stats["stats"]["63"]),
-            hexes_covered=int(stats["stats"]["64"]),
-            hexes_empty=int(stats["stats"]["65"]),
-            upgraded_action_cards=int(stats["stats"]["70"]),
-            upgraded_animals=bool(int(stats["stats"]["71"])),
-            upgraded_build=bool(int(stats["stats"]["72"])),
-            upgraded_cards=bool(int(stats["stats"]["73"])),
-            upgraded_sponsors=bool(int(stats["stats"]["74"])),
-            upgraded_association=bool(int(stats["stats"]["75"])),
-            icons_africa=int(stats["stats"]["76"]),
-            icons_europe=int(stats["stats"]["77"]),
-            icons_asia=int(stats["stats"]["78"]),
-            icons_australia=int(stats["stats"]["79"]),
-            icons_americas=int(stats["stats"]["80"]),
-            icons_bird=int(stats["stats"]["81"]),
-            icons_predator=int(stats["stats"]["82"]),
-            icons_herbivore=int(stats["stats"]["83"]),
-            icons_bear=int(stats["stats"]["84"]),
-            icons_reptile=int(stats["stats"]["85"]),
-            icons_primate=int(stats["stats"]["86"]),
-            icons_petting_zoo=int(stats["stats"]["97"]),
-            icons_sea_animal=int(stats["stats"]["91"]),
-            icons_water=int(stats["stats"]["88"]),
-            icons_rock=int(stats["stats"]["89"]),
-            icons_science=int(stats["stats"]["90"]),
-        )
+        return parse_player_stats(stats)
 
     def parse_game_stats(self) -> Stats:
         # Player stats are in last event.
         if not self.data.logs:
             raise StatsNotSetError()
 
-        # The stats are in a log that's close to the end.
-        # It doesn't get deterministically emitted in any given position,
-        # so we search for it.
-        stats = None
-        for l in self.data.logs[-10:]:
-            for e in l.data:
-                if (
-                    e.args
-                    and "args" in e.args
-                    and isinstance(e.args["args"], dict)
-                    and "result" in e.args["args"]
-                ):
-                    stats = e.args["args"]["result"]
-                    break
-            if stats is not None:
-                break
-
+        stats = find_stats_result(self.data.logs[-END_OF_GAME_EVENTS:])
         if stats is None:
             raise StatsNotSetError()
 
         return Stats(
-            player_stats=[
-                self.parse_player_stats(player_stats) for player_stats in stats
-            ]
+            player_stats=[parse_player_stats(player_stats) for player_stats in stats]
         )
 
     @property
@@ -1,5 +1,6 @@
 import datetime
 import json
+import pickle
 import sys
 from pathlib import Path
 
@@ -7,7 +8,11 @@ import pytest
 from python.runfiles import Runfiles  # type: ignore
 
 from ark_nova_stats.bga_log_parser.exceptions import NonArkNovaReplayError
-from ark_nova_stats.bga_log_parser.game_log import GameLog, GameLogEventData
+from ark_nova_stats.bga_log_parser.game_log import (
+    CompactArgs,
+    GameLog,
+    GameLogEventData,
+)
 
 
 def load_data_from_fixture_file(filename: str) -> dict:
@@ -227,6 +232,54 @@ class TestGameLog:
         )
 
 
+class TestGame:
+    def test_populates_game(self):
+        x = GameLog(**load_data_from_fixture_file("sample_game.log.json"))
+        game = x.game
+        assert 537650395 == game.table_id
+        assert [91196162, 86346298] == list(game.player_ids)
+        assert "Baboude" == game.players[0].name
+        assert len(x.data.logs) == len(game.events)
+        assert len(x.summary.card_plays) == len(game.card_plays)
+        assert len(x.summary.opening_hands) == len(game.opening_hands)
+        assert x.stats == game.stats
+        assert 86346298 == game.end.result.player_id
+
+    def test_populates_tie(self):
+        x = GameLog(**load_data_from_fixture_file("tie.log.json"))
+        assert "tie" == x.game.WhichOneof("result")
+
+
+class TestGameLogSummary:
+    def test_is_computed_once(self):
+        x = GameLog(**load_data_from_fixture_file("4p.log.json"))
+        assert x.summary is x.summary
+
+    def test_indexes_players(self):
+        x = GameLog(**load_data_from_fixture_file("sample_game.log.json"))
+        summary = x.summary
+        assert 2 == len(summary.players)
+        assert "Baboude" == summary.players_by_id[91196162].name
+        assert 86346298 == summary.players_by_name["sorryimlikethis"].id
+        assert summary.winner is not None
+        assert "sorryimlikethis" == summary.winner.name
+        assert not summary.is_tie
+
+    def test_card_names_by_player_match_card_plays(self):
+        x = GameLog(**load_data_from_fixture_file("sample_game.log.json"))
+        summary = x.summary
+        from_plays: dict[int, set[str]] = {}
+        for play in summary.card_plays:
+            from_plays.setdefault(play.player.id, set()).add(play.card.name)
+
+        assert from_plays == summary.card_names_by_player
+
+    def test_detects_tie(self):
+        x = GameLog(**load_data_from_fixture_file("tie.log.json"))
+        assert x.summary.is_tie
+        assert x.summary.winner is None
+
+
 class TestGameLogData:
     def test_card_plays_for_4p_game(self):
         game_log = load_data_from_fixture_file("4p.log.json")
@@ -475,6 +528,38 @@ class TestGameLogEventData:
         assert cards[0].id == "P114_ReleaseYosemite"
         assert cards[0].name == "Yosemite national park"
 
+    def test_derived_values_are_computed_once(self):
+        play_log = load_data_from_fixture_file("play_event.log.json")
+        x = GameLogEventData(**play_log)
+        assert x.played_cards is x.played_cards
+        assert x.played_card_names is x.played_card_names
+        assert x.player is x.player
+
+    def test_is_compact(self):
+        play_log = load_data_from_fixture_file("play_event.log.json")
+        x = GameLogEventData(**play_log)
+        assert not hasattr(x, "__dict__")
+
+    def test_round_trips_through_pickle_with_cached_values(self):
+        play_log = load_data_from_fixture_file("non_play_event.log.json")
+        x = GameLogEventData(**play_log)
+        assert x.played_cards is None
+
+        unpickled = pickle.loads(pickle.dumps(x))
+        assert x == unpickled
+        assert unpickled.played_cards is None
+        assert not unpickled.is_play_action
+
+    def test_args_are_kept_compact(self):
+        play_log = load_data_from_fixture_file("play_event.log.json")
+        x = GameLogEventData(**play_log)
+        assert isinstance(x.args, CompactArgs)
+        assert play_log["args"] == x.args
+        assert list(play_log["args"]) == list(x.args)
+        assert "card_name" in x.args
+        assert play_log["args"]["card_name"] == x.args["card_name"]
+        assert x.args.get("missing") is None
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/action.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ark_nova_stats.bga_log_parser.proto import animals_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_animals__pb2
+from ark_nova_stats.bga_log_parser.proto import associate_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_associate__pb2
+from ark_nova_stats.bga_log_parser.proto import build_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_build__pb2
+from ark_nova_stats.bga_log_parser.proto import cards_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_cards__pb2
+from ark_nova_stats.bga_log_parser.proto import sponsors_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_sponsors__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0ark_nova_stats/bga_log_parser/proto/action.proto\x12#ark_nova_stats.bga_log_parser.proto\x1a\x31\x61rk_nova_stats/bga_log_parser/proto/animals.proto\x1a\x33\x61rk_nova_stats/bga_log_parser/proto/associate.proto\x1a/ark_nova_stats/bga_log_parser/proto/build.proto\x1a/ark_nova_stats/bga_log_parser/proto/cards.proto\x1a\x32\x61rk_nova_stats/bga_log_parser/proto/sponsors.proto\"\t\n\x07XAction\"\x1b\n\x08SellCard\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\"[\n\x0b\x45xtraAction\x12\x42\n\tsell_card\x18\x01 \x01(\x0b\x32-.ark_nova_stats.bga_log_parser.proto.SellCardH\x00\x42\x08\n\x06\x61\x63tion\"\xb1\x04\n\x06\x41\x63tion\x12\x11\n\tbreak_num\x18\x01 \x01(\x05\x12\x11\n\tplayer_id\x18\x02 \x01(\x03\x12\x10\n\x08strength\x18\x03 \x01(\x05\x12\x39\n\x01x\x18\x04 \x01(\x0b\x32,.ark_nova_stats.bga_log_parser.proto.XActionH\x00\x12\x45\n\x07\x61nimals\x18\x05 \x01(\x0b\x32\x32.ark_nova_stats.bga_log_parser.proto.AnimalsActionH\x00\x12\x41\n\x05\x62uild\x18\x06 \x01(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.BuildActionH\x00\x12G\n\x08sponsors\x18\x07 \x01(\x0b\x32\x33.ark_nova_stats.bga_log_parser.proto.SponsorsActionH\x00\x12K\n\tassociate\x18\x08 \x01(\x0b\x32\x36.ark_nova_stats.bga_log_parser.proto.AssociationActionH\x00\x12\x41\n\x05\x63\x61rds\x18\t \x01(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.CardsActionH\x00\x12G\n\rextra_actions\x18\n \x03(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.ExtraActionB\x08\n\x06\x61\x63tionb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.action_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _XACTION._serialized_start=343
+  _XACTION._serialized_end=352
+  _SELLCARD._serialized_start=354
+  _SELLCARD._serialized_end=381
+  _EXTRAACTION._serialized_start=383
+  _EXTRAACTION._serialized_end=474
+  _ACTION._serialized_start=477
+  _ACTION._serialized_end=1038
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/animals.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ark_nova_stats.bga_log_parser.proto import build_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_build__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1ark_nova_stats/bga_log_parser/proto/animals.proto\x12#ark_nova_stats.bga_log_parser.proto\x1a/ark_nova_stats/bga_log_parser/proto/build.proto\"c\n\nPlayAnimal\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\x12\x44\n\tenclosure\x18\x02 \x01(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.PlayBuilding\"Q\n\rAnimalsAction\x12@\n\x07\x61nimals\x18\x01 \x03(\x0b\x32/.ark_nova_stats.bga_log_parser.proto.PlayAnimalb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.animals_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _PLAYANIMAL._serialized_start=139
+  _PLAYANIMAL._serialized_end=238
+  _ANIMALSACTION._serialized_start=240
+  _ANIMALSACTION._serialized_end=321
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/associate.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ark_nova_stats.bga_log_parser.proto import build_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_build__pb2
+from ark_nova_stats.bga_log_parser.proto import cards_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_cards__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n3ark_nova_stats/bga_log_parser/proto/associate.proto\x12#ark_nova_stats.bga_log_parser.proto\x1a/ark_nova_stats/bga_log_parser/proto/build.proto\x1a/ark_nova_stats/bga_log_parser/proto/cards.proto\"\x15\n\x13\x41ssociateReputation\"[\n\x13\x41ssociatePartnerZoo\x12\x44\n\x0bpartner_zoo\x18\x01 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.PartnerZoo\"Z\n\x13\x41ssociateUniversity\x12\x43\n\nuniversity\x18\x01 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.University\"\r\n\x0b\x45xtraWorker\"b\n\x12ThreeSizeEnclosure\x12L\n\x0b\x63oordinates\x18\x03 \x03(\x0b\x32\x37.ark_nova_stats.bga_log_parser.proto.BuildingCoordinate\"\x0f\n\rTwoReputation\"\x0b\n\tFiveMoney\"\n\n\x08TenMoney\"\x08\n\x06ThreeX\"I\n\tDrawThree\x12<\n\x05\x64raws\x18\x01 \x03(\x0b\x32-.ark_nova_stats.bga_log_parser.proto.DrawCard\"U\n\x12TimesTwoMultiplier\x12?\n\x06\x61\x63tion\x18\x01 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.ActionCard\"%\n\x12\x42uySponsorFromHand\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\"\xc9\x07\n\x17\x43onservationTrackReward\x12\x16\n\x0etrack_position\x18\x01 \x01(\x05\x12I\n\x0eupgrade_action\x18\x02 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.ActionCardH\x00\x12H\n\x0c\x65xtra_worker\x18\x03 \x01(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.ExtraWorkerH\x00\x12\x45\n\nuniversity\x18\x04 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.UniversityH\x00\x12\x46\n\x0bpartner_zoo\x18\x05 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.PartnerZooH\x00\x12W\n\x14three_size_enclosure\x18\x06 \x01(\x0b\x32\x37.ark_nova_stats.bga_log_parser.proto.ThreeSizeEnclosureH\x00\x12L\n\x0etwo_reputation\x18\x07 \x01(\x0b\x32\x32.ark_nova_stats.bga_log_parser.proto.TwoReputationH\x00\x12\x44\n\nfive_money\x18\x08 \x01(\x0b\x32..ark_nova_stats.bga_log_parser.proto.FiveMoneyH\x00\x12\x42\n\tten_money\x18\t \x01(\x0b\x32-.ark_nova_stats.bga_log_parser.proto.TenMoneyH\x00\x12>\n\x07three_x\x18\n \x01(\x0b\x32+.ark_nova_stats.bga_log_parser.proto.ThreeXH\x00\x12\x44\n\ndraw_three\x18\x0b \x01(\x0b\x32..ark_nova_stats.bga_log_parser.proto.DrawThreeH\x00\x12W\n\x14times_two_multiplier\x18\x0c \x01(\x0b\x32\x37.ark_nova_stats.bga_log_parser.proto.TimesTwoMultiplierH\x00\x12X\n\x15\x62uy_sponsor_from_hand\x18\r \x01(\x0b\x32\x37.ark_nova_stats.bga_log_parser.proto.BuySponsorFromHandH\x00\x42\x08\n\x06reward\"\xef\x02\n\x1c\x41ssociateConservationProject\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\x12\x10\n\x08strength\x18\x02 \x01(\x05\x12`\n\x0fone_time_reward\x18\x03 \x01(\x0e\x32\x45.ark_nova_stats.bga_log_parser.proto.ConservationProjectOneTimeRewardH\x00\x12\x63\n\x10recurring_reward\x18\x04 \x01(\x0e\x32G.ark_nova_stats.bga_log_parser.proto.ConservationProjectRecurringRewardH\x00\x12S\n\rtrack_rewards\x18\x05 \x03(\x0b\x32<.ark_nova_stats.bga_log_parser.proto.ConservationTrackRewardB\x10\n\x0eproject_reward\"\x85\x03\n\x14\x41ssociationSubAction\x12\x0f\n\x07workers\x18\x01 \x01(\x05\x12N\n\nreputation\x18\x02 \x01(\x0b\x32\x38.ark_nova_stats.bga_log_parser.proto.AssociateReputationH\x00\x12O\n\x0bpartner_zoo\x18\x03 \x01(\x0b\x32\x38.ark_nova_stats.bga_log_parser.proto.AssociatePartnerZooH\x00\x12N\n\nuniversity\x18\x04 \x01(\x0b\x32\x38.ark_nova_stats.bga_log_parser.proto.AssociateUniversityH\x00\x12\x61\n\x14\x63onservation_project\x18\x05 \x01(\x0b\x32\x41.ark_nova_stats.bga_log_parser.proto.AssociateConservationProjectH\x00\x42\x08\n\x06\x61\x63tion\"a\n\x11\x41ssociationAction\x12L\n\tsubaction\x18\x01 \x03(\x0b\x32\x39.ark_nova_stats.bga_log_parser.proto.AssociationSubAction*\xa0\x01\n\nPartnerZoo\x12\x17\n\x13PARTNER_ZOO_UNKNOWN\x10\x00\x12\x16\n\x12PARTNER_ZOO_AFRICA\x10\x01\x12\x18\n\x14PARTNER_ZOO_AMERICAS\x10\x02\x12\x14\n\x10PARTNER_ZOO_ASIA\x10\x03\x12\x19\n\x15PARTNER_ZOO_AUSTRALIA\x10\x04\x12\x16\n\x12PARTNER_ZOO_EUROPE\x10\x05*\x8c\x01\n\nUniversity\x12\x16\n\x12UNIVERSITY_UNKNOWN\x10\x00\x12\x1a\n\x16UNIVERSITY_TWO_SCIENCE\x10\x01\x12%\n!UNIVERSITY_SCIENCE_TWO_REPUTATION\x10\x02\x12#\n\x1fUNIVERSITY_REPUTATION_HAND_SIZE\x10\x03*\xe1\x03\n\"ConservationProjectRecurringReward\x12\x31\n-CONSERVATION_PROJECT_RECURRING_REWARD_UNKNOWN\x10\x00\x12\x32\n.CONSERVATION_PROJECT_RECURRING_REWARD_SNAPPING\x10\x01\x12\x38\n4CONSERVATION_PROJECT_RECURRING_REWARD_BUILD_TWO_SIZE\x10\x02\x12\x35\n1CONSERVATION_PROJECT_RECURRING_REWARD_FIVE_INCOME\x10\x03\x12\x35\n1CONSERVATION_PROJECT_RECURRING_REWARD_TWO_CLEVERS\x10\x04\x12\x33\n/CONSERVATION_PROJECT_RECURRING_REWARD_TWO_POUCH\x10\x05\x12@\n<CONSERVATION_PROJECT_RECURRING_REWARD_ONE_CONSERVATION_POINT\x10\x06\x12\x35\n1CONSERVATION_PROJECT_RECURRING_REWARD_BUY_SPONSOR\x10\x07*\x93\x05\n ConservationProjectOneTimeReward\x12\x30\n,CONSERVATION_PROJECT_ONE_TIME_REWARD_UNKNOWN\x10\x00\x12;\n7CONSERVATION_PROJECT_ONE_TIME_REWARD_ASSOCIATION_WORKER\x10\x01\x12\x35\n1CONSERVATION_PROJECT_ONE_TIME_REWARD_TWELVE_MONEY\x10\x02\x12\x30\n,CONSERVATION_PROJECT_ONE_TIME_REWARD_THREE_X\x10\x03\x12\x33\n/CONSERVATION_PROJECT_ONE_TIME_REWARD_UNIVERSITY\x10\x04\x12=\n9CONSERVATION_PROJECT_ONE_TIME_REWARD_AVIARY_REPTILE_HOUSE\x10\x05\x12\x36\n2CONSERVATION_PROJECT_ONE_TIME_REWARD_DETERMINATION\x10\x06\x12\x37\n3CONSERVATION_PROJECT_ONE_TIME_REWARD_TWO_REPUTATION\x10\x07\x12?\n;CONSERVATION_PROJECT_ONE_TIME_REWARD_ONE_CONSERVATION_POINT\x10\x08\x12\x34\n0CONSERVATION_PROJECT_ONE_TIME_REWARD_PARTNER_ZOO\x10\t\x12;\n7CONSERVATION_PROJECT_ONE_TIME_REWARD_GEOGRAPHICAL_BONUS\x10\n*\xa3\x01\n\nActionCard\x12\x17\n\x13\x41\x43TION_CARD_UNKNOWN\x10\x00\x12\x17\n\x13\x41\x43TION_CARD_ANIMALS\x10\x01\x12\x1b\n\x17\x41\x43TION_CARD_ASSOCIATION\x10\x02\x12\x15\n\x11\x41\x43TION_CARD_BUILD\x10\x03\x12\x15\n\x11\x41\x43TION_CARD_CARDS\x10\x04\x12\x18\n\x14\x41\x43TION_CARD_SPONSORS\x10\x05\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.associate_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _PARTNERZOO._serialized_start=2600
+  _PARTNERZOO._serialized_end=2760
+  _UNIVERSITY._serialized_start=2763
+  _UNIVERSITY._serialized_end=2903
+  _CONSERVATIONPROJECTRECURRINGREWARD._serialized_start=2906
+  _CONSERVATIONPROJECTRECURRINGREWARD._serialized_end=3387
+  _CONSERVATIONPROJECTONETIMEREWARD._serialized_start=3390
+  _CONSERVATIONPROJECTONETIMEREWARD._serialized_end=4049
+  _ACTIONCARD._serialized_start=4052
+  _ACTIONCARD._serialized_end=4215
+  _ASSOCIATEREPUTATION._serialized_start=190
+  _ASSOCIATEREPUTATION._serialized_end=211
+  _ASSOCIATEPARTNERZOO._serialized_start=213
+  _ASSOCIATEPARTNERZOO._serialized_end=304
+  _ASSOCIATEUNIVERSITY._serialized_start=306
+  _ASSOCIATEUNIVERSITY._serialized_end=396
+  _EXTRAWORKER._serialized_start=398
+  _EXTRAWORKER._serialized_end=411
+  _THREESIZEENCLOSURE._serialized_start=413
+  _THREESIZEENCLOSURE._serialized_end=511
+  _TWOREPUTATION._serialized_start=513
+  _TWOREPUTATION._serialized_end=528
+  _FIVEMONEY._serialized_start=530
+  _FIVEMONEY._serialized_end=541
+  _TENMONEY._serialized_start=543
+  _TENMONEY._serialized_end=553
+  _THREEX._serialized_start=555
+  _THREEX._serialized_end=563
+  _DRAWTHREE._serialized_start=565
+  _DRAWTHREE._serialized_end=638
+  _TIMESTWOMULTIPLIER._serialized_start=640
+  _TIMESTWOMULTIPLIER._serialized_end=725
+  _BUYSPONSORFROMHAND._serialized_start=727
+  _BUYSPONSORFROMHAND._serialized_end=764
+  _CONSERVATIONTRACKREWARD._serialized_start=767
+  _CONSERVATIONTRACKREWARD._serialized_end=1736
+  _ASSOCIATECONSERVATIONPROJECT._serialized_start=1739
+  _ASSOCIATECONSERVATIONPROJECT._serialized_end=2106
+  _ASSOCIATIONSUBACTION._serialized_start=2109
+  _ASSOCIATIONSUBACTION._serialized_end=2498
+  _ASSOCIATIONACTION._serialized_start=2500
+  _ASSOCIATIONACTION._serialized_end=2597
+# @@protoc_insertion_point(module_scope)
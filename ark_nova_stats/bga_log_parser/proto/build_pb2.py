@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/build.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/ark_nova_stats/bga_log_parser/proto/build.proto\x12#ark_nova_stats.bga_log_parser.proto\"*\n\x12\x42uildingCoordinate\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\"\xab\x01\n\x0cPlayBuilding\x12\x0c\n\x04size\x18\x01 \x01(\x05\x12?\n\x04type\x18\x02 \x01(\x0e\x32\x31.ark_nova_stats.bga_log_parser.proto.BuildingType\x12L\n\x0b\x63oordinates\x18\x03 \x03(\x0b\x32\x37.ark_nova_stats.bga_log_parser.proto.BuildingCoordinate\"P\n\x0b\x42uildAction\x12\x41\n\x06\x62uilds\x18\x02 \x03(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.PlayBuilding*\xb6\x01\n\x0c\x42uildingType\x12\x19\n\x15\x42UILDING_TYPE_UNKNOWN\x10\x00\x12\x1a\n\x16\x42UILDING_TYPE_PAVILION\x10\x01\x12\x17\n\x13\x42UILDING_TYPE_KIOSK\x10\x02\x12\x1b\n\x17\x42UILDING_TYPE_ENCLOSURE\x10\x03\x12\x1f\n\x1b\x42UILDING_TYPE_REPTILE_HOUSE\x10\x04\x12\x18\n\x14\x42UILDING_TYPE_AVIARY\x10\x05\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.build_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _BUILDINGTYPE._serialized_start=389
+  _BUILDINGTYPE._serialized_end=571
+  _BUILDINGCOORDINATE._serialized_start=88
+  _BUILDINGCOORDINATE._serialized_end=130
+  _PLAYBUILDING._serialized_start=133
+  _PLAYBUILDING._serialized_end=304
+  _BUILDACTION._serialized_start=306
+  _BUILDACTION._serialized_end=386
+# @@protoc_insertion_point(module_scope)
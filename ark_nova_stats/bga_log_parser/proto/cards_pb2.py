@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/cards.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/ark_nova_stats/bga_log_parser/proto/cards.proto\x12#ark_nova_stats.bga_log_parser.proto\"\x12\n\x10\x44rawCardFromDeck\"@\n\x13\x44rawCardFromDisplay\x12\x18\n\x10\x64isplay_position\x18\x01 \x01(\x05\x12\x0f\n\x07\x63\x61rd_id\x18\x02 \x01(\x05\"\xb2\x01\n\x08\x44rawCard\x12J\n\tdeck_draw\x18\x01 \x01(\x0b\x32\x35.ark_nova_stats.bga_log_parser.proto.DrawCardFromDeckH\x00\x12P\n\x0c\x64isplay_draw\x18\x02 \x01(\x0b\x32\x38.ark_nova_stats.bga_log_parser.proto.DrawCardFromDisplayH\x00\x42\x08\n\x06\x61\x63tion\"\x1e\n\x0b\x44iscardCard\x12\x0f\n\x07\x63\x61rd_id\x18\x03 \x01(\x05\"\x8f\x01\n\x0b\x43\x61rdsAction\x12<\n\x05\x64raws\x18\x01 \x03(\x0b\x32-.ark_nova_stats.bga_log_parser.proto.DrawCard\x12\x42\n\x08\x64iscards\x18\x02 \x03(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.DiscardCardb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.cards_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _DRAWCARDFROMDECK._serialized_start=88
+  _DRAWCARDFROMDECK._serialized_end=106
+  _DRAWCARDFROMDISPLAY._serialized_start=108
+  _DRAWCARDFROMDISPLAY._serialized_end=172
+  _DRAWCARD._serialized_start=175
+  _DRAWCARD._serialized_end=353
+  _DISCARDCARD._serialized_start=355
+  _DISCARDCARD._serialized_end=385
+  _CARDSACTION._serialized_start=388
+  _CARDSACTION._serialized_end=531
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/game.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ark_nova_stats.bga_log_parser.proto import action_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_action__pb2
+from ark_nova_stats.bga_log_parser.proto import stats_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_stats__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.ark_nova_stats/bga_log_parser/proto/game.proto\x12#ark_nova_stats.bga_log_parser.proto\x1a\x30\x61rk_nova_stats/bga_log_parser/proto/action.proto\x1a/ark_nova_stats/bga_log_parser/proto/stats.proto\"E\n\x05Round\x12<\n\x07\x61\x63tions\x18\x01 \x03(\x0b\x32+.ark_nova_stats.bga_log_parser.proto.Action\"\r\n\x0bGameAbandon\"\t\n\x07GameTie\"0\n\rGameEndResult\x12\x0c\n\x04rank\x18\x01 \x01(\x05\x12\x11\n\tplayer_id\x18\x02 \x01(\x03\"M\n\x07GameEnd\x12\x42\n\x06result\x18\x01 \x01(\x0b\x32\x32.ark_nova_stats.bga_log_parser.proto.GameEndResult\"E\n\nGamePlayer\x12\n\n\x02id\x18\x01 \x01(\x03\x12\r\n\x05\x63olor\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0e\n\x06\x61vatar\x18\x04 \x01(\t\"$\n\x08GameCard\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"l\n\x0cGameCardPlay\x12;\n\x04\x63\x61rd\x18\x01 \x01(\x0b\x32-.ark_nova_stats.bga_log_parser.proto.GameCard\x12\x11\n\tplayer_id\x18\x02 \x01(\x03\x12\x0c\n\x04move\x18\x03 \x01(\x05\"b\n\x0fGameOpeningHand\x12\x11\n\tplayer_id\x18\x01 \x01(\x03\x12<\n\x05\x63\x61rds\x18\x02 \x03(\x0b\x32-.ark_nova_stats.bga_log_parser.proto.GameCard\"\xa8\x01\n\rGameEventData\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0b\n\x03log\x18\x03 \x01(\t\x12\x11\n\targs_json\x18\x04 \x01(\t\x12\x16\n\tlock_uuid\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07synchro\x18\x06 \x01(\x05H\x01\x88\x01\x01\x12\x0e\n\x01h\x18\x07 \x01(\tH\x02\x88\x01\x01\x42\x0c\n\n_lock_uuidB\n\n\x08_synchroB\x04\n\x02_h\"\xc8\x01\n\tGameEvent\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x10\n\x08table_id\x18\x02 \x01(\x03\x12\x11\n\tpacket_id\x18\x03 \x01(\t\x12\x13\n\x0bpacket_type\x18\x04 \x01(\t\x12\x0c\n\x04time\x18\x05 \x01(\x03\x12\x14\n\x07move_id\x18\x06 \x01(\x03H\x00\x88\x01\x01\x12@\n\x04\x64\x61ta\x18\x07 \x03(\x0b\x32\x32.ark_nova_stats.bga_log_parser.proto.GameEventDataB\n\n\x08_move_id\"\x92\x05\n\x04Game\x12\x10\n\x08table_id\x18\x01 \x01(\x03\x12\x43\n\x07\x61\x62\x61ndon\x18\x02 \x01(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.GameAbandonH\x00\x12;\n\x03tie\x18\x03 \x01(\x0b\x32,.ark_nova_stats.bga_log_parser.proto.GameTieH\x00\x12;\n\x03\x65nd\x18\x04 \x01(\x0b\x32,.ark_nova_stats.bga_log_parser.proto.GameEndH\x00\x12\x12\n\nplayer_ids\x18\x05 \x03(\x03\x12:\n\x06rounds\x18\x06 \x03(\x0b\x32*.ark_nova_stats.bga_log_parser.proto.Round\x12\x0e\n\x06status\x18\x07 \x01(\x05\x12@\n\x07players\x18\x08 \x03(\x0b\x32/.ark_nova_stats.bga_log_parser.proto.GamePlayer\x12>\n\x06\x65vents\x18\t \x03(\x0b\x32..ark_nova_stats.bga_log_parser.proto.GameEvent\x12\x45\n\ncard_plays\x18\n \x03(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.GameCardPlay\x12K\n\ropening_hands\x18\x0b \x03(\x0b\x32\x34.ark_nova_stats.bga_log_parser.proto.GameOpeningHand\x12\x39\n\x05stats\x18\x0c \x01(\x0b\x32*.ark_nova_stats.bga_log_parser.proto.StatsB\x08\n\x06resultb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.game_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _ROUND._serialized_start=186
+  _ROUND._serialized_end=255
+  _GAMEABANDON._serialized_start=257
+  _GAMEABANDON._serialized_end=270
+  _GAMETIE._serialized_start=272
+  _GAMETIE._serialized_end=281
+  _GAMEENDRESULT._serialized_start=283
+  _GAMEENDRESULT._serialized_end=331
+  _GAMEEND._serialized_start=333
+  _GAMEEND._serialized_end=410
+  _GAMEPLAYER._serialized_start=412
+  _GAMEPLAYER._serialized_end=481
+  _GAMECARD._serialized_start=483
+  _GAMECARD._serialized_end=519
+  _GAMECARDPLAY._serialized_start=521
+  _GAMECARDPLAY._serialized_end=629
+  _GAMEOPENINGHAND._serialized_start=631
+  _GAMEOPENINGHAND._serialized_end=729
+  _GAMEEVENTDATA._serialized_start=732
+  _GAMEEVENTDATA._serialized_end=900
+  _GAMEEVENT._serialized_start=903
+  _GAMEEVENT._serialized_end=1103
+  _GAME._serialized_start=1106
+  _GAME._serialized_end=1764
+# @@protoc_insertion_point(module_scope)
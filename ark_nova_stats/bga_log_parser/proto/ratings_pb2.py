@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/ratings.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1ark_nova_stats/bga_log_parser/proto/ratings.proto\x12#ark_nova_stats.bga_log_parser.proto\"u\n\x0cPlayerResult\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04rank\x18\x03 \x01(\x05\x12\r\n\x05score\x18\x04 \x01(\x05\x12\x11\n\tscore_aux\x18\x05 \x01(\x05\x12\x0e\n\x06zombie\x18\x06 \x01(\t\x12\x0b\n\x03tie\x18\x07 \x01(\t\"c\n\x11PlayerArenaRating\x12\x14\n\x0c\x61rena_rating\x18\x01 \x01(\x02\x12\x0e\n\x06league\x18\x02 \x01(\x05\x12\x15\n\rleague_points\x18\x03 \x01(\x05\x12\x11\n\tarena_elo\x18\x04 \x01(\x03\"\x8b\x01\n\x13PlayerCurrentRating\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0b\n\x03\x65lo\x18\x02 \x01(\x02\x12\x45\n\x05\x61rena\x18\x03 \x01(\x0b\x32\x36.ark_nova_stats.bga_log_parser.proto.PlayerArenaRating\x12\x14\n\x0cgames_played\x18\x04 \x01(\x03\"P\n\x18PlayerEloGlobalModifiers\x12\x10\n\x08p_factor\x18\x01 \x01(\x03\x12\x10\n\x08n_factor\x18\x02 \x01(\x03\x12\x10\n\x08\x65_factor\x18\x03 \x01(\x02\"w\n\rPlayerEloDuel\x12\x17\n\x0f\x65xpected_result\x18\x01 \x01(\x02\x12\x13\n\x0b\x64uel_result\x18\x02 \x01(\x02\x12\x10\n\x08k_factor\x18\x03 \x01(\x02\x12\x11\n\telo_delta\x18\x04 \x01(\x02\x12\x13\n\x0bopponent_id\x18\x05 \x01(\x03\"\xb8\x03\n\x15PlayerEloRatingUpdate\x12\x11\n\tplayer_id\x18\x01 \x01(\x03\x12W\n\x10global_modifiers\x18\x02 \x01(\x0b\x32=.ark_nova_stats.bga_log_parser.proto.PlayerEloGlobalModifiers\x12T\n\x05\x64uels\x18\x03 \x03(\x0b\x32\x45.ark_nova_stats.bga_log_parser.proto.PlayerEloRatingUpdate.DuelsEntry\x12\x15\n\rtot_elo_delta\x18\x04 \x01(\x02\x12\x15\n\ravg_elo_delta\x18\x05 \x01(\x02\x12\x16\n\x0ereal_elo_delta\x18\x06 \x01(\x02\x12\x1d\n\x15\x65lo_delta_adjust_desc\x18\x07 \x01(\t\x12\x16\n\x0enew_elo_rating\x18\x08 \x01(\x02\x1a`\n\nDuelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12\x41\n\x05value\x18\x02 \x01(\x0b\x32\x32.ark_nova_stats.bga_log_parser.proto.PlayerEloDuel:\x02\x38\x01\"\xfd\x01\n\x17PlayerArenaRatingUpdate\x12\x11\n\tplayer_id\x18\x01 \x01(\x03\x12\x1f\n\x17\x61vg_league_points_delta\x18\x02 \x01(\x03\x12 \n\x18real_league_points_delta\x18\x03 \x01(\x03\x12\x1b\n\x13promotion_to_league\x18\x04 \x01(\x05\x12\x1b\n\x13\x61vg_arena_elo_delta\x18\x05 \x01(\x02\x12\x1c\n\x14real_arena_elo_delta\x18\x06 \x01(\x03\x12\x1a\n\x12\x61rena_rating_delta\x18\x07 \x01(\x02\x12\x18\n\x10new_arena_rating\x18\x08 \x01(\x02\"\xb0\x07\n\x0fGameRatingsData\x12\x61\n\x0fplayers_results\x18\x01 \x03(\x0b\x32H.ark_nova_stats.bga_log_parser.proto.GameRatingsData.PlayersResultsEntry\x12p\n\x17players_current_ratings\x18\x02 \x03(\x0b\x32O.ark_nova_stats.bga_log_parser.proto.GameRatingsData.PlayersCurrentRatingsEntry\x12s\n\x19players_elo_rating_update\x18\x03 \x03(\x0b\x32P.ark_nova_stats.bga_log_parser.proto.GameRatingsData.PlayersEloRatingUpdateEntry\x12w\n\x1bplayers_arena_rating_update\x18\x04 \x03(\x0b\x32R.ark_nova_stats.bga_log_parser.proto.GameRatingsData.PlayersArenaRatingUpdateEntry\x1ah\n\x13PlayersResultsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12@\n\x05value\x18\x02 \x01(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.PlayerResult:\x02\x38\x01\x1av\n\x1aPlayersCurrentRatingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12G\n\x05value\x18\x02 \x01(\x0b\x32\x38.ark_nova_stats.bga_log_parser.proto.PlayerCurrentRating:\x02\x38\x01\x1ay\n\x1bPlayersEloRatingUpdateEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12I\n\x05value\x18\x02 \x01(\x0b\x32:.ark_nova_stats.bga_log_parser.proto.PlayerEloRatingUpdate:\x02\x38\x01\x1a}\n\x1dPlayersArenaRatingUpdateEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12K\n\x05value\x18\x02 \x01(\x0b\x32<.ark_nova_stats.bga_log_parser.proto.PlayerArenaRatingUpdate:\x02\x38\x01\"\x92\x01\n\x0bGameRatings\x12?\n\x06status\x18\x01 \x01(\x0e\x32/.ark_nova_stats.bga_log_parser.proto.GameStatus\x12\x42\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x34.ark_nova_stats.bga_log_parser.proto.GameRatingsData*?\n\nGameStatus\x12\x17\n\x13GAME_STATUS_UNKNOWN\x10\x00\x12\x18\n\x14GAME_STATUS_FINISHED\x10\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.ratings_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _PLAYERELORATINGUPDATE_DUELSENTRY._options = None
+  _PLAYERELORATINGUPDATE_DUELSENTRY._serialized_options = b'8\001'
+  _GAMERATINGSDATA_PLAYERSRESULTSENTRY._options = None
+  _GAMERATINGSDATA_PLAYERSRESULTSENTRY._serialized_options = b'8\001'
+  _GAMERATINGSDATA_PLAYERSCURRENTRATINGSENTRY._options = None
+  _GAMERATINGSDATA_PLAYERSCURRENTRATINGSENTRY._serialized_options = b'8\001'
+  _GAMERATINGSDATA_PLAYERSELORATINGUPDATEENTRY._options = None
+  _GAMERATINGSDATA_PLAYERSELORATINGUPDATEENTRY._serialized_options = b'8\001'
+  _GAMERATINGSDATA_PLAYERSARENARATINGUPDATEENTRY._options = None
+  _GAMERATINGSDATA_PLAYERSARENARATINGUPDATEENTRY._serialized_options = b'8\001'
+  _GAMESTATUS._serialized_start=2450
+  _GAMESTATUS._serialized_end=2513
+  _PLAYERRESULT._serialized_start=90
+  _PLAYERRESULT._serialized_end=207
+  _PLAYERARENARATING._serialized_start=209
+  _PLAYERARENARATING._serialized_end=308
+  _PLAYERCURRENTRATING._serialized_start=311
+  _PLAYERCURRENTRATING._serialized_end=450
+  _PLAYERELOGLOBALMODIFIERS._serialized_start=452
+  _PLAYERELOGLOBALMODIFIERS._serialized_end=532
+  _PLAYERELODUEL._serialized_start=534
+  _PLAYERELODUEL._serialized_end=653
+  _PLAYERELORATINGUPDATE._serialized_start=656
+  _PLAYERELORATINGUPDATE._serialized_end=1096
+  _PLAYERELORATINGUPDATE_DUELSENTRY._serialized_start=1000
+  _PLAYERELORATINGUPDATE_DUELSENTRY._serialized_end=1096
+  _PLAYERARENARATINGUPDATE._serialized_start=1099
+  _PLAYERARENARATINGUPDATE._serialized_end=1352
+  _GAMERATINGSDATA._serialized_start=1355
+  _GAMERATINGSDATA._serialized_end=2299
+  _GAMERATINGSDATA_PLAYERSRESULTSENTRY._serialized_start=1825
+  _GAMERATINGSDATA_PLAYERSRESULTSENTRY._serialized_end=1929
+  _GAMERATINGSDATA_PLAYERSCURRENTRATINGSENTRY._serialized_start=1931
+  _GAMERATINGSDATA_PLAYERSCURRENTRATINGSENTRY._serialized_end=2049
+  _GAMERATINGSDATA_PLAYERSELORATINGUPDATEENTRY._serialized_start=2051
+  _GAMERATINGSDATA_PLAYERSELORATINGUPDATEENTRY._serialized_end=2172
+  _GAMERATINGSDATA_PLAYERSARENARATINGUPDATEENTRY._serialized_start=2174
+  _GAMERATINGSDATA_PLAYERSARENARATINGUPDATEENTRY._serialized_end=2299
+  _GAMERATINGS._serialized_start=2302
+  _GAMERATINGS._serialized_end=2448
+# @@protoc_insertion_point(module_scope)
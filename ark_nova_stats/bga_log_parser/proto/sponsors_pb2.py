@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/sponsors.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ark_nova_stats.bga_log_parser.proto import build_pb2 as ark__nova__stats_dot_bga__log__parser_dot_proto_dot_build__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2ark_nova_stats/bga_log_parser/proto/sponsors.proto\x12#ark_nova_stats.bga_log_parser.proto\x1a/ark_nova_stats/bga_log_parser/proto/build.proto\"\x0e\n\x0c\x42reakSponsor\"u\n\x0bPlaySponsor\x12\x0f\n\x07\x63\x61rd_id\x18\x01 \x01(\x05\x12H\n\x08\x62uilding\x18\x02 \x01(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.PlayBuildingH\x00\x88\x01\x01\x42\x0b\n\t_building\"V\n\x0cPlaySponsors\x12\x46\n\x0cplay_sponsor\x18\x01 \x03(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.PlaySponsor\"\xaa\x01\n\x0eSponsorsAction\x12\x42\n\x05\x62reak\x18\x01 \x01(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.BreakSponsorH\x00\x12J\n\rplay_sponsors\x18\x02 \x01(\x0b\x32\x31.ark_nova_stats.bga_log_parser.proto.PlaySponsorsH\x00\x42\x08\n\x06\x61\x63tionb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.sponsors_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _BREAKSPONSOR._serialized_start=140
+  _BREAKSPONSOR._serialized_end=154
+  _PLAYSPONSOR._serialized_start=156
+  _PLAYSPONSOR._serialized_end=273
+  _PLAYSPONSORS._serialized_start=275
+  _PLAYSPONSORS._serialized_end=361
+  _SPONSORSACTION._serialized_start=364
+  _SPONSORSACTION._serialized_end=534
+# @@protoc_insertion_point(module_scope)
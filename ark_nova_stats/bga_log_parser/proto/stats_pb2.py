@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: ark_nova_stats/bga_log_parser/proto/stats.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/ark_nova_stats/bga_log_parser/proto/stats.proto\x12#ark_nova_stats.bga_log_parser.proto\"\xe6\r\n\x0bPlayerStats\x12\x11\n\tplayer_id\x18\x01 \x01(\x03\x12\r\n\x05score\x18\x02 \x01(\x05\x12\x0c\n\x04rank\x18\x03 \x01(\x05\x12\x15\n\rthinking_time\x18\x04 \x01(\x05\x12\x19\n\x11starting_position\x18\x05 \x01(\x05\x12\r\n\x05turns\x18\x06 \x01(\x05\x12\x18\n\x10\x62reaks_triggered\x18\x07 \x01(\x05\x12\x15\n\rtriggered_end\x18\x08 \x01(\x08\x12\x0e\n\x06map_id\x18\t \x01(\x05\x12\x0e\n\x06\x61ppeal\x18\n \x01(\x05\x12\x14\n\x0c\x63onservation\x18\x0b \x01(\x05\x12\x12\n\nreputation\x18\x0c \x01(\x05\x12\x15\n\ractions_build\x18\r \x01(\x05\x12\x17\n\x0f\x61\x63tions_animals\x18\x0e \x01(\x05\x12\x15\n\ractions_cards\x18\x0f \x01(\x05\x12\x1b\n\x13\x61\x63tions_association\x18\x10 \x01(\x05\x12\x18\n\x10\x61\x63tions_sponsors\x18\x11 \x01(\x05\x12\x17\n\x0fx_tokens_gained\x18\x12 \x01(\x05\x12\x11\n\tx_actions\x18\x13 \x01(\x05\x12\x15\n\rx_tokens_used\x18\x14 \x01(\x05\x12\x14\n\x0cmoney_gained\x18\x15 \x01(\x05\x12#\n\x1bmoney_gained_through_income\x18\x16 \x01(\x05\x12\x1e\n\x16money_spent_on_animals\x18\x17 \x01(\x05\x12!\n\x19money_spent_on_enclosures\x18\x18 \x01(\x05\x12 \n\x18money_spent_on_donations\x18\x19 \x01(\x05\x12:\n2money_spent_on_playing_cards_from_reputation_range\x18\x1a \x01(\x05\x12\x1d\n\x15\x63\x61rds_drawn_from_deck\x18\x1b \x01(\x05\x12)\n!cards_drawn_from_reputation_range\x18\x1c \x01(\x05\x12\x15\n\rcards_snapped\x18\x1d \x01(\x05\x12\x17\n\x0f\x63\x61rds_discarded\x18\x1e \x01(\x05\x12\x17\n\x0fplayed_sponsors\x18\x1f \x01(\x05\x12\x16\n\x0eplayed_animals\x18  \x01(\x05\x12\x18\n\x10released_animals\x18! \x01(\x05\x12\x1b\n\x13\x61ssociation_workers\x18\" \x01(\x05\x12\x1d\n\x15\x61ssociation_donations\x18# \x01(\x05\x12&\n\x1e\x61ssociation_reputation_actions\x18$ \x01(\x05\x12\'\n\x1f\x61ssociation_partner_zoo_actions\x18% \x01(\x05\x12&\n\x1e\x61ssociation_university_actions\x18& \x01(\x05\x12\x30\n(association_conservation_project_actions\x18\' \x01(\x05\x12\x18\n\x10\x62uilt_enclosures\x18( \x01(\x05\x12\x14\n\x0c\x62uilt_kiosks\x18) \x01(\x05\x12\x17\n\x0f\x62uilt_pavilions\x18* \x01(\x05\x12\x1e\n\x16\x62uilt_unique_buildings\x18+ \x01(\x05\x12\x15\n\rhexes_covered\x18, \x01(\x05\x12\x13\n\x0bhexes_empty\x18- \x01(\x05\x12\x1d\n\x15upgraded_action_cards\x18. \x01(\x05\x12\x18\n\x10upgraded_animals\x18/ \x01(\x08\x12\x16\n\x0eupgraded_build\x18\x30 \x01(\x08\x12\x16\n\x0eupgraded_cards\x18\x31 \x01(\x08\x12\x19\n\x11upgraded_sponsors\x18\x32 \x01(\x08\x12\x1c\n\x14upgraded_association\x18\x33 \x01(\x08\x12\x14\n\x0cicons_africa\x18\x34 \x01(\x05\x12\x14\n\x0cicons_europe\x18\x35 \x01(\x05\x12\x12\n\nicons_asia\x18\x36 \x01(\x05\x12\x17\n\x0ficons_australia\x18\x37 \x01(\x05\x12\x16\n\x0eicons_americas\x18\x38 \x01(\x05\x12\x12\n\nicons_bird\x18\x39 \x01(\x05\x12\x16\n\x0eicons_predator\x18: \x01(\x05\x12\x17\n\x0ficons_herbivore\x18; \x01(\x05\x12\x12\n\nicons_bear\x18< \x01(\x05\x12\x15\n\ricons_reptile\x18= \x01(\x05\x12\x15\n\ricons_primate\x18> \x01(\x05\x12\x19\n\x11icons_petting_zoo\x18? \x01(\x05\x12\x18\n\x10icons_sea_animal\x18@ \x01(\x05\x12\x13\n\x0bicons_water\x18\x41 \x01(\x05\x12\x12\n\nicons_rock\x18\x42 \x01(\x05\x12\x15\n\ricons_science\x18\x43 \x01(\x05\"O\n\x05Stats\x12\x46\n\x0cplayer_stats\x18\x01 \x03(\x0b\x32\x30.ark_nova_stats.bga_log_parser.proto.PlayerStatsb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ark_nova_stats.bga_log_parser.proto.stats_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _PLAYERSTATS._serialized_start=89
+  _PLAYERSTATS._serialized_end=1855
+  _STATS._serialized_start=1857
+  _STATS._serialized_end=1936
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,442 @@
+import dataclasses
+import operator
+from typing import Any, Callable, Optional
+
+from ark_nova_stats.bga_log_parser.proto.stats_pb2 import PlayerStats  # type: ignore
+
+
+@dataclasses.dataclass(frozen=True)
+class StatField:
+    """
+    A single end-of-game statistic for a player.
+    `name` is shared by the PlayerStats proto field, the game_statistics column & CSV exports.
+    """
+
+    name: str
+    # The key of this stat in a BGA replay's player results. Most are numeric IDs under "stats".
+    bga_key: str
+    type: type
+    # Stats without a description aren't exposed over GraphQL.
+    description: Optional[str] = None
+    # Whether this stat is set directly on the player's results, rather than under "stats".
+    top_level: bool = False
+
+    @property
+    def graphql_name(self) -> str:
+        first, *rest = self.name.split("_")
+        return first + "".join(part.title() for part in rest)
+
+    @property
+    def decode(self) -> Callable[[Any], Any]:
+        # BGA reports every stat as a string (or int) of digits, including booleans.
+        if self.type is bool:
+            return lambda value: bool(int(value))
+
+        return int
+
+
+# The int keys here come from BGA's own format in replays;
+# I expect these to change / break over time as BGA changes its own format.
+STAT_FIELDS: tuple[StatField, ...] = (
+    StatField("score", "score", int, description="Player's score.", top_level=True),
+    StatField(
+        "rank",
+        "rank",
+        int,
+        description="Player's final rank. The winner has rank 1.",
+        top_level=True,
+    ),
+    StatField(
+        "thinking_time",
+        "1",
+        int,
+        description="The thinking time, in seconds, for this game log and user.",
+    ),
+    StatField(
+        "starting_position",
+        "11",
+        int,
+        description="The starting position for this game log and user.",
+    ),
+    StatField("turns", "12", int),
+    StatField(
+        "breaks_triggered",
+        "13",
+        int,
+        description="The number of breaks triggered by this user in this game.",
+    ),
+    StatField(
+        "triggered_end",
+        "14",
+        bool,
+        description="Whether the user in this game triggered the end of the game.",
+    ),
+    StatField(
+        "map_id", "15", int, description="The map ID for this game log and user."
+    ),
+    StatField("appeal", "16", int),
+    StatField("conservation", "17", int),
+    StatField("reputation", "19", int),
+    StatField(
+        "actions_build",
+        "20",
+        int,
+        description="The number of build actions for this game log and user.",
+    ),
+    StatField(
+        "actions_animals",
+        "21",
+        int,
+        description="The number of animals actions for this game log and user.",
+    ),
+    StatField(
+        "actions_cards",
+        "22",
+        int,
+        description="The number of cards actions for this game log and user.",
+    ),
+    StatField(
+        "actions_association",
+        "23",
+        int,
+        description="The number of association actions for this game log and user.",
+    ),
+    StatField(
+        "actions_sponsors",
+        "24",
+        int,
+        description="The number of sponsors actions for this game log and user.",
+    ),
+    StatField(
+        "x_tokens_gained",
+        "25",
+        int,
+        description="The number of X tokens gained for this game log and user.",
+    ),
+    StatField(
+        "x_actions",
+        "26",
+        int,
+        description="The number of X actions taken for this game log and user.",
+    ),
+    StatField(
+        "x_tokens_used",
+        "27",
+        int,
+        description="The number of X tokens used for this game log and user.",
+    ),
+    StatField(
+        "money_gained",
+        "30",
+        int,
+        description="The money gained for this game log and user.",
+    ),
+    StatField(
+        "money_gained_through_income",
+        "31",
+        int,
+        description="The money gained through income for this game log and user.",
+    ),
+    StatField(
+        "money_spent_on_animals",
+        "32",
+        int,
+        description="The money spent on animals for this game log and user.",
+    ),
+    StatField(
+        "money_spent_on_enclosures",
+        "33",
+        int,
+        description="The money spent on enclosures for this game log and user.",
+    ),
+    StatField(
+        "money_spent_on_donations",
+        "34",
+        int,
+        description="The money spent on donations for this game log and user.",
+    ),
+    StatField(
+        "money_spent_on_playing_cards_from_reputation_range",
+        "35",
+        int,
+        description="The money spent on playing cards from reputation range for this game log and user.",
+    ),
+    StatField(
+        "cards_drawn_from_deck",
+        "40",
+        int,
+        description="The number of cards drawn from deck for this game log and user.",
+    ),
+    StatField(
+        "cards_drawn_from_reputation_range",
+        "41",
+        int,
+        description="The number of cards drawn from reputation range for this game log and user.",
+    ),
+    StatField(
+        "cards_snapped",
+        "42",
+        int,
+        description="The number of cards snapped for this game log and user.",
+    ),
+    StatField(
+        "cards_discarded",
+        "43",
+        int,
+        description="The number of cards discarded for this game log and user.",
+    ),
+    StatField(
+        "played_sponsors",
+        "44",
+        int,
+        description="The number of played sponsors for this game log and user.",
+    ),
+    StatField(
+        "played_animals",
+        "45",
+        int,
+        description="The number of played animals for this game log and user.",
+    ),
+    StatField(
+        "released_animals",
+        "46",
+        int,
+        description="The number of released animals for this game log and user.",
+    ),
+    StatField(
+        "association_workers",
+        "50",
+        int,
+        description="The number of association workers for this game log and user.",
+    ),
+    StatField(
+        "association_donations",
+        "51",
+        int,
+        description="The number of association donations for this game log and user.",
+    ),
+    StatField(
+        "association_reputation_actions",
+        "52",
+        int,
+        description="The number of association reputation actions for this game log and user.",
+    ),
+    StatField(
+        "association_partner_zoo_actions",
+        "53",
+        int,
+        description="The number of association partner zoo actions for this game log and user.",
+    ),
+    StatField(
+        "association_university_actions",
+        "54",
+        int,
+        description="The number of association university actions for this game log and user.",
+    ),
+    StatField(
+        "association_conservation_project_actions",
+        "55",
+        int,
+        description="The number of association conservation project actions for this game log and user.",
+    ),
+    StatField(
+        "built_enclosures",
+        "60",
+        int,
+        description="The number of built enclosures for this game log and user.",
+    ),
+    StatField(
+        "built_kiosks",
+        "61",
+        int,
+        description="The number of built kiosks for this game log and user.",
+    ),
+    StatField(
+        "built_pavilions",
+        "62",
+        int,
+        description="The number of built pavilions for this game log and user.",
+    ),
+    StatField(
+        "built_unique_buildings",
+        "63",
+        int,
+        description="The number of built unique buildings for this game log and user.",
+    ),
+    StatField(
+        "hexes_covered",
+        "64",
+        int,
+        description="The number of covered map hexes for this game log and user.",
+    ),
+    StatField(
+        "hexes_empty",
+        "65",
+        int,
+        description="The number of empty max hexes for this game log and user.",
+    ),
+    StatField(
+        "upgraded_action_cards",
+        "70",
+        int,
+        description="The number of upgraded action cards for this game log and user.",
+    ),
+    StatField(
+        "upgraded_animals",
+        "71",
+        bool,
+        description="Whether the user upgraded animals in this game.",
+    ),
+    StatField(
+        "upgraded_build",
+        "72",
+        bool,
+        description="Whether the user upgraded build in this game.",
+    ),
+    StatField(
+        "upgraded_cards",
+        "73",
+        bool,
+        description="Whether the user upgraded cards in this game.",
+    ),
+    StatField(
+        "upgraded_sponsors",
+        "74",
+        bool,
+        description="Whether the user upgraded sponsors in this game.",
+    ),
+    StatField(
+        "upgraded_association",
+        "75",
+        bool,
+        description="Whether the user upgraded association in this game.",
+    ),
+    StatField(
+        "icons_africa",
+        "76",
+        int,
+        description="The number of africa icons for this game log and user.",
+    ),
+    StatField(
+        "icons_europe",
+        "77",
+        int,
+        description="The number of europe icons for this game log and user.",
+    ),
+    StatField(
+        "icons_asia",
+        "78",
+        int,
+        description="The number of asia icons for this game log and user.",
+    ),
+    StatField(
+        "icons_australia",
+        "79",
+        int,
+        description="The number of australia icons for this game log and user.",
+    ),
+    StatField(
+        "icons_americas",
+        "80",
+        int,
+        description="The number of americas icons for this game log and user.",
+    ),
+    StatField(
+        "icons_bird",
+        "81",
+        int,
+        description="The number of bird icons for this game log and user.",
+    ),
+    StatField(
+        "icons_predator",
+        "82",
+        int,
+        description="The number of predator icons for this game log and user.",
+    ),
+    StatField(
+        "icons_herbivore",
+        "83",
+        int,
+        description="The number of herbivore icons for this game log and user.",
+    ),
+    StatField(
+        "icons_bear",
+        "84",
+        int,
+        description="The number of bear icons for this game log and user.",
+    ),
+    StatField(
+        "icons_reptile",
+        "85",
+        int,
+        description="The number of reptile icons for this game log and user.",
+    ),
+    StatField(
+        "icons_primate",
+        "86",
+        int,
+        description="The number of primate icons for this game log and user.",
+    ),
+    StatField(
+        "icons_petting_zoo",
+        "97",
+        int,
+        description="The number of petting_zoo icons for this game log and user.",
+    ),
+    StatField(
+        "icons_sea_animal",
+        "91",
+        int,
+        description="The number of sea_animal icons for this game log and user.",
+    ),
+    StatField(
+        "icons_water",
+        "88",
+        int,
+        description="The number of water icons for this game log and user.",
+    ),
+    StatField(
+        "icons_rock",
+        "89",
+        int,
+        description="The number of rock icons for this game log and user.",
+    ),
+    StatField(
+        "icons_science",
+        "90",
+        int,
+        description="The number of science icons for this game log and user.",
+    ),
+)
+
+STAT_NAMES: tuple[str, ...] = tuple(field.name for field in STAT_FIELDS)
+
+# Precomputed, so that decoding a player's stats is a single pass over these tuples.
+_TOP_LEVEL_DECODERS = tuple(
+    (field.name, field.bga_key, field.decode)
+    for field in STAT_FIELDS
+    if field.top_level
+)
+_STATS_DECODERS = tuple(
+    (field.name, field.bga_key, field.decode)
+    for field in STAT_FIELDS
+    if not field.top_level
+)
+_get_stat_values = operator.attrgetter(*STAT_NAMES)
+
+
+def parse_player_stats(stats: dict[str, Any]) -> PlayerStats:
+    values = stats["stats"]
+    decoded = {name: decode(stats[key]) for name, key, decode in _TOP_LEVEL_DECODERS}
+    for name, key, decode in _STATS_DECODERS:
+        decoded[name] = decode(values[key])
+
+    return PlayerStats(player_id=int(stats["player"]), **decoded)
+
+
+def stat_values(player_stats: Any) -> dict[str, Any]:
+    """
+    Returns the value of each stat on `player_stats`, which can be anything with an attribute per stat
+    (e.g. a PlayerStats proto or a GameStatistics row).
+    """
+    return dict(zip(STAT_NAMES, _get_stat_values(player_stats)))
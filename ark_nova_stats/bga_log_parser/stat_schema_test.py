@@ -0,0 +1,70 @@
+import sys
+
+import pytest
+
+from ark_nova_stats.bga_log_parser.proto.stats_pb2 import PlayerStats  # type: ignore
+from ark_nova_stats.bga_log_parser.stat_schema import (
+    STAT_FIELDS,
+    STAT_NAMES,
+    StatField,
+    parse_player_stats,
+    stat_values,
+)
+
+
+def player_results() -> dict:
+    return {
+        "player": "123",
+        "score": "45",
+        "rank": "1",
+        "stats": {
+            field.bga_key: "1" if field.type is bool else str(i)
+            for i, field in enumerate(STAT_FIELDS)
+            if not field.top_level
+        },
+    }
+
+
+class TestStatFields:
+    def test_match_player_stats_proto(self):
+        proto_fields = [
+            f.name for f in PlayerStats.DESCRIPTOR.fields if f.name != "player_id"
+        ]
+        assert proto_fields == list(STAT_NAMES)
+
+    def test_bga_keys_are_unique(self):
+        keys = [field.bga_key for field in STAT_FIELDS]
+        assert len(keys) == len(set(keys))
+
+    def test_graphql_name(self):
+        field = StatField("money_spent_on_animals", "32", int)
+        assert "moneySpentOnAnimals" == field.graphql_name
+
+
+class TestParsePlayerStats:
+    def test_decodes_every_stat(self):
+        stats = parse_player_stats(player_results())
+        assert 123 == stats.player_id
+        assert 45 == stats.score
+        assert 1 == stats.rank
+        assert stats.upgraded_animals is True
+        assert 2 == stats.thinking_time
+
+    def test_raises_on_missing_stat(self):
+        results = player_results()
+        del results["stats"]["1"]
+        with pytest.raises(KeyError):
+            parse_player_stats(results)
+
+
+class TestStatValues:
+    def test_reads_every_stat(self):
+        stats = parse_player_stats(player_results())
+        values = stat_values(stats)
+        assert list(STAT_NAMES) == list(values)
+        assert 45 == values["score"]
+        assert values["upgraded_animals"] is True
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,352 @@
+import datetime
+import io
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Optional, Union
+
+from ark_nova_stats.bga_log_parser.exceptions import (
+    NonArkNovaReplayError,
+    StatsNotSetError,
+)
+from ark_nova_stats.bga_log_parser.game_log import (
+    ARK_NOVA_DETECTION_EVENTS,
+    GameLog,
+    GameLogCardPlay,
+    GameLogEvent,
+    GameLogEventDataCard,
+    GameLogPlayer,
+    GameLogSummary,
+    GameLogSummaryBuilder,
+    find_stats_result,
+    is_ark_nova_opening,
+)
+from ark_nova_stats.bga_log_parser.proto.stats_pb2 import Stats  # type: ignore
+from ark_nova_stats.bga_log_parser.stat_schema import parse_player_stats
+
+# A replay can be read from a path on disk, an in-memory JSON string or bytes buffer,
+# or an already-open (text or binary) file object.
+ReplaySource = Union[str, bytes, bytearray, os.PathLike, IO]
+
+READ_CHUNK_SIZE = 64 * 1024
+
+JSON_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamReader:
+    """
+    A minimal incremental JSON tokenizer.
+    Rather than decoding a whole document, it lets callers walk into objects & arrays
+    and decode one value at a time, so only the value currently being decoded is buffered.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int = READ_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _read_more(self) -> bool:
+        if self.eof:
+            return False
+
+        # Drop everything we've already consumed, and grow reads geometrically so that
+        # decoding a single large value doesn't re-scan the buffer too many times.
+        self.buffer = self.buffer[self.pos :]
+        self.pos = 0
+        chunk = self.fp.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+        Returns the empty string at the end of the input.
+        """
+        while True:
+            while (
+                self.pos < len(self.buffer) and self.buffer[self.pos] in JSON_WHITESPACE
+            ):
+                self.pos += 1
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if not self._read_more():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Expected {char!r} in JSON stream but found {found!r} instead."
+            )
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._read_more():
+                    continue
+                raise
+
+            # A number that runs up to the end of the buffer might be truncated.
+            if end == len(self.buffer) and self._read_more():
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yields the keys of the object at the current position.
+        Each time a key is yielded, the caller must consume its value
+        (via decode_value, iter_object or iter_array) before advancing the iterator.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.decode_value()
+            self.expect(":")
+            yield key
+
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+
+            self.expect("}")
+            return
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Yields the decoded elements of the array at the current position, one at a time.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.decode_value()
+
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+
+            self.expect("]")
+            return
+
+
+@contextmanager
+def open_replay_source(source: ReplaySource) -> Iterator[IO[str]]:
+    if isinstance(source, str):
+        # Strings are treated as JSON text; pass a Path to read from disk.
+        yield io.StringIO(source)
+    elif isinstance(source, (bytes, bytearray)):
+        yield io.TextIOWrapper(io.BytesIO(source), encoding="utf-8")
+    elif isinstance(source, os.PathLike):
+        with open(source, "r", encoding="utf-8") as f:
+            yield f
+    else:
+        if source.seekable():
+            source.seek(0)
+        if isinstance(source, io.TextIOBase):
+            yield source
+        else:
+            yield io.TextIOWrapper(source, encoding="utf-8")  # type: ignore
+
+
+def iter_game_log_events(
+    source: ReplaySource, prefix: tuple[str, ...] = ()
+) -> Iterator[GameLogEvent]:
+    """
+    Yields the events of a replay one at a time, without decoding the rest of the log.
+    `prefix` is the path of keys leading to the replay inside the document,
+    e.g. ("log",) for the BGA_JSONL_WITH_ELO archive format.
+    """
+    with open_replay_source(source) as fp:
+        reader = JSONStreamReader(fp)
+        if not _seek_to_path(reader, prefix + ("data", "logs")):
+            return
+
+        for event in reader.iter_array():
+            yield GameLogEvent(**event)
+
+
+def _seek_to_path(reader: JSONStreamReader, path: tuple[str, ...]) -> bool:
+    if not path:
+        return True
+
+    for key in reader.iter_object():
+        if key == path[0]:
+            return _seek_to_path(reader, path[1:])
+
+        reader.decode_value()
+
+    return False
+
+
+class GameLogEventStream:
+    """
+    A re-iterable view over a replay's events, which re-reads the source on each pass.
+    """
+
+    def __init__(self, source: ReplaySource, prefix: tuple[str, ...] = ()):
+        self.source = source
+        self.prefix = prefix
+
+    def __iter__(self) -> Iterator[GameLogEvent]:
+        return iter_game_log_events(self.source, self.prefix)
+
+
+class StreamingGameLogData:
+    def __init__(self, source: ReplaySource, prefix: tuple[str, ...]):
+        self.logs = GameLogEventStream(source, prefix)
+        self.players: list[GameLogPlayer] = []
+        self.summary = GameLogSummaryBuilder().build([])
+
+    @property
+    def card_plays(self) -> Iterator[GameLogCardPlay]:
+        return iter(self.summary.card_plays)
+
+    @property
+    def opening_hands(self) -> dict[int, list[GameLogEventDataCard]]:
+        return self.summary.opening_hands
+
+
+class StreamingGameLog:
+    """
+    A replay parsed in a single streaming pass over its source.
+    Only the windows of events needed to answer questions about the game are retained:
+    the opening events (game detection & opening hands), the closing events
+    (winner, ties & stats), and the events in which cards were played.
+    """
+
+    def __init__(self, source: ReplaySource, prefix: tuple[str, ...] = ()):
+        self.source = source
+        self.prefix = prefix
+        self.status: Optional[int] = None
+        self.data = StreamingGameLogData(source, prefix)
+        # Any other values found alongside the replay, e.g. the "elos" of an archived game.
+        self.extra: dict[str, Any] = {}
+        self.head: list[GameLogEvent] = []
+        self.first_time: Optional[int] = None
+        self.last_time: Optional[int] = None
+        self._summary_builder = GameLogSummaryBuilder()
+
+        with open_replay_source(source) as fp:
+            self._scan(JSONStreamReader(fp), prefix, top_level=True)
+
+        # Players are listed after the events, so the summary can only be built at the end.
+        self.data.summary = self._summary_builder.build(self.data.players)
+        self.stats = self.parse_game_stats()
+
+    def _scan(
+        self, reader: JSONStreamReader, path: tuple[str, ...], top_level: bool
+    ) -> None:
+        for key in reader.iter_object():
+            if path and key == path[0]:
+                # Descend until we find the replay itself.
+                self._scan(reader, path[1:], top_level=False)
+            elif not path and key == "data":
+                self._scan_data(reader)
+            elif not path and key == "status":
+                self.status = reader.decode_value()
+            elif top_level:
+                self.extra[key] = reader.decode_value()
+            else:
+                reader.decode_value()
+
+    def _scan_data(self, reader: JSONStreamReader) -> None:
+        for key in reader.iter_object():
+            if key == "logs":
+                self._scan_logs(reader)
+            elif key == "players":
+                self.data.players = [GameLogPlayer(**p) for p in reader.iter_array()]
+            else:
+                reader.decode_value()
+
+    def _scan_logs(self, reader: JSONStreamReader) -> None:
+        for raw_event in reader.iter_array():
+            event = GameLogEvent(**raw_event)
+            if self.first_time is None:
+                self.first_time = event.time
+            self.last_time = event.time
+
+            if len(self.head) < ARK_NOVA_DETECTION_EVENTS:
+                self.head.append(event)
+                if len(self.head) == ARK_NOVA_DETECTION_EVENTS:
+                    self.validate_is_ark_nova_game()
+
+            self._summary_builder.add_event(event)
+
+        if len(self.head) < ARK_NOVA_DETECTION_EVENTS:
+            self.validate_is_ark_nova_game()
+
+    def validate_is_ark_nova_game(self) -> None:
+        if not is_ark_nova_opening(self.head):
+            raise NonArkNovaReplayError()
+
+    @property
+    def table_id(self) -> Optional[int]:
+        if not self.head:
+            return None
+
+        return self.head[0].table_id
+
+    @property
+    def summary(self) -> GameLogSummary:
+        return self.data.summary
+
+    @property
+    def winner(self) -> Optional[GameLogPlayer]:
+        return self.summary.winner
+
+    @property
+    def is_tie(self) -> bool:
+        return self.summary.is_tie
+
+    def parse_game_stats(self) -> Stats:
+        stats = find_stats_result(self._summary_builder.tail)
+        if stats is None:
+            raise StatsNotSetError()
+
+        return Stats(
+            player_stats=[parse_player_stats(player_stats) for player_stats in stats]
+        )
+
+    @property
+    def game_start(self) -> datetime.datetime:
+        if self.status != 1:
+            raise ValueError(f"Log for table ID {self.table_id} does not have a status")
+
+        if self.first_time is None:
+            raise ValueError(f"Log for table ID {self.table_id} does not have any logs")
+
+        return datetime.datetime.fromtimestamp(self.first_time, tz=datetime.UTC)
+
+    @property
+    def game_end(self) -> datetime.datetime:
+        if self.status != 1:
+            raise ValueError(f"Log for table ID {self.table_id} does not have a status")
+
+        if self.last_time is None:
+            raise ValueError(f"Log for table ID {self.table_id} does not have any logs")
+
+        return datetime.datetime.fromtimestamp(self.last_time, tz=datetime.UTC)
+
+
+# Anything that answers questions about a replay, whether or not it was fully loaded.
+AnyGameLog = Union[GameLog, StreamingGameLog]
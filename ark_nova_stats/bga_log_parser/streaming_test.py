@@ -0,0 +1,110 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from python.runfiles import Runfiles  # type: ignore
+
+from ark_nova_stats.bga_log_parser.exceptions import NonArkNovaReplayError
+from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.bga_log_parser.streaming import (
+    JSONStreamReader,
+    StreamingGameLog,
+    iter_game_log_events,
+)
+
+
+def fixture_path(filename: str) -> Path:
+    r = Runfiles.Create()
+    return Path(
+        r.Rlocation(
+            str(
+                Path("_main")
+                / "ark_nova_stats"
+                / "bga_log_parser"
+                / "fixtures"
+                / filename
+            )
+        )
+    )
+
+
+def load_data_from_fixture_file(filename: str) -> dict:
+    with open(fixture_path(filename), "r") as fixture_file:
+        return json.loads(fixture_file.read().strip())
+
+
+class TestJSONStreamReader:
+    def test_decodes_array_elements_across_chunk_boundaries(self):
+        document = json.dumps({"a": [1, 22, {"b": "333"}, [4444]], "c": 55555})
+        reader = JSONStreamReader(io.StringIO(document), chunk_size=1)
+
+        keys = []
+        for key in reader.iter_object():
+            keys.append(key)
+            if key == "a":
+                assert [1, 22, {"b": "333"}, [4444]] == list(reader.iter_array())
+            else:
+                assert 55555 == reader.decode_value()
+
+        assert ["a", "c"] == keys
+
+
+class TestIterGameLogEvents:
+    def test_yields_every_event(self):
+        expected = GameLog(**load_data_from_fixture_file("4p.log.json"))
+        events = list(iter_game_log_events(fixture_path("4p.log.json")))
+        assert len(expected.data.logs) == len(events)
+        assert expected.data.logs[0] == events[0]
+        assert expected.data.logs[-1] == events[-1]
+
+    def test_reads_from_bytes(self):
+        raw = fixture_path("tie.log.json").read_bytes()
+        assert len(GameLog(**json.loads(raw)).data.logs) == len(
+            list(iter_game_log_events(raw))
+        )
+
+
+class TestStreamingGameLog:
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "sample_game.log.json",
+            "4p.log.json",
+            "tie.log.json",
+            "533468391_darcelmaw_hardyzhao.json",
+        ],
+    )
+    def test_matches_game_log(self, filename: str):
+        expected = GameLog(**load_data_from_fixture_file(filename))
+        x = StreamingGameLog(fixture_path(filename))
+
+        assert expected.status == x.status
+        assert expected.table_id == x.table_id
+        assert expected.data.players == x.data.players
+        assert expected.winner == x.winner
+        assert expected.is_tie == x.is_tie
+        assert expected.stats == x.stats
+        assert expected.game_start == x.game_start
+        assert expected.game_end == x.game_end
+        assert expected.data.opening_hands == x.data.opening_hands
+        assert list(expected.data.card_plays) == list(x.data.card_plays)
+
+    def test_reads_replay_nested_in_archive_payload(self):
+        payload = {
+            "elos": {"1": {"prior_elo": 100}},
+            "log": load_data_from_fixture_file("tie.log.json"),
+        }
+        x = StreamingGameLog(json.dumps(payload), prefix=("log",))
+        assert x.is_tie
+        assert {"elos": {"1": {"prior_elo": 100}}} == x.extra
+        assert len(payload["log"]["data"]["logs"]) == len(list(x.data.logs))
+
+    def test_raises_when_not_ark_nova_replay(self):
+        with pytest.raises(NonArkNovaReplayError):
+            StreamingGameLog(fixture_path("non_ark_nova_game.log.json"))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
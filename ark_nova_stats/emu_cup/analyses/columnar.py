@@ -0,0 +1,307 @@
+import itertools
+from array import array
+from collections import Counter
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+from ark_nova_stats.bga_log_parser.streaming import AnyGameLog
+from ark_nova_stats.emu_cup.analyses.elo_adjusted import (
+    CardWinRateELOAdjustedOutput,
+    probability_of_win,
+)
+from ark_nova_stats.emu_cup.analyses.win_rates import CardRawWinRateOutput
+from ark_nova_stats.emu_cup.player_elos import PlayerELOs
+
+# The score a player gets for each result.
+WIN = 1.0
+TIE = 0.5
+LOSS = 0.0
+
+
+class CardIncidence:
+    """
+    A sparse card × player-game incidence matrix, stored in compressed sparse row form.
+    Each row holds the cards one player had in one game, along with their score in that game
+    and the score they were expected to get going into it.
+    Cards are encoded as integer IDs, in the order that they were first seen.
+    """
+
+    def __init__(self) -> None:
+        self.card_names: list[str] = []
+        self.card_ids: dict[str, int] = {}
+        # The cards in row i are card_indices[row_offsets[i]:row_offsets[i + 1]].
+        self.row_offsets = array("q", [0])
+        self.card_indices = array("q")
+        self.scores = array("d")
+        self.expected_scores = array("d")
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.scores)
+
+    @property
+    def num_cards(self) -> int:
+        return len(self.card_names)
+
+    def card_id(self, card: str) -> int:
+        card_id = self.card_ids.get(card)
+        if card_id is None:
+            card_id = self.card_ids[card] = len(self.card_names)
+            self.card_names.append(card)
+
+        return card_id
+
+    def add_row(
+        self, cards: Iterable[str], score: float, expected_score: float = 0.0
+    ) -> None:
+        card_ids = self.card_ids
+        for card in cards:
+            if card not in card_ids:
+                self.card_id(card)
+
+        self.card_indices.extend(map(card_ids.__getitem__, cards))
+        self.row_offsets.append(len(self.card_indices))
+        self.scores.append(score)
+        self.expected_scores.append(expected_score)
+
+    def row_cards(self) -> Iterator[array]:
+        offsets = self.row_offsets
+        for row in range(self.num_rows):
+            yield self.card_indices[offsets[row] : offsets[row + 1]]
+
+    def merge(self, other: "CardIncidence") -> None:
+        """
+        Appends the rows of another matrix (e.g. built over a different set of games)
+        to this one, re-encoding its card IDs.
+        """
+        remapped = [self.card_id(card) for card in other.card_names]
+        offset = len(self.card_indices)
+        self.card_indices.extend(remapped[card_id] for card_id in other.card_indices)
+        self.row_offsets.extend(
+            offset + row_offset for row_offset in other.row_offsets[1:]
+        )
+        self.scores.extend(other.scores)
+        self.expected_scores.extend(other.expected_scores)
+
+    def column_counts(self, rows: Optional[Iterable[bool]] = None) -> list[int]:
+        """
+        Returns the number of (selected) rows that each card appears in, indexed by card ID.
+        """
+        if rows is None:
+            counts = Counter(self.card_indices)
+        else:
+            offsets = self.row_offsets
+            counts = Counter(
+                itertools.chain.from_iterable(
+                    self.card_indices[offsets[row] : offsets[row + 1]]
+                    for row in itertools.compress(itertools.count(), rows)
+                )
+            )
+
+        return [counts[card_id] for card_id in range(self.num_cards)]
+
+    def column_residuals(self) -> list[float]:
+        """
+        Returns the sum of each card's rows' (score - expected score), indexed by card ID.
+        """
+        residuals = [0.0] * self.num_cards
+        for score, expected_score, cards in zip(
+            self.scores, self.expected_scores, self.row_cards()
+        ):
+            residual = score - expected_score
+            for card_id in cards:
+                residuals[card_id] += residual
+
+        return residuals
+
+
+def raw_win_rate_outputs(incidence: CardIncidence) -> dict[str, CardRawWinRateOutput]:
+    """
+    Computes the same rows as CardRawWinRate.output, for every card at once.
+    Ties count as both a win and a loss.
+    """
+    wins = incidence.column_counts(score > LOSS for score in incidence.scores)
+    losses = incidence.column_counts(score < WIN for score in incidence.scores)
+    plays = [card_wins + card_losses for card_wins, card_losses in zip(wins, losses)]
+
+    num_cards = incidence.num_cards or 1
+    average_wins = sum(wins) * 1.0 / num_cards
+    average_plays = sum(plays) * 1.0 / num_cards
+
+    return {
+        card: CardRawWinRateOutput(
+            rank=card_id + 1,
+            card=card,
+            rate=round(wins[card_id] * 1.0 / plays[card_id] * 100, 2),
+            plays=plays[card_id],
+            rate_bayes=round(
+                (wins[card_id] + average_wins)
+                * 1.0
+                / (plays[card_id] + average_plays)
+                * 100,
+                2,
+            ),
+        )
+        for card_id, card in enumerate(incidence.card_names)
+    }
+
+
+def elo_adjusted_outputs(
+    incidence: CardIncidence,
+) -> dict[str, CardWinRateELOAdjustedOutput]:
+    """
+    Computes the same rows as CardWinRateELOAdjusted.output, for every card at once.
+    """
+    games = incidence.column_counts()
+    points = incidence.column_residuals()
+    average_plays = (
+        1.0 * sum(games) / incidence.num_cards if incidence.num_cards > 0 else 0
+    )
+
+    return {
+        card: CardWinRateELOAdjustedOutput(
+            rank=card_id + 1,
+            card=card,
+            rate=round(points[card_id] / games[card_id] * 100, 2),
+            plays=games[card_id],
+            rate_bayes=round(
+                points[card_id] * 1.0 / (games[card_id] + average_plays) * 100, 2
+            ),
+        )
+        for card_id, card in enumerate(incidence.card_names)
+    }
+
+
+OutputT = TypeVar("OutputT")
+
+
+class ColumnarOutputs(Generic[OutputT]):
+    """
+    Exposes one of a ColumnarCardWinRates' sets of outputs the way the per-card analyzers do,
+    as `all_cards` (in the order that they were first seen) & `output`.
+    """
+
+    def __init__(self, incidence: CardIncidence, output: Callable[[str], OutputT]):
+        self.incidence = incidence
+        self.output = output
+
+    @property
+    def all_cards(self) -> dict[str, int]:
+        return self.incidence.card_ids
+
+
+class ColumnarCardWinRates:
+    """
+    Computes raw & ELO-adjusted card win rates from card incidence matrices,
+    rather than updating per-card records game by game.
+    Its outputs match CardRawWinRate & CardWinRateELOAdjusted
+    (or their opening hand variants, if `opening_hands` is set).
+    """
+
+    def __init__(self, opening_hands: bool = False):
+        self.opening_hands = opening_hands
+        self.raw = CardIncidence()
+        self.elo_adjusted = CardIncidence()
+        self.raw_outputs: Optional[dict[str, CardRawWinRateOutput]] = None
+        self.elo_adjusted_outputs: Optional[dict[str, CardWinRateELOAdjustedOutput]] = (
+            None
+        )
+
+    def invalidate_outputs(self) -> None:
+        self.raw_outputs = None
+        self.elo_adjusted_outputs = None
+
+    def merge(self, other: "ColumnarCardWinRates") -> None:
+        self.raw.merge(other.raw)
+        self.elo_adjusted.merge(other.elo_adjusted)
+        self.invalidate_outputs()
+
+    def game_log_cards(self, log: AnyGameLog) -> dict[int, set[str]]:
+        summary = log.summary
+        if self.opening_hands:
+            return {
+                player_id: set(card.name for card in hand_cards)
+                for player_id, hand_cards in summary.opening_hands.items()
+            }
+
+        if summary.unattributed_play is not None:
+            raise ValueError(
+                f"Player ID not set for log event: {summary.unattributed_play}"
+            )
+
+        return summary.card_names_by_player
+
+    def game_scores(
+        self, log: AnyGameLog, game_cards: dict[int, set[str]]
+    ) -> dict[int, float]:
+        summary = log.summary
+        winner_id = summary.winner.id if summary.winner is not None else None
+        return {
+            player_id: (
+                WIN if player_id == winner_id else TIE if summary.is_tie else LOSS
+            )
+            for player_id in game_cards
+        }
+
+    def process_game(
+        self, log: AnyGameLog, elos: Optional[dict[int, PlayerELOs]] = None
+    ) -> None:
+        self.process_raw_game(log)
+        if elos:
+            self.process_elo_adjusted_game(log, elos)
+
+    def process_raw_game(self, log: AnyGameLog) -> None:
+        game_cards = self.game_log_cards(log)
+        scores = self.game_scores(log, game_cards)
+
+        # Cards played in tied games don't count towards raw win rates.
+        if self.opening_hands or not log.summary.is_tie:
+            for player_id, player_cards in game_cards.items():
+                self.raw.add_row(player_cards, scores[player_id])
+
+        self.invalidate_outputs()
+
+    def process_elo_adjusted_game(
+        self, log: AnyGameLog, elos: dict[int, PlayerELOs]
+    ) -> None:
+        players = log.summary.players
+        if len(players) != 2:
+            return
+
+        game_cards = self.game_log_cards(log)
+        scores = self.game_scores(log, game_cards)
+        # The players' expected scores sum to 1, so we only need to compute one.
+        first_player_expected = probability_of_win(
+            elos[players[0].id].prior_elo, elos[players[1].id].prior_elo
+        )
+        expected_scores = {
+            players[0].id: first_player_expected,
+            players[1].id: 1 - first_player_expected,
+        }
+        for player_id, player_cards in game_cards.items():
+            self.elo_adjusted.add_row(
+                player_cards, scores[player_id], expected_scores[player_id]
+            )
+
+        self.invalidate_outputs()
+
+    def raw_output(self, card: str) -> CardRawWinRateOutput:
+        if self.raw_outputs is None:
+            self.raw_outputs = raw_win_rate_outputs(self.raw)
+
+        return self.raw_outputs[card]
+
+    def elo_adjusted_output(self, card: str) -> CardWinRateELOAdjustedOutput:
+        if self.elo_adjusted_outputs is None:
+            self.elo_adjusted_outputs = elo_adjusted_outputs(self.elo_adjusted)
+
+        return self.elo_adjusted_outputs[card]
+
+    @property
+    def raw_win_rates(self) -> ColumnarOutputs[CardRawWinRateOutput]:
+        return ColumnarOutputs(self.raw, self.raw_output)
+
+    @property
+    def elo_adjusted_win_rates(
+        self,
+    ) -> ColumnarOutputs[CardWinRateELOAdjustedOutput]:
+        return ColumnarOutputs(self.elo_adjusted, self.elo_adjusted_output)
@@ -0,0 +1,140 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from python.runfiles import Runfiles  # type: ignore
+
+from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.emu_cup.analyses.columnar import (
+    CardIncidence,
+    ColumnarCardWinRates,
+)
+from ark_nova_stats.emu_cup.analyses.elo_adjusted import (
+    CardWinRateELOAdjusted,
+    OpeningHandWinRateELOAdjusted,
+)
+from ark_nova_stats.emu_cup.analyses.win_rates import (
+    CardRawWinRate,
+    OpeningHandRawWinRate,
+)
+from ark_nova_stats.emu_cup.player_elos import PlayerELOs
+
+
+def load_game_log_fixture(filename: str) -> GameLog:
+    r = Runfiles.Create()
+    fixture_file_path = r.Rlocation(
+        str(Path("_main") / "ark_nova_stats" / "bga_log_parser" / "fixtures" / filename)
+    )
+    with open(fixture_file_path, "r") as fixture_file:
+        return GameLog(**json.loads(fixture_file.read().strip()))
+
+
+def fake_elos(log: GameLog) -> dict[int, PlayerELOs]:
+    return {
+        player.id: PlayerELOs(
+            id=player.id,
+            prior_elo=1000 + 50 * i,
+            new_elo=1000 + 50 * i,
+            prior_arena_elo=0,
+            new_arena_elo=0,
+        )
+        for i, player in enumerate(log.data.players)
+    }
+
+
+def load_logs() -> list[GameLog]:
+    return [
+        load_game_log_fixture("sample_game.log.json"),
+        load_game_log_fixture("4p.log.json"),
+        load_game_log_fixture("tie.log.json"),
+        load_game_log_fixture("533468391_darcelmaw_hardyzhao.json"),
+    ]
+
+
+class TestCardIncidence:
+    def test_counts_columns(self):
+        incidence = CardIncidence()
+        incidence.add_row(["a", "b"], 1.0, 0.25)
+        incidence.add_row(["b", "c"], 0.0, 0.75)
+
+        assert ["a", "b", "c"] == incidence.card_names
+        assert [1, 2, 1] == incidence.column_counts()
+        assert [1, 1, 0] == incidence.column_counts([True, False])
+        assert [0.75, 0.0, -0.75] == incidence.column_residuals()
+
+    def test_merge_reencodes_cards(self):
+        incidence = CardIncidence()
+        incidence.add_row(["a", "b"], 1.0)
+        other = CardIncidence()
+        other.add_row(["c", "a"], 0.0)
+        incidence.merge(other)
+
+        assert ["a", "b", "c"] == incidence.card_names
+        assert [[0, 1], [2, 0]] == [list(cards) for cards in incidence.row_cards()]
+        assert [1.0, 0.0] == list(incidence.scores)
+
+
+class TestColumnarCardWinRates:
+    def test_returns_empty_when_no_logs_provided(self):
+        win_rates = ColumnarCardWinRates()
+        with pytest.raises(KeyError):
+            win_rates.raw_output("no such card")
+        with pytest.raises(KeyError):
+            win_rates.elo_adjusted_output("no such card")
+
+    @pytest.mark.parametrize(
+        "opening_hands,raw_type,elo_type",
+        [
+            (False, CardRawWinRate, CardWinRateELOAdjusted),
+            (True, OpeningHandRawWinRate, OpeningHandWinRateELOAdjusted),
+        ],
+    )
+    def test_matches_per_card_analyses(self, opening_hands, raw_type, elo_type):
+        columnar = ColumnarCardWinRates(opening_hands=opening_hands)
+        raw = raw_type()
+        elo_adjusted = elo_type()
+        for log in load_logs():
+            columnar.process_game(log, fake_elos(log))
+            raw.process_game(log)
+            elo_adjusted.process_game(log, fake_elos(log))
+
+        assert list(raw.game_card_records) == columnar.raw.card_names
+        for card in raw.game_card_records:
+            assert raw.output(card) == columnar.raw_output(card)
+
+        assert list(elo_adjusted.game_card_records) == columnar.elo_adjusted.card_names
+        for card in elo_adjusted.game_card_records:
+            assert elo_adjusted.output(card) == columnar.elo_adjusted_output(card)
+
+    def test_merged_partials_match_single_pass(self):
+        logs = load_logs()
+        single_pass = ColumnarCardWinRates()
+        merged = ColumnarCardWinRates()
+        for log in logs:
+            single_pass.process_game(log, fake_elos(log))
+            partial = ColumnarCardWinRates()
+            partial.process_game(log, fake_elos(log))
+            merged.merge(partial)
+
+        for card in single_pass.raw.card_names:
+            assert single_pass.raw_output(card) == merged.raw_output(card)
+        for card in single_pass.elo_adjusted.card_names:
+            assert single_pass.elo_adjusted_output(card) == merged.elo_adjusted_output(
+                card
+            )
+
+    def test_process_game_invalidates_outputs(self):
+        win_rates = ColumnarCardWinRates()
+        log = load_game_log_fixture("sample_game.log.json")
+        win_rates.process_game(log)
+        card = win_rates.raw.card_names[0]
+        before = win_rates.raw_output(card)
+
+        win_rates.process_game(log)
+
+        assert before.plays * 2 == win_rates.raw_output(card).plays
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
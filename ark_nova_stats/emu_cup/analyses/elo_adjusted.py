@@ -1,8 +1,8 @@
 import dataclasses
 from collections import Counter, defaultdict
-from typing import Optional
+from typing import Any, Optional, Self
 
-from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.bga_log_parser.streaming import AnyGameLog
 from ark_nova_stats.emu_cup.player_elos import PlayerELOs
 
 
@@ -31,6 +31,10 @@ class CardELORecord:
 
         return (self.total_points + global_points) * 1.0 / (self.games + global_games)
 
+    def merge(self, other: "CardELORecord") -> None:
+        self.games += other.games
+        self.total_points += other.total_points
+
 
 @dataclasses.dataclass
 class CardWinRateELOAdjustedOutput:
@@ -51,67 +55,115 @@ class CardWinRateELOAdjusted:
         self.game_card_records: dict[str, CardELORecord] = {}
         self.average_plays = None
         self.outputs = None
-        self.player_cards: defaultdict[int, set[str]] = defaultdict(lambda: set())
+        self.player_cards: defaultdict[int, set[str]] = defaultdict(set)
+
+    def merge(self, other: "CardWinRateELOAdjusted") -> None:
+        """
+        Folds another set of (partial) aggregates into this one,
+        e.g. ones computed over a different set of games in another process.
+        """
+        self.all_cards.update(other.all_cards)
+        for card, record in other.game_card_records.items():
+            if card not in self.game_card_records:
+                self.game_card_records[card] = CardELORecord(card_name=card)
+            self.game_card_records[card].merge(record)
+
+        for player_id, player_cards in other.player_cards.items():
+            self.player_cards[player_id].update(player_cards)
+
+        self.invalidate_outputs()
+
+    def invalidate_outputs(self) -> None:
+        """
+        Drops the cached average plays & outputs, so that they're recomputed
+        to reflect any games processed since they were last computed.
+        """
+        self.average_plays = None
+        self.outputs = None
+
+    def to_checkpoint(self) -> dict[str, Any]:
+        """
+        Returns a JSON-serializable snapshot of the aggregates,
+        from which more games can later be processed (see from_checkpoint).
+        """
+        return {
+            "all_cards": dict(self.all_cards),
+            "game_card_records": [
+                [record.card_name, record.games, record.total_points]
+                for record in self.game_card_records.values()
+            ],
+            "player_cards": {
+                str(player_id): sorted(player_cards)
+                for player_id, player_cards in self.player_cards.items()
+            },
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict[str, Any]) -> Self:
+        analysis = cls()
+        analysis.all_cards.update(checkpoint["all_cards"])
+        analysis.game_card_records = {
+            card: CardELORecord(card_name=card, games=games, total_points=total_points)
+            for card, games, total_points in checkpoint["game_card_records"]
+        }
+        for player_id, player_cards in checkpoint["player_cards"].items():
+            analysis.player_cards[int(player_id)] = set(player_cards)
 
-    def process_game(self, log: GameLog, elos: dict[int, PlayerELOs]) -> None:
-        if len(log.data.players) != 2:
+        return analysis
+
+    def process_game(self, log: AnyGameLog, elos: dict[int, PlayerELOs]) -> None:
+        summary = log.summary
+        players = summary.players
+        if len(players) != 2:
             print(f"Skipping log, not a two-player game")
+            return
 
         winrates_by_id: dict[int, float] = {
-            log.data.players[0].id: probability_of_win(
-                elos[log.data.players[0].id].prior_elo,
-                elos[log.data.players[1].id].prior_elo,
+            players[0].id: probability_of_win(
+                elos[players[0].id].prior_elo,
+                elos[players[1].id].prior_elo,
             ),
-            log.data.players[1].id: probability_of_win(
-                elos[log.data.players[1].id].prior_elo,
-                elos[log.data.players[0].id].prior_elo,
+            players[1].id: probability_of_win(
+                elos[players[1].id].prior_elo,
+                elos[players[0].id].prior_elo,
             ),
         }
 
         game_cards = self.game_log_cards(log)
 
-        winner = log.winner
+        result: int | float
+        winner = summary.winner
         for player_id, player_cards in game_cards.items():
             self.all_cards.update(player_cards)
             self.player_cards[player_id] = self.player_cards[player_id].union(
                 player_cards
             )
 
+            if winner is not None and player_id == winner.id:
+                result = 1
+            elif summary.is_tie:
+                result = 0.5
+            else:
+                result = 0
+
             for card in player_cards:
                 if card not in self.game_card_records:
                     self.game_card_records[card] = CardELORecord(card_name=card)
 
-                result: int | float
-                if winner is not None and player_id == winner.id:
-                    result = 1
-                elif log.is_tie:
-                    result = 0.5
-                else:
-                    result = 0
                 self.game_card_records[card].add_points(
                     result - winrates_by_id[player_id]
                 )
 
-    def game_log_cards(self, log: GameLog) -> dict[int, set[str]]:
-        game_cards: defaultdict[int, set[str]] = defaultdict(lambda: set())
-        for event in log.data.logs:
-            for event_data in event.data:
-                if not event_data.is_play_action:
-                    continue
-
-                card_names = event_data.played_card_names
-                if card_names is None:
-                    continue
+        self.invalidate_outputs()
 
-                if event_data.player is not None:
-                    if event_data.player["id"] is None:
-                        raise ValueError(
-                            f"Player ID not set for log event: {event_data}"
-                        )
-                    player_id: int = int(event_data.player["id"])
-                    game_cards[player_id] = game_cards[player_id].union(card_names)
+    def game_log_cards(self, log: AnyGameLog) -> dict[int, set[str]]:
+        summary = log.summary
+        if summary.unattributed_play is not None:
+            raise ValueError(
+                f"Player ID not set for log event: {summary.unattributed_play}"
+            )
 
-        return game_cards
+        return summary.card_names_by_player
 
     def output(self, card: str) -> CardWinRateELOAdjustedOutput:
         if self.average_plays is None:
@@ -144,10 +196,8 @@ class CardWinRateELOAdjusted:
 
 
 class OpeningHandWinRateELOAdjusted(CardWinRateELOAdjusted):
-    def game_log_cards(self, log: GameLog) -> dict[int, set[str]]:
-        game_cards: defaultdict[int, set[str]] = defaultdict(lambda: set())
-        for player_id, hand_cards in log.data.opening_hands.items():
-            hand_card_names = [card.name for card in hand_cards]
-            game_cards[player_id] = game_cards[player_id].union(hand_card_names)
-
-        return game_cards
+    def game_log_cards(self, log: AnyGameLog) -> dict[int, set[str]]:
+        return {
+            player_id: set(card.name for card in hand_cards)
+            for player_id, hand_cards in log.summary.opening_hands.items()
+        }
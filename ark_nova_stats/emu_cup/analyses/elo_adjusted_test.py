@@ -1,8 +1,38 @@
+import json
 import sys
+from pathlib import Path
 
 import pytest
+from python.runfiles import Runfiles  # type: ignore
 
-from ark_nova_stats.emu_cup.analyses.elo_adjusted import CardWinRateELOAdjusted
+from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.emu_cup.analyses.elo_adjusted import (
+    CardWinRateELOAdjusted,
+    OpeningHandWinRateELOAdjusted,
+)
+from ark_nova_stats.emu_cup.player_elos import PlayerELOs
+
+
+def load_game_log_fixture(filename: str) -> GameLog:
+    r = Runfiles.Create()
+    fixture_file_path = r.Rlocation(
+        str(Path("_main") / "ark_nova_stats" / "bga_log_parser" / "fixtures" / filename)
+    )
+    with open(fixture_file_path, "r") as fixture_file:
+        return GameLog(**json.loads(fixture_file.read().strip()))
+
+
+def fake_elos(log: GameLog) -> dict[int, PlayerELOs]:
+    return {
+        player.id: PlayerELOs(
+            id=player.id,
+            prior_elo=1000 + 50 * i,
+            new_elo=1000 + 50 * i,
+            prior_arena_elo=0,
+            new_arena_elo=0,
+        )
+        for i, player in enumerate(log.data.players)
+    }
 
 
 class TestCardWinRateELOAdjusted:
@@ -14,6 +44,63 @@ class TestCardWinRateELOAdjusted:
         assert 0 == len(elo_adjusted.all_cards)
         assert 0 == len(elo_adjusted.game_card_records)
 
+    @pytest.mark.parametrize(
+        "analysis_type", [CardWinRateELOAdjusted, OpeningHandWinRateELOAdjusted]
+    )
+    def test_merged_partials_match_single_pass(self, analysis_type):
+        logs = [
+            load_game_log_fixture("sample_game.log.json"),
+            load_game_log_fixture("tie.log.json"),
+            load_game_log_fixture("533468391_darcelmaw_hardyzhao.json"),
+        ]
+
+        single_pass = analysis_type()
+        for log in logs:
+            single_pass.process_game(log, fake_elos(log))
+
+        merged = analysis_type()
+        for log in logs:
+            partial = analysis_type()
+            partial.process_game(log, fake_elos(log))
+            merged.merge(partial)
+
+        assert single_pass.all_cards == merged.all_cards
+        assert single_pass.game_card_records.keys() == merged.game_card_records.keys()
+        for card in single_pass.all_cards:
+            assert single_pass.output(card) == merged.output(card)
+
+    @pytest.mark.parametrize(
+        "analysis_type", [CardWinRateELOAdjusted, OpeningHandWinRateELOAdjusted]
+    )
+    def test_resuming_from_checkpoint_matches_single_pass(self, analysis_type):
+        logs = [
+            load_game_log_fixture("sample_game.log.json"),
+            load_game_log_fixture("tie.log.json"),
+            load_game_log_fixture("533468391_darcelmaw_hardyzhao.json"),
+        ]
+
+        single_pass = analysis_type()
+        for log in logs:
+            single_pass.process_game(log, fake_elos(log))
+
+        initial = analysis_type()
+        initial.process_game(logs[0], fake_elos(logs[0]))
+        # Outputs computed before more games arrive shouldn't be carried over.
+        for card in initial.all_cards:
+            initial.output(card)
+        checkpoint = json.loads(json.dumps(initial.to_checkpoint()))
+
+        resumed = analysis_type.from_checkpoint(checkpoint)
+        assert analysis_type == type(resumed)
+        for log in logs[1:]:
+            resumed.process_game(log, fake_elos(log))
+
+        assert single_pass.all_cards == resumed.all_cards
+        assert single_pass.game_card_records == resumed.game_card_records
+        assert single_pass.player_cards == resumed.player_cards
+        for card in single_pass.all_cards:
+            assert single_pass.output(card) == resumed.output(card)
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
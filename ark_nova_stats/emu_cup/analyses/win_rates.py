@@ -1,8 +1,8 @@
 import dataclasses
 from collections import Counter, defaultdict
-from typing import Optional
+from typing import Any, Optional, Self
 
-from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.bga_log_parser.streaming import AnyGameLog
 
 
 @dataclasses.dataclass
@@ -28,6 +28,10 @@ class CardRecord:
             (self.wins + global_wins) * 1.0 / (self.wins + self.losses + global_plays)
         )
 
+    def merge(self, other: "CardRecord") -> None:
+        self.wins += other.wins
+        self.losses += other.losses
+
 
 @dataclasses.dataclass
 class CardRawWinRateOutput:
@@ -46,14 +50,73 @@ class CardRawWinRate:
         self.game_card_records: dict[str, CardRecord] = {}
         self.global_stats = None
         self.outputs = None
-        self.player_cards: defaultdict[int, set[str]] = defaultdict(lambda: set())
-
-    def process_game(self, log: GameLog) -> None:
-        winner = log.winner
+        self.player_cards: defaultdict[int, set[str]] = defaultdict(set)
+
+    def merge(self, other: "CardRawWinRate") -> None:
+        """
+        Folds another set of (partial) aggregates into this one,
+        e.g. ones computed over a different set of games in another process.
+        """
+        self.all_cards.update(other.all_cards)
+        self.winner_cards.update(other.winner_cards)
+        self.loser_cards.update(other.loser_cards)
+        for card, record in other.game_card_records.items():
+            if card not in self.game_card_records:
+                self.game_card_records[card] = CardRecord(card_name=card)
+            self.game_card_records[card].merge(record)
+
+        for player_id, player_cards in other.player_cards.items():
+            self.player_cards[player_id].update(player_cards)
+
+        self.invalidate_outputs()
+
+    def invalidate_outputs(self) -> None:
+        """
+        Drops the cached global stats & outputs, so that they're recomputed
+        to reflect any games processed since they were last computed.
+        """
+        self.global_stats = None
+        self.outputs = None
 
+    def to_checkpoint(self) -> dict[str, Any]:
+        """
+        Returns a JSON-serializable snapshot of the aggregates,
+        from which more games can later be processed (see from_checkpoint).
+        """
+        return {
+            "all_cards": dict(self.all_cards),
+            "winner_cards": dict(self.winner_cards),
+            "loser_cards": dict(self.loser_cards),
+            "game_card_records": [
+                [record.card_name, record.wins, record.losses]
+                for record in self.game_card_records.values()
+            ],
+            "player_cards": {
+                str(player_id): sorted(player_cards)
+                for player_id, player_cards in self.player_cards.items()
+            },
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict[str, Any]) -> Self:
+        analysis = cls()
+        analysis.all_cards.update(checkpoint["all_cards"])
+        analysis.winner_cards.update(checkpoint["winner_cards"])
+        analysis.loser_cards.update(checkpoint["loser_cards"])
+        analysis.game_card_records = {
+            card: CardRecord(card_name=card, wins=wins, losses=losses)
+            for card, wins, losses in checkpoint["game_card_records"]
+        }
+        for player_id, player_cards in checkpoint["player_cards"].items():
+            analysis.player_cards[int(player_id)] = set(player_cards)
+
+        return analysis
+
+    def process_game(self, log: AnyGameLog) -> None:
+        summary = log.summary
         game_cards = self.game_log_cards(log)
 
-        winner = log.winner
+        winner = summary.winner
         for player_id, player_cards in game_cards.items():
             self.all_cards.update(player_cards)
 
@@ -67,35 +130,25 @@ class CardRawWinRate:
 
                 if winner is not None and player_id == winner.id:
                     self.game_card_records[card].wins += 1
-                elif log.is_tie:
+                elif summary.is_tie:
                     self.game_card_records[card].wins += 1
                     self.game_card_records[card].losses += 1
                 else:
                     self.game_card_records[card].losses += 1
 
-    def game_log_cards(self, log: GameLog) -> dict[int, set[str]]:
-        game_cards: defaultdict[int, set[str]] = defaultdict(lambda: set())
-        for event in log.data.logs:
-            for event_data in event.data:
-                if not event_data.is_play_action:
-                    continue
+        self.invalidate_outputs()
 
-                card_names = event_data.played_card_names
-                if card_names is None:
-                    continue
+    def game_log_cards(self, log: AnyGameLog) -> dict[int, set[str]]:
+        summary = log.summary
+        if summary.is_tie:
+            return {}
 
-                if log.is_tie:
-                    continue
-
-                if event_data.player is not None:
-                    if event_data.player["id"] is None:
-                        raise ValueError(
-                            f"Player ID not set for log event: {event_data}"
-                        )
-                    player_id: int = int(event_data.player["id"])
-                    game_cards[player_id] = game_cards[player_id].union(card_names)
+        if summary.unattributed_play is not None:
+            raise ValueError(
+                f"Player ID not set for log event: {summary.unattributed_play}"
+            )
 
-        return game_cards
+        return summary.card_names_by_player
 
     def output(self, card) -> CardRawWinRateOutput:
         if self.global_stats is None:
@@ -134,10 +187,8 @@ class CardRawWinRate:
 
 
 class OpeningHandRawWinRate(CardRawWinRate):
-    def game_log_cards(self, log: GameLog) -> dict[int, set[str]]:
-        game_cards: defaultdict[int, set[str]] = defaultdict(lambda: set())
-        for player_id, hand_cards in log.data.opening_hands.items():
-            hand_card_names = [card.name for card in hand_cards]
-            game_cards[player_id] = game_cards[player_id].union(hand_card_names)
-
-        return game_cards
+    def game_log_cards(self, log: AnyGameLog) -> dict[int, set[str]]:
+        return {
+            player_id: set(card.name for card in hand_cards)
+            for player_id, hand_cards in log.summary.opening_hands.items()
+        }
@@ -1,8 +1,24 @@
+import json
 import sys
+from pathlib import Path
 
 import pytest
+from python.runfiles import Runfiles  # type: ignore
 
-from ark_nova_stats.emu_cup.analyses.win_rates import CardRawWinRate
+from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.emu_cup.analyses.win_rates import (
+    CardRawWinRate,
+    OpeningHandRawWinRate,
+)
+
+
+def load_game_log_fixture(filename: str) -> GameLog:
+    r = Runfiles.Create()
+    fixture_file_path = r.Rlocation(
+        str(Path("_main") / "ark_nova_stats" / "bga_log_parser" / "fixtures" / filename)
+    )
+    with open(fixture_file_path, "r") as fixture_file:
+        return GameLog(**json.loads(fixture_file.read().strip()))
 
 
 class TestCardRawWinRate:
@@ -14,6 +30,78 @@ class TestCardRawWinRate:
         assert 0 == len(raw_win_rate.all_cards)
         assert 0 == len(raw_win_rate.game_card_records)
 
+    @pytest.mark.parametrize("analysis_type", [CardRawWinRate, OpeningHandRawWinRate])
+    def test_merged_partials_match_single_pass(self, analysis_type):
+        logs = [
+            load_game_log_fixture("sample_game.log.json"),
+            load_game_log_fixture("4p.log.json"),
+            load_game_log_fixture("533468391_darcelmaw_hardyzhao.json"),
+        ]
+
+        single_pass = analysis_type()
+        for log in logs:
+            single_pass.process_game(log)
+
+        merged = analysis_type()
+        for log in logs:
+            partial = analysis_type()
+            partial.process_game(log)
+            merged.merge(partial)
+
+        assert single_pass.all_cards == merged.all_cards
+        assert single_pass.game_card_records == merged.game_card_records
+        for card in single_pass.all_cards:
+            assert single_pass.output(card) == merged.output(card)
+
+    def test_merge_invalidates_outputs(self):
+        raw_win_rate = CardRawWinRate()
+        raw_win_rate.process_game(load_game_log_fixture("sample_game.log.json"))
+        card = next(iter(raw_win_rate.all_cards))
+        before = raw_win_rate.output(card)
+
+        other = CardRawWinRate()
+        other.process_game(load_game_log_fixture("sample_game.log.json"))
+        raw_win_rate.merge(other)
+
+        assert before.plays * 2 == raw_win_rate.output(card).plays
+
+    def test_process_game_invalidates_outputs(self):
+        raw_win_rate = CardRawWinRate()
+        raw_win_rate.process_game(load_game_log_fixture("sample_game.log.json"))
+        card = next(iter(raw_win_rate.all_cards))
+        before = raw_win_rate.output(card)
+
+        raw_win_rate.process_game(load_game_log_fixture("sample_game.log.json"))
+
+        assert before.plays * 2 == raw_win_rate.output(card).plays
+
+    @pytest.mark.parametrize("analysis_type", [CardRawWinRate, OpeningHandRawWinRate])
+    def test_resuming_from_checkpoint_matches_single_pass(self, analysis_type):
+        logs = [
+            load_game_log_fixture("sample_game.log.json"),
+            load_game_log_fixture("4p.log.json"),
+            load_game_log_fixture("533468391_darcelmaw_hardyzhao.json"),
+        ]
+
+        single_pass = analysis_type()
+        for log in logs:
+            single_pass.process_game(log)
+
+        initial = analysis_type()
+        initial.process_game(logs[0])
+        checkpoint = json.loads(json.dumps(initial.to_checkpoint()))
+
+        resumed = analysis_type.from_checkpoint(checkpoint)
+        assert analysis_type == type(resumed)
+        for log in logs[1:]:
+            resumed.process_game(log)
+
+        assert single_pass.all_cards == resumed.all_cards
+        assert single_pass.game_card_records == resumed.game_card_records
+        assert single_pass.player_cards == resumed.player_cards
+        for card in single_pass.all_cards:
+            assert single_pass.output(card) == resumed.output(card)
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
 
+import argparse
 import csv
 import datetime
+import functools
+import gzip
 import json
+import multiprocessing
 import os
-import sys
+import time
 from pathlib import Path
+from typing import Iterator, Optional, Protocol, Self, TypeVar
 
 from python.runfiles import Runfiles  # type: ignore
 
 from ark_nova_stats.bga_log_parser.exceptions import StatsNotSetError
-from ark_nova_stats.bga_log_parser.game_log import GameLog
+from ark_nova_stats.bga_log_parser.streaming import StreamingGameLog
+from ark_nova_stats.emu_cup.analyses.columnar import (
+    ColumnarCardWinRates,
+    ColumnarOutputs,
+)
 from ark_nova_stats.emu_cup.analyses.elo_adjusted import (
     CardWinRateELOAdjusted,
+    CardWinRateELOAdjustedOutput,
     OpeningHandWinRateELOAdjusted,
 )
 from ark_nova_stats.emu_cup.analyses.win_rates import (
     CardRawWinRate,
+    CardRawWinRateOutput,
     OpeningHandRawWinRate,
 )
 from ark_nova_stats.emu_cup.player_elos import PlayerELOs
@@ -31,41 +42,374 @@ def list_game_datafiles() -> list[Path]:
     )
 
 
-def main(working_dir: str) -> int:
-    raw_win_rates = CardRawWinRate()
-    opening_hand_raw_win_rates = OpeningHandRawWinRate()
-    elo_win_rates = CardWinRateELOAdjusted()
-    opening_hand_elo_win_rates = OpeningHandWinRateELOAdjusted()
-
-    for p in list_game_datafiles():
-        # path_parts = p.name.split("_")
-        # if int(path_parts[0]) not in EMU_CUP_GAME_TABLE_IDS:
-        #     continue
-
-        print(p)
-        with open(p, "r") as f:
-            parsed_file = json.loads(f.read().strip())
-            try:
-                log = GameLog(**parsed_file["log"])
-            except StatsNotSetError:
-                print(f"{p} doesn't have stats set!")
-                continue
-            elos: dict[int, PlayerELOs] = {
-                int(user_id): PlayerELOs(id=user_id, **vals)
-                for user_id, vals in parsed_file["elos"].items()
-            }
+# Bump this whenever the shape of the checkpointed aggregates changes.
+CHECKPOINT_VERSION = 1
+
+
+def read_datafile(p: Path) -> Optional[tuple[StreamingGameLog, dict[int, PlayerELOs]]]:
+    """
+    Reads an archived game's replay, along with its players' ELOs (if it has any).
+    """
+    # path_parts = p.name.split("_")
+    # if int(path_parts[0]) not in EMU_CUP_GAME_TABLE_IDS:
+    #     continue
+
+    try:
+        # Stream the replay rather than decoding the whole file up-front.
+        log = StreamingGameLog(p, prefix=("log",))
+    except StatsNotSetError:
+        print(f"{p} doesn't have stats set!")
+        return None
+    elos: dict[int, PlayerELOs] = {
+        int(user_id): PlayerELOs(id=user_id, **vals)
+        for user_id, vals in log.extra.get("elos", {}).items()
+    }
+    return log, elos
+
 
-        raw_win_rates.process_game(log)
-        opening_hand_raw_win_rates.process_game(log)
+class GameAnalyses:
+    """
+    The full set of analyses that we run over each game.
+    Partial analyses (e.g. over different sets of games in different processes) can be merged.
+    """
+
+    def __init__(self) -> None:
+        self.raw_win_rates = CardRawWinRate()
+        self.opening_hand_raw_win_rates = OpeningHandRawWinRate()
+        self.elo_win_rates = CardWinRateELOAdjusted()
+        self.opening_hand_elo_win_rates = OpeningHandWinRateELOAdjusted()
+        self.num_files = 0
+        self.num_games = 0
+        # Names of the datafiles that have been folded into these analyses.
+        self.processed_files: set[str] = set()
+
+    def process_datafile(self, p: Path) -> None:
+        self.num_files += 1
+        self.processed_files.add(p.name)
+        datafile = read_datafile(p)
+        if datafile is None:
+            return
+        log, elos = datafile
+
+        self.num_games += 1
+        self.raw_win_rates.process_game(log)
+        self.opening_hand_raw_win_rates.process_game(log)
 
         if not elos:
-            continue
+            return
         try:
-            elo_win_rates.process_game(log, elos)
-            opening_hand_elo_win_rates.process_game(log, elos)
+            self.elo_win_rates.process_game(log, elos)
+            self.opening_hand_elo_win_rates.process_game(log, elos)
         except Exception as e:
             print(f"Failed to process {p}: {e}")
-            continue
+
+    def merge(self, other: "GameAnalyses") -> None:
+        self.raw_win_rates.merge(other.raw_win_rates)
+        self.opening_hand_raw_win_rates.merge(other.opening_hand_raw_win_rates)
+        self.elo_win_rates.merge(other.elo_win_rates)
+        self.opening_hand_elo_win_rates.merge(other.opening_hand_elo_win_rates)
+        self.num_files += other.num_files
+        self.num_games += other.num_games
+        self.processed_files.update(other.processed_files)
+
+    def save_checkpoint(self, path: Path) -> None:
+        """
+        Writes the aggregates to a gzipped JSON file,
+        so that a later run only has to process datafiles that arrived since.
+        """
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "num_files": self.num_files,
+            "num_games": self.num_games,
+            "processed_files": sorted(self.processed_files),
+            "raw_win_rates": self.raw_win_rates.to_checkpoint(),
+            "opening_hand_raw_win_rates": self.opening_hand_raw_win_rates.to_checkpoint(),
+            "elo_win_rates": self.elo_win_rates.to_checkpoint(),
+            "opening_hand_elo_win_rates": self.opening_hand_elo_win_rates.to_checkpoint(),
+        }
+
+        # Write to a temporary file first, so that an interrupted run can't clobber the checkpoint.
+        temp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file, separators=(",", ":"))
+        temp_path.replace(path)
+
+    @classmethod
+    def load_checkpoint(cls, path: Path) -> Self:
+        with gzip.open(path, "rt", encoding="utf-8") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Checkpoint {path} has version {checkpoint.get('version')}, expected {CHECKPOINT_VERSION}"
+            )
+
+        analyses = cls()
+        analyses.num_files = checkpoint["num_files"]
+        analyses.num_games = checkpoint["num_games"]
+        analyses.processed_files = set(checkpoint["processed_files"])
+        analyses.raw_win_rates = CardRawWinRate.from_checkpoint(
+            checkpoint["raw_win_rates"]
+        )
+        analyses.opening_hand_raw_win_rates = OpeningHandRawWinRate.from_checkpoint(
+            checkpoint["opening_hand_raw_win_rates"]
+        )
+        analyses.elo_win_rates = CardWinRateELOAdjusted.from_checkpoint(
+            checkpoint["elo_win_rates"]
+        )
+        analyses.opening_hand_elo_win_rates = (
+            OpeningHandWinRateELOAdjusted.from_checkpoint(
+                checkpoint["opening_hand_elo_win_rates"]
+            )
+        )
+        return analyses
+
+
+class ColumnarGameAnalyses:
+    """
+    The same analyses as GameAnalyses, computed by ColumnarCardWinRates over card incidence matrices
+    rather than by updating per-card records game by game. Its outputs are the same.
+    It can't be checkpointed, since it keeps a row per player per game.
+    """
+
+    def __init__(self) -> None:
+        self.win_rates = ColumnarCardWinRates()
+        self.opening_hand_win_rates = ColumnarCardWinRates(opening_hands=True)
+        self.num_files = 0
+        self.num_games = 0
+        self.processed_files: set[str] = set()
+
+    @property
+    def raw_win_rates(self) -> ColumnarOutputs[CardRawWinRateOutput]:
+        return self.win_rates.raw_win_rates
+
+    @property
+    def opening_hand_raw_win_rates(self) -> ColumnarOutputs[CardRawWinRateOutput]:
+        return self.opening_hand_win_rates.raw_win_rates
+
+    @property
+    def elo_win_rates(self) -> ColumnarOutputs[CardWinRateELOAdjustedOutput]:
+        return self.win_rates.elo_adjusted_win_rates
+
+    @property
+    def opening_hand_elo_win_rates(
+        self,
+    ) -> ColumnarOutputs[CardWinRateELOAdjustedOutput]:
+        return self.opening_hand_win_rates.elo_adjusted_win_rates
+
+    def process_datafile(self, p: Path) -> None:
+        self.num_files += 1
+        self.processed_files.add(p.name)
+        datafile = read_datafile(p)
+        if datafile is None:
+            return
+        log, elos = datafile
+
+        self.num_games += 1
+        self.win_rates.process_raw_game(log)
+        self.opening_hand_win_rates.process_raw_game(log)
+
+        if not elos:
+            return
+        try:
+            self.win_rates.process_elo_adjusted_game(log, elos)
+            self.opening_hand_win_rates.process_elo_adjusted_game(log, elos)
+        except Exception as e:
+            print(f"Failed to process {p}: {e}")
+
+    def merge(self, other: "ColumnarGameAnalyses") -> None:
+        self.win_rates.merge(other.win_rates)
+        self.opening_hand_win_rates.merge(other.opening_hand_win_rates)
+        self.num_files += other.num_files
+        self.num_games += other.num_games
+        self.processed_files.update(other.processed_files)
+
+
+AnyGameAnalyses = GameAnalyses | ColumnarGameAnalyses
+
+# The ways that card win rates can be computed. They produce the same outputs.
+ENGINES: dict[str, type[AnyGameAnalyses]] = {
+    "records": GameAnalyses,
+    "columnar": ColumnarGameAnalyses,
+}
+
+
+class Analyses(Protocol):
+    num_files: int
+    num_games: int
+    processed_files: set[str]
+
+    def process_datafile(self, p: Path) -> None: ...
+
+    def merge(self, other: Self) -> None: ...
+
+
+AnalysesT = TypeVar("AnalysesT", bound=Analyses)
+
+
+def analyze_datafiles(paths: list[Path], analyses_type: type[AnalysesT]) -> AnalysesT:
+    analyses = analyses_type()
+    for p in paths:
+        analyses.process_datafile(p)
+
+    return analyses
+
+
+def analyze_all_datafiles(
+    paths: list[Path],
+    analyses: AnalysesT,
+    processes: int = 1,
+    chunk_size: int = 50,
+) -> AnalysesT:
+    """
+    Folds the given datafiles into `analyses` (e.g. empty, or loaded from a checkpoint),
+    skipping any datafiles that it's already processed.
+    """
+    paths = [p for p in paths if p.name not in analyses.processed_files]
+
+    # Chunks are merged back in the order they were listed,
+    # so that cards are output in the same order regardless of parallelism.
+    chunks = [paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    initial_num_files = analyses.num_files
+    start = time.time()
+
+    def report_progress() -> None:
+        elapsed = time.time() - start
+        num_files = analyses.num_files - initial_num_files
+        print(
+            f"Processed {num_files}/{len(paths)} new files "
+            f"({analyses.num_games} games total) in {elapsed:.1f}s: "
+            f"{num_files / (elapsed or 1):.1f} files/s"
+        )
+
+    if processes <= 1:
+        for chunk in chunks:
+            analyses.merge(analyze_datafiles(chunk, type(analyses)))
+            report_progress()
+        return analyses
+
+    with multiprocessing.Pool(processes=processes) as pool:
+        for partial in pool.imap(
+            functools.partial(analyze_datafiles, analyses_type=type(analyses)), chunks
+        ):
+            analyses.merge(partial)
+            report_progress()
+
+    return analyses
+
+
+def card_rows(analyses: AnyGameAnalyses) -> Iterator[dict]:
+    """
+    Yields a CSV row for each card, combining each analysis' output for it.
+    """
+    raw_win_rates = analyses.raw_win_rates
+    opening_hand_raw_win_rates = analyses.opening_hand_raw_win_rates
+    elo_win_rates = analyses.elo_win_rates
+    opening_hand_elo_win_rates = analyses.opening_hand_elo_win_rates
+
+    for card in raw_win_rates.all_cards:
+        raw_output = raw_win_rates.output(card)
+        elo_output = elo_win_rates.output(card)
+        row = {
+            "card": card,
+            "play_count_raw": raw_output.plays,
+            "win_rate_raw": raw_output.rate,
+            "win_rate_raw_bayes": raw_output.rate_bayes,
+        }
+        if card in opening_hand_raw_win_rates.all_cards:
+            opening_hand_raw_output = opening_hand_raw_win_rates.output(card)
+            row.update(
+                {
+                    "opening_hand_count_raw": opening_hand_raw_output.plays,
+                    "opening_hand_win_rate_raw": opening_hand_raw_output.rate,
+                    "opening_hand_win_rate_raw_bayes": opening_hand_raw_output.rate_bayes,
+                }
+            )
+
+        row.update(
+            {
+                "play_count_wae": elo_output.plays,
+                "wins_above_expected": elo_output.rate,
+                "wins_above_expected_bayes": elo_output.rate_bayes,
+            }
+        )
+
+        if card in opening_hand_elo_win_rates.all_cards:
+            opening_hand_elo_output = opening_hand_elo_win_rates.output(card)
+            row.update(
+                {
+                    "opening_hand_count_wae": opening_hand_elo_output.plays,
+                    "opening_hand_wins_above_expected": opening_hand_elo_output.rate,
+                    "opening_hand_wins_above_expected_bayes": opening_hand_elo_output.rate_bayes,
+                }
+            )
+
+        yield row
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compute card win rates over archived Ark Nova games."
+    )
+    parser.add_argument(
+        "working_dir",
+        help="Directory that the resulting CSV should be written to.",
+    )
+    parser.add_argument(
+        "--processes",
+        default=1,
+        type=int,
+        help="Number of processes to parse & aggregate games with.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        default=50,
+        type=int,
+        help="Number of game files that each process handles at a time.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        type=Path,
+        help="Gzipped JSON file to resume aggregates from (if it exists) and save them to, so that only new game files are processed.",
+    )
+    parser.add_argument(
+        "--engine",
+        default="records",
+        choices=sorted(ENGINES),
+        help="How to compute win rates: by updating per-card records game by game, or over columnar card incidence matrices. Both produce the same output.",
+    )
+    args = parser.parse_args()
+    if args.engine != "records" and args.checkpoint is not None:
+        parser.error("--checkpoint is only supported by the records engine")
+
+    return args
+
+
+def main(
+    working_dir: str,
+    processes: int = 1,
+    chunk_size: int = 50,
+    checkpoint: Optional[Path] = None,
+    engine: str = "records",
+) -> int:
+    analyses: AnyGameAnalyses = ENGINES[engine]()
+    if checkpoint is not None:
+        checkpoint = checkpoint.resolve()
+        if checkpoint.exists():
+            analyses = GameAnalyses.load_checkpoint(checkpoint)
+            print(
+                f"Resuming from checkpoint with {len(analyses.processed_files)} files"
+            )
+
+    analyses = analyze_all_datafiles(
+        list_game_datafiles(),
+        analyses,
+        processes=processes,
+        chunk_size=chunk_size,
+    )
+    if checkpoint is not None and isinstance(analyses, GameAnalyses):
+        analyses.save_checkpoint(checkpoint)
 
     os.chdir(working_dir)
 
@@ -88,47 +432,19 @@ def main(working_dir: str) -> int:
         ]
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        for card in raw_win_rates.all_cards:
-            raw_output = raw_win_rates.output(card)
-            elo_output = elo_win_rates.output(card)
-            row = {
-                "card": card,
-                "play_count_raw": raw_output.plays,
-                "win_rate_raw": raw_output.rate,
-                "win_rate_raw_bayes": raw_output.rate_bayes,
-            }
-            if card in opening_hand_raw_win_rates.all_cards:
-                opening_hand_raw_output = opening_hand_raw_win_rates.output(card)
-                row.update(
-                    {
-                        "opening_hand_count_raw": opening_hand_raw_output.plays,
-                        "opening_hand_win_rate_raw": opening_hand_raw_output.rate,
-                        "opening_hand_win_rate_raw_bayes": opening_hand_raw_output.rate_bayes,
-                    }
-                )
-
-            row.update(
-                {
-                    "play_count_wae": elo_output.plays,
-                    "wins_above_expected": elo_output.rate,
-                    "wins_above_expected_bayes": elo_output.rate_bayes,
-                }
-            )
-
-            if card in opening_hand_elo_win_rates.all_cards:
-                opening_hand_elo_output = opening_hand_elo_win_rates.output(card)
-                row.update(
-                    {
-                        "opening_hand_count_wae": opening_hand_elo_output.plays,
-                        "opening_hand_wins_above_expected": opening_hand_elo_output.rate,
-                        "opening_hand_wins_above_expected_bayes": opening_hand_elo_output.rate_bayes,
-                    }
-                )
-
-            writer.writerow(row)
+        writer.writerows(card_rows(analyses))
 
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main(sys.argv[1]))
+    args = parse_args()
+    raise SystemExit(
+        main(
+            args.working_dir,
+            processes=args.processes,
+            chunk_size=args.chunk_size,
+            checkpoint=args.checkpoint,
+            engine=args.engine,
+        )
+    )
@@ -0,0 +1,74 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from python.runfiles import Runfiles  # type: ignore
+
+from ark_nova_stats.emu_cup.analyze_games import (
+    ColumnarGameAnalyses,
+    GameAnalyses,
+    analyze_all_datafiles,
+    card_rows,
+)
+
+# Every archived game has two players, so every card has an ELO-adjusted win rate.
+FIXTURES = [
+    "sample_game.log.json",
+    "tie.log.json",
+    "533468391_darcelmaw_hardyzhao.json",
+]
+
+
+def write_datafiles(directory: Path) -> list[Path]:
+    """
+    Writes the replay fixtures out the way archived games are stored, alongside made-up ELOs.
+    """
+    r = Runfiles.Create()
+    paths = []
+    for i, filename in enumerate(FIXTURES):
+        fixture_path = r.Rlocation(
+            str(
+                Path("_main")
+                / "ark_nova_stats"
+                / "bga_log_parser"
+                / "fixtures"
+                / filename
+            )
+        )
+        with open(fixture_path, "r") as fixture_file:
+            log = json.loads(fixture_file.read().strip())
+
+        elos = {
+            str(player["id"]): {
+                "prior_elo": 1000 + 50 * j,
+                "new_elo": 1000 + 50 * j,
+                "prior_arena_elo": 0,
+                "new_arena_elo": 0,
+            }
+            for j, player in enumerate(log["data"]["players"])
+        }
+        path = directory / f"{i}_{filename}"
+        path.write_text(json.dumps({"log": log, "elos": elos}))
+        paths.append(path)
+
+    return paths
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_columnar_engine_matches_records_engine(tmp_path: Path, processes: int):
+    paths = write_datafiles(tmp_path)
+
+    records = analyze_all_datafiles(paths, GameAnalyses(), chunk_size=1)
+    columnar = analyze_all_datafiles(
+        paths, ColumnarGameAnalyses(), processes=processes, chunk_size=1
+    )
+
+    assert len(FIXTURES) == records.num_games == columnar.num_games
+    rows = list(card_rows(records))
+    assert rows
+    assert rows == list(card_rows(columnar))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
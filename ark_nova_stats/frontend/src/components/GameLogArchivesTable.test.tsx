@@ -1,7 +1,7 @@
 import { render, screen } from '@testing-library/react';
 import GameLogArchivesTable from './GameLogArchivesTable';
 import { emptyGameLog } from '../types/GameLog';
-import GameLogArchive from '../types/GameLogArchive';
+import GameLogArchive, { emptyGameLogArchive } from '../types/GameLogArchive';
 import { BrowserRouter } from 'react-router-dom';
 
 const archive: GameLogArchive = {
@@ -13,6 +13,19 @@ const archive: GameLogArchive = {
     numUsers: 345,
     maxGameLog: emptyGameLog,
     createdAt: 1727705813,
+    isDelta: false,
+    baseArchiveId: null,
+    deltaArchives: [],
+}
+
+const deltaArchive: GameLogArchive = {
+    ...emptyGameLogArchive,
+    id: 12346,
+    url: "https://fake/delta/url",
+    numGameLogs: 25,
+    createdAt: 1727792213,
+    isDelta: true,
+    baseArchiveId: 12345,
 }
 
 it('should handle when no data was retrieved', async () => {
@@ -34,3 +47,12 @@ it('should handle a single game log archive', async () => {
     expect(await screen.findByText("1000")).toBeInTheDocument();
     expect(await screen.findByText("345")).toBeInTheDocument();
 });
+
+it('should list delta archives as updates to their full archive', async () => {
+    render(
+        <GameLogArchivesTable gameLogArchives={[{...archive, deltaArchives: [deltaArchive]}]}/>,
+        {wrapper: BrowserRouter}
+    );
+    expect(await screen.findByText("1000")).toBeInTheDocument();
+    expect(await screen.findByText("+25 games (2024-10-01)")).toBeInTheDocument();
+});
@@ -16,7 +16,7 @@ type GameLogArchivesTableRow = {
     "Users": React.JSX.Element,
     "Latest table": React.JSX.Element,
     "Size in MB": React.JSX.Element,
-
+    "Updates": React.JSX.Element,
 }
 
 const GameLogArchivesTable = ({gameLogArchives}: GameLogArchivesTableParams) => {
@@ -24,6 +24,14 @@ const GameLogArchivesTable = ({gameLogArchives}: GameLogArchivesTableParams) =>
         return <p>Error: game log archives could not be retrieved!</p>;
     } else {
         const rows: GameLogArchivesTableRow[] = gameLogArchives.map((gameLogArchive: GameLogArchive) => {
+            // Deltas only hold the games since the previous archive, so they're listed as updates to their full archive.
+            let updatesDescription = gameLogArchive.deltaArchives.length === 0 ? <p>None</p> : <ul>
+                {gameLogArchive.deltaArchives.map((deltaArchive: GameLogArchive) => (
+                    <li key={deltaArchive.id}>
+                        <PageLink to={deltaArchive.url}>+{deltaArchive.numGameLogs} games ({getDate(deltaArchive.createdAt)})</PageLink>
+                    </li>
+                ))}
+            </ul>;
             let latestTableDescription = <PageLink to={"https://boardgamearena.com/table?table=" + gameLogArchive.maxGameLog.bgaTableId}>
                 {gameLogArchive.maxGameLog.bgaTableId}
             </PageLink>;
@@ -35,6 +43,7 @@ const GameLogArchivesTable = ({gameLogArchives}: GameLogArchivesTableParams) =>
                 "Users": <p>{gameLogArchive.numUsers}</p>,
                 "Latest table": <p>{latestTableDescription}</p>,
                 "Size in MB": <p>{Math.round((gameLogArchive.sizeBytes) / (1024 * 1024))}</p>,
+                "Updates": updatesDescription,
             }
         });
         return (
@@ -9,6 +9,9 @@ type GameLogArchive = {
     numUsers: number;
     maxGameLog: GameLog;
     createdAt: number;
+    isDelta: boolean;
+    baseArchiveId: number | null;
+    deltaArchives: GameLogArchive[];
 }
 
 export const emptyGameLogArchive: GameLogArchive = {
@@ -20,6 +23,9 @@ export const emptyGameLogArchive: GameLogArchive = {
     numUsers: 0,
     maxGameLog: emptyGameLog,
     createdAt: 0,
+    isDelta: false,
+    baseArchiveId: null,
+    deltaArchives: [],
 }
 
 export default GameLogArchive;
@@ -49,6 +49,14 @@ export const HOME_VIEW_QUERY = gql`
               }
             }
             createdAt
+            isDelta
+            baseArchiveId
+            deltaArchives {
+                id
+                url
+                numGameLogs
+                createdAt
+            }
         }
     }
 `;
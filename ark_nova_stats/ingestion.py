@@ -0,0 +1,243 @@
+import dataclasses
+import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+from ark_nova_stats.bga_log_parser.game_log import GameLog as ParsedGameLog
+from ark_nova_stats.config import app, db
+from ark_nova_stats.log_storage import compress_log
+from ark_nova_stats.models import (
+    Card,
+    CardPlay,
+    GameLog,
+    GameParticipation,
+    GameRating,
+    GameStatistics,
+    User,
+    game_statistics_values,
+)
+from ark_nova_stats.parsed_log_cache import parsed_log_cache
+from ark_nova_stats.rollups import (
+    update_card_play_counts,
+    update_current_elos,
+    update_game_counts,
+)
+from ark_nova_stats.stats import stats_cache
+
+
+@dataclasses.dataclass
+class GameLogSubmission:
+    table_id: int
+    log: str
+    parsed: ParsedGameLog
+
+
+def parse_submission(log: str) -> GameLogSubmission:
+    parsed = parsed_log_cache.parse(log)
+
+    table_ids = set(l.table_id for l in parsed.data.logs)
+    if len(table_ids) != 1:
+        raise RuntimeError(
+            f"Log is invalid: there must be exactly one table_id per game log, found: {table_ids}"
+        )
+
+    return GameLogSubmission(table_id=list(table_ids)[0], log=log, parsed=parsed)
+
+
+def user_values(parsed_logs: Iterable[ParsedGameLog]) -> list[dict[str, Any]]:
+    users: dict[int, dict[str, Any]] = {}
+    for parsed_log in parsed_logs:
+        for player in parsed_log.data.players:
+            users.setdefault(
+                player.id,
+                {"bga_id": player.id, "name": player.name, "avatar": player.avatar},
+            )
+
+    return list(users.values())
+
+
+def card_values(parsed_logs: Iterable[ParsedGameLog]) -> list[dict[str, Any]]:
+    cards: dict[str, dict[str, Any]] = {}
+    for parsed_log in parsed_logs:
+        for play in parsed_log.summary.card_plays:
+            cards.setdefault(
+                play.card.id, {"bga_id": play.card.id, "name": play.card.name}
+            )
+
+    return list(cards.values())
+
+
+def game_participation_values(
+    parsed_log: ParsedGameLog, game_log_id: int
+) -> list[dict[str, Any]]:
+    return [
+        {"user_id": player.id, "color": player.color, "game_log_id": game_log_id}
+        for player in parsed_log.summary.players
+    ]
+
+
+def card_play_values(
+    parsed_log: ParsedGameLog, game_log_id: int, card_ids: dict[str, int]
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "game_log_id": game_log_id,
+            "card_id": card_ids[play.card.id],
+            "user_id": play.player.id,
+            "move": play.move,
+        }
+        for play in parsed_log.summary.card_plays
+    ]
+
+
+def game_rating_elo_values(
+    ratings: Iterable[GameRating], game_ends: dict[int, datetime.datetime]
+) -> list[dict[str, Any]]:
+    """
+    Pairs ratings up with when their games ended (keyed by BGA table ID), so that their ELOs can be rolled up.
+    """
+    return [
+        {
+            "user_id": rating.user_id,
+            "new_elo": rating.new_elo,
+            "new_arena_elo": rating.new_arena_elo,
+            "game_end": game_ends[rating.bga_table_id],
+        }
+        for rating in ratings
+    ]
+
+
+def upsert_users(parsed_logs: Iterable[ParsedGameLog]) -> None:
+    # Users may have been created by other games, so skip any that already exist.
+    users = user_values(parsed_logs)
+    if users:
+        db.session.execute(postgresql_insert(User).on_conflict_do_nothing(), users)
+
+
+def upsert_cards(parsed_logs: Iterable[ParsedGameLog]) -> dict[str, int]:
+    """
+    Creates any of the cards played in the given games that don't exist yet.
+    Returns the IDs of all of the played cards, keyed by their BGA IDs.
+    """
+    cards = card_values(parsed_logs)
+    if not cards:
+        return {}
+
+    db.session.execute(
+        postgresql_insert(Card).on_conflict_do_nothing(index_elements=["bga_id"]),
+        cards,
+    )
+    return {
+        bga_id: card_id
+        for bga_id, card_id in db.session.execute(
+            select(Card.bga_id, Card.id).where(
+                Card.bga_id.in_([card["bga_id"] for card in cards])
+            )
+        )
+    }
+
+
+def ingest_game_logs(logs: list[str]) -> list[GameLog]:
+    """
+    Stores a batch of game logs, along with their users, cards, card plays & statistics.
+    Rather than looking up & adding each object one at a time, every table is read
+    & written with a constant number of set-based statements per batch.
+    Logs that have already been submitted are returned as-is.
+    """
+    submissions: dict[int, GameLogSubmission] = {}
+    for log in logs:
+        submission = parse_submission(log)
+        submissions.setdefault(submission.table_id, submission)
+
+    if app.config["TESTING"] == True:
+        return [
+            GameLog(
+                id=i + 1,
+                bga_table_id=submission.table_id,
+                log=submission.log,
+                game_start=submission.parsed.game_start,
+                game_end=submission.parsed.game_end,
+            )
+            for i, submission in enumerate(submissions.values())
+        ]
+
+    game_logs: dict[int, GameLog] = {
+        game_log.bga_table_id: game_log
+        for game_log in db.session.scalars(
+            select(GameLog).where(GameLog.bga_table_id.in_(submissions))
+        )
+    }
+    new_submissions = [
+        submission
+        for table_id, submission in submissions.items()
+        if table_id not in game_logs
+    ]
+    if new_submissions:
+        for game_log in db.session.scalars(
+            insert(GameLog).returning(GameLog),
+            [
+                {
+                    "bga_table_id": submission.table_id,
+                    "compressed_log": compress_log(submission.log),
+                    "game_start": submission.parsed.game_start,
+                    "game_end": submission.parsed.game_end,
+                }
+                for submission in new_submissions
+            ],
+        ):
+            game_logs[game_log.bga_table_id] = game_log
+
+        create_related_rows(new_submissions, game_logs)
+
+    db.session.commit()
+    if new_submissions:
+        stats_cache.invalidate()
+
+    return [game_logs[table_id] for table_id in submissions]
+
+
+def create_related_rows(
+    submissions: list[GameLogSubmission], game_logs: dict[int, GameLog]
+) -> None:
+    parsed_logs = [submission.parsed for submission in submissions]
+    upsert_users(parsed_logs)
+    card_ids = upsert_cards(parsed_logs)
+
+    participations = []
+    card_plays = []
+    statistics = []
+    for submission in submissions:
+        game_log_id = game_logs[submission.table_id].id
+        participations.extend(game_participation_values(submission.parsed, game_log_id))
+        card_plays.extend(card_play_values(submission.parsed, game_log_id, card_ids))
+        statistics.extend(game_statistics_values(submission.parsed))
+
+    for model, values in (
+        (GameParticipation, participations),
+        (CardPlay, card_plays),
+        (GameStatistics, statistics),
+    ):
+        if values:
+            db.session.execute(insert(model), values)
+
+    update_game_counts(participations)
+    update_card_play_counts(
+        card_plays, {game_log.id: game_log.game_end for game_log in game_logs.values()}
+    )
+
+    # Ratings & logs are submitted separately, in no particular order. Ratings that arrived
+    # before their log couldn't be rolled up without knowing when the game ended, so do it now.
+    game_ends = {
+        submission.table_id: game_logs[submission.table_id].game_end
+        for submission in submissions
+    }
+    update_current_elos(
+        game_rating_elo_values(
+            db.session.scalars(
+                select(GameRating).where(GameRating.bga_table_id.in_(game_ends))
+            ),
+            game_ends,
+        )
+    )
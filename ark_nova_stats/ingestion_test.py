@@ -0,0 +1,112 @@
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+from python.runfiles import Runfiles  # type: ignore
+
+from ark_nova_stats.ingestion import (
+    card_play_values,
+    card_values,
+    game_participation_values,
+    game_rating_elo_values,
+    parse_submission,
+    user_values,
+)
+from ark_nova_stats.models import GameRating
+from ark_nova_stats.rollups import latest_elo_values
+
+
+def read_fixture(filename: str) -> str:
+    r = Runfiles.Create()
+    fixture_file_path = r.Rlocation(
+        str(Path("_main") / "ark_nova_stats" / "bga_log_parser" / "fixtures" / filename)
+    )
+    with open(fixture_file_path, "r") as fixture_file:
+        return fixture_file.read().strip()
+
+
+class TestParseSubmission:
+    def test_parses_table_id(self):
+        submission = parse_submission(read_fixture("sample_game.log.json"))
+        assert submission.parsed.table_id == submission.table_id
+        assert read_fixture("sample_game.log.json") == submission.log
+
+
+class TestUserValues:
+    def test_deduplicates_players_across_games(self):
+        submissions = [
+            parse_submission(read_fixture("sample_game.log.json")),
+            parse_submission(read_fixture("sample_game.log.json")),
+        ]
+        users = user_values(s.parsed for s in submissions)
+
+        assert len(submissions[0].parsed.data.players) == len(users)
+        assert set(p.id for p in submissions[0].parsed.data.players) == set(
+            u["bga_id"] for u in users
+        )
+
+
+class TestCardValues:
+    def test_includes_each_played_card_once(self):
+        submissions = [
+            parse_submission(read_fixture("sample_game.log.json")),
+            parse_submission(read_fixture("4p.log.json")),
+        ]
+        cards = card_values(s.parsed for s in submissions)
+
+        bga_ids = [c["bga_id"] for c in cards]
+        assert len(set(bga_ids)) == len(bga_ids)
+        assert set(bga_ids) == set(
+            play.card.id for s in submissions for play in s.parsed.summary.card_plays
+        )
+
+
+class TestRelatedValues:
+    def test_references_game_log_and_cards(self):
+        parsed_log = parse_submission(read_fixture("4p.log.json")).parsed
+        card_ids = {
+            card["bga_id"]: i for i, card in enumerate(card_values([parsed_log]))
+        }
+
+        participations = game_participation_values(parsed_log, 7)
+        assert 4 == len(participations)
+        assert all(7 == p["game_log_id"] for p in participations)
+
+        plays = card_play_values(parsed_log, 7, card_ids)
+        assert len(parsed_log.summary.card_plays) == len(plays)
+        assert all(7 == p["game_log_id"] for p in plays)
+        assert set(card_ids.values()) == set(p["card_id"] for p in plays)
+
+
+class TestGameRatingEloValues:
+    def test_rolls_up_ratings_submitted_before_their_log(self):
+        submission = parse_submission(read_fixture("sample_game.log.json"))
+        player = submission.parsed.data.players[0]
+        # These ratings were stored before the game's log, so there was no game end to roll them up with.
+        ratings = [
+            GameRating(
+                bga_table_id=submission.table_id,
+                user_id=player.id,
+                new_elo=120,
+                new_arena_elo=None,
+            )
+        ]
+        game_end = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+        values = game_rating_elo_values(ratings, {submission.table_id: game_end})
+
+        assert [
+            {
+                "user_id": player.id,
+                "new_elo": 120,
+                "new_arena_elo": None,
+                "game_end": game_end,
+            }
+        ] == values
+        assert {player.id: (120, game_end)} == latest_elo_values(values, "new_elo")
+        assert {} == latest_elo_values(values, "new_arena_elo")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,22 @@
+import zlib
+
+# The first byte of each compressed log identifies the format it was compressed with,
+# so that the format can change later without having to recompress every existing log.
+ZLIB_FORMAT_VERSION = 1
+CURRENT_FORMAT_VERSION = ZLIB_FORMAT_VERSION
+
+
+class UnknownFormatError(ValueError):
+    pass
+
+
+def compress_log(log: str) -> bytes:
+    return bytes([CURRENT_FORMAT_VERSION]) + zlib.compress(log.encode("utf-8"), 9)
+
+
+def decompress_log(compressed: bytes) -> str:
+    version = compressed[0]
+    if version != ZLIB_FORMAT_VERSION:
+        raise UnknownFormatError(f"Compressed log uses an unknown format: {version}")
+
+    return zlib.decompress(compressed[1:]).decode("utf-8")
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import pytest
+from python.runfiles import Runfiles  # type: ignore
+
+from ark_nova_stats.log_storage import (
+    UnknownFormatError,
+    compress_log,
+    decompress_log,
+)
+
+
+def read_fixture(filename: str) -> str:
+    r = Runfiles.Create()
+    fixture_file_path = r.Rlocation(
+        str(Path("_main") / "ark_nova_stats" / "bga_log_parser" / "fixtures" / filename)
+    )
+    with open(fixture_file_path, "r") as fixture_file:
+        return fixture_file.read().strip()
+
+
+class TestCompressLog:
+    def test_round_trips(self):
+        log = read_fixture("sample_game.log.json")
+        assert log == decompress_log(compress_log(log))
+
+    def test_round_trips_non_ascii(self):
+        log = '{"name": "Zoë 🦒"}'
+        assert log == decompress_log(compress_log(log))
+
+    def test_compresses_log(self):
+        log = read_fixture("sample_game.log.json")
+        assert len(compress_log(log)) < len(log.encode("utf-8"))
+
+    def test_rejects_unknown_format_version(self):
+        compressed = bytearray(compress_log("{}"))
+        compressed[0] = 255
+        with pytest.raises(UnknownFormatError):
+            decompress_log(bytes(compressed))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -1,13 +1,14 @@
 import datetime
 import enum
-from typing import Generator, Optional
+from typing import Any, Generator, Optional
 
 from sqlalchemy import ForeignKey, Select, desc, func, select
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from ark_nova_stats.bga_log_parser.exceptions import StatsNotSetError
 from ark_nova_stats.bga_log_parser.game_log import GameLog as ParsedGameLog
+from ark_nova_stats.bga_log_parser.stat_schema import stat_values
 from ark_nova_stats.config import db
+from ark_nova_stats.log_storage import compress_log, decompress_log
 
 
 class Base(DeclarativeBase):
@@ -34,7 +35,9 @@ class GameLog(Base):
     __tablename__ = "game_logs"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    log: Mapped[str]
+    # Logs submitted before compression was introduced, which haven't been compressed yet.
+    uncompressed_log: Mapped[Optional[str]] = mapped_column("log")
+    compressed_log: Mapped[Optional[bytes]]
     created_at: Mapped[datetime.datetime] = mapped_column(
         db.TIMESTAMP(timezone=True),
         default=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
@@ -67,17 +70,31 @@ class GameLog(Base):
         back_populates="game_log"
     )
 
+    @property
+    def log(self) -> str:
+        if self.compressed_log is not None:
+            return decompress_log(self.compressed_log)
+
+        return self.uncompressed_log or ""
+
+    @log.setter
+    def log(self, log: str) -> None:
+        self.compressed_log = compress_log(log)
+        self.uncompressed_log = None
+
     def create_related_objects(
         self, parsed_logs: ParsedGameLog
     ) -> Generator[Base, None, None]:
         # Add users if not present.
-        present_users = db.session.execute(
-            db.select(User)
-            .filter(User.bga_id.in_([user.id for user in parsed_logs.data.players]))
-            .all()
-        ).scalars()
-        bga_id_to_user = {present.bga_id: present for present in present_users}
-        present_user_ids = set(present.bga_id for present in present_users)
+        bga_id_to_user = {
+            present.bga_id: present
+            for present in db.session.scalars(
+                db.select(User).filter(
+                    User.bga_id.in_([user.id for user in parsed_logs.data.players])
+                )
+            )
+        }
+        present_user_ids = set(bga_id_to_user)
 
         users_to_create = [
             user for user in parsed_logs.data.players if user.id not in present_user_ids
@@ -92,12 +109,11 @@ class GameLog(Base):
             yield bga_id_to_user[user.id]
 
         # Now create a game participation for each user.
-        for bga_user in parsed_logs.data.players:
-            log_user = next(u for u in parsed_logs.data.players if u.id == bga_user.id)
+        for bga_user in parsed_logs.summary.players:
             user = bga_id_to_user[bga_user.id]
             yield GameParticipation(
                 user=user,
-                color=log_user.color,
+                color=bga_user.color,
                 game_log=self,
             )
 
@@ -110,21 +126,22 @@ class GameLog(Base):
     def create_card_and_plays(
         self, parsed_logs: ParsedGameLog
     ) -> Generator[Base, None, None]:
-        cards = {}
+        card_plays = parsed_logs.summary.card_plays
+        # Look up all of the game's existing cards at once.
+        cards = {
+            card.bga_id: card
+            for card in db.session.scalars(
+                db.select(Card).where(
+                    Card.bga_id.in_(set(play.card.id for play in card_plays))
+                )
+            )
+        }
+
         # Now create a card & card play.
-        for play in parsed_logs.data.card_plays:
+        for play in card_plays:
             if play.card.id not in cards:
-                # Check to see if it exists.
-                find_card = db.session.execute(
-                    db.select(Card).where(Card.bga_id == play.card.id).limit(1).all()
-                ).scalars()
-                try:
-                    card = next(find_card)
-                except StopIteration:
-                    card = Card(name=play.card.name, bga_id=play.card.id)
-                    yield card
-
-                cards[card.bga_id] = card
+                cards[play.card.id] = Card(name=play.card.name, bga_id=play.card.id)
+                yield cards[play.card.id]
 
             yield CardPlay(
                 game_log=self,
@@ -136,81 +153,8 @@ class GameLog(Base):
     def create_game_statistics(
         self, parsed_logs: ParsedGameLog
     ) -> Generator[Base, None, None]:
-        try:
-            for s in parsed_logs.parse_game_stats().player_stats:
-                yield GameStatistics(
-                    bga_table_id=parsed_logs.table_id,
-                    bga_user_id=s.player_id,
-                    score=s.score,
-                    rank=s.rank,
-                    thinking_time=s.thinking_time,
-                    starting_position=s.starting_position,
-                    turns=s.turns,
-                    breaks_triggered=s.breaks_triggered,
-                    triggered_end=s.triggered_end,
-                    map_id=s.map_id,
-                    appeal=s.appeal,
-                    conservation=s.conservation,
-                    reputation=s.reputation,
-                    actions_build=s.actions_build,
-                    actions_animals=s.actions_animals,
-                    actions_cards=s.actions_cards,
-                    actions_association=s.actions_association,
-                    actions_sponsors=s.actions_sponsors,
-                    x_tokens_gained=s.x_tokens_gained,
-                    x_actions=s.x_actions,
-                    x_tokens_used=s.x_tokens_used,
-                    money_gained=s.money_gained,
-                    money_gained_through_income=s.money_gained_through_income,
-                    money_spent_on_animals=s.money_spent_on_animals,
-                    money_spent_on_enclosures=s.money_spent_on_enclosures,
-                    money_spent_on_donations=s.money_spent_on_donations,
-                    money_spent_on_playing_cards_from_reputation_range=s.money_spent_on_playing_cards_from_reputation_range,
-                    cards_drawn_from_deck=s.cards_drawn_from_deck,
-                    cards_drawn_from_reputation_range=s.cards_drawn_from_reputation_range,
-                    cards_snapped=s.cards_snapped,
-                    cards_discarded=s.cards_discarded,
-                    played_sponsors=s.played_sponsors,
-                    played_animals=s.played_animals,
-                    released_animals=s.released_animals,
-                    association_workers=s.association_workers,
-                    association_donations=s.association_donations,
-                    association_reputation_actions=s.association_reputation_actions,
-                    association_partner_zoo_actions=s.association_partner_zoo_actions,
-                    association_university_actions=s.association_university_actions,
-                    association_conservation_project_actions=s.association_conservation_project_actions,
-                    built_enclosures=s.built_enclosures,
-                    built_kiosks=s.built_kiosks,
-                    built_pavilions=s.built_pavilions,
-                    built_unique_buildings=s.built_unique_buildings,
-                    hexes_covered=s.hexes_covered,
-                    hexes_empty=s.hexes_empty,
-                    upgraded_action_cards=s.upgraded_action_cards,
-                    upgraded_animals=s.upgraded_animals,
-                    upgraded_build=s.upgraded_build,
-                    upgraded_cards=s.upgraded_cards,
-                    upgraded_sponsors=s.upgraded_sponsors,
-                    upgraded_association=s.upgraded_association,
-                    icons_africa=s.icons_africa,
-                    icons_europe=s.icons_europe,
-                    icons_asia=s.icons_asia,
-                    icons_australia=s.icons_australia,
-                    icons_americas=s.icons_americas,
-                    icons_bird=s.icons_bird,
-                    icons_predator=s.icons_predator,
-                    icons_herbivore=s.icons_herbivore,
-                    icons_bear=s.icons_bear,
-                    icons_reptile=s.icons_reptile,
-                    icons_primate=s.icons_primate,
-                    icons_petting_zoo=s.icons_petting_zoo,
-                    icons_sea_animal=s.icons_sea_animal,
-                    icons_water=s.icons_water,
-                    icons_rock=s.icons_rock,
-                    icons_science=s.icons_science,
-                )
-        except StatsNotSetError:
-            # Stats are not set on this replay; bail.
-            return
+        for values in game_statistics_values(parsed_logs):
+            yield GameStatistics(**values)
 
 
 class User(Base):
@@ -243,13 +187,11 @@ class User(Base):
         back_populates="user"
     )
 
+    stats: Mapped[Optional["UserStats"]] = relationship(back_populates="user")
+
     @property
     def num_game_logs(self) -> int:
-        return db.session.execute(
-            db.select(GameParticipation)
-            .where(GameParticipation.user_id == self.bga_id)
-            .count()
-        ).scalar_one()
+        return self.stats.num_game_logs if self.stats is not None else 0
 
     @property
     def recent_game_logs(self) -> list["GameLog"]:
@@ -267,11 +209,10 @@ class User(Base):
 
     def commonly_played_cards(self, num=10) -> Select[tuple["Card", int]]:
         return (
-            select(Card, func.count())
-            .join(CardPlay, CardPlay.card_id == Card.id)
-            .where(CardPlay.user_id == self.bga_id)
-            .group_by(Card.id)
-            .order_by(desc(func.count()))
+            select(Card, UserCardPlayCount.count)
+            .join(UserCardPlayCount, UserCardPlayCount.card_id == Card.id)
+            .where(UserCardPlayCount.user_id == self.bga_id)
+            .order_by(desc(UserCardPlayCount.count))
             .limit(num)
         )
 
@@ -285,36 +226,10 @@ class User(Base):
         )
 
     def current_elo(self) -> Optional[int]:
-        latest_rating: Optional[GameRating] = db.session.execute(
-            db.select(GameRating)
-            .join(GameLog, GameLog.bga_table_id == GameRating.bga_table_id)
-            .where(GameRating.user_id == self.bga_id)
-            .where(GameRating.new_elo != None)
-            .order_by(desc(GameLog.game_end))
-            .limit(1)
-            .first()
-        ).scalar_one_or_none()
-
-        if latest_rating is None:
-            return None
-
-        return latest_rating.new_elo
+        return self.stats.current_elo if self.stats is not None else None
 
     def current_arena_elo(self) -> Optional[int]:
-        latest_rating: Optional[GameRating] = db.session.execute(
-            db.select(GameRating)
-            .join(GameLog, GameLog.bga_table_id == GameRating.bga_table_id)
-            .where(GameRating.user_id == self.bga_id)
-            .where(GameRating.new_arena_elo != None)
-            .order_by(desc(GameLog.game_end))
-            .limit(1)
-            .first()
-        ).scalar_one_or_none()
-
-        if latest_rating is None:
-            return None
-
-        return latest_rating.new_arena_elo
+        return self.stats.current_arena_elo if self.stats is not None else None
 
 
 class GameLogArchiveType(enum.IntEnum):
@@ -323,6 +238,7 @@ class GameLogArchiveType(enum.IntEnum):
     BGA_JSONL_WITH_ELO = 2
     TOP_LEVEL_STATS_CSV = 3
     EMU_CUP_TOP_LEVEL_STATS_CSV = 4
+    STATS_SQLITE = 5
 
 
 class GameLogArchive(Base):
@@ -340,7 +256,87 @@ class GameLogArchive(Base):
         default=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
     )
 
+    # Delta archives only contain the game logs since the previous archive in their chain,
+    # which starts at this full archive. Full archives have no base archive.
+    base_archive_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("game_log_archives.id")
+    )
+
     last_game_log: Mapped[GameLog] = relationship(back_populates="archives")
+    base_archive: Mapped[Optional["GameLogArchive"]] = relationship(
+        remote_side=[id], back_populates="delta_archives"
+    )
+    delta_archives: Mapped[list["GameLogArchive"]] = relationship(
+        back_populates="base_archive", order_by="GameLogArchive.id"
+    )
+
+    @property
+    def is_delta(self) -> bool:
+        return self.base_archive_id is not None
+
+
+class BackfillCursor(Base):
+    """
+    How far a (shard of a) worker backfill has gotten through the game logs,
+    so that it can resume where it left off.
+    """
+
+    __tablename__ = "backfill_cursors"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str]
+    shard: Mapped[int]
+    num_shards: Mapped[int]
+    last_game_log_id: Mapped[int]
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        db.TIMESTAMP(timezone=True),
+        default=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
+        onupdate=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
+    )
+
+
+class UserStats(Base):
+    """
+    Rollup of each user's game count & latest ratings,
+    maintained as game logs & ratings are submitted (see rollups.py).
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.bga_id"), primary_key=True)
+    num_game_logs: Mapped[int] = mapped_column(default=0)
+    current_elo: Mapped[Optional[int]]
+    # When the game that the current ELO came from ended.
+    current_elo_game_end: Mapped[Optional[datetime.datetime]] = mapped_column(
+        db.TIMESTAMP(timezone=True)
+    )
+    current_arena_elo: Mapped[Optional[int]]
+    current_arena_elo_game_end: Mapped[Optional[datetime.datetime]] = mapped_column(
+        db.TIMESTAMP(timezone=True)
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        db.TIMESTAMP(timezone=True),
+        default=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
+        onupdate=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
+    )
+
+    user: Mapped["User"] = relationship(back_populates="stats")
+
+
+class UserCardPlayCount(Base):
+    """
+    Rollup of how many times each user has played each card, & when they last played it,
+    maintained as game logs are submitted (see rollups.py).
+    """
+
+    __tablename__ = "user_card_play_counts"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.bga_id"), primary_key=True)
+    card_id: Mapped[int] = mapped_column(ForeignKey("cards.id"), primary_key=True)
+    count: Mapped[int]
+    last_played_at: Mapped[datetime.datetime] = mapped_column(
+        db.TIMESTAMP(timezone=True)
+    )
 
 
 class Card(Base):
@@ -385,20 +381,18 @@ class Card(Base):
     def recent_users(self, num=10) -> Select[tuple["User"]]:
         return (
             select(User)
-            .join(CardPlay, CardPlay.user_id == User.bga_id)
-            .join(GameLog, GameLog.id == CardPlay.game_log_id)
-            .where(CardPlay.card_id == self.id)
-            .order_by(desc(GameLog.game_end))
+            .join(UserCardPlayCount, UserCardPlayCount.user_id == User.bga_id)
+            .where(UserCardPlayCount.card_id == self.id)
+            .order_by(desc(UserCardPlayCount.last_played_at))
             .limit(num)
         )
 
     def most_played_by(self, num=10) -> Select[tuple["User", int]]:
         return (
-            select(User, func.count())
-            .join(CardPlay, CardPlay.user_id == User.bga_id)
-            .where(CardPlay.card_id == self.id)
-            .group_by(User.id)
-            .order_by(desc(func.count()))
+            select(User, UserCardPlayCount.count)
+            .join(UserCardPlayCount, UserCardPlayCount.user_id == User.bga_id)
+            .where(UserCardPlayCount.card_id == self.id)
+            .order_by(desc(UserCardPlayCount.count))
             .limit(num)
         )
 
@@ -520,3 +514,19 @@ class GameStatistics(Base):
 
     user: Mapped["User"] = relationship(back_populates="game_statistics")
     game_log: Mapped["GameLog"] = relationship(back_populates="game_statistics")
+
+
+def game_statistics_values(parsed_logs: ParsedGameLog) -> list[dict[str, Any]]:
+    """
+    Returns the column values of the GameStatistics rows for each player in a game,
+    or nothing if stats aren't set on the replay.
+    """
+    return [
+        {
+            "bga_table_id": parsed_logs.table_id,
+            "bga_user_id": s.player_id,
+            **stat_values(s),
+        }
+        # Already decoded when the log was parsed.
+        for s in parsed_logs.stats.player_stats
+    ]
@@ -5,13 +5,32 @@ from typing import Generator
 
 import pytest
 
-from ark_nova_stats.models import GameLog
+from ark_nova_stats.bga_log_parser.stat_schema import STAT_FIELDS
+from ark_nova_stats.models import GameLog, GameStatistics
 
 
 class TestGameLog:
     def test_sample(self):
         assert GameLog(id=1)
 
+    def test_log_is_stored_compressed(self):
+        game_log = GameLog(id=1, log='{"status": 1}')
+        assert game_log.uncompressed_log is None
+        assert game_log.compressed_log is not None
+        assert '{"status": 1}' == game_log.log
+
+    def test_reads_uncompressed_log(self):
+        game_log = GameLog(id=1, uncompressed_log='{"status": 1}')
+        assert '{"status": 1}' == game_log.log
+
+
+class TestGameStatistics:
+    def test_has_a_column_per_stat(self):
+        columns = GameStatistics.__table__.columns
+        for field in STAT_FIELDS:
+            assert field.name in columns
+            assert field.type is columns[field.name].type.python_type
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,147 @@
+import collections
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ark_nova_stats.bga_log_parser.game_log import GameLog as ParsedGameLog
+
+# Bump this whenever the parser's output changes, so that stale pickles on disk are ignored.
+PARSER_VERSION = 3
+
+
+@dataclasses.dataclass
+class ParsedLogCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        if total == 0:
+            return 0.0
+
+        return (self.memory_hits + self.disk_hits) / total
+
+
+class ParsedLogCache:
+    """
+    Caches parsed game logs, so that a log that's processed by several stages
+    (e.g. consecutive backfills) is only parsed once.
+
+    Parsed logs are kept in memory, evicting the least-recently-used once their raw logs
+    total more than `max_log_bytes`. Parsed logs take up a few times as much memory as
+    their raw JSON, so this should be sized with that in mind; 0 disables the memory tier.
+    If `directory` is set, they're also pickled to disk, so that they're shared between
+    worker processes & survive restarts. Entries are keyed by a hash of the log's contents,
+    so the same log is shared between ingestion & backfills, and an edited log is never served stale.
+    """
+
+    def __init__(
+        self, max_log_bytes: int = 64 * 1024 * 1024, directory: Optional[str] = None
+    ):
+        self.max_log_bytes = max_log_bytes
+        self.directory = Path(directory) if directory is not None else None
+        # Parsed logs, along with the size of their raw logs.
+        self.entries: collections.OrderedDict[str, tuple[ParsedGameLog, int]] = (
+            collections.OrderedDict()
+        )
+        self.log_bytes = 0
+        self.stats = ParsedLogCacheStats()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(log: str) -> str:
+        return hashlib.sha256(log.encode("utf-8")).hexdigest()
+
+    def disk_path(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+
+        return self.directory / f"v{PARSER_VERSION}" / f"{key}.pickle"
+
+    def parse(self, log: str) -> ParsedGameLog:
+        """
+        Returns the parsed form of `log`, parsing it only if it isn't already cached.
+        Parse errors are raised as usual, and aren't cached.
+        """
+        key = self.key(log)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.stats.memory_hits += 1
+                return entry[0]
+
+        parsed = self.read_from_disk(key)
+        if parsed is not None:
+            with self.lock:
+                self.stats.disk_hits += 1
+        else:
+            parsed = ParsedGameLog(**json.loads(log))
+            # Build the summary up-front, so that it's cached (& pickled) along with the log.
+            parsed.summary
+            self.write_to_disk(key, parsed)
+            with self.lock:
+                self.stats.misses += 1
+
+        self.remember(key, parsed, len(log))
+        return parsed
+
+    def remember(self, key: str, parsed: ParsedGameLog, log_bytes: int) -> None:
+        if log_bytes > self.max_log_bytes:
+            return
+
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = (parsed, log_bytes)
+                self.log_bytes += log_bytes
+            self.entries.move_to_end(key)
+            while self.log_bytes > self.max_log_bytes:
+                _, (_, evicted_bytes) = self.entries.popitem(last=False)
+                self.log_bytes -= evicted_bytes
+
+    def read_from_disk(self, key: str) -> Optional[ParsedGameLog]:
+        path = self.disk_path(key)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as cached_file:
+                return pickle.load(cached_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            # Treat a truncated or outdated pickle as a miss, and overwrite it.
+            return None
+
+    def write_to_disk(self, key: str, parsed: ParsedGameLog) -> None:
+        path = self.disk_path(key)
+        if path is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that other processes never read a partial pickle.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".tmp", delete=False
+        ) as temp_file:
+            pickle.dump(parsed, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_file.name, path)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.log_bytes = 0
+
+
+# Replays are a few MB each & are rarely parsed twice by the same process,
+# so only keep them in memory if a budget's configured.
+parsed_log_cache = ParsedLogCache(
+    max_log_bytes=int(os.getenv("PARSED_LOG_CACHE_MEMORY_BYTES", "0")),
+    directory=os.getenv("PARSED_LOG_CACHE_DIR"),
+)
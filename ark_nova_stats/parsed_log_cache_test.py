@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+from python.runfiles import Runfiles  # type: ignore
+
+from ark_nova_stats.bga_log_parser.exceptions import BGALogParserError
+from ark_nova_stats.parsed_log_cache import ParsedLogCache
+
+
+def read_fixture(filename: str) -> str:
+    r = Runfiles.Create()
+    fixture_file_path = r.Rlocation(
+        str(Path("_main") / "ark_nova_stats" / "bga_log_parser" / "fixtures" / filename)
+    )
+    with open(fixture_file_path, "r") as fixture_file:
+        return fixture_file.read().strip()
+
+
+class TestParsedLogCache:
+    def test_parses_once(self):
+        cache = ParsedLogCache()
+        log = read_fixture("tie.log.json")
+
+        first = cache.parse(log)
+        assert first is cache.parse(log)
+        assert 1 == cache.stats.memory_hits
+        assert 1 == cache.stats.misses
+        assert 0.5 == cache.stats.hit_rate
+
+    def test_keys_by_content(self):
+        cache = ParsedLogCache()
+        cache.parse(read_fixture("tie.log.json"))
+        cache.parse(read_fixture("4p.log.json"))
+        assert 2 == cache.stats.misses
+
+    def test_evicts_least_recently_used_beyond_max_log_bytes(self):
+        tie = read_fixture("tie.log.json")
+        four_player = read_fixture("4p.log.json")
+        cache = ParsedLogCache(max_log_bytes=len(tie) + len(four_player) - 1)
+        cache.parse(tie)
+        cache.parse(four_player)
+        assert [ParsedLogCache.key(four_player)] == list(cache.entries)
+        assert len(four_player) == cache.log_bytes
+
+        cache.parse(tie)
+        assert 3 == cache.stats.misses
+        assert len(tie) == cache.log_bytes
+
+    def test_skips_memory_when_disabled(self, tmp_path):
+        log = read_fixture("tie.log.json")
+        cache = ParsedLogCache(max_log_bytes=0, directory=str(tmp_path))
+        cache.parse(log)
+        cache.parse(log)
+
+        assert 0 == len(cache.entries)
+        assert 0 == cache.stats.memory_hits
+        assert 1 == cache.stats.disk_hits
+
+    def test_reads_from_disk(self, tmp_path):
+        log = read_fixture("tie.log.json")
+        parsed = ParsedLogCache(directory=str(tmp_path)).parse(log)
+
+        cache = ParsedLogCache(directory=str(tmp_path))
+        cached = cache.parse(log)
+        assert 1 == cache.stats.disk_hits
+        assert 0 == cache.stats.misses
+        assert parsed.summary.card_plays == cached.summary.card_plays
+        assert parsed.stats == cached.stats
+
+    def test_ignores_corrupt_pickles(self, tmp_path):
+        log = read_fixture("tie.log.json")
+        cache = ParsedLogCache(directory=str(tmp_path))
+        path = cache.disk_path(cache.key(log))
+        assert path is not None
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a pickle")
+
+        assert cache.parse(log)
+        assert 1 == cache.stats.misses
+
+    def test_does_not_cache_errors(self):
+        cache = ParsedLogCache()
+        log = read_fixture("non_ark_nova_game.log.json")
+        for _ in range(2):
+            with pytest.raises(BGALogParserError):
+                cache.parse(log)
+
+        assert 0 == len(cache.entries)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,228 @@
+import datetime
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import case, delete, desc, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+from ark_nova_stats.config import db
+from ark_nova_stats.models import (
+    CardPlay,
+    GameLog,
+    GameParticipation,
+    GameRating,
+    UserCardPlayCount,
+    UserStats,
+)
+
+# Each kind of ELO that's rolled up, as (rating column, user_stats value column, user_stats game end column).
+ELO_COLUMNS = (
+    ("new_elo", "current_elo", "current_elo_game_end"),
+    ("new_arena_elo", "current_arena_elo", "current_arena_elo_game_end"),
+)
+
+
+def card_play_count_values(
+    card_plays: Iterable[dict[str, Any]], game_ends: dict[int, datetime.datetime]
+) -> list[dict[str, Any]]:
+    """
+    Sums up card play rows (as produced by ingestion.card_play_values) per user & card.
+    `game_ends` maps game log IDs to when those games ended.
+    """
+    counts: dict[tuple[int, int], dict[str, Any]] = {}
+    for play in card_plays:
+        game_end = game_ends[play["game_log_id"]]
+        key = (play["user_id"], play["card_id"])
+        row = counts.get(key)
+        if row is None:
+            counts[key] = {
+                "user_id": play["user_id"],
+                "card_id": play["card_id"],
+                "count": 1,
+                "last_played_at": game_end,
+            }
+        else:
+            row["count"] += 1
+            row["last_played_at"] = max(row["last_played_at"], game_end)
+
+    return list(counts.values())
+
+
+def game_count_values(
+    participations: Iterable[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    counts: dict[int, int] = {}
+    for participation in participations:
+        user_id = participation["user_id"]
+        counts[user_id] = counts.get(user_id, 0) + 1
+
+    return [
+        {"user_id": user_id, "num_game_logs": count}
+        for user_id, count in counts.items()
+    ]
+
+
+def latest_elo_values(
+    ratings: Iterable[dict[str, Any]], elo_column: str
+) -> dict[int, tuple[int, datetime.datetime]]:
+    """
+    Returns each user's latest non-null `elo_column` from the given rating rows,
+    along with when the game it came from ended.
+    """
+    latest: dict[int, tuple[int, datetime.datetime]] = {}
+    for rating in ratings:
+        elo: Optional[int] = rating[elo_column]
+        if elo is None:
+            continue
+
+        game_end: datetime.datetime = rating["game_end"]
+        user_id = rating["user_id"]
+        if user_id not in latest or latest[user_id][1] <= game_end:
+            latest[user_id] = (elo, game_end)
+
+    return latest
+
+
+def update_card_play_counts(
+    card_plays: Iterable[dict[str, Any]], game_ends: dict[int, datetime.datetime]
+) -> None:
+    values = card_play_count_values(card_plays, game_ends)
+    if not values:
+        return
+
+    statement = postgresql_insert(UserCardPlayCount)
+    db.session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["user_id", "card_id"],
+            set_={
+                "count": UserCardPlayCount.count + statement.excluded["count"],
+                "last_played_at": func.greatest(
+                    UserCardPlayCount.last_played_at,
+                    statement.excluded["last_played_at"],
+                ),
+            },
+        ),
+        values,
+    )
+
+
+def update_game_counts(participations: Iterable[dict[str, Any]]) -> None:
+    values = game_count_values(participations)
+    if not values:
+        return
+
+    statement = postgresql_insert(UserStats)
+    db.session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "num_game_logs": UserStats.num_game_logs
+                + statement.excluded["num_game_logs"],
+                "updated_at": func.now(),
+            },
+        ),
+        values,
+    )
+
+
+def upsert_current_elo_statement(value_column: str, game_end_column: str):
+    """
+    Upserts a user's current ELO, unless it's older than the one already recorded.
+    """
+    statement = postgresql_insert(UserStats)
+    current_game_end = getattr(UserStats, game_end_column)
+    is_newer = or_(
+        current_game_end == None,
+        statement.excluded[game_end_column] >= current_game_end,
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={
+            value_column: case(
+                (is_newer, statement.excluded[value_column]),
+                else_=getattr(UserStats, value_column),
+            ),
+            game_end_column: case(
+                (is_newer, statement.excluded[game_end_column]),
+                else_=current_game_end,
+            ),
+            "updated_at": func.now(),
+        },
+    )
+
+
+def update_current_elos(ratings: Iterable[dict[str, Any]]) -> None:
+    """
+    Records the ELOs from the given rating rows, which also need the `game_end` of their games.
+    """
+    ratings = list(ratings)
+    for rating_column, value_column, game_end_column in ELO_COLUMNS:
+        latest = latest_elo_values(ratings, rating_column)
+        if not latest:
+            continue
+
+        db.session.execute(
+            upsert_current_elo_statement(value_column, game_end_column),
+            [
+                {"user_id": user_id, value_column: elo, game_end_column: game_end}
+                for user_id, (elo, game_end) in latest.items()
+            ],
+        )
+
+
+def rebuild_rollups() -> None:
+    """
+    Recomputes every rollup table from scratch, e.g. after a backfill.
+    """
+    db.session.execute(delete(UserCardPlayCount))
+    db.session.execute(
+        insert(UserCardPlayCount).from_select(
+            ["user_id", "card_id", "count", "last_played_at"],
+            select(
+                CardPlay.user_id,
+                CardPlay.card_id,
+                func.count(),
+                func.max(GameLog.game_end),
+            )
+            .join(GameLog, GameLog.id == CardPlay.game_log_id)
+            .group_by(CardPlay.user_id, CardPlay.card_id),
+        )
+    )
+
+    db.session.execute(delete(UserStats))
+    db.session.execute(
+        insert(UserStats).from_select(
+            ["user_id", "num_game_logs"],
+            select(GameParticipation.user_id, func.count()).group_by(
+                GameParticipation.user_id
+            ),
+        )
+    )
+    for rating_column, value_column, game_end_column in ELO_COLUMNS:
+        elo = getattr(GameRating, rating_column)
+        # Rank each user's ratings by how recently the game ended, and keep the latest.
+        ranked = (
+            select(
+                GameRating.user_id,
+                elo.label("elo"),
+                GameLog.game_end,
+                func.row_number()
+                .over(
+                    partition_by=GameRating.user_id,
+                    order_by=desc(GameLog.game_end),
+                )
+                .label("recency"),
+            )
+            .join(GameLog, GameLog.bga_table_id == GameRating.bga_table_id)
+            .where(elo != None)
+            .subquery()
+        )
+        db.session.execute(
+            upsert_current_elo_statement(value_column, game_end_column).from_select(
+                ["user_id", value_column, game_end_column],
+                select(ranked.c.user_id, ranked.c.elo, ranked.c.game_end).where(
+                    ranked.c.recency == 1
+                ),
+            )
+        )
+
+    db.session.commit()
@@ -0,0 +1,56 @@
+import datetime
+import sys
+
+import pytest
+
+from ark_nova_stats.rollups import (
+    card_play_count_values,
+    game_count_values,
+    latest_elo_values,
+)
+
+EARLIER = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+LATER = datetime.datetime(2024, 2, 1, tzinfo=datetime.timezone.utc)
+
+
+def test_card_play_count_values_sums_per_user_and_card():
+    plays = [
+        {"game_log_id": 1, "card_id": 10, "user_id": 100, "move": 1},
+        {"game_log_id": 2, "card_id": 10, "user_id": 100, "move": 5},
+        {"game_log_id": 2, "card_id": 11, "user_id": 100, "move": 6},
+        {"game_log_id": 2, "card_id": 10, "user_id": 200, "move": 7},
+    ]
+
+    assert [
+        {"user_id": 100, "card_id": 10, "count": 2, "last_played_at": LATER},
+        {"user_id": 100, "card_id": 11, "count": 1, "last_played_at": LATER},
+        {"user_id": 200, "card_id": 10, "count": 1, "last_played_at": LATER},
+    ] == card_play_count_values(plays, {1: EARLIER, 2: LATER})
+
+
+def test_game_count_values_counts_per_user():
+    participations = [
+        {"user_id": 100, "color": "ff0000", "game_log_id": 1},
+        {"user_id": 200, "color": "0000ff", "game_log_id": 1},
+        {"user_id": 100, "color": "ff0000", "game_log_id": 2},
+    ]
+
+    assert [
+        {"user_id": 100, "num_game_logs": 2},
+        {"user_id": 200, "num_game_logs": 1},
+    ] == game_count_values(participations)
+
+
+def test_latest_elo_values_skips_missing_ratings():
+    ratings: list[dict] = [
+        {"user_id": 100, "new_elo": 120, "new_arena_elo": None, "game_end": LATER},
+        {"user_id": 100, "new_elo": 110, "new_arena_elo": 1500, "game_end": EARLIER},
+        {"user_id": 200, "new_elo": None, "new_arena_elo": None, "game_end": LATER},
+    ]
+
+    assert {100: (120, LATER)} == latest_elo_values(ratings, "new_elo")
+    assert {100: (1500, EARLIER)} == latest_elo_values(ratings, "new_arena_elo")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
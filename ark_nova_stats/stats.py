@@ -0,0 +1,116 @@
+import dataclasses
+import datetime
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import cast, func, select, text
+from sqlalchemy.types import Date
+
+from ark_nova_stats.config import db
+from ark_nova_stats.models import Base, GameLog, User
+
+# Tables with fewer (estimated) rows than this are counted exactly.
+EXACT_COUNT_THRESHOLD = 100_000
+
+# How many days of submission counts to report.
+DAILY_SUBMISSION_DAYS = 30
+
+
+@dataclasses.dataclass
+class DailySubmissions:
+    date: datetime.date
+    count: int
+
+
+@dataclasses.dataclass
+class Stats:
+    num_game_logs: int
+    num_players: int
+    most_recent_submission: Optional[datetime.datetime]
+    daily_submissions: list[DailySubmissions]
+
+
+def estimated_row_count(model: type[Base]) -> int:
+    """
+    Returns the number of rows in `model`'s table, as estimated by Postgres' planner statistics.
+    Large tables aren't counted exactly, since that requires scanning the whole table.
+    """
+    estimate = db.session.scalar(
+        text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+        ),
+        {"table": model.__tablename__},
+    )
+    # Tables that haven't been vacuumed or analyzed yet have no estimate.
+    if estimate is None or estimate < EXACT_COUNT_THRESHOLD:
+        return db.session.scalar(select(func.count()).select_from(model)) or 0
+
+    return estimate
+
+
+def fetch_daily_submissions(
+    num_days: int = DAILY_SUBMISSION_DAYS,
+) -> list[DailySubmissions]:
+    since = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(
+        days=num_days
+    )
+    day = cast(GameLog.created_at, Date)
+    return [
+        DailySubmissions(date=date, count=count)
+        for date, count in db.session.execute(
+            select(day, func.count())
+            .where(GameLog.created_at >= since)
+            .group_by(day)
+            .order_by(day)
+        ).tuples()
+    ]
+
+
+def fetch_stats() -> Stats:
+    return Stats(
+        num_game_logs=estimated_row_count(GameLog),
+        num_players=estimated_row_count(User),
+        # Served by the index on created_at, rather than fetching whole game logs.
+        most_recent_submission=db.session.scalar(select(func.max(GameLog.created_at))),
+        daily_submissions=fetch_daily_submissions(),
+    )
+
+
+class StatsCache:
+    """
+    Caches database statistics for `ttl`, so that frequent requests don't each query the database.
+    Submitting game logs invalidates the cache, so that this process reflects them straight away;
+    other processes pick them up once their cached stats expire.
+    """
+
+    def __init__(
+        self,
+        ttl: datetime.timedelta = datetime.timedelta(minutes=1),
+        fetch: Callable[[], Stats] = fetch_stats,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.fetch = fetch
+        self.clock = clock
+        self.stats: Optional[Stats] = None
+        self.fetched_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self) -> Stats:
+        with self.lock:
+            if (
+                self.stats is None
+                or self.clock() - self.fetched_at >= self.ttl.total_seconds()
+            ):
+                self.stats = self.fetch()
+                self.fetched_at = self.clock()
+
+            return self.stats
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.stats = None
+
+
+stats_cache = StatsCache()
@@ -0,0 +1,61 @@
+import datetime
+import sys
+
+import pytest
+
+from ark_nova_stats.stats import Stats, StatsCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache() -> tuple[StatsCache, FakeClock, list[Stats]]:
+    clock = FakeClock()
+    fetched: list[Stats] = []
+
+    def fetch() -> Stats:
+        stats = Stats(
+            num_game_logs=len(fetched),
+            num_players=0,
+            most_recent_submission=None,
+            daily_submissions=[],
+        )
+        fetched.append(stats)
+        return stats
+
+    return (
+        StatsCache(ttl=datetime.timedelta(seconds=60), fetch=fetch, clock=clock),
+        clock,
+        fetched,
+    )
+
+
+class TestStatsCache:
+    def test_serves_cached_stats_until_ttl(self):
+        cache, clock, fetched = make_cache()
+
+        assert 0 == cache.get().num_game_logs
+        clock.now = 59
+        assert 0 == cache.get().num_game_logs
+        assert 1 == len(fetched)
+
+        clock.now = 60
+        assert 1 == cache.get().num_game_logs
+        assert 2 == len(fetched)
+
+    def test_invalidate_refetches(self):
+        cache, clock, fetched = make_cache()
+
+        cache.get()
+        cache.invalidate()
+        assert 1 == cache.get().num_game_logs
+        assert 2 == len(fetched)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
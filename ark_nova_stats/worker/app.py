@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 import os
 import tempfile
@@ -8,19 +7,22 @@ from typing import Optional
 
 import boto3
 
-from ark_nova_stats.bga_log_parser.game_log import GameLog as BGAGameLog
-from ark_nova_stats.config import app, db
-from ark_nova_stats.models import (
-    Card,
-    CardPlay,
-    GameLog,
-    GameLogArchive,
-    GameStatistics,
-)
+from ark_nova_stats.config import app
+from ark_nova_stats.models import GameLogArchive
+from ark_nova_stats.rollups import rebuild_rollups
 from ark_nova_stats.worker.archives import (
     BGAWithELOArchiveCreator,
     EmuCupTopLevelStatsCsvArchiveCreator,
+    StatsDatabaseArchiveCreator,
     TopLevelStatsCsvArchiveCreator,
+    game_logs_after,
+)
+from ark_nova_stats.worker.backfills import (
+    CardPlayBackfill,
+    GameLogCompressionBackfill,
+    GameLogStartEndBackfill,
+    GameStatisticsBackfill,
+    run_backfill,
 )
 
 max_delay = 12 * 60 * 60
@@ -45,6 +47,7 @@ def archive_logs_to_tigris(
             BGAWithELOArchiveCreator,
             TopLevelStatsCsvArchiveCreator,
             EmuCupTopLevelStatsCsvArchiveCreator,
+            StatsDatabaseArchiveCreator,
         )
     ]
     archive_types_to_create = [
@@ -64,8 +67,13 @@ def archive_logs_to_tigris(
     with tempfile.TemporaryDirectory() as tmpdirname:
         for archive_type in archive_types_to_create:
             archive_type.create_archive_tempfile(tmpdirname)
+            archive_type.merge_previous_archives(tmpdirname)
 
-        for game_log in archive_types_to_create[0].game_logs():
+        # Each archive only needs the game logs after the end of its latest chain.
+        after_game_log_id = min(
+            archive_type.after_game_log_id for archive_type in archive_types_to_create
+        )
+        for game_log in game_logs_after(after_game_log_id):
             logs_processed += 1
             for archive_type in archive_types_to_create:
                 archive_type.process_game_log(game_log)
@@ -80,105 +88,34 @@ def archive_logs_to_tigris(
     return archives
 
 
-def populate_card_play_actions() -> None:
+def populate_card_play_actions(num_shards: int = 1) -> None:
     logger.info(f"Populating card play actions.")
-    card_ids = set()
-    for game_log in db.session.execute(db.select(GameLog)).yield_per(10):
-        parsed_log = BGAGameLog(**json.loads(game_log.log))
-        # First, create underlying card models.
-        for play in parsed_log.data.card_plays:
-            # Check to see if it exists.
-            if play.card.id in card_ids:
-                continue
-
-            find_card = db.session.execute(
-                db.select(Card).where(Card.bga_id == play.card.id).count()
-            ).scalar_one()
-            if find_card > 0:
-                card_ids.add(play.card.id)
-                continue
-
-            card = Card(name=play.card.name, bga_id=play.card.id)
-            logger.info(f"Staging card creation for: {play.card.id}")
-            db.session.add(card)
-            card_ids.add(play.card.id)
-
-    logger.info("Committing all the new cards.")
-    db.session.commit()
-
-    # Now create all the card plays.
-    logging.info("Creating card plays.")
-    for game_log in db.session.execute(db.select(GameLog)).yield_per(10):
-        parsed_log = BGAGameLog(**json.loads(game_log.log))
-        for play in parsed_log.data.card_plays:
-            find_play = db.session.execute(
-                db.select(CardPlay)
-                .where(
-                    CardPlay.game_log_id == game_log.id
-                    and CardPlay.card_id == play.card.id
-                    and CardPlay.user_id == play.player.id
-                    and CardPlay.move == play.move
-                )
-                .count()
-            ).scalar_one()
-            if find_play > 0:
-                continue
-
-            card = db.session.execute(
-                db.select(Card).where(Card.bga_id == play.card.id).limit(1)
-            ).scalar_one()
-            logger.info(
-                f"Staging card play creation for game ID {game_log.id}, card {play.card.id}"
-            )
-
-            db.session.add(
-                CardPlay(
-                    game_log_id=game_log.id,
-                    card=card,
-                    user_id=play.player.id,
-                    move=play.move,
-                )
-            )
-
-    logger.info("Committing all the new card plays.")
-    db.session.commit()
-
-    logger.info("Done creating new card plays!")
-
-
-def populate_game_log_start_end() -> None:
-    logger.info(f"Populating game log start & ends.")
-    updated = 0
-    for game_log in db.session.execute(
-        db.select(GameLog).where(GameLog.game_start == None).limit(25)
-    ).yield_per(10):
-        parsed_log = BGAGameLog(**json.loads(game_log.log))
-        game_log.game_start = parsed_log.game_start
-        game_log.game_end = parsed_log.game_end
-        updated += 1
+    processed = run_backfill(CardPlayBackfill, logger, num_shards=num_shards)
+    logger.info(f"Done creating card plays for {processed} game logs!")
+
 
-    logger.info("Committing all the populated game log starts & ends.")
-    db.session.commit()
-    logger.info(f"Done populating {updated} game log starts & ends!")
+def populate_game_log_start_end(num_shards: int = 1) -> None:
+    logger.info(f"Populating game log start & ends.")
+    processed = run_backfill(GameLogStartEndBackfill, logger, num_shards=num_shards)
+    logger.info(f"Done populating {processed} game log starts & ends!")
 
 
-def populate_game_statistics() -> None:
+def populate_game_statistics(num_shards: int = 1) -> None:
     logger.info(f"Populating game statistics.")
-    updated = 0
-    for game_log in db.session.execute(
-        db.select(GameLog)
-        .outerjoin(GameStatistics)
-        .where(GameStatistics.bga_table_id == None)
-        .limit(25)
-    ).yield_per(10):
-        parsed_log = BGAGameLog(**json.loads(game_log.log))
-        for s in game_log.create_game_statistics(parsed_log):
-            db.session.add(s)
-        updated += 1
-
-    logger.info(f"Committing {updated} populated game statistics.")
-    db.session.commit()
-    logger.info(f"Done populating {updated} game statistics!")
+    processed = run_backfill(GameStatisticsBackfill, logger, num_shards=num_shards)
+    logger.info(f"Done populating game statistics for {processed} game logs!")
+
+
+def compress_game_logs(num_shards: int = 1) -> None:
+    logger.info(f"Compressing game logs.")
+    processed = run_backfill(GameLogCompressionBackfill, logger, num_shards=num_shards)
+    logger.info(f"Done compressing {processed} game logs!")
+
+
+def rebuild_rollup_tables() -> None:
+    logger.info(f"Rebuilding rollup tables.")
+    rebuild_rollups()
+    logger.info(f"Done rebuilding rollup tables!")
 
 
 API_SECRET_KEY = os.getenv("API_WORKER_SECRET")
@@ -194,6 +131,8 @@ def main() -> int:
             # populate_card_play_actions()
             # populate_game_log_start_end()
             # populate_game_statistics()
+            # compress_game_logs()
+            # rebuild_rollup_tables()
             delay = (start + max_delay) - time.time()
             if delay > 0:
                 time.sleep(delay)
@@ -1,30 +1,127 @@
 import csv
 import datetime
+import functools
+import io
 import json
 import logging
 import os
+import shutil
+import sqlite3
 import tarfile
 import tempfile
-from typing import Iterable, Optional
+from typing import IO, Any, Iterable, Optional
 
-import sqlalchemy
-from sqlalchemy import desc
+from sqlalchemy import Select, desc, distinct, exists, func, select
+from sqlalchemy.orm import selectinload
 
+from ark_nova_stats.bga_log_parser.stat_schema import (
+    STAT_FIELDS,
+    STAT_NAMES,
+    stat_values,
+)
 from ark_nova_stats.config import db
 from ark_nova_stats.emu_cup.tables import EMU_CUP_GAME_TABLE_IDS
-from ark_nova_stats.models import GameLog, GameLogArchive, GameLogArchiveType, User
+from ark_nova_stats.models import (
+    CardPlay,
+    GameLog,
+    GameLogArchive,
+    GameLogArchiveType,
+    GameParticipation,
+    User,
+)
+
+
+def embed_raw_json(payload: dict, key: str, raw_json: str) -> str:
+    """
+    Serializes `payload` with an already-encoded JSON value appended under `key`,
+    without having to decode & re-encode that value.
+    """
+    encoded = json.dumps(payload)
+    separator = ", " if payload else ""
+    return f"{encoded[:-1]}{separator}{json.dumps(key)}: {raw_json}}}"
+
+
+# How many game logs to fetch from the database at a time when archiving.
+ARCHIVE_BATCH_SIZE = 500
+
+
+def stream_game_logs(
+    query: Select[tuple[GameLog]], batch_size: int = ARCHIVE_BATCH_SIZE
+) -> Iterable[GameLog]:
+    """
+    Yields the game logs matched by `query`, fetching them from a server-side cursor
+    `batch_size` at a time, so that only one batch is held in memory.
+    The relationships that archives read are loaded with one query per batch,
+    rather than lazily loaded for each game log.
+    """
+    return db.session.scalars(
+        query.options(
+            selectinload(GameLog.users),
+            selectinload(GameLog.game_ratings),
+            selectinload(GameLog.game_statistics),
+            selectinload(GameLog.card_plays).joinedload(CardPlay.card),
+        ).execution_options(stream_results=True, yield_per=batch_size)
+    )
+
+
+def game_logs_after(after_game_log_id: int = 0) -> Iterable[GameLog]:
+    """
+    Yields the game logs with IDs greater than `after_game_log_id` in order of ID.
+    """
+    return stream_game_logs(
+        select(GameLog).where(GameLog.id > after_game_log_id).order_by(GameLog.id)
+    )
+
+
+def archive_key(archive: GameLogArchive) -> str:
+    # Archives are uploaded under their type, with the same filename as in their URL.
+    return (
+        GameLogArchiveType(archive.archive_type).name
+        + "/"
+        + archive.url.rsplit("/", 1)[-1]
+    )
+
+
+def archive_manifest_entry(archive: GameLogArchive) -> dict[str, Any]:
+    return {
+        "url": archive.url,
+        "size_bytes": archive.size_bytes,
+        "num_game_logs": archive.num_game_logs,
+        "last_game_log_id": archive.last_game_log_id,
+        "created_at": int(round(archive.created_at.timestamp())),
+    }
 
 
 class GameLogArchiveCreator:
+    """
+    Writes an archive of game logs & uploads it to Tigris.
+
+    Most archives are deltas, which only contain the game logs since the previous archive
+    of the same type. Each chain of deltas starts at a full archive; once a chain has
+    `max_deltas` deltas, the next archive compacts the chain into a new full archive
+    by copying the previous archives' members, rather than re-reading every game log.
+    A manifest of the latest chain is uploaded alongside the archives.
+    """
+
+    # Higher gzip levels are much slower, for very little reduction in size on replay JSON.
+    compresslevel = 6
+
     def __init__(
-        self, logger: logging.Logger, tigris_client, min_interval: datetime.timedelta
+        self,
+        logger: logging.Logger,
+        tigris_client,
+        min_interval: datetime.timedelta,
+        max_deltas: int = 6,
     ):
         self.logger = logger
         self.tigris_client = tigris_client
         self.min_interval = min_interval
+        self.max_deltas = max_deltas
         self.num_logs = 0
         self.users: set[str] = set()
-        self.last_log: Optional[GameLog] = None
+        self.last_game_log_id: Optional[int] = None
+        self.member_names: set[str] = set()
+        self.merged_archives: list[GameLogArchive] = []
         self._filename: Optional[str] = None
         self.archive_tempfile: Optional[tempfile._TemporaryFileWrapper[bytes]] = None
         self.archive_tarfile: Optional[tarfile.TarFile] = None
@@ -33,8 +130,48 @@ class GameLogArchiveCreator:
     def archive_type(self) -> GameLogArchiveType:
         raise NotImplementedError
 
+    @functools.cached_property
+    def latest_archive(self) -> Optional[GameLogArchive]:
+        return db.session.scalars(
+            select(GameLogArchive)
+            .where(GameLogArchive.archive_type == self.archive_type)
+            .order_by(desc(GameLogArchive.id))
+            .limit(1)
+        ).first()
+
+    @property
+    def base_archive(self) -> Optional[GameLogArchive]:
+        """
+        The full archive that the latest archive's chain starts at.
+        """
+        latest_archive = self.latest_archive
+        if latest_archive is None or latest_archive.base_archive is None:
+            return latest_archive
+
+        return latest_archive.base_archive
+
+    @property
+    def is_delta(self) -> bool:
+        base_archive = self.base_archive
+        return (
+            base_archive is not None
+            and len(base_archive.delta_archives) < self.max_deltas
+        )
+
+    @property
+    def after_game_log_id(self) -> int:
+        """
+        The ID of the last game log in the latest archive's chain.
+        Only game logs after this need to be read from the database.
+        """
+        latest_archive = self.latest_archive
+        if latest_archive is None or latest_archive.last_game_log_id is None:
+            return 0
+
+        return latest_archive.last_game_log_id
+
     def should_include_game_log(self, game_log: GameLog) -> bool:
-        return True
+        return game_log.id > self.after_game_log_id
 
     def process_game_log(self, game_log: GameLog) -> None:
         if not self.should_include_game_log(game_log):
@@ -43,8 +180,8 @@ class GameLogArchiveCreator:
         self.num_logs += 1
         game_users: list[User] = game_log.users
         self.users.update(set([u.name for u in game_users]))
-        if self.last_log is None or self.last_log.game_end < game_log.game_end:
-            self.last_log = game_log
+        if self.last_game_log_id is None or self.last_game_log_id < game_log.id:
+            self.last_game_log_id = game_log.id
 
     @property
     def filename(self) -> str:
@@ -53,6 +190,7 @@ class GameLogArchiveCreator:
                 self.archive_type.name
                 + "_"
                 + datetime.datetime.now(tz=datetime.timezone.utc).strftime("%Y_%m_%d")
+                + ("_delta" if self.is_delta else "")
                 + ".tar.gz"
             )
 
@@ -60,16 +198,13 @@ class GameLogArchiveCreator:
 
     def should_create_archive(self) -> bool:
         # First, bail if we've uploaded an archive recently.
-        last_archive: Optional[GameLogArchive] = db.session.execute(
-            db.select(GameLogArchive)
-            .filter(GameLogArchive.archive_type == self.archive_type)
-            .order_by(desc(GameLogArchive.created_at))
-            .first()
-        ).scalar_one_or_none()
+        last_archive = self.latest_archive
         if last_archive is None:
             return True
 
-        time_since_last_archive = datetime.datetime.now() - last_archive.created_at
+        time_since_last_archive = (
+            datetime.datetime.now(tz=datetime.timezone.utc) - last_archive.created_at
+        )
         if time_since_last_archive < self.min_interval:
             self.logger.debug(
                 f"Last archive was uploaded at {last_archive.created_at}, which was {time_since_last_archive} ago; skipping."
@@ -77,28 +212,110 @@ class GameLogArchiveCreator:
             return False
 
         # Next, check to see if we have new logs to include in the archive.
-        new_logs = db.session.execute(
-            db.select(GameLog).where(GameLog.id > last_archive.last_game_log_id).count()
-        ).scalar_one()
-        if new_logs == 0:
+        has_new_logs = db.session.scalar(
+            select(exists().where(GameLog.id > self.after_game_log_id))
+        )
+        if not has_new_logs:
             self.logger.debug(
-                f"No new logs to include since game ID {last_archive.last_game_log_id}; skipping."
+                f"No new logs to include since game ID {self.after_game_log_id}; skipping."
             )
             return False
 
         return True
 
     def game_logs(self) -> Iterable[GameLog]:
-        return db.select(GameLog).yield_per(10)
+        return game_logs_after(self.after_game_log_id)
 
     def create_archive_tempfile(self, directory: str) -> tarfile.TarFile:
         self.logger.info(f"Creating archive at: {self.filename}")
         self.archive_tempfile = tempfile.NamedTemporaryFile(
             suffix=self.filename, dir=directory, delete=False
         )
-        self.archive_tarfile = tarfile.open(self.archive_tempfile.name, "w:gz")
+        self.archive_tarfile = tarfile.open(
+            self.archive_tempfile.name, "w:gz", compresslevel=self.compresslevel
+        )
         return self.archive_tarfile
 
+    def add_archive_member(
+        self, name: str, content: bytes, mtime: Optional[float] = None
+    ) -> None:
+        """
+        Writes `content` straight into the archive as a file called `name`.
+        """
+        if self.archive_tarfile is None:
+            raise ValueError(
+                "Cannot call add_archive_member before creating the archive tarfile."
+            )
+
+        member = tarfile.TarInfo(name=name)
+        member.size = len(content)
+        member.mode = 0o644
+        member.mtime = int(
+            mtime
+            if mtime is not None
+            else datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+        )
+        self.archive_tarfile.addfile(member, io.BytesIO(content))
+        self.member_names.add(name)
+
+    def game_log_member_name(self, game_log: GameLog) -> str:
+        user_names = "_".join([u.name.replace(" ", "_") for u in game_log.users])
+        return f"{game_log.bga_table_id}_{user_names}.json"
+
+    def merge_archive_member(self, member: tarfile.TarInfo, content: IO[bytes]) -> None:
+        """
+        Copies a member of a previous archive into this one.
+        """
+        if self.archive_tarfile is None:
+            raise ValueError(
+                "Cannot call merge_archive_member before creating the archive tarfile."
+            )
+
+        # A game log may have been included in more than one archive in a chain.
+        if member.name in self.member_names:
+            return
+
+        self.archive_tarfile.addfile(member, content)
+        self.member_names.add(member.name)
+
+    def merge_previous_archives(self, directory: str) -> None:
+        """
+        If this archive compacts the latest chain, copies the latest full archive
+        & its deltas into it, so that only newer game logs need to be processed.
+        """
+        base_archive = self.base_archive
+        if self.is_delta or base_archive is None:
+            return
+
+        for previous_archive in [base_archive, *base_archive.delta_archives]:
+            key = archive_key(previous_archive)
+            self.logger.info(f"Merging previous archive at: {key}")
+            path = os.path.join(directory, f"previous_{previous_archive.id}.tar.gz")
+            self.tigris_client.download_file(os.getenv("BUCKET_NAME"), key, path)
+            with tarfile.open(path, "r:gz") as previous_tarfile:
+                for member in previous_tarfile:
+                    content = previous_tarfile.extractfile(member)
+                    if content is not None:
+                        self.merge_archive_member(member, content)
+            os.remove(path)
+
+            self.num_logs += previous_archive.num_game_logs
+            self.merged_archives.append(previous_archive)
+
+    def count_users_query(self) -> Select[tuple[int]]:
+        return (
+            select(func.count(distinct(GameParticipation.user_id)))
+            .join(GameLog)
+            .where(GameLog.id <= (self.last_game_log_id or self.after_game_log_id))
+        )
+
+    def count_users(self) -> int:
+        if not self.merged_archives:
+            return len(self.users)
+
+        # Users can appear in several of the merged archives, so count them from scratch.
+        return db.session.scalar(self.count_users_query()) or 0
+
     def upload_archive(self) -> None:
         # Upload the compressed gzip jsonl to Tigris.
         if self.archive_tarfile is None or self.archive_tempfile is None:
@@ -106,8 +323,10 @@ class GameLogArchiveCreator:
                 f"Cannot call upload_archive before we've created the tempfile."
             )
 
-        os.fsync(self.archive_tempfile)
+        # Finish writing the archive, then make sure it's durable before uploading it.
         self.archive_tarfile.close()
+        self.archive_tempfile.flush()
+        os.fsync(self.archive_tempfile.fileno())
         self.archive_tempfile.close()
 
         key = self.archive_type.name + "/" + self.filename
@@ -119,6 +338,31 @@ class GameLogArchiveCreator:
         )
         self.logger.info(f"Uploaded game log archive at: {key} with size: {size_bytes}")
 
+    def manifest(self, archive: GameLogArchive) -> dict[str, Any]:
+        """
+        Describes the chain that `archive` is in: its full archive, followed by its deltas.
+        Restoring every game log means downloading the full archive & each delta in order.
+        """
+        base_archive = archive.base_archive or archive
+        return {
+            "archive_type": self.archive_type.name,
+            "full": archive_manifest_entry(base_archive),
+            "deltas": [
+                archive_manifest_entry(delta_archive)
+                for delta_archive in base_archive.delta_archives
+            ],
+        }
+
+    def upload_manifest(self, archive: GameLogArchive) -> None:
+        key = self.archive_type.name + "/manifest.json"
+        self.tigris_client.put_object(
+            Bucket=os.getenv("BUCKET_NAME"),
+            Key=key,
+            Body=json.dumps(self.manifest(archive)).encode("utf-8"),
+            ContentType="application/json",
+        )
+        self.logger.info(f"Uploaded game log archive manifest at: {key}")
+
     def record_archive(self) -> GameLogArchive:
         # Record this archive in the database.
         if self.archive_tempfile is None:
@@ -128,27 +372,28 @@ class GameLogArchiveCreator:
 
         url = f"{os.getenv('TIGRIS_CUSTOM_DOMAIN_HOST')}/{self.archive_type.name}/{self.filename}"
         size_bytes = os.path.getsize(self.archive_tempfile.name)
+        is_delta = self.is_delta
 
-        if self.last_log is None:
-            last_game_log_id = None
-        else:
-            last_game_log_id = self.last_log.id
+        # Archives without any new game logs still cover the rest of their chain.
+        last_game_log_id = max(self.last_game_log_id or 0, self.after_game_log_id)
 
         new_archive = GameLogArchive(
             url=url,
             archive_type=self.archive_type.value,
             size_bytes=size_bytes,
             num_game_logs=self.num_logs,
-            num_users=len(self.users),
-            last_game_log_id=last_game_log_id,
+            num_users=self.count_users(),
+            last_game_log_id=last_game_log_id or None,
+            base_archive=self.base_archive if is_delta else None,
         )
 
         db.session.add(new_archive)
         db.session.commit()
         self.logger.info(
-            f"Recorded a new game log archive at: {url} with {self.num_logs} games"
+            f"Recorded a new {'delta' if is_delta else 'full'} game log archive at: {url} with {self.num_logs} games"
         )
 
+        self.upload_manifest(new_archive)
         return new_archive
 
 
@@ -164,18 +409,14 @@ class RawBGALogArchiveCreator(GameLogArchiveCreator):
             )
 
         super(RawBGALogArchiveCreator, self).process_game_log(game_log)
+        if not self.should_include_game_log(game_log):
+            return
 
-        user_names = "_".join([u.name.replace(" ", "_") for u in game_log.users])
-        log_tempfile_name = f"{game_log.bga_table_id}_{user_names}.json"
-        with tempfile.NamedTemporaryFile(
-            suffix=log_tempfile_name, mode="w"
-        ) as log_tempfile:
-            log_tempfile.write(game_log.log)
-            log_tempfile.flush()
-            os.fsync(log_tempfile)
-
-            self.archive_tarfile.add(log_tempfile.name, arcname=log_tempfile_name)
-            os.fsync(self.archive_tempfile)
+        self.add_archive_member(
+            self.game_log_member_name(game_log),
+            game_log.log.encode("utf-8"),
+            mtime=game_log.game_end.timestamp(),
+        )
 
 
 class BGAWithELOArchiveCreator(GameLogArchiveCreator):
@@ -190,8 +431,8 @@ class BGAWithELOArchiveCreator(GameLogArchiveCreator):
             )
 
         super(BGAWithELOArchiveCreator, self).process_game_log(game_log)
-
-        user_names = "_".join([u.name.replace(" ", "_") for u in game_log.users])
+        if not self.should_include_game_log(game_log):
+            return
 
         ratings = game_log.game_ratings
         payload = {}
@@ -207,97 +448,53 @@ class BGAWithELOArchiveCreator(GameLogArchiveCreator):
             }
         if game_log.game_statistics is not None:
             payload["statistics"] = {
-                stat.bga_user_id: {
-                    "score": stat.score,
-                    "rank": stat.rank,
-                    "thinking_time": stat.thinking_time,
-                    "starting_position": stat.starting_position,
-                    "turns": stat.turns,
-                    "breaks_triggered": stat.breaks_triggered,
-                    "triggered_end": stat.triggered_end,
-                    "map_id": stat.map_id,
-                    "appeal": stat.appeal,
-                    "conservation": stat.conservation,
-                    "reputation": stat.reputation,
-                    "actions_build": stat.actions_build,
-                    "actions_animals": stat.actions_animals,
-                    "actions_cards": stat.actions_cards,
-                    "actions_association": stat.actions_association,
-                    "actions_sponsors": stat.actions_sponsors,
-                    "x_tokens_gained": stat.x_tokens_gained,
-                    "x_actions": stat.x_actions,
-                    "x_tokens_used": stat.x_tokens_used,
-                    "money_gained": stat.money_gained,
-                    "money_gained_through_income": stat.money_gained_through_income,
-                    "money_spent_on_animals": stat.money_spent_on_animals,
-                    "money_spent_on_enclosures": stat.money_spent_on_enclosures,
-                    "money_spent_on_donations": stat.money_spent_on_donations,
-                    "money_spent_on_playing_cards_from_reputation_range": stat.money_spent_on_playing_cards_from_reputation_range,
-                    "cards_drawn_from_deck": stat.cards_drawn_from_deck,
-                    "cards_drawn_from_reputation_range": stat.cards_drawn_from_reputation_range,
-                    "cards_snapped": stat.cards_snapped,
-                    "cards_discarded": stat.cards_discarded,
-                    "played_sponsors": stat.played_sponsors,
-                    "played_animals": stat.played_animals,
-                    "released_animals": stat.released_animals,
-                    "association_workers": stat.association_workers,
-                    "association_donations": stat.association_donations,
-                    "association_reputation_actions": stat.association_reputation_actions,
-                    "association_partner_zoo_actions": stat.association_partner_zoo_actions,
-                    "association_university_actions": stat.association_university_actions,
-                    "association_conservation_project_actions": stat.association_conservation_project_actions,
-                    "built_enclosures": stat.built_enclosures,
-                    "built_kiosks": stat.built_kiosks,
-                    "built_pavilions": stat.built_pavilions,
-                    "built_unique_buildings": stat.built_unique_buildings,
-                    "hexes_covered": stat.hexes_covered,
-                    "hexes_empty": stat.hexes_empty,
-                    "upgraded_action_cards": stat.upgraded_action_cards,
-                    "upgraded_animals": stat.upgraded_animals,
-                    "upgraded_build": stat.upgraded_build,
-                    "upgraded_cards": stat.upgraded_cards,
-                    "upgraded_sponsors": stat.upgraded_sponsors,
-                    "upgraded_association": stat.upgraded_association,
-                    "icons_africa": stat.icons_africa,
-                    "icons_europe": stat.icons_europe,
-                    "icons_asia": stat.icons_asia,
-                    "icons_australia": stat.icons_australia,
-                    "icons_americas": stat.icons_americas,
-                    "icons_bird": stat.icons_bird,
-                    "icons_predator": stat.icons_predator,
-                    "icons_herbivore": stat.icons_herbivore,
-                    "icons_bear": stat.icons_bear,
-                    "icons_reptile": stat.icons_reptile,
-                    "icons_primate": stat.icons_primate,
-                    "icons_petting_zoo": stat.icons_petting_zoo,
-                    "icons_sea_animal": stat.icons_sea_animal,
-                    "icons_water": stat.icons_water,
-                    "icons_rock": stat.icons_rock,
-                    "icons_science": stat.icons_science,
-                }
-                for stat in game_log.game_statistics
+                stat.bga_user_id: stat_values(stat) for stat in game_log.game_statistics
             }
 
-        log_tempfile_name = f"{game_log.bga_table_id}_{user_names}.json"
-        with tempfile.NamedTemporaryFile(
-            suffix=log_tempfile_name, mode="w"
-        ) as log_tempfile:
-            payload["log"] = json.loads(game_log.log)
-            log_tempfile.write(json.dumps(payload))
-            log_tempfile.flush()
-            os.fsync(log_tempfile)
-
-            self.archive_tarfile.add(log_tempfile.name, arcname=log_tempfile_name)
-            os.fsync(self.archive_tempfile)
+        # The log is already JSON, so embed it as-is rather than decoding & re-encoding it.
+        self.add_archive_member(
+            self.game_log_member_name(game_log),
+            embed_raw_json(payload, "log", game_log.log).encode("utf-8"),
+            mtime=game_log.game_end.timestamp(),
+        )
 
 
 class TopLevelStatsCsvArchiveCreator(GameLogArchiveCreator):
     def __init__(self, *args, **kwargs) -> None:
         super(TopLevelStatsCsvArchiveCreator, self).__init__(*args, **kwargs)
-        self.csv_filename = self.filename.replace(".tar.gz", ".csv")
-        self.csv_file = tempfile.NamedTemporaryFile(suffix=self.csv_filename, mode="w")
+        self.csv_file: Optional[tempfile._TemporaryFileWrapper[str]] = None
+        self.csv_writer: Optional[csv.DictWriter] = None
+
+    @property
+    def csv_filename(self) -> str:
+        return self.filename.replace(".tar.gz", ".csv")
+
+    def create_archive_tempfile(self, directory: str) -> tarfile.TarFile:
+        archive_tarfile = super(
+            TopLevelStatsCsvArchiveCreator, self
+        ).create_archive_tempfile(directory)
+        self.csv_file = tempfile.NamedTemporaryFile(
+            suffix=self.csv_filename, dir=directory, mode="w"
+        )
         self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=self.csv_field_names)
         self.csv_writer.writeheader()
+        return archive_tarfile
+
+    def merge_archive_member(self, member: tarfile.TarInfo, content: IO[bytes]) -> None:
+        if not member.name.endswith(".csv"):
+            super(TopLevelStatsCsvArchiveCreator, self).merge_archive_member(
+                member, content
+            )
+            return
+
+        if self.csv_writer is None:
+            raise ValueError(
+                "Cannot call merge_archive_member before creating the archive tarfile."
+            )
+
+        # Each archive holds a single CSV, so append the previous archive's rows to ours.
+        for row in csv.DictReader(io.TextIOWrapper(content, encoding="utf-8")):
+            self.csv_writer.writerow(row)
 
     @property
     def archive_type(self) -> GameLogArchiveType:
@@ -313,75 +510,15 @@ class TopLevelStatsCsvArchiveCreator(GameLogArchiveCreator):
             "new_elo",
             "prior_arena_elo",
             "new_arena_elo",
-            "score",
-            "rank",
-            "thinking_time",
-            "starting_position",
-            "turns",
-            "breaks_triggered",
-            "triggered_end",
-            "map_id",
-            "appeal",
-            "conservation",
-            "reputation",
-            "actions_build",
-            "actions_animals",
-            "actions_cards",
-            "actions_association",
-            "actions_sponsors",
-            "x_tokens_gained",
-            "x_actions",
-            "x_tokens_used",
-            "money_gained",
-            "money_gained_through_income",
-            "money_spent_on_animals",
-            "money_spent_on_enclosures",
-            "money_spent_on_donations",
-            "money_spent_on_playing_cards_from_reputation_range",
-            "cards_drawn_from_deck",
-            "cards_drawn_from_reputation_range",
-            "cards_snapped",
-            "cards_discarded",
-            "played_sponsors",
-            "played_animals",
-            "released_animals",
-            "association_workers",
-            "association_donations",
-            "association_reputation_actions",
-            "association_partner_zoo_actions",
-            "association_university_actions",
-            "association_conservation_project_actions",
-            "built_enclosures",
-            "built_kiosks",
-            "built_pavilions",
-            "built_unique_buildings",
-            "hexes_covered",
-            "hexes_empty",
-            "upgraded_action_cards",
-            "upgraded_animals",
-            "upgraded_build",
-            "upgraded_cards",
-            "upgraded_sponsors",
-            "upgraded_association",
-            "icons_africa",
-            "icons_europe",
-            "icons_asia",
-            "icons_australia",
-            "icons_americas",
-            "icons_bird",
-            "icons_predator",
-            "icons_herbivore",
-            "icons_bear",
-            "icons_reptile",
-            "icons_primate",
-            "icons_petting_zoo",
-            "icons_sea_animal",
-            "icons_water",
-            "icons_rock",
-            "icons_science",
+            *STAT_NAMES,
         ]
 
     def process_game_log(self, game_log: GameLog) -> None:
+        if self.csv_writer is None:
+            raise ValueError(
+                "Cannot call process_game_log before creating the archive tarfile."
+            )
+
         super(TopLevelStatsCsvArchiveCreator, self).process_game_log(game_log)
         if not self.should_include_game_log(game_log):
             return
@@ -407,76 +544,7 @@ class TopLevelStatsCsvArchiveCreator(GameLogArchiveCreator):
 
             for stat in game_log.game_statistics:
                 if stat.bga_user_id == user.bga_id:
-                    row.update(
-                        {
-                            "score": stat.score,
-                            "rank": stat.rank,
-                            "thinking_time": stat.thinking_time,
-                            "starting_position": stat.starting_position,
-                            "turns": stat.turns,
-                            "breaks_triggered": stat.breaks_triggered,
-                            "triggered_end": stat.triggered_end,
-                            "map_id": stat.map_id,
-                            "appeal": stat.appeal,
-                            "conservation": stat.conservation,
-                            "reputation": stat.reputation,
-                            "actions_build": stat.actions_build,
-                            "actions_animals": stat.actions_animals,
-                            "actions_cards": stat.actions_cards,
-                            "actions_association": stat.actions_association,
-                            "actions_sponsors": stat.actions_sponsors,
-                            "x_tokens_gained": stat.x_tokens_gained,
-                            "x_actions": stat.x_actions,
-                            "x_tokens_used": stat.x_tokens_used,
-                            "money_gained": stat.money_gained,
-                            "money_gained_through_income": stat.money_gained_through_income,
-                            "money_spent_on_animals": stat.money_spent_on_animals,
-                            "money_spent_on_enclosures": stat.money_spent_on_enclosures,
-                            "money_spent_on_donations": stat.money_spent_on_donations,
-                            "money_spent_on_playing_cards_from_reputation_range": stat.money_spent_on_playing_cards_from_reputation_range,
-                            "cards_drawn_from_deck": stat.cards_drawn_from_deck,
-                            "cards_drawn_from_reputation_range": stat.cards_drawn_from_reputation_range,
-                            "cards_snapped": stat.cards_snapped,
-                            "cards_discarded": stat.cards_discarded,
-                            "played_sponsors": stat.played_sponsors,
-                            "played_animals": stat.played_animals,
-                            "released_animals": stat.released_animals,
-                            "association_workers": stat.association_workers,
-                            "association_donations": stat.association_donations,
-                            "association_reputation_actions": stat.association_reputation_actions,
-                            "association_partner_zoo_actions": stat.association_partner_zoo_actions,
-                            "association_university_actions": stat.association_university_actions,
-                            "association_conservation_project_actions": stat.association_conservation_project_actions,
-                            "built_enclosures": stat.built_enclosures,
-                            "built_kiosks": stat.built_kiosks,
-                            "built_pavilions": stat.built_pavilions,
-                            "built_unique_buildings": stat.built_unique_buildings,
-                            "hexes_covered": stat.hexes_covered,
-                            "hexes_empty": stat.hexes_empty,
-                            "upgraded_action_cards": stat.upgraded_action_cards,
-                            "upgraded_animals": stat.upgraded_animals,
-                            "upgraded_build": stat.upgraded_build,
-                            "upgraded_cards": stat.upgraded_cards,
-                            "upgraded_sponsors": stat.upgraded_sponsors,
-                            "upgraded_association": stat.upgraded_association,
-                            "icons_africa": stat.icons_africa,
-                            "icons_europe": stat.icons_europe,
-                            "icons_asia": stat.icons_asia,
-                            "icons_australia": stat.icons_australia,
-                            "icons_americas": stat.icons_americas,
-                            "icons_bird": stat.icons_bird,
-                            "icons_predator": stat.icons_predator,
-                            "icons_herbivore": stat.icons_herbivore,
-                            "icons_bear": stat.icons_bear,
-                            "icons_reptile": stat.icons_reptile,
-                            "icons_primate": stat.icons_primate,
-                            "icons_petting_zoo": stat.icons_petting_zoo,
-                            "icons_sea_animal": stat.icons_sea_animal,
-                            "icons_water": stat.icons_water,
-                            "icons_rock": stat.icons_rock,
-                            "icons_science": stat.icons_science,
-                        }
-                    )
+                    row.update(stat_values(stat))
                     break
 
             rows.append(row)
@@ -488,14 +556,17 @@ class TopLevelStatsCsvArchiveCreator(GameLogArchiveCreator):
             self.csv_writer.writerow(row)
 
     def upload_archive(self) -> None:
-        if self.archive_tarfile is None or self.archive_tempfile is None:
+        if (
+            self.archive_tarfile is None
+            or self.archive_tempfile is None
+            or self.csv_file is None
+        ):
             raise ValueError(
                 "Cannot call upload_archive before creating the archive tarfile."
             )
 
         self.csv_file.flush()
         self.archive_tarfile.add(self.csv_file.name, arcname=self.csv_filename)
-        os.fsync(self.archive_tempfile)
         super(TopLevelStatsCsvArchiveCreator, self).upload_archive()
         self.csv_file.close()
 
@@ -506,10 +577,11 @@ class EmuCupTopLevelStatsCsvArchiveCreator(TopLevelStatsCsvArchiveCreator):
         return GameLogArchiveType.EMU_CUP_TOP_LEVEL_STATS_CSV
 
     def game_logs(self) -> Iterable[GameLog]:
-        return (
-            db.select(GameLog)
+        return stream_game_logs(
+            select(GameLog)
+            .where(GameLog.id > self.after_game_log_id)
             .where(GameLog.bga_table_id.in_(EMU_CUP_GAME_TABLE_IDS))
-            .yield_per(10)
+            .order_by(GameLog.id)
         )
 
     def should_include_game_log(self, game_log: GameLog) -> bool:
@@ -522,13 +594,224 @@ class EmuCupTopLevelStatsCsvArchiveCreator(TopLevelStatsCsvArchiveCreator):
         if not super().should_create_archive():
             return False
 
-        last_archive: Optional[GameLogArchive] = db.session.execute(
-            db.select(GameLogArchive)
-            .filter(GameLogArchive.archive_type == self.archive_type)
-            .order_by(desc(GameLogArchive.last_game_log_id))
-            .first()
-        ).scalar_one_or_none()
-        if last_archive is None:
-            return True
+        # Only archive once new Emu Cup games have been submitted.
+        return bool(
+            db.session.scalar(
+                select(
+                    exists()
+                    .where(GameLog.id > self.after_game_log_id)
+                    .where(GameLog.bga_table_id.in_(EMU_CUP_GAME_TABLE_IDS))
+                )
+            )
+        )
+
+    def count_users_query(self) -> Select[tuple[int]]:
+        return (
+            super()
+            .count_users_query()
+            .where(GameLog.bga_table_id.in_(EMU_CUP_GAME_TABLE_IDS))
+        )
+
+
+def sqlite_type(python_type: type) -> str:
+    return "BOOLEAN" if python_type is bool else "INTEGER"
+
+
+# Each table in a stats database, as (name, column definitions, primary key).
+STATS_DATABASE_TABLES: tuple[tuple[str, list[str], list[str]], ...] = (
+    (
+        "game_logs",
+        ["bga_table_id INTEGER", "game_start INTEGER", "game_end INTEGER"],
+        ["bga_table_id"],
+    ),
+    (
+        "game_ratings",
+        [
+            "bga_table_id INTEGER",
+            "user_id INTEGER",
+            "prior_elo INTEGER",
+            "new_elo INTEGER",
+            "prior_arena_elo INTEGER",
+            "new_arena_elo INTEGER",
+        ],
+        ["bga_table_id", "user_id"],
+    ),
+    (
+        "game_statistics",
+        [
+            "bga_table_id INTEGER",
+            "user_id INTEGER",
+            "user_name TEXT",
+            *[f"{field.name} {sqlite_type(field.type)}" for field in STAT_FIELDS],
+        ],
+        ["bga_table_id", "user_id"],
+    ),
+    (
+        "card_plays",
+        [
+            "bga_table_id INTEGER",
+            "user_id INTEGER",
+            "card_id TEXT",
+            "card_name TEXT",
+            "move INTEGER",
+        ],
+        ["bga_table_id", "user_id", "card_id", "move"],
+    ),
+)
+
+
+class StatsDatabaseArchiveCreator(GameLogArchiveCreator):
+    """
+    Archives game statistics, ratings & card plays as typed tables in a SQLite database,
+    which can be queried directly (e.g. with sqlite3 or DuckDB) instead of re-parsing CSVs.
+    Rows are buffered & inserted in batches of `batch_size` game logs.
+    """
+
+    def __init__(self, *args, batch_size: int = 1000, **kwargs) -> None:
+        super(StatsDatabaseArchiveCreator, self).__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self.directory: Optional[str] = None
+        self.database_path: Optional[str] = None
+        self.database: Optional[sqlite3.Connection] = None
+        self.pending_rows: dict[str, list[tuple]] = {
+            table: [] for table, _, _ in STATS_DATABASE_TABLES
+        }
+        self.num_pending_game_logs = 0
+
+    @property
+    def archive_type(self) -> GameLogArchiveType:
+        return GameLogArchiveType.STATS_SQLITE
+
+    @property
+    def database_filename(self) -> str:
+        return self.filename.replace(".tar.gz", ".sqlite")
+
+    def create_archive_tempfile(self, directory: str) -> tarfile.TarFile:
+        archive_tarfile = super(
+            StatsDatabaseArchiveCreator, self
+        ).create_archive_tempfile(directory)
+        self.directory = directory
+        self.database_path = os.path.join(directory, self.database_filename)
+        self.database = sqlite3.connect(self.database_path)
+        for table, columns, primary_key in STATS_DATABASE_TABLES:
+            self.database.execute(
+                f"CREATE TABLE {table} ({', '.join(columns)}, PRIMARY KEY ({', '.join(primary_key)})) WITHOUT ROWID"
+            )
+        return archive_tarfile
+
+    def flush_rows(self) -> None:
+        if self.database is None:
+            raise ValueError(
+                "Cannot call flush_rows before creating the archive tarfile."
+            )
+
+        for table, rows in self.pending_rows.items():
+            if not rows:
+                continue
+
+            placeholders = ", ".join("?" * len(rows[0]))
+            # A game log may have been included in more than one archive in a chain.
+            self.database.executemany(
+                f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})", rows
+            )
+            rows.clear()
+
+        self.database.commit()
+        self.num_pending_game_logs = 0
+
+    def process_game_log(self, game_log: GameLog) -> None:
+        if self.database is None:
+            raise ValueError(
+                "Cannot call process_game_log before creating the archive tarfile."
+            )
+
+        super(StatsDatabaseArchiveCreator, self).process_game_log(game_log)
+        if not self.should_include_game_log(game_log):
+            return
+
+        table_id = game_log.bga_table_id
+        self.pending_rows["game_logs"].append(
+            (
+                table_id,
+                (
+                    int(game_log.game_start.timestamp())
+                    if game_log.game_start is not None
+                    else None
+                ),
+                int(game_log.game_end.timestamp()),
+            )
+        )
+        self.pending_rows["game_ratings"].extend(
+            (
+                table_id,
+                rating.user_id,
+                rating.prior_elo,
+                rating.new_elo,
+                rating.prior_arena_elo,
+                rating.new_arena_elo,
+            )
+            for rating in game_log.game_ratings
+        )
+        user_names = {user.bga_id: user.name for user in game_log.users}
+        self.pending_rows["game_statistics"].extend(
+            (
+                table_id,
+                stat.bga_user_id,
+                user_names.get(stat.bga_user_id),
+                *stat_values(stat).values(),
+            )
+            for stat in game_log.game_statistics
+        )
+        self.pending_rows["card_plays"].extend(
+            (table_id, play.user_id, play.card.bga_id, play.card.name, play.move)
+            for play in game_log.card_plays
+        )
+
+        self.num_pending_game_logs += 1
+        if self.num_pending_game_logs >= self.batch_size:
+            self.flush_rows()
+
+    def merge_archive_member(self, member: tarfile.TarInfo, content: IO[bytes]) -> None:
+        if not member.name.endswith(".sqlite"):
+            super(StatsDatabaseArchiveCreator, self).merge_archive_member(
+                member, content
+            )
+            return
+
+        if self.database is None or self.directory is None:
+            raise ValueError(
+                "Cannot call merge_archive_member before creating the archive tarfile."
+            )
+
+        # Each archive holds a single database, so copy the previous archive's rows into ours.
+        previous_path = os.path.join(self.directory, f"previous_{member.name}")
+        with open(previous_path, "wb") as previous_file:
+            shutil.copyfileobj(content, previous_file)
+
+        self.database.execute("ATTACH DATABASE ? AS previous", (previous_path,))
+        for table, _, _ in STATS_DATABASE_TABLES:
+            self.database.execute(
+                f"INSERT OR IGNORE INTO {table} SELECT * FROM previous.{table}"
+            )
+        self.database.commit()
+        self.database.execute("DETACH DATABASE previous")
+        os.remove(previous_path)
+
+    def upload_archive(self) -> None:
+        if (
+            self.archive_tarfile is None
+            or self.archive_tempfile is None
+            or self.database is None
+            or self.database_path is None
+        ):
+            raise ValueError(
+                "Cannot call upload_archive before creating the archive tarfile."
+            )
 
-        return bool(max(EMU_CUP_GAME_TABLE_IDS) > last_archive.last_game_log.id)
+        self.flush_rows()
+        self.database.execute("CREATE INDEX card_plays_card_id ON card_plays (card_id)")
+        self.database.commit()
+        self.database.close()
+        self.archive_tarfile.add(self.database_path, arcname=self.database_filename)
+        super(StatsDatabaseArchiveCreator, self).upload_archive()
+        os.remove(self.database_path)
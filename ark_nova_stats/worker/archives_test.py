@@ -0,0 +1,373 @@
+import csv
+import datetime
+import io
+import json
+import logging
+import sqlite3
+import sys
+import tarfile
+from typing import Optional
+
+import pytest
+
+from ark_nova_stats.bga_log_parser.stat_schema import STAT_NAMES
+from ark_nova_stats.models import (
+    Card,
+    CardPlay,
+    GameLog,
+    GameLogArchive,
+    GameLogArchiveType,
+    GameRating,
+    GameStatistics,
+    User,
+)
+from ark_nova_stats.worker.archives import (
+    BGAWithELOArchiveCreator,
+    GameLogArchiveCreator,
+    RawBGALogArchiveCreator,
+    StatsDatabaseArchiveCreator,
+    TopLevelStatsCsvArchiveCreator,
+    embed_raw_json,
+)
+
+
+def make_game_log(id: int = 1, bga_table_id: int = 123) -> GameLog:
+    game_log = GameLog(
+        id=id,
+        bga_table_id=bga_table_id,
+        log=json.dumps({"status": 1, "data": {"logs": [], "players": []}}),
+        game_end=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    game_log.users = [User(bga_id=1, name="some player"), User(bga_id=2, name="b")]
+    game_log.game_ratings = [
+        GameRating(
+            user_id=1,
+            prior_elo=100,
+            new_elo=110,
+            prior_arena_elo=None,
+            new_arena_elo=None,
+        )
+    ]
+    game_log.game_statistics = []
+    return game_log
+
+
+class TestEmbedRawJSON:
+    def test_matches_reencoding(self):
+        raw = json.dumps({"a": [1, 2, {"b": None}]})
+        payload = {"elos": {1: {"prior_elo": 100}}}
+
+        assert json.loads(
+            json.dumps({**payload, "log": json.loads(raw)})
+        ) == json.loads(embed_raw_json(payload, "log", raw))
+
+    def test_handles_empty_payload(self):
+        assert {"log": [1]} == json.loads(embed_raw_json({}, "log", "[1]"))
+
+
+class FakeTigrisClient:
+    """
+    Keeps uploaded objects in memory, keyed by their object keys.
+    """
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+
+    def upload_file(self, path: str, bucket: Optional[str], key: str) -> None:
+        self.objects[key] = open(path, "rb").read()
+
+    def download_file(self, bucket: Optional[str], key: str, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.objects[key])
+
+    def put_object(
+        self, Bucket: Optional[str], Key: str, Body: bytes, **kwargs
+    ) -> None:
+        self.objects[Key] = Body
+
+
+def make_creator(
+    creator_type: type[GameLogArchiveCreator],
+    latest_archive: Optional[GameLogArchive] = None,
+    tigris_client: Optional[FakeTigrisClient] = None,
+    max_deltas: int = 6,
+) -> GameLogArchiveCreator:
+    creator = creator_type(
+        logger=logging.getLogger(__name__),
+        tigris_client=tigris_client,
+        min_interval=datetime.timedelta(days=1),
+        max_deltas=max_deltas,
+    )
+    # Stand in for the database lookup of the previous archive.
+    creator.latest_archive = latest_archive
+    return creator
+
+
+def write_archive(
+    creator: GameLogArchiveCreator,
+    game_logs: list[GameLog],
+    id: int,
+) -> GameLogArchive:
+    """
+    Writes & "uploads" an archive of the given game logs, without recording it in the database.
+    """
+    assert creator.archive_tarfile is not None
+    for game_log in game_logs:
+        creator.process_game_log(game_log)
+    creator.upload_archive()
+
+    return GameLogArchive(
+        id=id,
+        archive_type=creator.archive_type.value,
+        url=f"https://host/{creator.archive_type.name}/{creator.filename}",
+        size_bytes=0,
+        num_game_logs=creator.num_logs,
+        num_users=len(creator.users),
+        last_game_log_id=creator.last_game_log_id,
+        created_at=datetime.datetime(2024, 1, id, tzinfo=datetime.timezone.utc),
+    )
+
+
+class TestArchiveCreators:
+    @pytest.mark.parametrize(
+        "creator_type", [RawBGALogArchiveCreator, BGAWithELOArchiveCreator]
+    )
+    def test_writes_game_log_members(self, creator_type, tmp_path):
+        creator = make_creator(creator_type)
+        creator.create_archive_tempfile(str(tmp_path))
+        game_log = make_game_log()
+        creator.process_game_log(game_log)
+        assert creator.archive_tarfile is not None
+        creator.archive_tarfile.close()
+
+        assert creator.archive_tempfile is not None
+        with tarfile.open(creator.archive_tempfile.name, "r:gz") as archive:
+            [member] = archive.getmembers()
+            assert "123_some_player_b.json" == member.name
+            extracted = archive.extractfile(member)
+            assert extracted is not None
+            content = json.loads(extracted.read())
+
+        if creator_type is RawBGALogArchiveCreator:
+            assert json.loads(game_log.log) == content
+        else:
+            assert json.loads(game_log.log) == content["log"]
+            assert {
+                "1": {
+                    "prior_elo": 100,
+                    "new_elo": 110,
+                    "prior_arena_elo": None,
+                    "new_arena_elo": None,
+                }
+            } == content["elos"]
+
+
+class TestDeltaArchives:
+    def test_delta_only_includes_newer_game_logs(self, tmp_path):
+        full_archive = GameLogArchive(
+            id=1,
+            archive_type=GameLogArchiveType.RAW_BGA_JSONL.value,
+            url="https://host/RAW_BGA_JSONL/RAW_BGA_JSONL_2024_01_01.tar.gz",
+            last_game_log_id=1,
+        )
+        creator = make_creator(RawBGALogArchiveCreator, latest_archive=full_archive)
+        assert creator.is_delta
+        assert creator.filename.endswith("_delta.tar.gz")
+
+        creator.create_archive_tempfile(str(tmp_path))
+        creator.process_game_log(make_game_log(id=1, bga_table_id=123))
+        creator.process_game_log(make_game_log(id=2, bga_table_id=456))
+        assert creator.archive_tarfile is not None
+        creator.archive_tarfile.close()
+
+        assert 1 == creator.num_logs
+        assert 2 == creator.last_game_log_id
+        assert creator.archive_tempfile is not None
+        with tarfile.open(creator.archive_tempfile.name, "r:gz") as archive:
+            assert ["456_some_player_b.json"] == archive.getnames()
+
+    def test_compacts_chain_into_full_archive(self, tmp_path):
+        tigris_client = FakeTigrisClient()
+        first = make_creator(RawBGALogArchiveCreator, tigris_client=tigris_client)
+        first.create_archive_tempfile(str(tmp_path))
+        full_archive = write_archive(
+            first, [make_game_log(id=1, bga_table_id=123)], id=1
+        )
+
+        delta = make_creator(
+            RawBGALogArchiveCreator,
+            latest_archive=full_archive,
+            tigris_client=tigris_client,
+        )
+        delta.create_archive_tempfile(str(tmp_path))
+        delta_archive = write_archive(
+            delta, [make_game_log(id=2, bga_table_id=456)], id=2
+        )
+        delta_archive.base_archive = full_archive
+
+        compacted = make_creator(
+            RawBGALogArchiveCreator,
+            latest_archive=delta_archive,
+            tigris_client=tigris_client,
+            max_deltas=1,
+        )
+        assert not compacted.is_delta
+        assert 2 == compacted.after_game_log_id
+        compacted.create_archive_tempfile(str(tmp_path))
+        compacted.merge_previous_archives(str(tmp_path))
+        for game_log in [
+            make_game_log(id=2, bga_table_id=456),
+            make_game_log(id=3, bga_table_id=789),
+        ]:
+            compacted.process_game_log(game_log)
+        assert compacted.archive_tarfile is not None
+        compacted.archive_tarfile.close()
+
+        assert 3 == compacted.num_logs
+        assert 3 == compacted.last_game_log_id
+        assert compacted.archive_tempfile is not None
+        with tarfile.open(compacted.archive_tempfile.name, "r:gz") as archive:
+            assert [
+                "123_some_player_b.json",
+                "456_some_player_b.json",
+                "789_some_player_b.json",
+            ] == archive.getnames()
+
+    def test_compaction_appends_csv_rows(self, tmp_path):
+        tigris_client = FakeTigrisClient()
+        first = make_creator(
+            TopLevelStatsCsvArchiveCreator, tigris_client=tigris_client
+        )
+        first.create_archive_tempfile(str(tmp_path))
+        full_archive = write_archive(
+            first, [make_game_log(id=1, bga_table_id=123)], id=1
+        )
+
+        compacted = make_creator(
+            TopLevelStatsCsvArchiveCreator,
+            latest_archive=full_archive,
+            tigris_client=tigris_client,
+            max_deltas=0,
+        )
+        compacted.create_archive_tempfile(str(tmp_path))
+        compacted.merge_previous_archives(str(tmp_path))
+        compacted.process_game_log(make_game_log(id=2, bga_table_id=456))
+        compacted.upload_archive()
+
+        archive_bytes = tigris_client.objects[
+            "TOP_LEVEL_STATS_CSV/" + compacted.filename
+        ]
+        with tarfile.open(fileobj=io.BytesIO(archive_bytes), mode="r:gz") as archive:
+            [member] = archive.getmembers()
+            extracted = archive.extractfile(member)
+            assert extracted is not None
+            rows = list(csv.DictReader(io.TextIOWrapper(extracted, encoding="utf-8")))
+
+        assert ["123", "123", "456", "456"] == [row["bga_table_id"] for row in rows]
+        assert "110" == rows[0]["new_elo"]
+
+    def test_manifest_lists_chain(self):
+        created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        full_archive = GameLogArchive(
+            id=1,
+            url="https://host/RAW_BGA_JSONL/full.tar.gz",
+            size_bytes=10,
+            num_game_logs=2,
+            last_game_log_id=2,
+            created_at=created_at,
+        )
+        delta_archive = GameLogArchive(
+            id=2,
+            url="https://host/RAW_BGA_JSONL/delta.tar.gz",
+            size_bytes=5,
+            num_game_logs=1,
+            last_game_log_id=3,
+            created_at=created_at,
+        )
+        full_archive.delta_archives = [delta_archive]
+
+        manifest = make_creator(RawBGALogArchiveCreator).manifest(delta_archive)
+        assert "RAW_BGA_JSONL" == manifest["archive_type"]
+        assert "https://host/RAW_BGA_JSONL/full.tar.gz" == manifest["full"]["url"]
+        assert [3] == [delta["last_game_log_id"] for delta in manifest["deltas"]]
+
+
+def read_stats_database(
+    tigris_client: FakeTigrisClient, creator: GameLogArchiveCreator, tmp_path
+) -> sqlite3.Connection:
+    archive_bytes = tigris_client.objects["STATS_SQLITE/" + creator.filename]
+    with tarfile.open(fileobj=io.BytesIO(archive_bytes), mode="r:gz") as archive:
+        [member] = archive.getmembers()
+        extracted = archive.extractfile(member)
+        assert extracted is not None
+        path = tmp_path / "extracted.sqlite"
+        path.write_bytes(extracted.read())
+
+    return sqlite3.connect(path)
+
+
+class TestStatsDatabaseArchiveCreator:
+    def test_writes_typed_tables(self, tmp_path):
+        tigris_client = FakeTigrisClient()
+        creator = make_creator(StatsDatabaseArchiveCreator, tigris_client=tigris_client)
+        creator.create_archive_tempfile(str(tmp_path))
+        game_log = make_game_log()
+        game_log.game_statistics = [
+            GameStatistics(
+                bga_table_id=123,
+                bga_user_id=1,
+                **{name: i for i, name in enumerate(STAT_NAMES)},
+            )
+        ]
+        game_log.card_plays = [
+            CardPlay(user_id=2, move=7, card=Card(bga_id="A401_Lion", name="Lion"))
+        ]
+        creator.process_game_log(game_log)
+        creator.upload_archive()
+
+        database = read_stats_database(tigris_client, creator, tmp_path)
+        assert [(123, None, 1704067200)] == database.execute(
+            "SELECT * FROM game_logs"
+        ).fetchall()
+        assert [(123, 1, 100, 110, None, None)] == database.execute(
+            "SELECT * FROM game_ratings"
+        ).fetchall()
+        [statistics] = database.execute(
+            "SELECT user_name, score, icons_science FROM game_statistics"
+        ).fetchall()
+        assert ("some player", 0, len(STAT_NAMES) - 1) == statistics
+        assert [(123, 2, "A401_Lion", "Lion", 7)] == database.execute(
+            "SELECT * FROM card_plays"
+        ).fetchall()
+
+    def test_compaction_copies_rows(self, tmp_path):
+        tigris_client = FakeTigrisClient()
+        first = make_creator(StatsDatabaseArchiveCreator, tigris_client=tigris_client)
+        first.create_archive_tempfile(str(tmp_path))
+        full_archive = write_archive(
+            first, [make_game_log(id=1, bga_table_id=123)], id=1
+        )
+
+        compacted = make_creator(
+            StatsDatabaseArchiveCreator,
+            latest_archive=full_archive,
+            tigris_client=tigris_client,
+            max_deltas=0,
+        )
+        compacted.create_archive_tempfile(str(tmp_path))
+        compacted.merge_previous_archives(str(tmp_path))
+        for game_log in [
+            make_game_log(id=1, bga_table_id=123),
+            make_game_log(id=2, bga_table_id=456),
+        ]:
+            compacted.process_game_log(game_log)
+        compacted.upload_archive()
+
+        database = read_stats_database(tigris_client, compacted, tmp_path)
+        assert [(123,), (456,)] == database.execute(
+            "SELECT bga_table_id FROM game_ratings ORDER BY bga_table_id"
+        ).fetchall()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -0,0 +1,258 @@
+import logging
+import multiprocessing
+from typing import Optional, Sequence, Type
+
+from sqlalchemy import Select, exists, insert, select
+
+from ark_nova_stats.bga_log_parser.exceptions import BGALogParserError
+from ark_nova_stats.bga_log_parser.game_log import GameLog as BGAGameLog
+from ark_nova_stats.bga_log_parser.streaming import StreamingGameLog
+from ark_nova_stats.config import app, db
+from ark_nova_stats.ingestion import card_play_values, upsert_cards
+from ark_nova_stats.log_storage import compress_log
+from ark_nova_stats.models import (
+    BackfillCursor,
+    CardPlay,
+    GameLog,
+    GameStatistics,
+    game_statistics_values,
+)
+from ark_nova_stats.parsed_log_cache import parsed_log_cache
+from ark_nova_stats.rollups import update_card_play_counts
+
+
+class GameLogBackfill:
+    """
+    Processes the game logs matched by `game_logs_query` in batches, in order of ID.
+    After each batch is committed, the ID of its last game log is recorded in a cursor,
+    so that an interrupted backfill resumes where it left off.
+    Game logs can also be split into shards by ID, to be backfilled by separate processes.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        batch_size: int = 100,
+        shard: int = 0,
+        num_shards: int = 1,
+    ):
+        self.logger = logger
+        self.batch_size = batch_size
+        self.shard = shard
+        self.num_shards = num_shards
+
+    @property
+    def name(self) -> str:
+        raise NotImplementedError
+
+    def game_logs_query(self) -> Select[tuple[GameLog]]:
+        return select(GameLog)
+
+    def process_batch(self, game_logs: Sequence[GameLog]) -> None:
+        raise NotImplementedError
+
+    def parse_game_logs(self, game_logs: Sequence[GameLog]) -> dict[int, BGAGameLog]:
+        """
+        Parses each of the given game logs, keyed by game log ID.
+        Logs that can't be parsed are skipped, rather than halting the backfill.
+        """
+        parsed_logs = {}
+        for game_log in game_logs:
+            try:
+                parsed_logs[game_log.id] = parsed_log_cache.parse(game_log.log)
+            except BGALogParserError as e:
+                self.logger.warning(
+                    f"Skipping game log ID {game_log.id}, which couldn't be parsed: {e!r}"
+                )
+
+        return parsed_logs
+
+    def cursor(self) -> BackfillCursor:
+        cursor = db.session.scalars(
+            select(BackfillCursor)
+            .where(BackfillCursor.name == self.name)
+            .where(BackfillCursor.shard == self.shard)
+            .where(BackfillCursor.num_shards == self.num_shards)
+        ).one_or_none()
+        if cursor is None:
+            cursor = BackfillCursor(
+                name=self.name,
+                shard=self.shard,
+                num_shards=self.num_shards,
+                last_game_log_id=0,
+            )
+            db.session.add(cursor)
+
+        return cursor
+
+    def next_batch(self, after_game_log_id: int) -> Sequence[GameLog]:
+        query = self.game_logs_query().where(GameLog.id > after_game_log_id)
+        if self.num_shards > 1:
+            query = query.where(GameLog.id % self.num_shards == self.shard)
+
+        return db.session.scalars(
+            query.order_by(GameLog.id).limit(self.batch_size)
+        ).all()
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """
+        Backfills batches until there are no more game logs to process (or max_batches is reached).
+        Returns the number of game logs processed.
+        """
+        cursor = self.cursor()
+        processed = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            game_logs = self.next_batch(cursor.last_game_log_id)
+            if not game_logs:
+                break
+
+            self.process_batch(game_logs)
+            cursor.last_game_log_id = game_logs[-1].id
+            db.session.commit()
+
+            processed += len(game_logs)
+            batches += 1
+            self.logger.info(
+                f"[{self.name} {self.shard + 1}/{self.num_shards}] Processed {processed} game logs, up to ID {cursor.last_game_log_id}."
+            )
+
+        stats = parsed_log_cache.stats
+        self.logger.info(
+            f"[{self.name} {self.shard + 1}/{self.num_shards}] Parsed log cache: {stats.memory_hits} memory hits, {stats.disk_hits} disk hits, {stats.misses} misses ({stats.hit_rate:.0%} hit rate)."
+        )
+
+        return processed
+
+
+class CardPlayBackfill(GameLogBackfill):
+    @property
+    def name(self) -> str:
+        return "card_plays"
+
+    def process_batch(self, game_logs: Sequence[GameLog]) -> None:
+        parsed_logs = self.parse_game_logs(game_logs)
+        card_ids = upsert_cards(parsed_logs.values())
+
+        existing_plays = set(
+            db.session.execute(
+                select(
+                    CardPlay.game_log_id,
+                    CardPlay.card_id,
+                    CardPlay.user_id,
+                    CardPlay.move,
+                ).where(CardPlay.game_log_id.in_(parsed_logs))
+            ).tuples()
+        )
+        new_plays = [
+            play
+            for game_log_id, parsed_log in parsed_logs.items()
+            for play in card_play_values(parsed_log, game_log_id, card_ids)
+            if (play["game_log_id"], play["card_id"], play["user_id"], play["move"])
+            not in existing_plays
+        ]
+        if new_plays:
+            db.session.execute(insert(CardPlay), new_plays)
+            update_card_play_counts(
+                new_plays, {game_log.id: game_log.game_end for game_log in game_logs}
+            )
+
+
+class GameLogStartEndBackfill(GameLogBackfill):
+    @property
+    def name(self) -> str:
+        return "game_log_start_end"
+
+    def game_logs_query(self) -> Select[tuple[GameLog]]:
+        return select(GameLog).where(GameLog.game_start == None)
+
+    def process_batch(self, game_logs: Sequence[GameLog]) -> None:
+        for game_log in game_logs:
+            # Only the first & last events are needed, so avoid building the whole log.
+            try:
+                parsed_log = StreamingGameLog(game_log.log)
+            except BGALogParserError as e:
+                self.logger.warning(
+                    f"Skipping game log ID {game_log.id}, which couldn't be parsed: {e!r}"
+                )
+                continue
+            game_log.game_start = parsed_log.game_start
+            game_log.game_end = parsed_log.game_end
+
+
+class GameStatisticsBackfill(GameLogBackfill):
+    @property
+    def name(self) -> str:
+        return "game_statistics"
+
+    def game_logs_query(self) -> Select[tuple[GameLog]]:
+        return select(GameLog).where(
+            ~exists().where(GameStatistics.bga_table_id == GameLog.bga_table_id)
+        )
+
+    def process_batch(self, game_logs: Sequence[GameLog]) -> None:
+        statistics = [
+            values
+            for parsed_log in self.parse_game_logs(game_logs).values()
+            for values in game_statistics_values(parsed_log)
+        ]
+        if statistics:
+            db.session.execute(insert(GameStatistics), statistics)
+
+
+class GameLogCompressionBackfill(GameLogBackfill):
+    @property
+    def name(self) -> str:
+        return "game_log_compression"
+
+    def game_logs_query(self) -> Select[tuple[GameLog]]:
+        return select(GameLog).where(GameLog.compressed_log == None)
+
+    def process_batch(self, game_logs: Sequence[GameLog]) -> None:
+        for game_log in game_logs:
+            game_log.compressed_log = compress_log(game_log.uncompressed_log or "")
+            game_log.uncompressed_log = None
+
+
+def run_backfill_shard(
+    backfill_type: Type[GameLogBackfill],
+    shard: int,
+    num_shards: int,
+    batch_size: int,
+    max_batches: Optional[int],
+) -> int:
+    with app.app_context():
+        # Database connections inherited from the parent process can't be shared.
+        db.engine.dispose(close=False)
+        return backfill_type(
+            logging.getLogger(__name__),
+            batch_size=batch_size,
+            shard=shard,
+            num_shards=num_shards,
+        ).run(max_batches=max_batches)
+
+
+def run_backfill(
+    backfill_type: Type[GameLogBackfill],
+    logger: logging.Logger,
+    batch_size: int = 100,
+    num_shards: int = 1,
+    max_batches: Optional[int] = None,
+) -> int:
+    """
+    Runs a backfill to completion, fanning its shards out across processes if num_shards > 1.
+    Returns the number of game logs processed.
+    """
+    if num_shards <= 1:
+        return backfill_type(logger, batch_size=batch_size).run(max_batches=max_batches)
+
+    with multiprocessing.Pool(processes=num_shards) as pool:
+        return sum(
+            pool.starmap(
+                run_backfill_shard,
+                [
+                    (backfill_type, shard, num_shards, batch_size, max_batches)
+                    for shard in range(num_shards)
+                ],
+            )
+        )
@@ -15,7 +15,7 @@ class ProtoComment(ProtoNode):
         self.value = value
 
     def __eq__(self, other) -> bool:
-        return str(self) == str(other)
+        return type(self) == type(other) and self.value == other.value
 
     def __str__(self) -> str:
         return f"<ProtoComment value={self.value}>"
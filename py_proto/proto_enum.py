@@ -12,6 +12,7 @@ from py_proto.proto_node import (
     ProtoContainerNode,
     ProtoNode,
     ProtoNodeDiff,
+    diff_keyed_sets,
 )
 from py_proto.proto_option import ParsedProtoOptionNode, ProtoOption
 from py_proto.proto_reserved import ProtoReserved
@@ -90,7 +91,7 @@ class ProtoEnumValue(ProtoNode):
         return ProtoEnumValue(
             self.identifier,
             self.value,
-            sorted(self.options, key=lambda o: str(o.name)),
+            sorted(self.options, key=lambda o: o.sort_key()),
             parent=self.parent,
         )
 
@@ -100,15 +101,13 @@ class ProtoEnumValue(ProtoNode):
     ) -> Optional["ParsedProtoEnumValueNode"]:
         match = ProtoIdentifier.match(proto_source=proto_source)
         if match is None:
-            raise ValueError(f"Proto has invalid enum value name: {proto_source}")
+            raise ValueError(f"Proto has invalid enum value name")
 
         enum_value_name = match.node
         proto_source = match.remaining_source.strip()
 
         if not proto_source.startswith("="):
-            raise ValueError(
-                f"Proto has invalid enum value syntax, expecting =: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid enum value syntax, expecting =")
 
         proto_source = proto_source[1:].strip()
 
@@ -119,9 +118,7 @@ class ProtoEnumValue(ProtoNode):
         else:
             int_match = ProtoInt.match(proto_source=proto_source)
         if int_match is None:
-            raise ValueError(
-                f"Proto has invalid enum value, expecting int: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid enum value, expecting int")
 
         int_match.node.sign = sign
         enum_value = int_match.node
@@ -133,16 +130,14 @@ class ProtoEnumValue(ProtoNode):
             end_bracket = proto_source.find("]")
             if end_bracket == -1:
                 raise ValueError(
-                    f"Proto has invalid enum value option syntax, cannot find ]: {proto_source}"
+                    f"Proto has invalid enum value option syntax, cannot find ]"
                 )
             for option_part in proto_source[:end_bracket].strip().split(","):
                 proto_enum_value_option_match = ProtoEnumValueOption.match(
                     proto_source=option_part.strip(), parent=None
                 )
                 if proto_enum_value_option_match is None:
-                    raise ValueError(
-                        f"Proto has invalid enum value option syntax: {proto_source}"
-                    )
+                    raise ValueError(f"Proto has invalid enum value option syntax")
                 options.append(proto_enum_value_option_match.node)
             proto_source = proto_source[end_bracket + 1 :].strip()
 
@@ -179,13 +174,9 @@ class ProtoEnumValue(ProtoNode):
                 diffs.append(ProtoEnumValueAdded(enum, after))
             elif before is not None:
                 diffs.append(ProtoEnumValueRemoved(enum, before))
-        else:
+        elif before.structural_hash != after.structural_hash:
             if before.identifier != after.identifier:
                 diffs.append(ProtoEnumValueNameChanged(enum, before, after.identifier))
-            else:
-                raise ValueError(
-                    f"Don't know how to handle diff between enums whose names aren't identical: {before}, {after}"
-                )
 
             diffs.extend(
                 ProtoEnumValueOption.diff_sets(before, before.options, after.options)
@@ -268,15 +259,13 @@ class ProtoEnum(ProtoContainerNode):
         proto_source = proto_source[5:]
         match = ProtoIdentifier.match(proto_source=proto_source)
         if match is None:
-            raise ValueError(f"Proto has invalid enum name: {proto_source}")
+            raise ValueError(f"Proto has invalid enum name")
 
         enum_name = match.node
         proto_source = match.remaining_source.strip()
 
         if not proto_source.startswith("{"):
-            raise ValueError(
-                f"Proto has invalid syntax, expecting opening curly brace: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid syntax, expecting opening curly brace")
 
         return ParsedProtoIdentifierNode(enum_name, proto_source[1:].strip())
 
@@ -307,23 +296,28 @@ class ProtoEnum(ProtoContainerNode):
         )
         return "\n".join(serialize_parts)
 
+    @property
+    def reserveds(self) -> list[ProtoReserved]:
+        return [node for node in self.nodes if isinstance(node, ProtoReserved)]
+
     @staticmethod
     def diff(
-        parent: ProtoNode, before: "ProtoEnum", after: "ProtoEnum"
+        parent: ProtoNode, before: Optional["ProtoEnum"], after: Optional["ProtoEnum"]
     ) -> list["ProtoNodeDiff"]:
         if before is None and after is not None:
             return [ProtoEnumAdded(parent, after)]
         elif before is not None and after is None:
             return [ProtoEnumRemoved(parent, before)]
-        elif before is None and after is None:
+        elif before is None or after is None:
             return []
         elif before.name != after.name:
             return []
-        elif before == after:
+        elif before.structural_hash == after.structural_hash:
             return []
         diffs: list[ProtoNodeDiff] = []
         # TODO: scope these diffs under ProtoEnum
         diffs.extend(ProtoOption.diff_sets(parent, before.options, after.options))
+        diffs.extend(ProtoReserved.diff_sets(before, before.reserveds, after.reserveds))
         diffs.extend(ProtoEnumValue.diff_sets(before, before.values, after.values))
         return diffs
 
@@ -331,27 +325,14 @@ class ProtoEnum(ProtoContainerNode):
     def diff_sets(
         parent: ProtoNode, before: list["ProtoEnum"], after: list["ProtoEnum"]
     ) -> list["ProtoNodeDiff"]:
-        diffs: list[ProtoNodeDiff] = []
-        before_names = set(o.name.identifier for o in before)
-        after_names = set(o.name.identifier for o in after)
-        for name in before_names - after_names:
-            diffs.append(
-                ProtoEnumRemoved(
-                    parent, next(i for i in before if i.name.identifier == name)
-                )
-            )
-        for name in after_names - before_names:
-            diffs.append(
-                ProtoEnumAdded(
-                    parent, next(i for i in after if i.name.identifier == name)
-                )
-            )
-        for name in before_names & after_names:
-            before_enum = next(i for i in before if i.name.identifier == name)
-            after_enum = next(i for i in after if i.name.identifier == name)
-            diffs.extend(ProtoEnum.diff(parent, before_enum, after_enum))
-
-        return diffs
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda enum: enum.name.identifier,
+            lambda before_enum, after_enum: ProtoEnum.diff(
+                parent, before_enum, after_enum
+            ),
+        )
 
 
 class ProtoEnumDiff(ProtoNodeDiff):
@@ -63,14 +63,14 @@ class ProtoExtend(ProtoContainerNode):
         proto_source = proto_source[7:]
         match = ProtoEnumOrMessageIdentifier.match(proto_source)
         if match is None:
-            raise ValueError(f"Proto extend has invalid message name: {proto_source}")
+            raise ValueError(f"Proto extend has invalid message name")
 
         name = match.node
         proto_source = match.remaining_source.strip()
 
         if not proto_source.startswith("{"):
             raise ValueError(
-                f"Proto extend has invalid syntax, expecting opening curly brace: {proto_source}"
+                f"Proto extend has invalid syntax, expecting opening curly brace"
             )
 
         return ParsedProtoEnumOrMessageIdentifierNode(name, proto_source[1:].strip())
@@ -14,10 +14,12 @@ from py_proto.proto_node import (
     ProtoContainerNode,
     ProtoNode,
     ProtoNodeDiff,
+    error_reason,
 )
 from py_proto.proto_option import ProtoOption
 from py_proto.proto_package import ProtoPackage
 from py_proto.proto_service import ProtoService
+from py_proto.proto_source import ProtoParseError, ProtoSource
 from py_proto.proto_syntax import ProtoSyntax
 
 
@@ -55,13 +57,26 @@ class ParsedProtoFileHeaderNode(ParsedProtoNode):
 
 
 class ProtoFile(ProtoContainerNode):
-    def __init__(self, syntax: ProtoSyntax, *args, **kwargs):
+    def __init__(
+        self,
+        syntax: ProtoSyntax,
+        *args,
+        parsed_source: Optional[ProtoSource] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.syntax = syntax
+        self.syntax.parent = self
+        # The source that this file's nodes' spans point into.
+        self.parsed_source = parsed_source
 
         if len([node for node in self.nodes if isinstance(node, ProtoPackage)]) > 1:
             raise ValueError(f"Proto can't have more than one package statement")
 
+    @property
+    def source(self) -> Optional[ProtoSource]:
+        return self.parsed_source
+
     @property
     def imports(self) -> list[ProtoImport]:
         return [node for node in self.nodes if isinstance(node, ProtoImport)]
@@ -85,6 +100,10 @@ class ProtoFile(ProtoContainerNode):
     def messages(self) -> list[ProtoMessage]:
         return [node for node in self.nodes if isinstance(node, ProtoMessage)]
 
+    @property
+    def services(self) -> list[ProtoService]:
+        return [node for node in self.nodes if isinstance(node, ProtoService)]
+
     @classmethod
     def match_header(
         cls,
@@ -148,8 +167,11 @@ class ProtoFile(ProtoContainerNode):
             for node_type in [ProtoSingleLineComment, ProtoMultiLineComment]:
                 try:
                     match_result = node_type.match(proto_content)
-                except (ValueError, IndexError, TypeError):
-                    raise ValueError(f"Could not parse proto content:\n{proto_content}")
+                except (ValueError, IndexError, TypeError) as e:
+                    raise ProtoParseError(
+                        f"Could not parse comment: {error_reason(e)}",
+                        remaining_length=len(proto_content),
+                    ) from e
                 if match_result is not None:
                     parsed_tree.append(match_result.node)
                     proto_content = match_result.remaining_source.strip()
@@ -160,10 +182,15 @@ class ProtoFile(ProtoContainerNode):
         # Next, parse syntax.
         try:
             syntax_match = ProtoSyntax.match(proto_content.strip())
-        except (ValueError, IndexError, TypeError):
-            raise ValueError(f"Proto doesn't have parseable syntax:\n{proto_content}")
+        except (ValueError, IndexError, TypeError) as e:
+            raise ProtoParseError(
+                f"Could not parse syntax: {error_reason(e)}",
+                remaining_length=len(proto_content),
+            ) from e
         if syntax_match is None:
-            raise ValueError(f"Proto doesn't have parseable syntax:\n{proto_content}")
+            raise ProtoParseError(
+                "Expected syntax statement", remaining_length=len(proto_content)
+            )
         syntax = syntax_match.node
         proto_content = syntax_match.remaining_source.strip()
 
@@ -195,5 +222,6 @@ class ProtoFile(ProtoContainerNode):
         diffs.extend(ProtoPackage.diff(self.package, other.package))
         diffs.extend(ProtoEnum.diff_sets(self, self.enums, other.enums))
         diffs.extend(ProtoMessage.diff_sets(self, self.messages, other.messages))
+        diffs.extend(ProtoService.diff_sets(self, self.services, other.services))
 
         return [d for d in diffs if d is not None]
@@ -50,9 +50,7 @@ class ProtoFloat(ProtoNode):
         if proto_source.startswith("inf"):
             proto_source = proto_source[3:]
             if proto_source and proto_source[0] in ProtoIdentifier.ALL:
-                raise ValueError(
-                    f"Proto has invalid float, invalid post-inf character: {proto_source}"
-                )
+                raise ValueError(f"Proto has invalid float, invalid post-inf character")
             return ParsedProtoFloatNode(
                 ProtoFloat(
                     value=float("inf"), sign=ProtoFloatSign.POSITIVE, parent=parent
@@ -63,9 +61,7 @@ class ProtoFloat(ProtoNode):
         if proto_source.startswith("nan"):
             proto_source = proto_source[3:]
             if proto_source and proto_source[0] in ProtoIdentifier.ALL:
-                raise ValueError(
-                    f"Proto has invalid float, invalid post-nan character: {proto_source}"
-                )
+                raise ValueError(f"Proto has invalid float, invalid post-nan character")
             return ParsedProtoFloatNode(
                 ProtoFloat(
                     value=float("nan"), sign=ProtoFloatSign.POSITIVE, parent=parent
@@ -84,9 +80,7 @@ class ProtoFloat(ProtoNode):
                 break
             if c == ".":
                 if decimal_started:
-                    raise ValueError(
-                        f"Proto has invalid float, duplicate decimal: {proto_source}"
-                    )
+                    raise ValueError(f"Proto has invalid float, duplicate decimal")
                 decimal_started = True
             elif decimal_started:
                 precision += 1
@@ -108,13 +102,11 @@ class ProtoFloat(ProtoNode):
 
             for i, c in enumerate(proto_source):
                 if c in ProtoFloat.SIGNS:
-                    raise ValueError(
-                        f"Proto has invalid float, unexpected sign: {proto_source}"
-                    )
+                    raise ValueError(f"Proto has invalid float, unexpected sign")
                 if c not in ProtoFloat.DIGITS:
                     if c in ProtoIdentifier.ALL:
                         raise ValueError(
-                            f"Proto has invalid float, non-digit character: {proto_source}"
+                            f"Proto has invalid float, non-digit character"
                         )
                     i -= 1
                     break
@@ -1,3 +1,4 @@
+import sys
 from typing import Optional
 
 from py_proto.proto_node import ParsedProtoNode, ProtoNode
@@ -25,7 +26,8 @@ class ProtoIdentifier(ProtoNode):
 
     def __init__(self, identifier: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.identifier = identifier
+        # Schemas repeat the same names & type names many times, so share one copy of each.
+        self.identifier = sys.intern(identifier)
 
     def __eq__(self, other) -> bool:
         return self.identifier == other.identifier
@@ -37,7 +39,7 @@ class ProtoIdentifier(ProtoNode):
         return str(self)
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self.identifier)
 
     def normalize(self) -> "ProtoIdentifier":
         return self
@@ -81,7 +83,7 @@ class ProtoFullIdentifier(ProtoIdentifier):
                 if i == last_part_start:
                     # We have an invalid character after a period.
                     raise ValueError(
-                        f"Proto source has invalid identifier, expecting alphanumeric after .: {proto_source}"
+                        f"Proto source has invalid identifier, expecting alphanumeric after ."
                     )
                 identifier_parts.append(proto_source[last_part_start:i])
                 return ParsedProtoFullIdentifierNode(
@@ -97,7 +99,7 @@ class ProtoFullIdentifier(ProtoIdentifier):
         # we got to the end while resolving this identifier.
         if last_part_start >= len(proto_source):
             raise ValueError(
-                f"Proto source has invalid identifier, expecting alphanumeric after .: {proto_source}"
+                f"Proto source has invalid identifier, expecting alphanumeric after ."
             )
         identifier_parts.append(proto_source[last_part_start:])
         return ParsedProtoFullIdentifierNode(
@@ -1,6 +1,11 @@
 from typing import Any, Iterator, Optional
 
-from py_proto.proto_node import ParsedProtoNode, ProtoNode, ProtoNodeDiff
+from py_proto.proto_node import (
+    ParsedProtoNode,
+    ProtoNode,
+    ProtoNodeDiff,
+    diff_keyed_sets,
+)
 from py_proto.proto_string_literal import ProtoStringLiteral
 
 
@@ -60,18 +65,16 @@ class ProtoImport(ProtoNode):
         public = False
         if proto_source.startswith("public "):
             if weak:
-                raise ValueError(f"Proto has invalid import syntax: {proto_source}")
+                raise ValueError(f"Proto has invalid import syntax")
             public = True
             proto_source = proto_source[7:]
 
         match = ProtoStringLiteral.match(proto_source)
         if match is None:
-            raise ValueError(f"Proto has invalid import syntax: {proto_source}")
+            raise ValueError(f"Proto has invalid import syntax")
 
         if not match.remaining_source.startswith(";"):
-            raise ValueError(
-                f"Proto has invalid import syntax: {match.remaining_source}"
-            )
+            raise ValueError(f"Proto has invalid import syntax")
 
         return ParsedProtoNode(
             ProtoImport(path=match.node, weak=weak, public=public, parent=parent),
@@ -88,30 +91,33 @@ class ProtoImport(ProtoNode):
         return " ".join(parts)
 
     @staticmethod
-    def diff_sets(
-        before: list["ProtoImport"], after: list["ProtoImport"]
+    def diff(
+        before: Optional["ProtoImport"], after: Optional["ProtoImport"]
     ) -> list["ProtoNodeDiff"]:
         diffs: list[ProtoNodeDiff] = []
-        before_names = set(i.path for i in before)
-        after_names = set(i.path for i in after)
-        for name in before_names - after_names:
-            diffs.append(ProtoImportRemoved(next(i for i in before if i.path == name)))
-        for name in after_names - before_names:
-            diffs.append(ProtoImportAdded(next(i for i in after if i.path == name)))
-        for name in before_names & after_names:
-            before_import = next(i for i in before if i.path == name)
-            after_import = next(i for i in after if i.path == name)
-            if before_import.weak and not after_import.weak:
-                diffs.append(ProtoImportMadeNonWeak(after_import))
-            elif not before_import.weak and after_import.weak:
-                diffs.append(ProtoImportMadeWeak(after_import))
-            if before_import.public and not after_import.public:
-                diffs.append(ProtoImportMadeNonPublic(after_import))
-            elif not before_import.public and after_import.public:
-                diffs.append(ProtoImportMadePublic(after_import))
-
+        if before is None and after is not None:
+            diffs.append(ProtoImportAdded(after))
+        elif before is not None and after is None:
+            diffs.append(ProtoImportRemoved(before))
+        elif before is not None and after is not None:
+            if before.weak and not after.weak:
+                diffs.append(ProtoImportMadeNonWeak(after))
+            elif not before.weak and after.weak:
+                diffs.append(ProtoImportMadeWeak(after))
+            if before.public and not after.public:
+                diffs.append(ProtoImportMadeNonPublic(after))
+            elif not before.public and after.public:
+                diffs.append(ProtoImportMadePublic(after))
         return diffs
 
+    @staticmethod
+    def diff_sets(
+        before: list["ProtoImport"], after: list["ProtoImport"]
+    ) -> list["ProtoNodeDiff"]:
+        return diff_keyed_sets(
+            before, after, lambda proto_import: proto_import.path, ProtoImport.diff
+        )
+
 
 class ProtoImportAdded(ProtoNodeDiff):
     def __init__(self, proto_import: ProtoImport):
@@ -59,13 +59,13 @@ class ProtoInt(ProtoNode):
                 for i, c in enumerate(proto_source):
                     if c not in ProtoInt.HEX:
                         if c in ProtoFullIdentifier.ALL:
-                            raise ValueError(f"Proto has invalid hex: {proto_source}")
+                            raise ValueError(f"Proto has invalid hex")
                         i -= 1
                         break
                 try:
                     value = int(f"0x{proto_source[:i + 1]}", 16)
                 except ValueError:
-                    raise ValueError(f"Proto has invalid hex: {proto_source}")
+                    raise ValueError(f"Proto has invalid hex")
                 return ParsedProtoIntNode(
                     ProtoInt(value=value, sign=ProtoIntSign.POSITIVE, parent=parent),
                     proto_source[i + 1 :].strip(),
@@ -75,13 +75,13 @@ class ProtoInt(ProtoNode):
                 for i, c in enumerate(proto_source):
                     if c not in ProtoInt.OCTAL:
                         if c in ProtoFullIdentifier.ALL:
-                            raise ValueError(f"Proto has invalid octal: {proto_source}")
+                            raise ValueError(f"Proto has invalid octal")
                         i -= 1
                         break
                 try:
                     value = int(f"0{proto_source[:i + 1]}", 8)
                 except ValueError:
-                    raise ValueError(f"Proto has invalid octal: {proto_source}")
+                    raise ValueError(f"Proto has invalid octal")
                 return ParsedProtoIntNode(
                     ProtoInt(value=value, sign=ProtoIntSign.POSITIVE, parent=parent),
                     proto_source[i + 1 :].strip(),
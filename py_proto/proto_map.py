@@ -7,7 +7,12 @@ from py_proto.proto_message_field import (
     ProtoMessageFieldOption,
     ProtoMessageFieldTypesEnum,
 )
-from py_proto.proto_node import ParsedProtoNode, ProtoNode, ProtoNodeDiff
+from py_proto.proto_node import (
+    ParsedProtoNode,
+    ProtoNode,
+    ProtoNodeDiff,
+    diff_keyed_sets,
+)
 
 
 class ProtoMapKeyTypesEnum(Enum):
@@ -81,7 +86,7 @@ class ProtoMap(ProtoNode):
             name=self.name,
             number=self.number,
             enum_or_message_type_name=self.enum_or_message_type_name,
-            options=sorted(self.options, key=lambda o: str(o.normalize())),
+            options=sorted(self.options, key=lambda o: o.sort_key()),
         )
 
     @classmethod
@@ -160,23 +165,19 @@ class ProtoMap(ProtoNode):
             end_bracket = proto_source.find("]")
             if end_bracket == -1:
                 raise ValueError(
-                    f"Proto has invalid map field option syntax, cannot find ]: {proto_source}"
+                    f"Proto has invalid map field option syntax, cannot find ]"
                 )
             for option_part in proto_source[:end_bracket].strip().split(","):
                 message_field_option_match = ProtoMessageFieldOption.match(
                     option_part.strip()
                 )
                 if message_field_option_match is None:
-                    raise ValueError(
-                        f"Proto has invalid map field option syntax: {proto_source}"
-                    )
+                    raise ValueError(f"Proto has invalid map field option syntax")
                 options.append(message_field_option_match.node)
             proto_source = proto_source[end_bracket + 1 :].strip()
 
         if not proto_source.startswith(";"):
-            raise ValueError(
-                f"Proto has invalid map field syntax, missing ending ;:{proto_source}"
-            )
+            raise ValueError(f"Proto has invalid map field syntax, missing ending ;")
 
         return ParsedProtoNode(
             ProtoMap(
@@ -223,17 +224,19 @@ class ProtoMap(ProtoNode):
 
     @staticmethod
     def diff(
-        parent: Optional[ProtoNode], before: "ProtoMap", after: "ProtoMap"
+        parent: Optional[ProtoNode],
+        before: Optional["ProtoMap"],
+        after: Optional["ProtoMap"],
     ) -> list["ProtoNodeDiff"]:
         if before is None and after is not None:
             return [ProtoMapAdded(parent, after)]
         elif before is not None and after is None:
             return [ProtoMapRemoved(parent, before)]
-        elif before is None and after is None:
+        elif before is None or after is None:
             return []
         elif before.name != after.name:
             return []
-        elif before == after:
+        elif before.structural_hash == after.structural_hash:
             return []
         diffs: list["ProtoNodeDiff"] = []
         return diffs
@@ -242,27 +245,12 @@ class ProtoMap(ProtoNode):
     def diff_sets(
         parent: Optional[ProtoNode], before: list["ProtoMap"], after: list["ProtoMap"]
     ) -> Sequence["ProtoNodeDiff"]:
-        diffs: list[ProtoNodeDiff] = []
-        before_names = set(o.name.identifier for o in before)
-        after_names = set(o.name.identifier for o in after)
-        for name in before_names - after_names:
-            diffs.append(
-                ProtoMapRemoved(
-                    parent, next(i for i in before if i.name.identifier == name)
-                )
-            )
-        for name in after_names - before_names:
-            diffs.append(
-                ProtoMapAdded(
-                    parent, next(i for i in after if i.name.identifier == name)
-                )
-            )
-        for name in before_names & after_names:
-            before_enum = next(i for i in before if i.name.identifier == name)
-            after_enum = next(i for i in after if i.name.identifier == name)
-            diffs.extend(ProtoMap.diff(parent, before_enum, after_enum))
-
-        return diffs
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda map: map.name.identifier,
+            lambda before_map, after_map: ProtoMap.diff(parent, before_map, after_map),
+        )
 
 
 class ProtoMapDiff(ProtoNodeDiff):
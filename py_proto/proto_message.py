@@ -16,6 +16,7 @@ from py_proto.proto_node import (
     ProtoContainerNode,
     ProtoNode,
     ProtoNodeDiff,
+    diff_keyed_sets,
 )
 from py_proto.proto_oneof import ProtoOneOf
 from py_proto.proto_option import ProtoOption
@@ -72,11 +73,11 @@ class ProtoMessage(ProtoContainerNode):
                 )
 
         sorted_nodes_for_normalizing = (
-            sorted(options, key=lambda o: str(o.normalize()))
-            + sorted(enums, key=lambda e: str(e))
-            + sorted(messages, key=lambda m: str(m))
+            sorted(options, key=lambda o: o.sort_key())
+            + sorted(enums, key=lambda e: e.name.identifier)
+            + sorted(messages, key=lambda m: m.name.identifier)
             + sorted(fields, key=lambda f: int(f.number))
-            + sorted(oneofs, key=lambda o: str(o))
+            + sorted(oneofs, key=lambda o: o.name.identifier)
             + sorted(reserveds, key=lambda r: int(r.min))
         )
 
@@ -98,14 +99,14 @@ class ProtoMessage(ProtoContainerNode):
         proto_source = proto_source[8:]
         match = ProtoIdentifier.match(proto_source)
         if match is None:
-            raise ValueError(f"Proto has invalid message name: {proto_source}")
+            raise ValueError(f"Proto has invalid message name")
 
         enum_name = match.node
         proto_source = match.remaining_source.strip()
 
         if not proto_source.startswith("{"):
             raise ValueError(
-                f"Proto message has invalid syntax, expecting opening curly brace: {proto_source}"
+                f"Proto message has invalid syntax, expecting opening curly brace"
             )
 
         return ParsedProtoIdentifierNode(enum_name, proto_source[1:].strip())
@@ -143,6 +144,18 @@ class ProtoMessage(ProtoContainerNode):
     def options(self) -> list[ProtoOption]:
         return [node for node in self.nodes if isinstance(node, ProtoOption)]
 
+    @property
+    def enums(self) -> list[ProtoEnum]:
+        return [node for node in self.nodes if isinstance(node, ProtoEnum)]
+
+    @property
+    def messages(self) -> list["ProtoMessage"]:
+        return [node for node in self.nodes if isinstance(node, ProtoMessage)]
+
+    @property
+    def reserveds(self) -> list[ProtoReserved]:
+        return [node for node in self.nodes if isinstance(node, ProtoReserved)]
+
     @property
     def maps(self) -> list[ProtoMap]:
         return [node for node in self.nodes if isinstance(node, ProtoMap)]
@@ -166,28 +179,28 @@ class ProtoMessage(ProtoContainerNode):
     @staticmethod
     def diff(
         parent: ProtoNode,
-        before: "ProtoMessage",
-        after: "ProtoMessage",
+        before: Optional["ProtoMessage"],
+        after: Optional["ProtoMessage"],
     ) -> Sequence["ProtoNodeDiff"]:
         if before is None and after is not None:
             return [ProtoMessageAdded(parent, after)]
         elif before is not None and after is None:
             return [ProtoMessageRemoved(parent, before)]
-        elif before is None and after is None:
+        elif before is None or after is None:
             return []
         elif before.name != after.name:
             return []
-        elif before == after:
+        elif before.structural_hash == after.structural_hash:
             return []
         diffs: list[ProtoNodeDiff] = []
 
         # TODO:
-        # ProtoEnum,
         # ProtoExtend,
         # ProtoExtensions,
-        # ProtoMessage,
-        # ProtoReserved,
         diffs.extend(ProtoOption.diff_sets(before, before.options, after.options))
+        diffs.extend(ProtoEnum.diff_sets(before, before.enums, after.enums))
+        diffs.extend(ProtoMessage.diff_sets(before, before.messages, after.messages))
+        diffs.extend(ProtoReserved.diff_sets(before, before.reserveds, after.reserveds))
         diffs.extend(ProtoOneOf.diff_sets(before, before.oneofs, after.oneofs))
         diffs.extend(ProtoMap.diff_sets(before, before.maps, after.maps))
         diffs.extend(
@@ -203,28 +216,14 @@ class ProtoMessage(ProtoContainerNode):
         before: list["ProtoMessage"],
         after: list["ProtoMessage"],
     ) -> Sequence["ProtoNodeDiff"]:
-        diffs: list[ProtoNodeDiff] = []
-        before_names = set(o.name.identifier for o in before)
-        after_names = set(o.name.identifier for o in after)
-        for name in before_names - after_names:
-            diffs.append(
-                ProtoMessageRemoved(
-                    parent,
-                    next(i for i in before if i.name.identifier == name),
-                )
-            )
-        for name in after_names - before_names:
-            diffs.append(
-                ProtoMessageAdded(
-                    parent, next(i for i in after if i.name.identifier == name)
-                )
-            )
-        for name in before_names & after_names:
-            before_message = next(i for i in before if i.name.identifier == name)
-            after_message = next(i for i in after if i.name.identifier == name)
-            diffs.extend(ProtoMessage.diff(parent, before_message, after_message))
-
-        return diffs
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda message: message.name.identifier,
+            lambda before_message, after_message: ProtoMessage.diff(
+                parent, before_message, after_message
+            ),
+        )
 
 
 class ProtoMessageDiff(ProtoNodeDiff):
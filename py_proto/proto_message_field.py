@@ -114,7 +114,7 @@ class ProtoMessageField(ProtoNode):
             repeated=self.repeated,
             optional=self.optional,
             enum_or_message_type_name=self.enum_or_message_type_name,
-            options=sorted(self.options, key=lambda o: str(o.name)),
+            options=sorted(self.options, key=lambda o: o.sort_key()),
             parent=self.parent,
         )
 
@@ -182,22 +182,20 @@ class ProtoMessageField(ProtoNode):
             end_bracket = proto_source.find("]")
             if end_bracket == -1:
                 raise ValueError(
-                    f"Proto has invalid message field option syntax, cannot find ]: {proto_source}"
+                    f"Proto has invalid message field option syntax, cannot find ]"
                 )
             for option_part in proto_source[:end_bracket].strip().split(","):
                 message_field_option_match = ProtoMessageFieldOption.match(
                     option_part.strip()
                 )
                 if message_field_option_match is None:
-                    raise ValueError(
-                        f"Proto has invalid message field option syntax: {proto_source}"
-                    )
+                    raise ValueError(f"Proto has invalid message field option syntax")
                 options.append(message_field_option_match.node)
             proto_source = proto_source[end_bracket + 1 :].strip()
 
         if not proto_source.startswith(";"):
             raise ValueError(
-                f"Proto has invalid message field syntax, missing ending ;:{proto_source}"
+                f"Proto has invalid message field syntax, missing ending ;"
             )
 
         return ParsedProtoMessageFieldNode(
@@ -256,7 +254,7 @@ class ProtoMessageField(ProtoNode):
                 diffs.append(ProtoMessageFieldAdded(parent, after))
             elif before is not None:
                 diffs.append(ProtoMessageFieldRemoved(parent, before))
-        else:
+        elif before.structural_hash != after.structural_hash:
             if before.name != after.name:
                 diffs.append(ProtoMessageFieldNameChanged(parent, before, after.name))
             if before.number != after.number:
@@ -1,5 +1,23 @@
 import abc
-from typing import NamedTuple, Optional, Sequence
+import hashlib
+from typing import Callable, Hashable, Iterable, NamedTuple, Optional, Sequence, TypeVar
+
+from py_proto.proto_source import (
+    ProtoParseError,
+    ProtoSource,
+    ProtoSourcePosition,
+    ProtoSpan,
+)
+
+# Error messages quote at most this much of the underlying error, rather than the whole remaining source.
+MAX_ERROR_REASON_LENGTH = 200
+
+
+def error_reason(error: Exception) -> str:
+    reason = str(error).split("\n", 1)[0]
+    if len(reason) > MAX_ERROR_REASON_LENGTH:
+        return reason[:MAX_ERROR_REASON_LENGTH] + "..."
+    return reason
 
 
 class ProtoNode(abc.ABC):
@@ -12,8 +30,44 @@ class ProtoNode(abc.ABC):
     ) -> Optional["ParsedProtoNode"]:
         raise NotImplementedError
 
-    def __init__(self, parent: Optional["ProtoNode"] = None):
+    def __init__(
+        self, parent: Optional["ProtoNode"] = None, span: Optional[ProtoSpan] = None
+    ):
         self.parent = parent
+        # Offsets of this node in the parsed source, if it was parsed by a parser that tracks them.
+        self.span = span
+        self._structural_hash: Optional[bytes] = None
+
+    @property
+    def source(self) -> Optional[ProtoSource]:
+        return self.parent.source if self.parent is not None else None
+
+    @property
+    def start_position(self) -> Optional[ProtoSourcePosition]:
+        source = self.source
+        if self.span is None or source is None:
+            return None
+        return source.position(self.span.start)
+
+    @property
+    def end_position(self) -> Optional[ProtoSourcePosition]:
+        source = self.source
+        if self.span is None or source is None:
+            return None
+        return source.position(self.span.end)
+
+    @property
+    def structural_hash(self) -> bytes:
+        """
+        A digest of this node's serialized subtree, so that diffs can skip identical subtrees
+        without comparing them node by node.
+        It's computed on first use & then cached, so nodes shouldn't be modified after that.
+        """
+        if self._structural_hash is None:
+            self._structural_hash = hashlib.blake2b(
+                self.serialize().encode("utf-8"), digest_size=16
+            ).digest()
+        return self._structural_hash
 
     @abc.abstractmethod
     def serialize(self) -> str:
@@ -37,6 +91,14 @@ class ProtoContainerNode(ProtoNode):
             node.parent = self
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if (
+            isinstance(other, ProtoContainerNode)
+            and self._structural_hash is not None
+            and self._structural_hash == other._structural_hash
+        ):
+            return True
         return self.nodes == other.nodes
 
     @classmethod
@@ -80,11 +142,20 @@ class ProtoContainerNode(ProtoNode):
         for node_type in cls.container_types():
             try:
                 match_result = node_type.match(partial_content)
-            except (ValueError, IndexError, TypeError):
-                raise ValueError(f"Could not parse partial content:\n{partial_content}")
+            except ProtoParseError:
+                # A nested container already knows where it failed.
+                raise
+            except (ValueError, IndexError, TypeError) as e:
+                raise ProtoParseError(
+                    f"Could not parse {node_type.__name__} in {cls.__name__}: {error_reason(e)}",
+                    remaining_length=len(partial_content),
+                ) from e
             if match_result is not None:
                 return match_result
-        raise ValueError(f"Could not parse partial content:\n{partial_content}")
+        raise ProtoParseError(
+            f"Could not parse content in {cls.__name__}",
+            remaining_length=len(partial_content),
+        )
 
     @classmethod
     def match(
@@ -117,8 +188,9 @@ class ProtoContainerNode(ProtoNode):
         if footer_match is None:
             footer_match = cls.match_footer(proto_source, parent)
             if footer_match is None:
-                raise ValueError(
-                    f"Footer was not found when matching container node {cls} for remaining proto source {proto_source}"
+                raise ProtoParseError(
+                    f"Footer was not found when matching container node {cls.__name__}",
+                    remaining_length=len(proto_source),
                 )
 
         return ParsedProtoNode(
@@ -144,3 +216,34 @@ class ProtoNodeDiff(abc.ABC):
 
     def __hash__(self) -> int:
         return hash(str(self))
+
+
+NodeType = TypeVar("NodeType", bound=ProtoNode)
+DiffType = TypeVar("DiffType", bound=ProtoNodeDiff)
+
+
+def diff_keyed_sets(
+    before: Iterable[NodeType],
+    after: Iterable[NodeType],
+    key: Callable[[NodeType], Hashable],
+    diff: Callable[[Optional[NodeType], Optional[NodeType]], Sequence[DiffType]],
+) -> list[DiffType]:
+    """
+    Diffs two sets of nodes, pairing up the nodes in each that have the same key, e.g. their name.
+    Each set is indexed once, so this is linear in the number of nodes.
+    `diff` is called with None in place of nodes that were added or removed.
+    """
+    before_index: dict[Hashable, NodeType] = {}
+    for node in before:
+        before_index.setdefault(key(node), node)
+    after_index: dict[Hashable, NodeType] = {}
+    for node in after:
+        after_index.setdefault(key(node), node)
+
+    diffs: list[DiffType] = []
+    for node_key, before_node in before_index.items():
+        diffs.extend(diff(before_node, after_index.get(node_key)))
+    for node_key, after_node in after_index.items():
+        if node_key not in before_index:
+            diffs.extend(diff(None, after_node))
+    return diffs
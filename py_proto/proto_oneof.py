@@ -15,6 +15,7 @@ from py_proto.proto_node import (
     ProtoContainerNode,
     ProtoNode,
     ProtoNodeDiff,
+    diff_keyed_sets,
 )
 from py_proto.proto_option import ParsedProtoOptionNode, ProtoOption
 
@@ -73,7 +74,7 @@ class ProtoOneOf(ProtoContainerNode):
                     f"Can't sort message {self} node for normalizing: {node}"
                 )
 
-        sorted_options = sorted(options, key=lambda o: str(o.normalize()))
+        sorted_options = sorted(options, key=lambda o: o.sort_key())
         sorted_fields = sorted(fields, key=lambda f: int(f.number))
         sorted_oneofs = sorted(
             oneofs,
@@ -100,16 +101,14 @@ class ProtoOneOf(ProtoContainerNode):
         match = ProtoIdentifier.match(proto_source)
         if match is None:
             raise ValueError(
-                f"Proto has invalid syntax, expecting identifier for oneof: {proto_source}"
+                f"Proto has invalid syntax, expecting identifier for oneof"
             )
 
         oneof_name = match.node
         proto_source = match.remaining_source.strip()
 
         if not proto_source.startswith("{"):
-            raise ValueError(
-                f"Proto has invalid syntax, expecting opening curly brace: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid syntax, expecting opening curly brace")
 
         return ParsedProtoIdentifierNode(oneof_name, proto_source[1:].strip())
 
@@ -151,17 +150,19 @@ class ProtoOneOf(ProtoContainerNode):
 
     @staticmethod
     def diff(
-        parent: ProtoNode, before: "ProtoOneOf", after: "ProtoOneOf"
+        parent: ProtoNode,
+        before: Optional["ProtoOneOf"],
+        after: Optional["ProtoOneOf"],
     ) -> Sequence["ProtoNodeDiff"]:
         if before is None and after is not None:
             return [ProtoOneOfAdded(parent, after)]
         elif before is not None and after is None:
             return [ProtoOneOfRemoved(parent, before)]
-        elif before is None and after is None:
+        elif before is None or after is None:
             return []
         elif before.name != after.name:
             return []
-        elif before == after:
+        elif before.structural_hash == after.structural_hash:
             return []
         diffs: list[ProtoNodeDiff] = []
         diffs.extend(ProtoOption.diff_sets(before, before.options, after.options))
@@ -178,27 +179,14 @@ class ProtoOneOf(ProtoContainerNode):
         before: list["ProtoOneOf"],
         after: list["ProtoOneOf"],
     ) -> Sequence["ProtoNodeDiff"]:
-        diffs: list[ProtoNodeDiff] = []
-        before_names = set(o.name.identifier for o in before)
-        after_names = set(o.name.identifier for o in after)
-        for name in before_names - after_names:
-            diffs.append(
-                ProtoOneOfRemoved(
-                    parent, next(i for i in before if i.name.identifier == name)
-                )
-            )
-        for name in after_names - before_names:
-            diffs.append(
-                ProtoOneOfAdded(
-                    parent, next(i for i in after if i.name.identifier == name)
-                )
-            )
-        for name in before_names & after_names:
-            before_oneof = next(i for i in before if i.name.identifier == name)
-            after_oneof = next(i for i in after if i.name.identifier == name)
-            diffs.extend(ProtoOneOf.diff(parent, before_oneof, after_oneof))
-
-        return diffs
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda oneof: oneof.name.identifier,
+            lambda before_oneof, after_oneof: ProtoOneOf.diff(
+                parent, before_oneof, after_oneof
+            ),
+        )
 
 
 class ProtoOneOfDiff(ProtoNodeDiff):
@@ -6,7 +6,12 @@ from py_proto.proto_identifier import (
     ProtoFullIdentifier,
     ProtoIdentifier,
 )
-from py_proto.proto_node import ParsedProtoNode, ProtoNode, ProtoNodeDiff
+from py_proto.proto_node import (
+    ParsedProtoNode,
+    ProtoNode,
+    ProtoNodeDiff,
+    diff_keyed_sets,
+)
 
 
 class ParsedProtoOptionNode(ParsedProtoNode):
@@ -37,6 +42,10 @@ class ProtoOption(ProtoNode):
     def normalize(self) -> "ProtoOption":
         return self
 
+    def sort_key(self) -> tuple[str, str]:
+        # Options can be repeated, so order ties on name by value to keep normalizing deterministic.
+        return (self.name.identifier, self.value.serialize())
+
     @classmethod
     def match(
         cls, proto_source: str, parent: Optional[ProtoNode] = None
@@ -56,9 +65,7 @@ class ProtoOption(ProtoNode):
                     not identifier_match
                     or not identifier_match.remaining_source.startswith(")")
                 ):
-                    raise ValueError(
-                        f"Proto has invalid option when expecting ): {proto_source}"
-                    )
+                    raise ValueError(f"Proto has invalid option when expecting )")
                 name_parts.append(
                     ProtoIdentifier(identifier=f"({identifier_match.node.identifier})")
                 )
@@ -82,21 +89,15 @@ class ProtoOption(ProtoNode):
 
         proto_source = proto_source.strip()
         if not proto_source.startswith("="):
-            raise ValueError(
-                f"Proto has invalid option when expecting =: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid option when expecting =")
         proto_source = proto_source[1:].strip()
         constant_match = ProtoConstant.match(proto_source)
         if constant_match is None:
-            raise ValueError(
-                f"Proto has invalid option when expecting constant: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid option when expecting constant")
 
         proto_source = constant_match.remaining_source
         if not constant_match.remaining_source.startswith(";"):
-            raise ValueError(
-                f"Proto has invalid option when expecting ;: {proto_source}"
-            )
+            raise ValueError(f"Proto has invalid option when expecting ;")
 
         identifier: ProtoFullIdentifier | ProtoIdentifier
         if len(name_parts) > 1:
@@ -125,18 +126,18 @@ class ProtoOption(ProtoNode):
     @staticmethod
     def diff(
         parent: ProtoNode,
-        before: "ProtoOption",
-        after: "ProtoOption",
+        before: Optional["ProtoOption"],
+        after: Optional["ProtoOption"],
     ) -> Sequence["ProtoOptionDiff"]:
         if before is None and after is not None:
             return [ProtoOptionAdded(parent, after)]
         elif before is not None and after is None:
             return [ProtoOptionRemoved(parent, before)]
-        elif before is None and after is None:
+        elif before is None or after is None:
             return []
         elif before.name != after.name:
             return []
-        elif before == after:
+        elif before.structural_hash == after.structural_hash:
             return []
         return [ProtoOptionValueChanged(parent, before.name, before.value, after.value)]
 
@@ -146,27 +147,14 @@ class ProtoOption(ProtoNode):
         before: Sequence["ProtoOption"],
         after: Sequence["ProtoOption"],
     ) -> list["ProtoOptionDiff"]:
-        diffs: list[ProtoOptionDiff] = []
-        before_names = set(o.name.identifier for o in before)
-        after_names = set(o.name.identifier for o in after)
-        for name in before_names - after_names:
-            diffs.append(
-                ProtoOptionRemoved(
-                    parent, next(i for i in before if i.name.identifier == name)
-                )
-            )
-        for name in after_names - before_names:
-            diffs.append(
-                ProtoOptionAdded(
-                    parent, next(i for i in after if i.name.identifier == name)
-                )
-            )
-        for name in before_names & after_names:
-            before_option = next(i for i in before if i.name.identifier == name)
-            after_option = next(i for i in after if i.name.identifier == name)
-            diffs.extend(ProtoOption.diff(parent, before_option, after_option))
-
-        return diffs
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda option: option.name.identifier,
+            lambda before_option, after_option: ProtoOption.diff(
+                parent, before_option, after_option
+            ),
+        )
 
 
 class ProtoOptionDiff(ProtoNodeDiff):
@@ -28,19 +28,17 @@ class ProtoPackage(ProtoNode):
             return None
 
         if not proto_source.startswith("package "):
-            raise ValueError(f"Proto has invalid package: {proto_source}")
+            raise ValueError(f"Proto has invalid package")
 
         proto_source = proto_source[8:]
         parts = proto_source.split(";")
         package = parts[0]
 
         if len(parts) == 1:
-            raise ValueError(
-                f"Proto has invalid package declaration syntax: {';'.join(parts)}"
-            )
+            raise ValueError(f"Proto has invalid package declaration syntax")
 
         if not package:
-            raise ValueError(f"Proto cannot have empty package: {proto_source}")
+            raise ValueError(f"Proto cannot have empty package")
 
         proto_source = ";".join(parts[1:])
 
@@ -24,6 +24,8 @@ class ProtoRange(ProtoNode):
     ):
         super().__init__(*args, **kwargs)
         self.min = min
+        if isinstance(self.min, ProtoNode):
+            self.min.parent = self
 
         if (
             max is not None
@@ -33,6 +35,8 @@ class ProtoRange(ProtoNode):
             raise ValueError(f"min {min} was greater than max {max} in ProtoRange")
 
         self.max = max
+        if isinstance(self.max, ProtoNode):
+            self.max.parent = self
 
     def __eq__(self, other) -> bool:
         return self.min == other.min and self.max == other.max
@@ -82,7 +86,7 @@ class ProtoRange(ProtoNode):
                     match = ProtoInt.match(proto_source)
                 if match is None:
                     raise ValueError(
-                        f"Proto source has invalid range, expecting int for max: {proto_source}"
+                        f"Proto source has invalid range, expecting int for max"
                     )
                 match.node.sign = sign
                 max = match.node
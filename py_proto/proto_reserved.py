@@ -1,8 +1,13 @@
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
 from py_proto.proto_identifier import ProtoIdentifier
-from py_proto.proto_node import ParsedProtoNode, ProtoNode
+from py_proto.proto_node import (
+    ParsedProtoNode,
+    ProtoNode,
+    ProtoNodeDiff,
+    diff_keyed_sets,
+)
 from py_proto.proto_range import ProtoRange
 
 
@@ -60,7 +65,7 @@ class ProtoReserved(ProtoNode):
         return ProtoReserved(
             parent=self.parent,
             ranges=sorted(self.ranges, key=lambda r: int(r.min)),
-            fields=sorted(self.fields, key=lambda f: str(f)),
+            fields=sorted(self.fields, key=lambda f: f.identifier),
             quote_type=self.quote_type,
         )
 
@@ -69,7 +74,7 @@ class ProtoReserved(ProtoNode):
         if self.ranges:
             return int(min(self.ranges, key=lambda r: int(r.min)).min)
         else:
-            return str(min(self.fields, key=lambda f: str(f)))
+            return str(min(self.fields, key=lambda f: f.identifier))
 
     @classmethod
     def match(
@@ -106,21 +111,21 @@ class ProtoReserved(ProtoNode):
                 ]
                 if not quote_types:
                     raise ValueError(
-                        f"Proto source has invalid reserved syntax, expecting quote for field identifier: {proto_source}"
+                        f"Proto source has invalid reserved syntax, expecting quote for field identifier"
                     )
                 quote_type = quote_types[0]
                 proto_source = proto_source[1:]
                 match = ProtoIdentifier.match(proto_source)
                 if match is None:
                     raise ValueError(
-                        f"Proto source has invalid reserved syntax, expecting field identifier: {proto_source}"
+                        f"Proto source has invalid reserved syntax, expecting field identifier"
                     )
 
                 fields.append(match.node)
                 proto_source = match.remaining_source
                 if not proto_source.startswith(quote_type.value):
                     raise ValueError(
-                        f"Proto source has invalid reserved syntax, expecting closing quote {quote_type.value}: {proto_source}"
+                        f"Proto source has invalid reserved syntax, expecting closing quote {quote_type.value}"
                     )
                 proto_source = proto_source[1:].strip()
 
@@ -142,3 +147,62 @@ class ProtoReserved(ProtoNode):
             ),
         ]
         return " ".join(serialize_parts) + ";"
+
+    @staticmethod
+    def diff(
+        parent: ProtoNode,
+        before: Optional["ProtoReserved"],
+        after: Optional["ProtoReserved"],
+    ) -> Sequence["ProtoNodeDiff"]:
+        # Reserveds are paired up by what they reserve, so paired reserveds are identical.
+        if before is None and after is not None:
+            return [ProtoReservedAdded(parent, after)]
+        elif before is not None and after is None:
+            return [ProtoReservedRemoved(parent, before)]
+        return []
+
+    @staticmethod
+    def diff_sets(
+        parent: ProtoNode,
+        before: list["ProtoReserved"],
+        after: list["ProtoReserved"],
+    ) -> Sequence["ProtoNodeDiff"]:
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda reserved: (
+                frozenset(r.serialize() for r in reserved.ranges),
+                frozenset(f.identifier for f in reserved.fields),
+            ),
+            lambda before_reserved, after_reserved: ProtoReserved.diff(
+                parent, before_reserved, after_reserved
+            ),
+        )
+
+
+class ProtoReservedDiff(ProtoNodeDiff):
+    def __init__(self, parent: ProtoNode, reserved: ProtoReserved):
+        self.parent = parent
+        self.reserved = reserved
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ProtoReservedDiff)
+            and self.reserved == other.reserved
+            and self.parent == other.parent
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} reserved={self.reserved} parent={self.parent}>"
+        )
+
+
+class ProtoReservedAdded(ProtoReservedDiff):
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and isinstance(other, ProtoReservedAdded)
+
+
+class ProtoReservedRemoved(ProtoReservedDiff):
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and isinstance(other, ProtoReservedRemoved)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from py_proto.proto_comment import (
     ProtoComment,
@@ -10,7 +10,13 @@ from py_proto.proto_identifier import (
     ProtoEnumOrMessageIdentifier,
     ProtoIdentifier,
 )
-from py_proto.proto_node import ParsedProtoNode, ProtoContainerNode, ProtoNode
+from py_proto.proto_node import (
+    ParsedProtoNode,
+    ProtoContainerNode,
+    ProtoNode,
+    ProtoNodeDiff,
+    diff_keyed_sets,
+)
 from py_proto.proto_option import ProtoOption
 
 
@@ -65,7 +71,7 @@ class ProtoServiceRPC(ProtoNode):
             response_type=self.response_type,
             request_stream=self.request_stream,
             response_stream=self.response_stream,
-            options=sorted(self.options, key=lambda o: str(o.normalize())),
+            options=sorted(self.options, key=lambda o: o.sort_key()),
             parent=self.parent,
         )
 
@@ -221,6 +227,58 @@ class ProtoServiceRPC(ProtoNode):
         else:
             return " ".join(serialized_parts) + ";"
 
+    @staticmethod
+    def diff(
+        service: "ProtoService",
+        before: Optional["ProtoServiceRPC"],
+        after: Optional["ProtoServiceRPC"],
+    ) -> Sequence["ProtoNodeDiff"]:
+        if before is None and after is not None:
+            return [ProtoServiceRPCAdded(service, after)]
+        elif before is not None and after is None:
+            return [ProtoServiceRPCRemoved(service, before)]
+        elif before is None or after is None:
+            return []
+        elif before.structural_hash == after.structural_hash:
+            return []
+
+        diffs: list[ProtoNodeDiff] = []
+        if (
+            before.request_type != after.request_type
+            or before.request_stream != after.request_stream
+        ):
+            diffs.append(
+                ProtoServiceRPCRequestChanged(
+                    service, before, after.request_type, after.request_stream
+                )
+            )
+        if (
+            before.response_type != after.response_type
+            or before.response_stream != after.response_stream
+        ):
+            diffs.append(
+                ProtoServiceRPCResponseChanged(
+                    service, before, after.response_type, after.response_stream
+                )
+            )
+        diffs.extend(ProtoOption.diff_sets(before, before.options, after.options))
+        return diffs
+
+    @staticmethod
+    def diff_sets(
+        service: "ProtoService",
+        before: list["ProtoServiceRPC"],
+        after: list["ProtoServiceRPC"],
+    ) -> Sequence["ProtoNodeDiff"]:
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda rpc: rpc.name.identifier,
+            lambda before_rpc, after_rpc: ProtoServiceRPC.diff(
+                service, before_rpc, after_rpc
+            ),
+        )
+
 
 class ProtoService(ProtoContainerNode):
     def __init__(self, name: ProtoIdentifier, *args, **kwargs):
@@ -259,14 +317,14 @@ class ProtoService(ProtoContainerNode):
         proto_source = proto_source[8:]
         match = ProtoIdentifier.match(proto_source)
         if match is None:
-            raise ValueError(f"Proto has invalid service name: {proto_source}")
+            raise ValueError(f"Proto has invalid service name")
 
         service_name = match.node
         proto_source = match.remaining_source.strip()
 
         if not proto_source.startswith("{"):
             raise ValueError(
-                f"Proto service has invalid syntax, expecting opening curly brace: {proto_source}"
+                f"Proto service has invalid syntax, expecting opening curly brace"
             )
 
         return ParsedProtoIdentifierNode(service_name, proto_source[1:].strip())
@@ -297,6 +355,10 @@ class ProtoService(ProtoContainerNode):
     def options(self) -> list[ProtoOption]:
         return [node for node in self.nodes if isinstance(node, ProtoOption)]
 
+    @property
+    def rpcs(self) -> list[ProtoServiceRPC]:
+        return [node for node in self.nodes if isinstance(node, ProtoServiceRPC)]
+
     def serialize(self) -> str:
         serialize_parts = (
             [f"service {self.name.serialize()} {{"]
@@ -304,3 +366,141 @@ class ProtoService(ProtoContainerNode):
             + ["}"]
         )
         return "\n".join(serialize_parts)
+
+    @staticmethod
+    def diff(
+        parent: ProtoNode,
+        before: Optional["ProtoService"],
+        after: Optional["ProtoService"],
+    ) -> Sequence["ProtoNodeDiff"]:
+        if before is None and after is not None:
+            return [ProtoServiceAdded(parent, after)]
+        elif before is not None and after is None:
+            return [ProtoServiceRemoved(parent, before)]
+        elif before is None or after is None:
+            return []
+        elif before.name != after.name:
+            return []
+        elif before.structural_hash == after.structural_hash:
+            return []
+        diffs: list[ProtoNodeDiff] = []
+        diffs.extend(ProtoOption.diff_sets(before, before.options, after.options))
+        diffs.extend(ProtoServiceRPC.diff_sets(before, before.rpcs, after.rpcs))
+        return diffs
+
+    @staticmethod
+    def diff_sets(
+        parent: ProtoNode,
+        before: list["ProtoService"],
+        after: list["ProtoService"],
+    ) -> Sequence["ProtoNodeDiff"]:
+        return diff_keyed_sets(
+            before,
+            after,
+            lambda service: service.name.identifier,
+            lambda before_service, after_service: ProtoService.diff(
+                parent, before_service, after_service
+            ),
+        )
+
+
+class ProtoServiceDiff(ProtoNodeDiff):
+    def __init__(self, parent: ProtoNode, service: ProtoService):
+        self.parent = parent
+        self.service = service
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ProtoServiceDiff)
+            and self.service == other.service
+            and self.parent == other.parent
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} service={self.service} parent={self.parent}>"
+        )
+
+
+class ProtoServiceAdded(ProtoServiceDiff):
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and isinstance(other, ProtoServiceAdded)
+
+
+class ProtoServiceRemoved(ProtoServiceDiff):
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and isinstance(other, ProtoServiceRemoved)
+
+
+class ProtoServiceRPCDiff(ProtoNodeDiff):
+    def __init__(self, service: ProtoService, rpc: ProtoServiceRPC):
+        self.service = service
+        self.rpc = rpc
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ProtoServiceRPCDiff)
+            and self.service == other.service
+            and self.rpc == other.rpc
+        )
+
+    def __str__(self) -> str:
+        return f"<{self.__class__.__name__} service={self.service} rpc={self.rpc}>"
+
+
+class ProtoServiceRPCAdded(ProtoServiceRPCDiff):
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and isinstance(other, ProtoServiceRPCAdded)
+
+
+class ProtoServiceRPCRemoved(ProtoServiceRPCDiff):
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and isinstance(other, ProtoServiceRPCRemoved)
+
+
+class ProtoServiceRPCRequestChanged(ProtoServiceRPCDiff):
+    def __init__(
+        self,
+        service: ProtoService,
+        rpc: ProtoServiceRPC,
+        new_request_type: ProtoEnumOrMessageIdentifier,
+        new_request_stream: bool,
+    ):
+        super().__init__(service, rpc)
+        self.new_request_type = new_request_type
+        self.new_request_stream = new_request_stream
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            super().__eq__(other)
+            and isinstance(other, ProtoServiceRPCRequestChanged)
+            and self.new_request_type == other.new_request_type
+            and self.new_request_stream == other.new_request_stream
+        )
+
+    def __str__(self) -> str:
+        return f"<ProtoServiceRPCRequestChanged service={self.service} rpc={self.rpc} new_request_type={self.new_request_type} new_request_stream={self.new_request_stream}>"
+
+
+class ProtoServiceRPCResponseChanged(ProtoServiceRPCDiff):
+    def __init__(
+        self,
+        service: ProtoService,
+        rpc: ProtoServiceRPC,
+        new_response_type: ProtoEnumOrMessageIdentifier,
+        new_response_stream: bool,
+    ):
+        super().__init__(service, rpc)
+        self.new_response_type = new_response_type
+        self.new_response_stream = new_response_stream
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            super().__eq__(other)
+            and isinstance(other, ProtoServiceRPCResponseChanged)
+            and self.new_response_type == other.new_response_type
+            and self.new_response_stream == other.new_response_stream
+        )
+
+    def __str__(self) -> str:
+        return f"<ProtoServiceRPCResponseChanged service={self.service} rpc={self.rpc} new_response_type={self.new_response_type} new_response_stream={self.new_response_stream}>"
@@ -0,0 +1,89 @@
+import bisect
+from typing import NamedTuple, Optional
+
+
+class ProtoSpan(NamedTuple):
+    start: int
+    end: int
+
+
+class ProtoSourcePosition(NamedTuple):
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        return f"line {self.line}, column {self.column}"
+
+
+class ProtoSource:
+    """
+    The text of a proto file that nodes' spans point into.
+    Lines & columns are only computed when asked for, from an index of where each line starts.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._line_starts: Optional[list[int]] = None
+
+    @property
+    def line_starts(self) -> list[int]:
+        if self._line_starts is None:
+            line_starts = [0]
+            newline = self.text.find("\n")
+            while newline != -1:
+                line_starts.append(newline + 1)
+                newline = self.text.find("\n", newline + 1)
+            self._line_starts = line_starts
+        return self._line_starts
+
+    def position(self, offset: int) -> ProtoSourcePosition:
+        """
+        Returns the 1-indexed line & column of `offset`.
+        """
+        line = bisect.bisect_right(self.line_starts, offset)
+        return ProtoSourcePosition(line, offset - self.line_starts[line - 1] + 1)
+
+    def excerpt(self, span: ProtoSpan) -> str:
+        return self.text[span.start : span.end]
+
+
+class ProtoParseError(ValueError):
+    """
+    A parse error that points at where in the source it happened, rather than copying the source.
+
+    The match-based parser only ever sees the unconsumed end of the source, so it records
+    how much source remained instead; `locate` turns that into a span once the full source is known.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        span: Optional[ProtoSpan] = None,
+        source: Optional[ProtoSource] = None,
+        remaining_length: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.span = span
+        self.source = source
+        self.remaining_length = remaining_length
+
+    @property
+    def position(self) -> Optional[ProtoSourcePosition]:
+        if self.span is None or self.source is None:
+            return None
+        return self.source.position(self.span.start)
+
+    def locate(self, source: ProtoSource) -> "ProtoParseError":
+        if self.span is None and self.remaining_length is not None:
+            # The match-based parser strips the source, so the remainder is measured from its stripped end.
+            offset = max(len(source.text.rstrip()) - self.remaining_length, 0)
+            self.span = ProtoSpan(offset, offset)
+        self.source = source
+        return self
+
+    def __str__(self) -> str:
+        position = self.position
+        if position is None:
+            return self.message
+        return f"{self.message} at {position}"
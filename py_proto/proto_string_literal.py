@@ -26,7 +26,7 @@ class ProtoStringLiteral(ProtoNode):
         return str(self)
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(self.value)
 
     def normalize(self) -> "ProtoStringLiteral":
         return self
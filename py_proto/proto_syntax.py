@@ -19,6 +19,7 @@ class ProtoSyntax(ProtoNode):
     def __init__(self, syntax: ProtoStringLiteral, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.syntax = syntax
+        self.syntax.parent = self
 
     def __eq__(self, other) -> bool:
         return self.syntax == other.syntax
@@ -44,9 +45,9 @@ class ProtoSyntax(ProtoNode):
         proto_source = proto_source[9:]
         match = ProtoStringLiteral.match(proto_source)
         if match is None:
-            raise ValueError(f"Proto has invalid syntax syntax: {proto_source}")
+            raise ValueError(f"Proto has invalid syntax syntax")
         if not match.remaining_source.startswith(";"):
-            raise ValueError(f"Proto has invalid syntax: {proto_source}")
+            raise ValueError(f"Proto has invalid syntax")
         try:
             ProtoSyntaxType[match.node.value.upper()]
         except KeyError:
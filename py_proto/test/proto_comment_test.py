@@ -75,5 +75,17 @@ class ProtoMultiLineCommentTest(unittest.TestCase):
         )
 
 
+class ProtoCommentEqualityTest(unittest.TestCase):
+    def test_equal(self):
+        self.assertEqual(ProtoSingleLineComment(" foo"), ProtoSingleLineComment(" foo"))
+        self.assertNotEqual(
+            ProtoSingleLineComment(" foo"), ProtoSingleLineComment(" bar")
+        )
+        self.assertNotEqual(
+            ProtoSingleLineComment(" foo"), ProtoMultiLineComment(" foo")
+        )
+        self.assertNotEqual(ProtoSingleLineComment(" foo"), None)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -20,7 +20,7 @@ from py_proto.proto_identifier import ProtoIdentifier
 from py_proto.proto_int import ProtoInt, ProtoIntSign
 from py_proto.proto_option import ProtoOption
 from py_proto.proto_range import ProtoRange, ProtoRangeEnum
-from py_proto.proto_reserved import ProtoReserved
+from py_proto.proto_reserved import ProtoReserved, ProtoReservedRemoved
 from py_proto.proto_string_literal import ProtoStringLiteral
 
 
@@ -957,6 +957,30 @@ class EnumTest(unittest.TestCase):
         )
         self.assertEqual(5, len(diff))
 
+    def test_diff_unchanged_enum_values_returns_changes_only(self):
+        before = ProtoEnum.match(dedent("""
+            enum FooEnum {
+                FE_UNKNOWN = 0;
+                FE_ONE = 1;
+                reserved 2;
+            }
+            """).strip()).node
+        after = ProtoEnum.match(dedent("""
+            enum FooEnum {
+                FE_UNKNOWN = 0;
+                FE_UNO = 1;
+            }
+            """).strip()).node
+        self.assertEqual(
+            [
+                ProtoReservedRemoved(before, before.reserveds[0]),
+                ProtoEnumValueNameChanged(
+                    before, before.values[1], ProtoIdentifier("FE_UNO")
+                ),
+            ],
+            ProtoEnum.diff(self.DEFAULT_PARENT, before, after),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -98,6 +98,20 @@ class IdentifierTest(unittest.TestCase):
             ".a.bar0_baz.foo",
         )
 
+    def test_identifier_hash(self):
+        self.assertEqual(
+            hash(ProtoIdentifier("foo")), hash(ProtoEnumOrMessageIdentifier("foo"))
+        )
+        self.assertEqual(1, len({ProtoIdentifier("foo"), ProtoIdentifier("foo")}))
+        self.assertEqual(2, len({ProtoIdentifier("foo"), ProtoIdentifier("bar")}))
+
+    def test_identifier_interned(self):
+        name = "".join(["foo", "_bar"])
+        self.assertIs(
+            ProtoIdentifier(name).identifier,
+            ProtoEnumOrMessageIdentifier("foo_bar").identifier,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
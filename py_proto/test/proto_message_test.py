@@ -6,7 +6,7 @@ from textwrap import dedent
 from py_proto.proto_bool import ProtoBool
 from py_proto.proto_comment import ProtoMultiLineComment, ProtoSingleLineComment
 from py_proto.proto_constant import ProtoConstant
-from py_proto.proto_enum import ProtoEnum, ProtoEnumValue
+from py_proto.proto_enum import ProtoEnum, ProtoEnumAdded, ProtoEnumValue
 from py_proto.proto_extend import ProtoExtend
 from py_proto.proto_extensions import ProtoExtensions
 from py_proto.proto_identifier import (
@@ -19,13 +19,18 @@ from py_proto.proto_map import ProtoMap, ProtoMapKeyTypesEnum, ProtoMapValueType
 from py_proto.proto_message import ProtoMessage, ProtoMessageAdded, ProtoMessageRemoved
 from py_proto.proto_message_field import (
     ProtoMessageField,
+    ProtoMessageFieldAdded,
     ProtoMessageFieldOption,
     ProtoMessageFieldTypesEnum,
 )
 from py_proto.proto_oneof import ProtoOneOf
 from py_proto.proto_option import ProtoOption
 from py_proto.proto_range import ProtoRange, ProtoRangeEnum
-from py_proto.proto_reserved import ProtoReserved
+from py_proto.proto_reserved import (
+    ProtoReserved,
+    ProtoReservedAdded,
+    ProtoReservedRemoved,
+)
 from py_proto.proto_string_literal import ProtoStringLiteral
 
 
@@ -489,6 +494,31 @@ class MessageTest(unittest.TestCase):
             ],
         )
 
+    def test_message_normalizes_repeated_options_independent_of_order(self):
+        forward = ProtoMessage.match(
+            dedent("""
+                message MyMessage {
+                    option (r) = 1;
+                    option (r) = 2;
+                    string foo = 1 [ (f) = "b", (f) = "a" ];
+                }
+                """.strip()),
+        ).node
+        backward = ProtoMessage.match(
+            dedent("""
+                message MyMessage {
+                    option (r) = 2;
+                    option (r) = 1;
+                    string foo = 1 [ (f) = "a", (f) = "b" ];
+                }
+                """.strip()),
+        ).node
+        self.assertNotEqual(forward, backward)
+        self.assertEqual(forward.normalize(), backward.normalize())
+        self.assertEqual(
+            forward.normalize().serialize(), backward.normalize().serialize()
+        )
+
     def test_diff_same_message_returns_empty(self):
         pm1 = ProtoMessage(
             ProtoIdentifier("MyMessage"),
@@ -694,6 +724,88 @@ class MessageTest(unittest.TestCase):
         )
         self.assertEqual(4, len(diff))
 
+    def test_diff_nested_message_enum_and_reserved(self):
+        before = ProtoMessage.match(dedent("""
+            message Outer {
+                message Inner {
+                    string foo = 1;
+                }
+                message Removed {}
+                enum InnerEnum {
+                    IE_UNKNOWN = 0;
+                }
+                reserved 5;
+            }
+            """).strip()).node
+        after = ProtoMessage.match(dedent("""
+            message Outer {
+                message Inner {
+                    string foo = 1;
+                    string bar = 2;
+                }
+                enum InnerEnum {
+                    IE_UNKNOWN = 0;
+                }
+                enum AddedEnum {
+                    AE_UNKNOWN = 0;
+                }
+                reserved 6;
+            }
+            """).strip()).node
+        diff = ProtoMessage.diff(self.DEFAULT_PARENT, before, after)
+
+        self.assertIn(ProtoMessageRemoved(before, before.messages[1]), diff)
+        self.assertIn(
+            ProtoMessageFieldAdded(
+                before.messages[0], after.messages[0].message_fields[1]
+            ),
+            diff,
+        )
+        self.assertIn(ProtoEnumAdded(before, after.enums[1]), diff)
+        self.assertIn(ProtoReservedRemoved(before, before.reserveds[0]), diff)
+        self.assertIn(ProtoReservedAdded(before, after.reserveds[0]), diff)
+        self.assertEqual(5, len(diff))
+
+    def test_diff_skips_identical_nested_messages(self):
+        source = dedent("""
+            message Outer {
+                message Inner {
+                    string foo = 1;
+                }
+            }
+            """).strip()
+        before = ProtoMessage.match(source).node
+        after = ProtoMessage.match(source).node
+        self.assertEqual(before.structural_hash, after.structural_hash)
+        self.assertEqual([], ProtoMessage.diff(self.DEFAULT_PARENT, before, after))
+
+    def test_structural_hash(self):
+        source = dedent("""
+            message Outer {
+                message Inner {
+                    string foo = 1;
+                }
+                // comment
+                int32 bar = 2;
+            }
+            """).strip()
+        message = ProtoMessage.match(source).node
+        self.assertEqual(
+            message.structural_hash, ProtoMessage.match(source).node.structural_hash
+        )
+        for changed_source in [
+            source.replace("Outer", "Other"),
+            source.replace("Inner", "Other"),
+            source.replace("foo = 1", "foo = 3"),
+            source.replace("comment", "changed comment"),
+            source.replace("int32", "int64"),
+        ]:
+            with self.subTest(changed_source=changed_source):
+                self.assertNotEqual(
+                    message.structural_hash,
+                    ProtoMessage.match(changed_source).node.structural_hash,
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,12 @@
 import unittest
 from textwrap import dedent
 
-from py_proto.proto_reserved import ProtoReserved
+from py_proto.proto_range import ProtoRange
+from py_proto.proto_reserved import (
+    ProtoReserved,
+    ProtoReservedAdded,
+    ProtoReservedRemoved,
+)
 
 
 class ReservedTest(unittest.TestCase):
@@ -51,6 +56,25 @@ class ReservedTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             ProtoReserved.match("reserved 1, 'foo';")
 
+    def test_diff_sets(self):
+        parent = ProtoReserved(ranges=[ProtoRange(1)])
+        before = [
+            ProtoReserved.match("reserved 1, 2;").node,
+            ProtoReserved.match("reserved 'foo';").node,
+        ]
+        after = [
+            ProtoReserved.match("reserved 2, 1;").node,
+            ProtoReserved.match('reserved "bar";').node,
+        ]
+        self.assertEqual(
+            [
+                ProtoReservedRemoved(parent, before[1]),
+                ProtoReservedAdded(parent, after[1]),
+            ],
+            ProtoReserved.diff_sets(parent, before, after),
+        )
+        self.assertEqual([], ProtoReserved.diff_sets(parent, before, before))
+
 
 if __name__ == "__main__":
     unittest.main()
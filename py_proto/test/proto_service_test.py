@@ -11,8 +11,17 @@ from py_proto.proto_identifier import (
     ProtoFullIdentifier,
     ProtoIdentifier,
 )
-from py_proto.proto_option import ProtoOption
-from py_proto.proto_service import ProtoService, ProtoServiceRPC
+from py_proto.proto_option import ProtoOption, ProtoOptionValueChanged
+from py_proto.proto_service import (
+    ProtoService,
+    ProtoServiceAdded,
+    ProtoServiceRemoved,
+    ProtoServiceRPC,
+    ProtoServiceRPCAdded,
+    ProtoServiceRPCRemoved,
+    ProtoServiceRPCRequestChanged,
+    ProtoServiceRPCResponseChanged,
+)
 from py_proto.proto_string_literal import ProtoStringLiteral
 
 
@@ -326,6 +335,70 @@ class ServiceTest(unittest.TestCase):
             ],
         )
 
+    def test_diff_sets(self):
+        parent = ProtoService(ProtoIdentifier("DefaultParent"), [])
+        before = [
+            ProtoService.match("service Foo {}").node,
+            ProtoService.match("service Bar {}").node,
+        ]
+        after = [
+            ProtoService.match("service Foo {}").node,
+            ProtoService.match("service Baz {}").node,
+        ]
+        self.assertEqual(
+            [
+                ProtoServiceRemoved(parent, before[1]),
+                ProtoServiceAdded(parent, after[1]),
+            ],
+            ProtoService.diff_sets(parent, before, after),
+        )
+
+    def test_diff_rpcs(self):
+        before = ProtoService.match(dedent("""
+            service FooService {
+                rpc Same (SameRequest) returns (SameResponse);
+                rpc Removed (RemovedRequest) returns (RemovedResponse);
+                rpc Request (OldRequest) returns (RequestResponse);
+                rpc Response (ResponseRequest) returns (ResponseResponse);
+                rpc Option (OptionRequest) returns (OptionResponse) { option foo = 1; }
+            }
+            """).strip()).node
+        after = ProtoService.match(dedent("""
+            service FooService {
+                rpc Same (SameRequest) returns (SameResponse);
+                rpc Request (NewRequest) returns (RequestResponse);
+                rpc Response (ResponseRequest) returns (stream ResponseResponse);
+                rpc Option (OptionRequest) returns (OptionResponse) { option foo = 2; }
+                rpc Added (AddedRequest) returns (AddedResponse);
+            }
+            """).strip()).node
+        parent = ProtoService(ProtoIdentifier("DefaultParent"), [])
+        self.assertEqual(
+            [
+                ProtoServiceRPCRemoved(before, before.rpcs[1]),
+                ProtoServiceRPCRequestChanged(
+                    before,
+                    before.rpcs[2],
+                    ProtoEnumOrMessageIdentifier("NewRequest"),
+                    False,
+                ),
+                ProtoServiceRPCResponseChanged(
+                    before,
+                    before.rpcs[3],
+                    ProtoEnumOrMessageIdentifier("ResponseResponse"),
+                    True,
+                ),
+                ProtoOptionValueChanged(
+                    before.rpcs[4],
+                    ProtoIdentifier("foo"),
+                    before.rpcs[4].options[0].value,
+                    after.rpcs[3].options[0].value,
+                ),
+                ProtoServiceRPCAdded(before, after.rpcs[4]),
+            ],
+            ProtoService.diff(parent, before, after),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
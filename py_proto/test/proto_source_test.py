@@ -0,0 +1,60 @@
+# type: ignore
+
+import unittest
+
+from py_proto.proto_source import (
+    ProtoParseError,
+    ProtoSource,
+    ProtoSourcePosition,
+    ProtoSpan,
+)
+
+
+class SourceTest(unittest.TestCase):
+    def test_line_starts(self):
+        self.assertEqual([0], ProtoSource("").line_starts)
+        self.assertEqual([0], ProtoSource("foo").line_starts)
+        self.assertEqual([0, 4, 5], ProtoSource("foo\n\nbar").line_starts)
+        self.assertEqual([0, 4], ProtoSource("foo\n").line_starts)
+
+    def test_position(self):
+        source = ProtoSource("foo\n\nbar baz")
+        self.assertEqual(ProtoSourcePosition(1, 1), source.position(0))
+        self.assertEqual(ProtoSourcePosition(1, 4), source.position(3))
+        self.assertEqual(ProtoSourcePosition(2, 1), source.position(4))
+        self.assertEqual(ProtoSourcePosition(3, 1), source.position(5))
+        self.assertEqual(ProtoSourcePosition(3, 5), source.position(9))
+        self.assertEqual("line 3, column 5", str(source.position(9)))
+
+    def test_excerpt(self):
+        source = ProtoSource("foo\n\nbar baz")
+        self.assertEqual("bar", source.excerpt(ProtoSpan(5, 8)))
+        self.assertEqual("", source.excerpt(ProtoSpan(5, 5)))
+
+    def test_error_without_position(self):
+        error = ProtoParseError("Oops")
+        self.assertIsNone(error.position)
+        self.assertEqual("Oops", str(error))
+
+    def test_error_with_position(self):
+        error = ProtoParseError(
+            "Oops", span=ProtoSpan(5, 8), source=ProtoSource("foo\n\nbar baz")
+        )
+        self.assertEqual(ProtoSourcePosition(3, 1), error.position)
+        self.assertEqual("Oops at line 3, column 1", str(error))
+
+    def test_locate(self):
+        error = ProtoParseError("Oops", remaining_length=3)
+        located = error.locate(ProtoSource("foo\n\nbar baz\n\n"))
+        self.assertIs(error, located)
+        self.assertEqual(ProtoSpan(9, 9), error.span)
+        self.assertEqual("Oops at line 3, column 5", str(error))
+
+    def test_locate_keeps_span(self):
+        error = ProtoParseError("Oops", span=ProtoSpan(0, 3), remaining_length=3)
+        error.locate(ProtoSource("foo\n\nbar baz"))
+        self.assertEqual(ProtoSpan(0, 3), error.span)
+
+
+if __name__ == "__main__":
+    unittest.main()
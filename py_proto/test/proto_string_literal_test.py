@@ -38,6 +38,16 @@ class StringLiteralTest(unittest.TestCase):
         self.assertEqual(parsed_escaped_quote.remaining_source, "")
         self.assertEqual(parsed_escaped_quote.node.serialize(), '"foo\\"barbaz"')
 
+    def test_hash(self):
+        self.assertEqual(
+            hash(ProtoStringLiteral("foo", quote="'")),
+            hash(ProtoStringLiteral("foo", quote='"')),
+        )
+        self.assertEqual(
+            1,
+            len({ProtoStringLiteral("foo", quote="'"), ProtoStringLiteral("foo")}),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+# type: ignore
+
+import os
+import tempfile
+import unittest
+from textwrap import dedent
+from unittest import mock
+
+from py_proto.util.parse_cache import ParseCache
+from py_proto.util.parser import ParseError, Parser, ParserBackend
+
+SOURCE = dedent("""
+    syntax = "proto3";
+
+    package foo.bar;
+
+    message Foo {
+        string bar = 1;
+    }
+    """)
+
+
+class ParseCacheTest(unittest.TestCase):
+    def test_loads(self):
+        cache = ParseCache()
+        self.assertEqual(Parser.loads(SOURCE), cache.loads(SOURCE))
+
+    def test_loads_cached(self):
+        cache = ParseCache()
+        proto_file = cache.loads(SOURCE)
+        with mock.patch.object(Parser, "loads") as loads:
+            self.assertIs(proto_file, cache.loads(SOURCE))
+            loads.assert_not_called()
+
+        other_file = cache.loads(SOURCE.replace("Foo", "Baz"))
+        self.assertIsNot(proto_file, other_file)
+        self.assertNotEqual(proto_file, other_file)
+
+    def test_loads_backend(self):
+        cache = ParseCache(backend=ParserBackend.MATCH)
+        with mock.patch.object(Parser, "loads", wraps=Parser.loads) as loads:
+            cache.loads(SOURCE)
+            loads.assert_called_once_with(SOURCE, backend=ParserBackend.MATCH)
+
+    def test_loads_evicts(self):
+        cache = ParseCache(max_files=1)
+        proto_file = cache.loads(SOURCE)
+        cache.loads(SOURCE.replace("Foo", "Baz"))
+        self.assertEqual(1, len(cache.files))
+        self.assertIsNot(proto_file, cache.loads(SOURCE))
+
+    def test_loads_invalid(self):
+        cache = ParseCache()
+        with self.assertRaises(ParseError):
+            cache.loads('syntax = "proto3";\npackage foo.bar')
+        self.assertEqual(0, len(cache.files))
+
+    def test_loads_from_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            proto_file = ParseCache(directory=directory).loads(SOURCE)
+            self.assertEqual(1, len(os.listdir(directory)))
+
+            cache = ParseCache(directory=directory)
+            with mock.patch.object(Parser, "loads") as loads:
+                cached_file = cache.loads(SOURCE)
+                loads.assert_not_called()
+            self.assertEqual(proto_file, cached_file)
+            self.assertEqual(proto_file.serialize(), cached_file.serialize())
+            self.assertEqual(
+                proto_file.messages[0].start_position,
+                cached_file.messages[0].start_position,
+            )
+
+    def test_loads_from_corrupt_disk_entry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ParseCache(directory=directory)
+            cache.loads(SOURCE)
+            [entry] = os.listdir(directory)
+            with open(os.path.join(directory, entry), "wb") as cache_file:
+                cache_file.write(b"not a pickle")
+
+            self.assertEqual(
+                Parser.loads(SOURCE), ParseCache(directory=directory).loads(SOURCE)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
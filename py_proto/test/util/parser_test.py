@@ -30,7 +30,7 @@ from py_proto.proto_reserved import ProtoReserved
 from py_proto.proto_service import ProtoService, ProtoServiceRPC
 from py_proto.proto_string_literal import ProtoStringLiteral
 from py_proto.proto_syntax import ProtoSyntaxType
-from py_proto.util.parser import ParseError, Parser
+from py_proto.util.parser import ParseError, Parser, ParserBackend
 
 
 class IntTest(unittest.TestCase):
@@ -334,6 +334,74 @@ class IntTest(unittest.TestCase):
                     import weak "ba
                     """))
 
+    def test_parser_error_position(self):
+        proto_content = dedent("""
+            syntax = "proto3";
+
+            message Foo {
+                string bar = 1;
+                string baz = ;
+            }
+            """)
+        for backend in ParserBackend:
+            with self.subTest(backend=backend):
+                with self.assertRaises(ParseError) as context:
+                    Parser.loads(proto_content, backend=backend)
+                self.assertIsNotNone(context.exception.position)
+                self.assertEqual(6, context.exception.position.line)
+                # Errors point into the source, rather than copying it.
+                self.assertNotIn("string bar = 1;", str(context.exception))
+
+    def test_parser_error_chain_does_not_copy_source(self):
+        proto_content = (
+            dedent("""
+            syntax = "proto3";
+
+            message Foo
+                string baz = 1;
+            }
+            """)
+            + "".join(
+                f"message Bar{i} {{\n    string bar = 1;\n}}\n" for i in range(10000)
+            )
+        )
+        for backend in ParserBackend:
+            with self.subTest(backend=backend):
+                with self.assertRaises(ParseError) as context:
+                    Parser.loads(proto_content, backend=backend)
+                error: BaseException | None = context.exception
+                while error is not None:
+                    self.assertLess(len(str(error)), 1000)
+                    error = error.__cause__ or error.__context__
+        proto_content = dedent("""
+            syntax = "proto3";
+
+            package foo.bar.baz;
+
+            import public "foo.proto";
+
+            // Testing top-level single-line comment
+            message MyAwesomeMessage {
+                option (bar).baz = 1.2;
+                repeated string field_one = 1;
+                map <sfixed64, NestedMessage> my_map = 10;
+            }
+            """)
+        self.assertEqual(
+            Parser.loads(proto_content, backend=ParserBackend.TOKENIZER),
+            Parser.loads(proto_content, backend=ParserBackend.MATCH),
+        )
+
+        with self.assertRaises(ParseError):
+            Parser.loads(
+                dedent("""
+                    syntax = "proto3";
+
+                    package foo.bar.baz
+                    """),
+                backend=ParserBackend.TOKENIZER,
+            )
+
     def test_serialize(self):
         proto_file = Parser.loads(dedent("""
                 syntax = "proto3";
@@ -0,0 +1,193 @@
+# type: ignore
+
+import unittest
+from textwrap import dedent
+
+from py_proto.proto_file import ProtoFile
+from py_proto.proto_source import ProtoSourcePosition, ProtoSpan
+from py_proto.util.token_parser import TokenParser
+
+SOURCE = dedent("""
+    // Top-of-file comment.
+    /* Multi-line
+       top-of-file comment. */
+    syntax = "proto3";
+
+    package foo.bar.baz;
+
+    import public "foo.proto";
+    import weak 'bar/baz.proto';
+    import "bat.proto";
+
+    option java_package = "my.test.package";
+    option (fully.qualified).option = .314159265e1;
+    option (bar) = inf;
+    option baz.bat = -nan;
+    option cc_enable_arenas = true;
+    option optimize_for = SPEED;
+
+    extend .google.protobuf.FieldOptions {
+        string some_extendable_field = 1;
+        // yay
+    }
+
+    enum MyAwesomeEnum {
+        option allow_alias = true;
+        MAE_UNSPECIFIED = 0;
+        MAE_STARTED = 0x1;
+        MAE_RUNNING = 02 [ (custom_option) = "hello world", deprecated = true ];
+        MAE_STOPPED = -3;
+        reserved 4, 8 to 10, -20 to -15, 40 to max;
+        reserved "FOO", "BAR";
+    };
+
+    message MyAwesomeMessage {
+        option (bar).baz = 1.2;
+        enum MyNestedEnum {
+            MNE_UNDEFINED = 0;
+        }
+        message MyNestedMessage {
+            message MyDoublyNestedMessage {}
+        }
+        ;
+        reserved 1 to 3;
+        reserved 'yay', 'nay';
+        /* nested comment */
+        repeated string field_one = 1;
+        optional .foo.bar.MyNestedMessage field_two = 2 [ .bar.baz = true, (a.b).c = -1.5e-3 ];
+        extensions 8 to max, 100;
+        oneof foo {
+            string name = 4;
+            option java_package = "com.example.foo";
+            SubMessage sub_message = 9 [ (bar.baz).bat = "bat", baz.bat = -100 ];
+        }
+        map <sfixed64, NestedMessage> my_map = 10;
+        map<string, bytes> my_other_map = 11 [ deprecated = false ];
+        extend Foo {
+            int32 bar = 126;
+        }
+        bool stream = 12;
+    }
+
+    service MyGreatService {
+        option (foo.bar).baz = "bat";
+        // Nested comment.
+        rpc OneRPC (OneRPCRequest) returns (OneRPCResponse);
+        rpc TwoRPC (stream TwoRPCRequest) returns (stream .foo.TwoRPCResponse);
+        rpc ThreeRPC (stream) returns (stream.Response) { option java_package = "com.example.foo"; ; option (foo.bar).baz = false; }
+    }
+    """)
+
+
+class TokenParserTest(unittest.TestCase):
+    maxDiff = None
+
+    def assertParsesLikeMatch(self, source: str):
+        parsed = TokenParser(source).parse()
+        matched = ProtoFile.match(source).node
+        self.assertEqual(parsed, matched)
+        # Also compare representations, which include node classes (e.g. identifier types).
+        self.assertEqual(str(parsed.syntax), str(matched.syntax))
+        self.assertEqual(str(parsed.nodes), str(matched.nodes))
+        self.assertEqual(parsed.serialize(), matched.serialize())
+
+    def test_parse(self):
+        self.assertParsesLikeMatch(SOURCE)
+
+    def test_parse_minimal(self):
+        self.assertParsesLikeMatch('syntax = "proto3";')
+        self.assertParsesLikeMatch("syntax = 'proto2';\n")
+        self.assertParsesLikeMatch('syntax = "proto3";\nmessage Foo {}')
+
+    def test_parse_sets_parents(self):
+        parsed = TokenParser(SOURCE).parse()
+        for node in parsed.nodes:
+            self.assertIs(node.parent, parsed)
+        message = parsed.messages[0]
+        for node in message.nodes:
+            self.assertIs(node.parent, message)
+
+    def test_parse_sets_spans(self):
+        source = 'syntax = "proto3";\n\nmessage Foo {\n  string bar = 1;\n}\n'
+        parsed = TokenParser(source).parse()
+        self.assertEqual(ProtoSpan(0, len(source)), parsed.span)
+        self.assertEqual('syntax = "proto3";', source[slice(*parsed.syntax.span)])
+
+        message = parsed.messages[0]
+        self.assertEqual(
+            "message Foo {\n  string bar = 1;\n}", parsed.source.excerpt(message.span)
+        )
+        self.assertEqual(ProtoSourcePosition(3, 1), message.start_position)
+        self.assertEqual(ProtoSourcePosition(5, 2), message.end_position)
+
+        field = message.nodes[0]
+        self.assertEqual("string bar = 1;", parsed.source.excerpt(field.span))
+        self.assertEqual("bar", parsed.source.excerpt(field.name.span))
+        self.assertEqual(ProtoSourcePosition(4, 10), field.name.start_position)
+
+    def test_parse_no_syntax(self):
+        with self.assertRaisesRegex(ValueError, "Expected syntax statement"):
+            TokenParser('package foo;\nsyntax = "proto3";').parse()
+
+    def test_parse_unknown_syntax(self):
+        with self.assertRaisesRegex(ValueError, "unknown syntax type"):
+            TokenParser('syntax = "proto4";').parse()
+
+    def test_parse_reports_position(self):
+        with self.assertRaisesRegex(
+            ValueError, r"Expected ';', got 'message' at line 3, column 1"
+        ) as context:
+            TokenParser('syntax = "proto3";\npackage foo.bar\nmessage Foo {}').parse()
+        self.assertEqual(ProtoSpan(35, 42), context.exception.span)
+
+        with self.assertRaisesRegex(ValueError, r"at line 2, column 15") as context:
+            TokenParser('syntax = "proto3";\nmessage Foo { reserved 5 to 1; }').parse()
+        self.assertEqual(ProtoSourcePosition(2, 15), context.exception.position)
+
+    def test_parse_unterminated(self):
+        with self.assertRaisesRegex(ValueError, "reached the end of the proto source"):
+            TokenParser(
+                'syntax = "proto3";\nmessage Foo {\n  string bar = 1;\n'
+            ).parse()
+        with self.assertRaisesRegex(ValueError, "Unexpected character"):
+            TokenParser('syntax = "proto3";\nimport "foo').parse()
+
+    def test_parse_invalid(self):
+        for statement in [
+            "package .foo;",
+            "import weak public 'foo.proto';",
+            "option = 1;",
+            "option foo = ;",
+            "message Foo { string bar = 1.5; }",
+            "message Foo { repeated optional string bar = 1; }",
+            "message Foo { map<double, string> bar = 1; }",
+            "message Foo { reserved 'foo bar'; }",
+            "message Foo { reserved 5 to 1; }",
+            "message Foo { int32 foo = 1 [ foo = 1 }",
+            "enum Foo { FOO = 1.5; }",
+            "service Foo { string bar = 1; }",
+            "service Foo { rpc Bar (Baz) returns (Bat) { // comment\n } }",
+            "package foo; package bar;",
+            "option (foo) .bar = 1;",
+        ]:
+            with self.subTest(statement=statement):
+                with self.assertRaises(ValueError):
+                    TokenParser(f'syntax = "proto3";\n{statement}').parse()
+
+    def test_parse_rejects_whitespace_in_dotted_names(self):
+        # Stricter than the match backend, which takes package names verbatim.
+        source = 'syntax = "proto3";\npackage foo . bar;'
+        self.assertEqual("foo . bar", ProtoFile.match(source).node.package.package)
+        for statement in [
+            "package foo . bar;",
+            "package foo. bar;",
+            "option (foo . bar).baz = 1;",
+            "message Foo { foo . Bar bar = 1; }",
+        ]:
+            with self.subTest(statement=statement):
+                with self.assertRaisesRegex(ValueError, "Expected"):
+                    TokenParser(f'syntax = "proto3";\n{statement}').parse()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# type: ignore
+
+import unittest
+
+from py_proto.proto_source import ProtoSourcePosition, ProtoSpan
+from py_proto.util.tokenizer import Token, TokenizeError, TokenType, tokenize
+
+
+class TokenizerTest(unittest.TestCase):
+    def test_tokenize(self):
+        self.assertEqual(
+            tokenize('option (foo.bar) = "baz";'),
+            [
+                Token(TokenType.IDENTIFIER, "option", 0, 6),
+                Token(TokenType.SYMBOL, "(", 7, 8),
+                Token(TokenType.IDENTIFIER, "foo", 8, 11),
+                Token(TokenType.SYMBOL, ".", 11, 12),
+                Token(TokenType.IDENTIFIER, "bar", 12, 15),
+                Token(TokenType.SYMBOL, ")", 15, 16),
+                Token(TokenType.SYMBOL, "=", 17, 18),
+                Token(TokenType.STRING, '"baz"', 19, 24),
+                Token(TokenType.SYMBOL, ";", 24, 25),
+            ],
+        )
+
+    def test_tokenize_empty(self):
+        self.assertEqual(tokenize(""), [])
+        self.assertEqual(tokenize(" \n\t "), [])
+
+    def test_tokenize_numbers(self):
+        self.assertEqual(
+            [t.text for t in tokenize("1 0x1F 017 1.5 .314159265e1 1e-5 -2")],
+            ["1", "0x1F", "017", "1.5", ".314159265e1", "1e-5", "-", "2"],
+        )
+        self.assertTrue(
+            all(t.type == TokenType.NUMBER for t in tokenize("1 0x1F 1.5 1e-5"))
+        )
+
+    def test_tokenize_strings(self):
+        self.assertEqual(
+            [t.text for t in tokenize(r"""'foo' "b\"a'r" "//" 'a\'b'""")],
+            ["'foo'", r'"b\"a' + "'" + 'r"', '"//"', r"'a\'b'"],
+        )
+
+    def test_tokenize_comments(self):
+        self.assertEqual(
+            tokenize("// foo\nbar /* baz\n bat */"),
+            [
+                Token(TokenType.SINGLE_LINE_COMMENT, "// foo", 0, 6),
+                Token(TokenType.IDENTIFIER, "bar", 7, 10),
+                Token(TokenType.MULTI_LINE_COMMENT, "/* baz\n bat */", 11, 25),
+            ],
+        )
+
+    def test_tokenize_invalid(self):
+        with self.assertRaises(TokenizeError) as context:
+            tokenize("foo\nbar @ baz")
+        self.assertEqual(context.exception.span, ProtoSpan(8, 9))
+        self.assertEqual(context.exception.position, ProtoSourcePosition(2, 5))
+        self.assertEqual(
+            str(context.exception), "Unexpected character '@' at line 2, column 5"
+        )
+
+        with self.assertRaises(TokenizeError):
+            tokenize('"unterminated')
+        with self.assertRaises(TokenizeError):
+            tokenize("/* unterminated")
+
+
+if __name__ == "__main__":
+    unittest.main()
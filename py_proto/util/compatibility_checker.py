@@ -1,3 +1,4 @@
+import os
 import sys
 from dataclasses import dataclass
 from typing import Type
@@ -5,7 +6,8 @@ from typing import Type
 from py_proto.proto_file import ProtoFile
 from py_proto.proto_message import ProtoMessageAdded
 from py_proto.proto_node import ProtoNodeDiff
-from py_proto.util.parser import Parser
+from py_proto.util.parse_cache import ParseCache
+from py_proto.util.parser import ParserBackend
 
 
 @dataclass
@@ -20,11 +22,16 @@ class CompatibilityChecker:
 
 
 def main() -> int:
+    # CI checks the same schemas over & over, so parsed files can be cached on disk between runs.
+    # This keeps the match backend, since the tokenizer backend accepts a stricter grammar.
+    parse_cache = ParseCache(
+        directory=os.getenv("PY_PROTO_PARSE_CACHE_DIR"), backend=ParserBackend.MATCH
+    )
     with open(sys.argv[1], "r") as proto_file:
-        before = Parser.loads(proto_file.read())
+        before = parse_cache.loads(proto_file.read())
 
     with open(sys.argv[2], "r") as proto_file:
-        after = Parser.loads(proto_file.read())
+        after = parse_cache.loads(proto_file.read())
 
     violations = list(
         CompatibilityChecker([ProtoMessageAdded]).check_compatibility(before, after)
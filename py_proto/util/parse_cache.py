@@ -0,0 +1,84 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Optional
+
+from py_proto.proto_file import ProtoFile
+from py_proto.util.parser import Parser, ParserBackend
+
+# Bump this whenever nodes' attributes change, so that stale files on disk are ignored.
+CACHE_FORMAT_VERSION = 2
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    Caches parsed proto files by a hash of their content, in memory, and in `directory` if given.
+    Entries on disk are pickled, so `directory` must only be writable by trusted users.
+
+    Cached files are shared between callers, so they shouldn't be modified.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        backend: ParserBackend = ParserBackend.TOKENIZER,
+        max_files: int = 128,
+    ):
+        self.directory = directory
+        self.backend = backend
+        self.max_files = max_files
+        self.files: OrderedDict[str, ProtoFile] = OrderedDict()
+
+    def loads(self, proto_content: str) -> ProtoFile:
+        key = f"{self.backend.value}-{content_hash(proto_content)}"
+        proto_file = self.files.get(key)
+        if proto_file is not None:
+            self.files.move_to_end(key)
+            return proto_file
+
+        proto_file = self.load_from_disk(key)
+        if proto_file is None:
+            proto_file = Parser.loads(proto_content, backend=self.backend)
+            self.save_to_disk(key, proto_file)
+
+        self.files[key] = proto_file
+        while len(self.files) > self.max_files:
+            self.files.popitem(last=False)
+        return proto_file
+
+    def path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"{key}-v{CACHE_FORMAT_VERSION}.pickle")
+
+    def load_from_disk(self, key: str) -> Optional[ProtoFile]:
+        path = self.path(key)
+        if path is None or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as cache_file:
+                proto_file = pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # An unreadable entry is just a cache miss; it's overwritten once reparsed.
+            return None
+        return proto_file if isinstance(proto_file, ProtoFile) else None
+
+    def save_to_disk(self, key: str, proto_file: ProtoFile) -> None:
+        path = self.path(key)
+        if self.directory is None or path is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first, so that concurrent readers never see a partial entry.
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, delete=False
+        ) as cache_file:
+            pickle.dump(proto_file, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_file.name, path)
@@ -1,23 +1,53 @@
 import sys
+from enum import Enum
 
 from py_proto.proto_file import ProtoFile
+from py_proto.proto_source import ProtoParseError, ProtoSource
+from py_proto.util.token_parser import TokenParser
 
 
-class ParseError(ValueError):
-    pass
+class ParseError(ProtoParseError):
+    @classmethod
+    def from_error(cls, error: ProtoParseError) -> "ParseError":
+        return cls(
+            f"Proto doesn't have parseable syntax: {error.message}",
+            span=error.span,
+            source=error.source,
+        )
+
+
+class ParserBackend(Enum):
+    # Each node matches the start of the remaining source, & slices off what it consumed.
+    MATCH = "match"
+    # A single pass of tokens over the whole source. Linear in the size of the source.
+    # It doesn't allow whitespace inside dotted names, whereas MATCH takes package names
+    # verbatim up to the ;, so e.g. "package a . b;" only parses with MATCH.
+    TOKENIZER = "tokenizer"
 
 
 class Parser:
     @staticmethod
-    def loads(proto_content: str) -> ProtoFile:
+    def loads(
+        proto_content: str, backend: ParserBackend = ParserBackend.MATCH
+    ) -> ProtoFile:
+        if backend == ParserBackend.TOKENIZER:
+            try:
+                return TokenParser(proto_content).parse()
+            except ProtoParseError as e:
+                raise ParseError.from_error(e) from e
+
+        source = ProtoSource(proto_content)
         try:
             parsed_file = ProtoFile.match(proto_content, None)
+        except ProtoParseError as e:
+            raise ParseError.from_error(e.locate(source)) from e
         except ValueError as e:
-            raise ParseError(f"Proto doesn't have parseable syntax:\n{e}")
+            raise ParseError(f"Proto doesn't have parseable syntax: {e}") from e
         if parsed_file is None:
-            raise ParseError(f"Proto doesn't have parseable syntax:\n{proto_content}")
+            raise ParseError("Proto doesn't have parseable syntax", source=source)
 
         assert isinstance(parsed_file.node, ProtoFile)
+        parsed_file.node.parsed_source = source
         return parsed_file.node
 
 
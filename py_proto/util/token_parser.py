@@ -0,0 +1,622 @@
+from typing import Callable, Optional, TypeVar
+
+from py_proto.proto_comment import (
+    ProtoComment,
+    ProtoMultiLineComment,
+    ProtoSingleLineComment,
+)
+from py_proto.proto_constant import ProtoConstant
+from py_proto.proto_enum import ProtoEnum, ProtoEnumValue, ProtoEnumValueOption
+from py_proto.proto_extend import ProtoExtend
+from py_proto.proto_extensions import ProtoExtensions
+from py_proto.proto_file import ProtoFile
+from py_proto.proto_identifier import (
+    ProtoEnumOrMessageIdentifier,
+    ProtoFullIdentifier,
+    ProtoIdentifier,
+)
+from py_proto.proto_import import ProtoImport
+from py_proto.proto_int import ProtoInt, ProtoIntSign
+from py_proto.proto_map import ProtoMap, ProtoMapKeyTypesEnum
+from py_proto.proto_message import ProtoMessage
+from py_proto.proto_message_field import (
+    ProtoMessageField,
+    ProtoMessageFieldOption,
+    ProtoMessageFieldTypesEnum,
+)
+from py_proto.proto_node import ProtoNode, error_reason
+from py_proto.proto_oneof import ProtoOneOf
+from py_proto.proto_option import ProtoOption
+from py_proto.proto_package import ProtoPackage
+from py_proto.proto_range import ProtoRange, ProtoRangeEnum
+from py_proto.proto_reserved import ProtoReserved, ProtoReservedFieldQuoteEnum
+from py_proto.proto_service import ProtoService, ProtoServiceRPC
+from py_proto.proto_source import ProtoParseError, ProtoSource, ProtoSpan
+from py_proto.proto_string_literal import ProtoStringLiteral
+from py_proto.proto_syntax import ProtoSyntax, ProtoSyntaxType
+from py_proto.util.tokenizer import Token, TokenType, tokenize
+
+SCALAR_FIELD_TYPES = {
+    field_type.value: field_type
+    for field_type in ProtoMessageFieldTypesEnum
+    if field_type != ProtoMessageFieldTypesEnum.ENUM_OR_MESSAGE
+}
+MAP_KEY_TYPES = {key_type.value: key_type for key_type in ProtoMapKeyTypesEnum}
+
+NodeType = TypeVar("NodeType", bound=ProtoNode)
+FieldOptionType = TypeVar("FieldOptionType", bound=ProtoEnumValueOption)
+
+
+class TokenParser:
+    """
+    Parses a proto file from a single pass of tokens, rather than repeatedly slicing the
+    remaining source like the nodes' `match` methods do. Builds the same `ProtoFile` tree,
+    and records each node's span in the source.
+    """
+
+    def __init__(self, source: str):
+        self.source = ProtoSource(source)
+        self.tokens = tokenize(source)
+        self.index = 0
+
+    def error(self, message: str, token: Optional[Token] = None) -> ProtoParseError:
+        if token is None:
+            token = self.peek()
+        if token is None:
+            end = len(self.source.text)
+            return ProtoParseError(
+                f"{message}, but reached the end of the proto source",
+                span=ProtoSpan(end, end),
+                source=self.source,
+            )
+
+        return ProtoParseError(
+            f"{message}, got {token.text!r}",
+            span=ProtoSpan(token.start, token.end),
+            source=self.source,
+        )
+
+    def spanned(self, node: NodeType, start: int) -> NodeType:
+        """
+        Records that `node` was parsed from the tokens from `start` up to the current token.
+        """
+        node.span = ProtoSpan(self.tokens[start].start, self.tokens[self.index - 1].end)
+        return node
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.index + offset
+        if index >= len(self.tokens):
+            return None
+        return self.tokens[index]
+
+    def at(self, text: str, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return (
+            token is not None
+            and token.text == text
+            and token.type in (TokenType.SYMBOL, TokenType.IDENTIFIER)
+        )
+
+    def advance(self) -> Token:
+        token = self.peek()
+        if token is None:
+            raise self.error("Expected more proto source")
+        self.index += 1
+        return token
+
+    def expect(self, text: str) -> Token:
+        if not self.at(text):
+            raise self.error(f"Expected {text!r}")
+        return self.advance()
+
+    def expect_type(self, token_type: TokenType) -> Token:
+        token = self.peek()
+        if token is None or token.type != token_type:
+            raise self.error(f"Expected {token_type.value}")
+        return self.advance()
+
+    def at_adjacent(self, token_type: TokenType, text: Optional[str] = None) -> bool:
+        # Dotted names can't contain whitespace, so their parts must directly follow one another.
+        # This is stricter than the match backend for package names, which it takes verbatim
+        # up to the ;, so e.g. "package a . b;" is only accepted by the match backend.
+        previous = self.tokens[self.index - 1]
+        token = self.peek()
+        return (
+            token is not None
+            and token.start == previous.end
+            and token.type == token_type
+            and (text is None or token.text == text)
+        )
+
+    def dotted_name(self, leading_dot: bool = False) -> str:
+        parts = []
+        if leading_dot and self.at("."):
+            parts.append(self.advance().text)
+        parts.append(self.expect_type(TokenType.IDENTIFIER).text)
+        while self.at_adjacent(TokenType.SYMBOL, "."):
+            parts.append(self.advance().text)
+            if not self.at_adjacent(TokenType.IDENTIFIER):
+                raise self.error("Expected identifier after .")
+            parts.append(self.advance().text)
+        return "".join(parts)
+
+    def identifier(self) -> ProtoIdentifier:
+        start = self.index
+        identifier = ProtoIdentifier(self.expect_type(TokenType.IDENTIFIER).text)
+        return self.spanned(identifier, start)
+
+    def type_name(self) -> ProtoEnumOrMessageIdentifier:
+        start = self.index
+        type_name = ProtoEnumOrMessageIdentifier(self.dotted_name(leading_dot=True))
+        return self.spanned(type_name, start)
+
+    def string_literal(self) -> ProtoStringLiteral:
+        start = self.index
+        text = self.expect_type(TokenType.STRING).text
+        return self.spanned(ProtoStringLiteral(text[1:-1], quote=text[0]), start)
+
+    def integer(self, signed: bool = False) -> ProtoInt:
+        start = self.index
+        sign = ProtoIntSign.POSITIVE
+        if signed and self.at("-"):
+            self.advance()
+            sign = ProtoIntSign.NEGATIVE
+
+        token = self.expect_type(TokenType.NUMBER)
+        # Reuse the node's own matching on just this token, so that values are read identically.
+        match = ProtoInt.match(token.text)
+        if match is None or match.remaining_source:
+            raise self.error("Expected integer", token)
+        match.node.sign = sign
+        return self.spanned(match.node, start)
+
+    def constant(self) -> ProtoConstant:
+        start = self.index
+        token = self.peek()
+        if token is not None and token.type == TokenType.STRING:
+            return self.spanned(ProtoConstant(self.string_literal()), start)
+
+        sign = ""
+        if self.at("-") or self.at("+"):
+            sign = self.advance().text
+
+        token = self.peek()
+        if token is not None and token.type == TokenType.IDENTIFIER:
+            text = sign + self.dotted_name()
+        elif token is not None and token.type == TokenType.NUMBER:
+            text = sign + self.advance().text
+        else:
+            raise self.error("Expected constant")
+
+        match = ProtoConstant.match(text)
+        if match is None or match.remaining_source:
+            raise self.error("Expected constant", token)
+        self.spanned(match.node.value, start)
+        return self.spanned(match.node, start)
+
+    def option_name(self) -> ProtoIdentifier:
+        start = self.index
+        name_parts = []
+        if self.at("("):
+            self.advance()
+            name_parts.append(f"({self.dotted_name()})")
+            self.expect(")")
+            if self.at_adjacent(TokenType.SYMBOL, "."):
+                name_parts.append(self.dotted_name(leading_dot=True))
+        else:
+            token = self.peek()
+            if token is not None and (
+                token.type == TokenType.IDENTIFIER or self.at(".")
+            ):
+                name_parts.append(self.dotted_name(leading_dot=True))
+
+        if not name_parts:
+            raise self.error("Expected option name")
+        if len(name_parts) > 1:
+            return self.spanned(ProtoFullIdentifier("".join(name_parts)), start)
+        return self.spanned(ProtoIdentifier(name_parts[0]), start)
+
+    def option(self) -> ProtoOption:
+        start = self.index
+        self.expect("option")
+        name = self.option_name()
+        self.expect("=")
+        value = self.constant()
+        self.expect(";")
+        return self.spanned(ProtoOption(name, value), start)
+
+    def field_options(
+        self, option_type: type[FieldOptionType]
+    ) -> list[FieldOptionType]:
+        options: list[FieldOptionType] = []
+        if not self.at("["):
+            return options
+
+        self.advance()
+        while True:
+            start = self.index
+            name = self.option_name()
+            self.expect("=")
+            options.append(self.spanned(option_type(name, self.constant()), start))
+            if self.at("]"):
+                self.advance()
+                return options
+            self.expect(",")
+
+    def comment(self) -> Optional[ProtoComment]:
+        token = self.peek()
+        if token is None:
+            return None
+        if token.type == TokenType.SINGLE_LINE_COMMENT:
+            self.advance()
+            return self.spanned(ProtoSingleLineComment(token.text[2:]), self.index - 1)
+        if token.type == TokenType.MULTI_LINE_COMMENT:
+            self.advance()
+            return self.spanned(ProtoMultiLineComment(token.text[2:-2]), self.index - 1)
+        return None
+
+    def statement(self, parse_node: Callable[[], ProtoNode]) -> ProtoNode:
+        start = self.index
+        try:
+            return parse_node()
+        except ProtoParseError:
+            raise
+        except ValueError as e:
+            # Nodes' constructors also validate what they're given, e.g. that ranges are in order.
+            raise ProtoParseError(
+                error_reason(e),
+                span=ProtoSpan(self.tokens[start].start, self.tokens[start].end),
+                source=self.source,
+            ) from e
+
+    def container_nodes(self, parse_node: Callable[[], ProtoNode]) -> list[ProtoNode]:
+        """
+        Parses the statements of a `{ ... }` block, including its closing brace.
+        """
+        nodes: list[ProtoNode] = []
+        while not self.at("}"):
+            if self.peek() is None:
+                raise self.error("Expected closing curly brace")
+            # Remove empty statements.
+            if self.at(";"):
+                self.advance()
+                continue
+            comment = self.comment()
+            if comment is not None:
+                nodes.append(comment)
+                continue
+            nodes.append(self.statement(parse_node))
+        self.advance()
+        return nodes
+
+    def parse(self) -> ProtoFile:
+        header_nodes: list[ProtoNode] = []
+        while (comment := self.comment()) is not None:
+            header_nodes.append(comment)
+
+        start = self.index
+        if not self.at("syntax"):
+            raise self.error("Expected syntax statement")
+        self.advance()
+        self.expect("=")
+        syntax_token = self.peek()
+        syntax = self.string_literal()
+        try:
+            ProtoSyntaxType[syntax.value.upper()]
+        except KeyError:
+            raise self.error(
+                f"Proto has unknown syntax type, must be one of: {[proto_type.name for proto_type in ProtoSyntaxType]}",
+                syntax_token,
+            )
+        self.expect(";")
+        proto_syntax = self.spanned(ProtoSyntax(syntax), start)
+
+        nodes: list[ProtoNode] = []
+        while self.peek() is not None:
+            # Remove empty statements.
+            if self.at(";"):
+                self.advance()
+                continue
+            comment = self.comment()
+            if comment is not None:
+                nodes.append(comment)
+                continue
+            nodes.append(self.statement(self.top_level_node))
+
+        try:
+            proto_file = ProtoFile(
+                proto_syntax, header_nodes + nodes, parsed_source=self.source
+            )
+        except ValueError as e:
+            raise ProtoParseError(error_reason(e), source=self.source) from e
+        proto_file.span = ProtoSpan(0, len(self.source.text))
+        return proto_file
+
+    def top_level_node(self) -> ProtoNode:
+        if self.at("import"):
+            return self.proto_import()
+        elif self.at("package"):
+            return self.package()
+        elif self.at("option"):
+            return self.option()
+        elif self.at("message"):
+            return self.message()
+        elif self.at("enum"):
+            return self.enum()
+        elif self.at("extend"):
+            return self.extend()
+        elif self.at("service"):
+            return self.service()
+        raise self.error("Expected top-level statement")
+
+    def proto_import(self) -> ProtoImport:
+        start = self.index
+        self.expect("import")
+        weak = public = False
+        if self.at("weak"):
+            self.advance()
+            weak = True
+        elif self.at("public"):
+            self.advance()
+            public = True
+        path = self.string_literal()
+        self.expect(";")
+        return self.spanned(ProtoImport(path, weak=weak, public=public), start)
+
+    def package(self) -> ProtoPackage:
+        start = self.index
+        self.expect("package")
+        package = self.dotted_name()
+        self.expect(";")
+        return self.spanned(ProtoPackage(package), start)
+
+    def message(self) -> ProtoMessage:
+        start = self.index
+        self.expect("message")
+        name = self.identifier()
+        self.expect("{")
+        nodes = self.container_nodes(self.message_node)
+        return self.spanned(ProtoMessage(name, nodes), start)
+
+    def message_node(self) -> ProtoNode:
+        if self.at("enum"):
+            return self.enum()
+        elif self.at("extend"):
+            return self.extend()
+        elif self.at("extensions"):
+            return self.extensions()
+        elif self.at("option"):
+            return self.option()
+        elif self.at("message"):
+            return self.message()
+        elif self.at("reserved"):
+            return self.reserved()
+        elif self.at("oneof") and self.at("{", offset=2):
+            return self.oneof()
+        elif self.at("map") and self.at("<", offset=1):
+            return self.map()
+        return self.message_field()
+
+    def field_type(
+        self,
+    ) -> tuple[ProtoMessageFieldTypesEnum, Optional[ProtoEnumOrMessageIdentifier]]:
+        token = self.peek()
+        if (
+            token is not None
+            and token.type == TokenType.IDENTIFIER
+            and token.text in SCALAR_FIELD_TYPES
+        ):
+            self.advance()
+            return SCALAR_FIELD_TYPES[token.text], None
+        return ProtoMessageFieldTypesEnum.ENUM_OR_MESSAGE, self.type_name()
+
+    def message_field(self) -> ProtoMessageField:
+        start = self.index
+        repeated = optional = False
+        if self.at("repeated"):
+            self.advance()
+            repeated = True
+        if self.at("optional"):
+            if repeated:
+                raise self.error(
+                    "Proto message field has invalid syntax, cannot have both repeated and optional"
+                )
+            self.advance()
+            optional = True
+
+        field_type, type_name = self.field_type()
+        name = self.identifier()
+        self.expect("=")
+        number = self.integer()
+        options = self.field_options(ProtoMessageFieldOption)
+        self.expect(";")
+        return self.spanned(
+            ProtoMessageField(
+                field_type,
+                name,
+                number,
+                repeated=repeated,
+                optional=optional,
+                enum_or_message_type_name=type_name,
+                options=options,
+            ),
+            start,
+        )
+
+    def map(self) -> ProtoMap:
+        start = self.index
+        self.expect("map")
+        self.expect("<")
+        key_token = self.expect_type(TokenType.IDENTIFIER)
+        key_type = MAP_KEY_TYPES.get(key_token.text)
+        if key_type is None:
+            raise self.error("Expected map key type", key_token)
+        self.expect(",")
+
+        value_type, type_name = self.field_type()
+        self.expect(">")
+
+        name = self.identifier()
+        self.expect("=")
+        number = self.integer()
+        options = self.field_options(ProtoMessageFieldOption)
+        self.expect(";")
+        return self.spanned(
+            ProtoMap(
+                key_type,
+                value_type,
+                name,
+                number,
+                enum_or_message_type_name=type_name,
+                options=options,
+            ),
+            start,
+        )
+
+    def oneof(self) -> ProtoOneOf:
+        start = self.index
+        self.expect("oneof")
+        name = self.identifier()
+        self.expect("{")
+        nodes = self.container_nodes(self.oneof_node)
+        return self.spanned(ProtoOneOf(name, nodes), start)
+
+    def oneof_node(self) -> ProtoNode:
+        if self.at("option"):
+            return self.option()
+        return self.message_field()
+
+    def range(self) -> ProtoRange:
+        start = self.index
+        minimum = self.integer(signed=True)
+        maximum: Optional[ProtoInt | ProtoRangeEnum] = None
+        if self.at("to"):
+            self.advance()
+            if self.at("max"):
+                self.advance()
+                maximum = ProtoRangeEnum.MAX
+            else:
+                maximum = self.integer(signed=True)
+        return self.spanned(ProtoRange(minimum, maximum), start)
+
+    def extensions(self) -> ProtoExtensions:
+        start = self.index
+        self.expect("extensions")
+        ranges = [self.range()]
+        while not self.at(";"):
+            if self.at(","):
+                self.advance()
+            ranges.append(self.range())
+        self.advance()
+        return self.spanned(ProtoExtensions(ranges), start)
+
+    def reserved(self) -> ProtoReserved:
+        start = self.index
+        self.expect("reserved")
+        ranges: list[ProtoRange] = []
+        fields: list[ProtoIdentifier] = []
+        quote_type = None
+        while not self.at(";"):
+            if (ranges or fields) and self.at(","):
+                self.advance()
+            token = self.peek()
+            if token is not None and token.type == TokenType.STRING:
+                field = self.string_literal()
+                match = ProtoIdentifier.match(field.value) if field.value else None
+                if match is None or match.remaining_source:
+                    raise self.error("Expected reserved field identifier", token)
+                quote_type = ProtoReservedFieldQuoteEnum(field.quote)
+                fields.append(self.spanned(match.node, self.index - 1))
+            else:
+                ranges.append(self.range())
+        self.advance()
+        return self.spanned(
+            ProtoReserved(ranges=ranges, fields=fields, quote_type=quote_type), start
+        )
+
+    def enum(self) -> ProtoEnum:
+        start = self.index
+        self.expect("enum")
+        name = self.identifier()
+        self.expect("{")
+        nodes = self.container_nodes(self.enum_node)
+        return self.spanned(ProtoEnum(name, nodes), start)
+
+    def enum_node(self) -> ProtoNode:
+        if self.at("option"):
+            return self.option()
+        elif self.at("reserved"):
+            return self.reserved()
+
+        start = self.index
+        name = self.identifier()
+        self.expect("=")
+        value = self.integer(signed=True)
+        options = self.field_options(ProtoEnumValueOption)
+        return self.spanned(ProtoEnumValue(name, value, options), start)
+
+    def extend(self) -> ProtoExtend:
+        start = self.index
+        self.expect("extend")
+        name = self.type_name()
+        self.expect("{")
+        nodes = self.container_nodes(self.message_field)
+        return self.spanned(ProtoExtend(name, nodes), start)
+
+    def service(self) -> ProtoService:
+        start = self.index
+        self.expect("service")
+        name = self.identifier()
+        self.expect("{")
+        nodes = self.container_nodes(self.service_node)
+        return self.spanned(ProtoService(name, nodes), start)
+
+    def service_node(self) -> ProtoNode:
+        if self.at("option"):
+            return self.option()
+        elif self.at("rpc"):
+            return self.rpc()
+        raise self.error("Expected service option or rpc")
+
+    def rpc_type(self) -> tuple[ProtoEnumOrMessageIdentifier, bool]:
+        self.expect("(")
+        stream = False
+        type_name = self.type_name()
+        if type_name.identifier == "stream" and not self.at(")"):
+            stream = True
+            type_name = self.type_name()
+        self.expect(")")
+        return type_name, stream
+
+    def rpc(self) -> ProtoServiceRPC:
+        start = self.index
+        self.expect("rpc")
+        name = self.identifier()
+        request_type, request_stream = self.rpc_type()
+        self.expect("returns")
+        response_type, response_stream = self.rpc_type()
+
+        options = []
+        if self.at("{"):
+            self.advance()
+            while not self.at("}"):
+                # Remove empty statements.
+                if self.at(";"):
+                    self.advance()
+                    continue
+                options.append(self.option())
+            self.advance()
+        else:
+            self.expect(";")
+
+        return self.spanned(
+            ProtoServiceRPC(
+                name,
+                request_type,
+                response_type,
+                request_stream=request_stream,
+                response_stream=response_stream,
+                options=options,
+            ),
+            start,
+        )
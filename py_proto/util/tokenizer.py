@@ -0,0 +1,69 @@
+import re
+from enum import Enum
+from typing import NamedTuple
+
+from py_proto.proto_source import ProtoParseError, ProtoSource, ProtoSpan
+
+
+class TokenType(Enum):
+    IDENTIFIER = "identifier"
+    NUMBER = "number"
+    STRING = "string"
+    SYMBOL = "symbol"
+    SINGLE_LINE_COMMENT = "single_line_comment"
+    MULTI_LINE_COMMENT = "multi_line_comment"
+
+
+class Token(NamedTuple):
+    type: TokenType
+    text: str
+    start: int
+    end: int
+
+
+class TokenizeError(ProtoParseError):
+    pass
+
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<whitespace>\s+)
+    |(?P<single_line_comment>//[^\n]*)
+    |(?P<multi_line_comment>/\*.*?\*/)
+    |(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+    # Numbers are matched loosely (e.g. 0x1F, 1.5e-3, .5), and validated when they're parsed.
+    |(?P<number>\.?[0-9](?:[eE][+-]|[0-9A-Za-z_.])*)
+    |(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+    |(?P<symbol>[{}()\[\]<>=;,.+-])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+TOKEN_TYPES = {token_type.value: token_type for token_type in TokenType}
+
+
+def tokenize(source: str) -> list[Token]:
+    """
+    Splits `source` into tokens in a single pass, without copying the unconsumed source.
+    Whitespace is dropped, but each token keeps its offsets into `source`.
+    """
+    tokens = []
+    position = 0
+    length = len(source)
+    while position < length:
+        match = TOKEN_PATTERN.match(source, position)
+        if match is None:
+            raise TokenizeError(
+                f"Unexpected character {source[position]!r}",
+                span=ProtoSpan(position, position + 1),
+                source=ProtoSource(source),
+            )
+
+        kind = match.lastgroup
+        end = match.end()
+        if kind != "whitespace":
+            assert kind is not None
+            tokens.append(Token(TOKEN_TYPES[kind], match.group(kind), position, end))
+        position = end
+
+    return tokens